@@ -14,6 +14,7 @@ import asyncio
 from datetime import datetime
 import logging
 import json
+import os
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -37,6 +38,13 @@ class EmailRequest(BaseModel):
     sender_email: Optional[str] = "noreply@halcytone.com"
     metadata: Optional[Dict[str, Any]] = {}
 
+class BatchEmailRequest(BaseModel):
+    recipients: List[Dict[str, Any]]
+    subject: str
+    html: Optional[str] = None
+    text: Optional[str] = None
+    tracking: Optional[Dict[str, bool]] = {}
+
 class EmailResponse(BaseModel):
     message_id: str
     status: str
@@ -69,6 +77,9 @@ class CampaignResponse(BaseModel):
     status: str
     created_at: datetime
 
+# Simulated round trip of one batch send, in seconds
+BATCH_LATENCY = float(os.getenv("MOCK_CRM_BATCH_LATENCY", "0.05"))
+
 # Mock Database
 mock_emails = []
 mock_contacts = {}
@@ -145,6 +156,41 @@ async def send_email(request: EmailRequest):
         campaign_id=request.campaign_id
     )
 
+@app.post("/api/v1/email/batch")
+async def send_email_batch(request: BatchEmailRequest):
+    """Simulate a batch send; each call takes BATCH_LATENCY seconds"""
+
+    if "error" in request.subject.lower():
+        raise HTTPException(status_code=500, detail="Simulated CRM error: Batch sending failed")
+
+    await asyncio.sleep(BATCH_LATENCY)
+
+    # Recipients without a usable address fail individually
+    errors = [
+        f"Invalid recipient: {r.get('email')}"
+        for r in request.recipients
+        if "@" not in (r.get("email") or "")
+    ]
+    message_id = str(uuid.uuid4())
+
+    mock_emails.append({
+        "message_id": message_id,
+        "subject": request.subject,
+        "recipients_count": len(request.recipients),
+        "campaign_id": None,
+        "timestamp": datetime.utcnow(),
+        "status": "sent"
+    })
+
+    logger.info(f"Mock batch sent: {message_id} to {len(request.recipients)} recipients")
+
+    return {
+        "message_id": message_id,
+        "successful": len(request.recipients) - len(errors),
+        "failed": len(errors),
+        "errors": errors
+    }
+
 @app.get("/api/v1/email/{message_id}/status")
 async def get_email_status(message_id: str):
     """Get email delivery status"""
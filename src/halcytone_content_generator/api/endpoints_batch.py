@@ -1,19 +1,32 @@
 """
 Batch Content Generation Endpoints
 """
+import json
 import logging
+import uuid
 from typing import List, Dict, Any
 from datetime import datetime, timedelta
 
 from fastapi import APIRouter, HTTPException, Depends, Query
+from fastapi.responses import StreamingResponse
 from pydantic import ValidationError
 
 from ..schemas.content import (
     BatchContentRequest, BatchContentResponse, BatchContentItem,
-    BatchScheduleRequest, BatchScheduleResponse, BatchStatusResponse,
-    Content, SocialPost, NewsletterContent, WebUpdateContent
+    BatchScheduleRequest, BatchScheduleResponse, BatchStatusResponse, BatchItemStatus,
+    BatchScoreRequest, BatchScoreResponse, BatchScoreItem,
+)
+from ..services.ai_content_enhancer import ContentType
+from ..services.content_quality_scorer import (
+    ContentQualityScorer, QualityScore, get_content_quality_scorer
 )
 from ..services.content_assembler_v2 import EnhancedContentAssembler
+from ..services.batch_engine import (
+    BatchGenerationEngine, BatchItemProgress, BatchRun, plan_batch,
+    BATCH_PENDING, ITEM_ACTIVE_STATES, ITEM_CANCELLED, ITEM_COMPLETED,
+    ITEM_FAILED, ITEM_REJECTED
+)
+from ..services.batch_jobs import BatchJobExecutor, get_batch_executor
 from ..services.document_fetcher import DocumentFetcher
 from ..services.publishers.email_publisher import EmailPublisher
 from ..services.publishers.web_publisher import WebPublisher
@@ -34,6 +47,10 @@ def get_document_fetcher():
     settings = get_settings()
     return DocumentFetcher(settings)
 
+def get_quality_scorer():
+    """Dependency to get the shared content quality scorer"""
+    return get_content_quality_scorer()
+
 def get_publishers():
     """Get all available publishers"""
     settings = get_settings()
@@ -51,6 +68,15 @@ def get_publishers():
         'social': SocialPublisher(config)
     }
 
+def build_batch_engine(assembler: EnhancedContentAssembler = None) -> BatchGenerationEngine:
+    """Create a batch engine with the configured publishers and concurrency"""
+    settings = get_settings()
+    return BatchGenerationEngine(
+        assembler or get_content_assembler(),
+        get_publishers(),
+        max_concurrency=settings.BATCH_MAX_CONCURRENCY
+    )
+
 @router.post("/generateBatch", response_model=BatchContentResponse)
 async def generate_batch_content(
     period: str = Query(..., description="Time period: 'day', 'week', 'month'"),
@@ -60,11 +86,20 @@ async def generate_batch_content(
     template_variety: bool = Query(True, description="Use different templates across items"),
     include_scheduling: bool = Query(True, description="Include optimal scheduling recommendations"),
     content_themes: List[str] = Query(None, description="Specific content themes to focus on"),
+    background: bool = Query(False, description="Return immediately and generate in the background; "
+                                                "poll /batch/status"),
     assembler: EnhancedContentAssembler = Depends(get_content_assembler),
-    fetcher: DocumentFetcher = Depends(get_document_fetcher)
+    fetcher: DocumentFetcher = Depends(get_document_fetcher),
+    executor: BatchJobExecutor = Depends(get_batch_executor)
 ):
     """
     Generate batch content for multiple channels and time periods
+
+    All items are planned up front and generated concurrently (bounded by
+    BATCH_MAX_CONCURRENCY); per-item progress is available from
+    /batch/status/{batch_id} while the batch runs. With BATCH_JOBS_PERSISTENT
+    the batch is stored and checkpointed per item, so background batches
+    resume after a restart.
     """
     settings = get_settings()
 
@@ -99,8 +134,8 @@ async def generate_batch_content(
 
         logger.info(f"Starting batch generation: {batch_request.model_dump()}")
 
-        # Generate batch ID
-        batch_id = f"batch-{datetime.now().strftime('%Y%m%d-%H%M%S')}"
+        # Generate batch ID (suffixed so batches started in the same second stay distinct)
+        batch_id = f"batch-{datetime.now().strftime('%Y%m%d-%H%M%S')}-{uuid.uuid4().hex[:6]}"
 
         # Calculate date range based on period
         start_date = datetime.now()
@@ -128,120 +163,39 @@ async def generate_batch_content(
                 'vision': [{'title': 'Vision', 'content': 'Vision content', 'category': 'vision'}]
             }
 
-        # Get available publishers
-        publishers = get_publishers()
-
-        # Generate content items
-        batch_items = []
-        generated_count = 0
-
-        for i in range(item_count):
-            if generated_count >= max_items:
-                break
-
-            # Rotate through channels
-            channel = channels[i % len(channels)]
-
-            try:
-                # Generate content for this channel
-                if channel == 'email':
-                    # Choose template for variety
-                    if template_variety:
-                        templates = ['modern', 'minimal', 'plain']
-                        template_choice = templates[i % len(templates)]
-                    else:
-                        template_choice = 'modern'  # default template
-
-                    newsletter_data = assembler.generate_newsletter(
-                        document_content,
-                        template=template_choice
-                    )
-                    newsletter_content = NewsletterContent(**newsletter_data)
-                    content = Content.from_newsletter(
-                        newsletter_content,
-                        dry_run=batch_request.dry_run
-                    )
-
-                elif channel == 'web':
-                    web_data = assembler.generate_web_update(
-                        document_content,
-                        seo_optimize=True
-                    )
-                    web_content = WebUpdateContent(**web_data)
-                    content = Content.from_web_update(
-                        web_content,
-                        dry_run=batch_request.dry_run
-                    )
-
-                elif channel == 'social':
-                    # Generate for specific platform
-                    platforms = ['twitter', 'linkedin']
-                    platform = platforms[i % len(platforms)]
-
-                    # Generate posts for this platform only
-                    social_posts = assembler.generate_social_posts(
-                        document_content,
-                        platforms=[platform]
-                    )
-
-                    if social_posts:
-                        # Convert dict to SocialPost object
-                        post_data = social_posts[0]  # Take first post
-                        social_content = SocialPost(
-                            platform=post_data['platform'],
-                            content=post_data['content'],
-                            hashtags=post_data.get('hashtags', []),
-                            media_urls=post_data.get('media_urls', [])
-                        )
-                        content = Content.from_social_post(
-                            social_content,
-                            dry_run=batch_request.dry_run
-                        )
-                    else:
-                        logger.warning(f"No social content generated for {platform}")
-                        continue
-
-                # Validate content with appropriate publisher
-                publisher = publishers[channel]
-                validation_result = await publisher.validate(content)
-
-                if not validation_result.is_valid:
-                    logger.warning(f"Content validation failed for {channel}: {validation_result.issues}")
-                    continue
-
-                # Calculate scheduled time if requested
-                scheduled_time = None
-                if include_scheduling:
-                    # Distribute content over the time period
-                    time_offset = timedelta(hours=i * 2)  # Spread items 2 hours apart
-                    scheduled_time = start_date + time_offset
-
-                # Estimate engagement score
-                preview_result = await publisher.preview(content)
-                estimated_engagement = preview_result.estimated_engagement or 0.05
-
-                # Create batch item
-                batch_item = BatchContentItem(
-                    item_id=f"{batch_id}-{channel}-{generated_count:03d}",
-                    content_type=channel,
-                    content=content,
-                    scheduled_for=scheduled_time,
-                    priority=1 if channel == 'email' else 2,  # Email priority
-                    estimated_engagement=estimated_engagement,
-                    metadata={
-                        "channel": channel,
-                        "generation_index": generated_count,
-                        "validation_passed": True,
-                        "template_used": "varied" if template_variety else "default"
-                    }
-                )
-
-                batch_items.append(batch_item)
-                generated_count += 1
-
-            except Exception as e:
-                logger.error(f"Failed to generate content for {channel}: {e}")
-                continue
+        # Plan every item up front; the executor registers the run for live status
+        plans = plan_batch(
+            batch_id, channels, item_count, start_date,
+            template_variety=template_variety,
+            include_scheduling=include_scheduling
+        )
+        run = BatchRun(
+            batch_id=batch_id,
+            items=[BatchItemProgress(plan=plan) for plan in plans],
+            dry_run=batch_request.dry_run,
+            template_variety=template_variety,
+            period=period
+        )
+        engine = build_batch_engine(assembler)
+
+        if background:
+            await executor.submit(run, document_content, engine)
+            return BatchContentResponse(
+                batch_id=batch_id,
+                status=BATCH_PENDING,
+                items=[],
+                summary={
+                    "planned_items": len(plans),
+                    "time_period": period,
+                    "dry_run_mode": batch_request.dry_run,
+                    "status_url": f"/api/v1/batch/status/{batch_id}"
+                },
+                dry_run=batch_request.dry_run,
+                total_items=0
+            )
+
+        await executor.execute(run, document_content, engine)
+        batch_items = run.completed_items()
 
         # Create scheduling plan if requested
         scheduling_plan = None
@@ -303,51 +257,196 @@ async def generate_batch_content(
 @router.post("/schedule/{batch_id}", response_model=BatchScheduleResponse)
 async def schedule_batch(
     batch_id: str,
-    request: BatchScheduleRequest
+    request: BatchScheduleRequest,
+    executor: BatchJobExecutor = Depends(get_batch_executor)
 ):
     """
-    Schedule a previously generated batch for publication
+    Schedule the generated items of a finished batch for publication
+
+    Items keep their planned publish times unless custom_schedule maps their
+    item_id to a new time; with schedule_all=false only the items named in
+    custom_schedule are scheduled.
     """
-    # This would integrate with a job scheduler in a real implementation
     logger.info(f"Scheduling batch {batch_id}: {request.model_dump()}")
 
+    run = await executor.get_run(batch_id)
+    if run is None:
+        raise HTTPException(status_code=404, detail=f"Batch {batch_id} not found")
+    if not run.is_finished:
+        raise HTTPException(status_code=409, detail=f"Batch {batch_id} is still {run.status}")
+
+    # Planned times are naive local time (datetime.now()); convert aware input to match
+    custom_schedule = {
+        item_id: when.astimezone().replace(tzinfo=None) if when.tzinfo is not None else when
+        for item_id, when in (request.custom_schedule or {}).items()
+    }
+    generated = {item.plan.item_id: item for item in run.items if item.status == ITEM_COMPLETED}
+    unknown = [item_id for item_id in custom_schedule if item_id not in generated]
+    if unknown:
+        raise HTTPException(status_code=400, detail=f"Items not generated in batch {batch_id}: {unknown}")
+
+    selected = [
+        item for item_id, item in generated.items()
+        if request.schedule_all or item_id in custom_schedule
+    ]
+    publish_times = {
+        item.plan.item_id: custom_schedule.get(item.plan.item_id, item.plan.scheduled_for)
+        for item in selected
+    }
+    upcoming = [when for when in publish_times.values() if when is not None]
+    next_publish_time = min(upcoming) if upcoming else None
+
     if request.dry_run:
         return BatchScheduleResponse(
             batch_id=batch_id,
-            scheduled_items=[],
-            schedule_summary={"dry_run": True, "message": "Scheduling preview only"},
+            scheduled_items=list(publish_times),
+            schedule_summary={
+                "dry_run": True,
+                "message": "Scheduling preview only",
+                "total_scheduled": len(publish_times)
+            },
+            next_publish_time=next_publish_time,
             dry_run=True
         )
 
-    # Simulate scheduling
+    for item in selected:
+        item.plan.scheduled_for = publish_times[item.plan.item_id]
+        item.result.scheduled_for = item.plan.scheduled_for
+    run.scheduled_at = datetime.now()
+    await executor.save(run)
+
     return BatchScheduleResponse(
         batch_id=batch_id,
-        scheduled_items=[f"{batch_id}-item-{i}" for i in range(5)],
+        scheduled_items=list(publish_times),
         schedule_summary={
-            "total_scheduled": 5,
-            "next_execution": (datetime.now() + timedelta(minutes=30)).isoformat()
+            "total_scheduled": len(publish_times),
+            "next_execution": next_publish_time.isoformat() if next_publish_time else None
         },
-        next_publish_time=datetime.now() + timedelta(minutes=30),
+        next_publish_time=next_publish_time,
         dry_run=False
     )
 
 @router.get("/status/{batch_id}", response_model=BatchStatusResponse)
-async def get_batch_status(batch_id: str):
+async def get_batch_status(
+    batch_id: str,
+    executor: BatchJobExecutor = Depends(get_batch_executor)
+):
     """
-    Get the current status of a batch
+    Get the current status of a batch, including per-item progress
     """
-    # This would query a job status store in a real implementation
-    logger.info(f"Getting status for batch {batch_id}")
+    run = await executor.get_run(batch_id)
+    if run is None:
+        raise HTTPException(status_code=404, detail=f"Batch {batch_id} not found")
+
+    return _to_batch_status(run)
 
+@router.post("/cancel/{batch_id}", response_model=BatchStatusResponse)
+async def cancel_batch(
+    batch_id: str,
+    executor: BatchJobExecutor = Depends(get_batch_executor)
+):
+    """
+    Cancel a batch
+
+    Items not yet started are cancelled immediately; items already being
+    generated finish, after which the batch ends as cancelled.
+    """
+    run = await executor.cancel(batch_id)
+    if run is None:
+        raise HTTPException(status_code=404, detail=f"Batch {batch_id} not found")
+
+    return _to_batch_status(run)
+
+@router.post("/score", response_model=BatchScoreResponse)
+async def score_batch_content(
+    request: BatchScoreRequest,
+    stream: bool = Query(False, description="Stream newline-delimited JSON results as they finish"),
+    scorer: ContentQualityScorer = Depends(get_quality_scorer)
+):
+    """
+    Score a list of drafts for quality in one request
+
+    Metric calculation runs in the scorer's process pool. With stream=true the
+    response is newline-delimited JSON, one item per draft in completion order.
+    """
+    settings = get_settings()
+
+    try:
+        content_type = ContentType(request.content_type)
+    except ValueError:
+        valid_types = [ct.value for ct in ContentType]
+        raise HTTPException(status_code=400, detail=f"content_type must be one of {valid_types}")
+
+    if len(request.contents) > settings.QUALITY_SCORING_BATCH_MAX_ITEMS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Too many drafts; maximum is {settings.QUALITY_SCORING_BATCH_MAX_ITEMS}"
+        )
+
+    logger.info(f"Scoring batch of {len(request.contents)} {content_type.value} drafts")
+
+    scores = scorer.score_many(
+        request.contents,
+        content_type,
+        include_ai_analysis=request.include_ai_analysis
+    )
+
+    if stream:
+        async def stream_results():
+            async for index, score in scores:
+                yield json.dumps(_to_batch_score_item(index, score).model_dump()) + "\n"
+
+        return StreamingResponse(stream_results(), media_type="application/x-ndjson")
+
+    results = [_to_batch_score_item(index, score) async for index, score in scores]
+    results.sort(key=lambda item: item.index)
+
+    return BatchScoreResponse(
+        content_type=content_type.value,
+        results=results,
+        total_items=len(results),
+        average_score=sum(item.overall_score for item in results) / len(results)
+    )
+
+def _to_batch_status(run: BatchRun) -> BatchStatusResponse:
+    """Convert a batch run into its API status representation"""
     return BatchStatusResponse(
-        batch_id=batch_id,
-        status="completed",
-        items_total=10,
-        items_published=8,
-        items_pending=1,
-        items_failed=1,
-        last_updated=datetime.now(),
-        errors=["Failed to publish social post to Instagram"]
+        batch_id=run.batch_id,
+        status=run.status,
+        items_total=len(run.items),
+        items_published=run.count(ITEM_COMPLETED),
+        items_pending=run.count(*ITEM_ACTIVE_STATES),
+        items_failed=run.count(ITEM_FAILED, ITEM_REJECTED),
+        items_cancelled=run.count(ITEM_CANCELLED),
+        last_updated=run.last_updated,
+        errors=run.errors + [
+            f"{item.plan.item_id}: {item.error}" for item in run.items if item.error
+        ],
+        items=[_to_batch_item_status(item) for item in run.items]
+    )
+
+def _to_batch_item_status(item: BatchItemProgress) -> BatchItemStatus:
+    """Convert an item's progress into its API representation"""
+    return BatchItemStatus(
+        index=item.plan.index,
+        item_id=item.plan.item_id,
+        channel=item.plan.channel,
+        status=item.status,
+        scheduled_for=item.plan.scheduled_for,
+        started_at=item.started_at,
+        completed_at=item.completed_at,
+        error=item.error
+    )
+
+def _to_batch_score_item(index: int, score: QualityScore) -> BatchScoreItem:
+    """Convert a quality score into its API representation"""
+    return BatchScoreItem(
+        index=index,
+        overall_score=score.overall_score,
+        quality_level=score.quality_level.value,
+        category_scores=score.category_scores,
+        ai_assessment_score=score.ai_assessment_score,
+        improvement_suggestions=score.improvement_suggestions
     )
 
 def _calculate_distribution(batch_items: List[BatchContentItem]) -> Dict[str, Any]:
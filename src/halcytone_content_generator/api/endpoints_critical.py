@@ -5,6 +5,7 @@ from fastapi import APIRouter, HTTPException, Depends, BackgroundTasks
 from typing import Dict, List, Optional, Any
 from datetime import datetime
 from pydantic import BaseModel, Field
+import asyncio
 import logging
 
 from ..config import Settings, get_settings
@@ -74,6 +75,13 @@ class MetricsResponse(BaseModel):
     channel_breakdown: Dict[str, int]
     success_rate: float
     last_sync_times: Dict[str, str]
+    queue_depth: int = 0
+    scheduled_jobs: int = 0
+    avg_queue_wait_ms: float = 0.0
+    max_queue_wait_ms: float = 0.0
+    retained_jobs: int = 0
+    avg_job_duration_ms: float = 0.0
+    job_duration_buckets: Dict[str, int] = {}
 
 
 # Initialize services
@@ -157,7 +165,6 @@ async def send_newsletter(
 @router.post("/v2/content/sync", response_model=ContentSyncResponse)
 async def sync_content(
     request: ContentSyncRequest,
-    background_tasks: BackgroundTasks,
     sync_service: ContentSyncService = Depends(get_sync_service),
     api_key_data: Dict = Depends(validate_api_key_dep)
 ):
@@ -189,19 +196,21 @@ async def sync_content(
             except Exception as e:
                 logger.error(f"Error processing channel {channel_str}: {e}")
 
-        # Start sync job
-        job = await sync_service.sync_content(
-            document_id=request.document_id,
-            channels=channels,
-            correlation_id=request.correlation_id,
-            schedule_time=request.schedule_time
-        )
-
-        # Process job in background
-        if not request.schedule_time or request.schedule_time <= datetime.now():
-            background_tasks.add_task(
-                sync_service._execute_sync_job,
-                job
+        # Queue the job for the worker pool; a full queue is reported rather than waited on
+        sync_service.start()
+        try:
+            job = await sync_service.sync_content(
+                document_id=request.document_id,
+                channels=channels,
+                correlation_id=request.correlation_id,
+                schedule_time=request.schedule_time,
+                wait=False
+            )
+        except asyncio.QueueFull:
+            raise HTTPException(
+                status_code=503,
+                detail="Sync queue is full, retry later",
+                headers={"Retry-After": "30"}
             )
 
         return ContentSyncResponse(
@@ -213,6 +222,8 @@ async def sync_content(
             correlation_id=job.correlation_id
         )
 
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Failed to sync content: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -297,14 +308,20 @@ async def get_metrics(
         status_breakdown=stats['status_breakdown'],
         channel_breakdown=stats['channel_breakdown'],
         success_rate=stats['success_rate'],
-        last_sync_times=stats.get('last_sync_times', {})
+        last_sync_times=stats.get('last_sync_times', {}),
+        queue_depth=stats['queue']['queue_depth'],
+        scheduled_jobs=stats['queue']['scheduled_jobs'],
+        avg_queue_wait_ms=stats['queue']['avg_queue_wait_ms'],
+        max_queue_wait_ms=stats['queue']['max_queue_wait_ms'],
+        retained_jobs=stats['retained_jobs'],
+        avg_job_duration_ms=stats['duration_ms']['avg'],
+        job_duration_buckets=stats['duration_ms']['buckets']
     )
 
 
 @router.post("/v2/jobs/{job_id}/retry")
 async def retry_job(
     job_id: str,
-    background_tasks: BackgroundTasks,
     sync_service: ContentSyncService = Depends(get_sync_service),
     api_key_data: Dict = Depends(validate_api_key_dep)
 ):
@@ -324,18 +341,21 @@ async def retry_job(
             detail=f"Job {job_id} cannot be retried (status: {original_job.status.value})"
         )
 
-    # Create retry job
-    new_job = await sync_service.sync_content(
-        document_id=original_job.source_document_id,
-        channels=original_job.channels,
-        correlation_id=f"retry_{original_job.correlation_id}" if original_job.correlation_id else None
-    )
-
-    # Process in background
-    background_tasks.add_task(
-        sync_service._execute_sync_job,
-        new_job
-    )
+    # Queue retry job
+    sync_service.start()
+    try:
+        new_job = await sync_service.sync_content(
+            document_id=original_job.source_document_id,
+            channels=original_job.channels,
+            correlation_id=f"retry_{original_job.correlation_id}" if original_job.correlation_id else None,
+            wait=False
+        )
+    except asyncio.QueueFull:
+        raise HTTPException(
+            status_code=503,
+            detail="Sync queue is full, retry later",
+            headers={"Retry-After": "30"}
+        )
 
     return {
         "new_job_id": new_job.job_id,
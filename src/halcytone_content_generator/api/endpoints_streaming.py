@@ -0,0 +1,137 @@
+"""
+Streaming AI enhancement endpoints
+Server-Sent Events and WebSocket delivery of partial enhancement output
+"""
+import json
+import logging
+from typing import Any, AsyncIterator, Dict
+
+from fastapi import APIRouter, Depends, HTTPException, WebSocket, WebSocketDisconnect
+from fastapi.responses import StreamingResponse
+from pydantic import ValidationError
+
+from ..schemas.content import EnhancementStreamRequest
+from ..services.ai_content_enhancer import (
+    AIContentEnhancer, ContentType, EnhancementMode, EnhancementRequest, EnhancementResult,
+    get_ai_enhancer
+)
+
+logger = logging.getLogger(__name__)
+router = APIRouter(tags=["content-v2-streaming"], prefix="/v2")
+
+
+def get_enhancer() -> AIContentEnhancer:
+    """Dependency to get the shared AI enhancer"""
+    return get_ai_enhancer()
+
+
+def to_enhancement_request(body: EnhancementStreamRequest) -> EnhancementRequest:
+    """Convert the API request into an EnhancementRequest
+
+    Raises:
+        ValueError: If the content type or mode is unknown
+    """
+    try:
+        content_type = ContentType(body.content_type)
+    except ValueError:
+        valid_types = [ct.value for ct in ContentType]
+        raise ValueError(f"content_type must be one of {valid_types}")
+    try:
+        mode = EnhancementMode(body.mode)
+    except ValueError:
+        valid_modes = [m.value for m in EnhancementMode]
+        raise ValueError(f"mode must be one of {valid_modes}")
+
+    return EnhancementRequest(
+        content=body.content,
+        content_type=content_type,
+        mode=mode,
+        target_audience=body.target_audience,
+        keywords=body.keywords,
+        tone=body.tone,
+        max_length=body.max_length
+    )
+
+
+def result_payload(result: EnhancementResult) -> Dict[str, Any]:
+    """Convert the final enhancement result into its API representation"""
+    return {
+        "enhanced_content": result.enhanced_content,
+        "mode": result.mode.value,
+        "confidence_score": result.confidence_score,
+        "suggestions": result.suggestions,
+        "metadata": result.metadata
+    }
+
+
+def _sse_event(event: str, data: Dict[str, Any]) -> str:
+    """Format one Server-Sent Event"""
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+
+@router.post("/enhance/stream")
+async def stream_enhancement(
+    body: EnhancementStreamRequest,
+    enhancer: AIContentEnhancer = Depends(get_enhancer)
+):
+    """
+    Enhance content and stream the output as Server-Sent Events
+
+    Emits a `chunk` event ({"text": ...}) for each piece of the completion
+    as it arrives, then a single `result` event with the full enhanced
+    content, confidence score and suggestions.
+    """
+    try:
+        request = to_enhancement_request(body)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    async def events() -> AsyncIterator[str]:
+        async for item in enhancer.enhance_content_stream(request):
+            if isinstance(item, EnhancementResult):
+                yield _sse_event("result", result_payload(item))
+            else:
+                yield _sse_event("chunk", {"text": item})
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+
+@router.websocket("/enhance/ws")
+async def websocket_enhancement(
+    websocket: WebSocket,
+    enhancer: AIContentEnhancer = Depends(get_enhancer)
+):
+    """
+    Enhance content over a WebSocket
+
+    Message Format:
+        Incoming: an EnhancementStreamRequest as JSON, one per enhancement
+
+        Outgoing:
+        {"type": "chunk", "data": {"text": "..."}} for each partial output,
+        {"type": "result", "data": {...}} when an enhancement finishes, or
+        {"type": "error", "data": {"message": "..."}} for an invalid request
+    """
+    await websocket.accept()
+
+    try:
+        while True:
+            message = await websocket.receive_text()
+            try:
+                request = to_enhancement_request(EnhancementStreamRequest.model_validate_json(message))
+            except (ValidationError, ValueError) as e:
+                await websocket.send_json({"type": "error", "data": {"message": str(e)}})
+                continue
+
+            async for item in enhancer.enhance_content_stream(request):
+                if isinstance(item, EnhancementResult):
+                    await websocket.send_json({"type": "result", "data": result_payload(item)})
+                else:
+                    await websocket.send_json({"type": "chunk", "data": {"text": item}})
+
+    except WebSocketDisconnect:
+        logger.info("Enhancement WebSocket disconnected")
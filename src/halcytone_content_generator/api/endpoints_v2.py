@@ -12,7 +12,7 @@ from ..schemas.content import (
     Content, NewsletterContent, WebUpdateContent, SocialPost
 )
 from ..services.document_fetcher import DocumentFetcher
-from ..services.content_assembler_v2 import EnhancedContentAssembler
+from ..services.content_assembler_v2 import EnhancedContentAssembler, assemble_channels
 from ..services.content_validator import ContentValidator
 from ..services.publishers.email_publisher import EmailPublisher
 from ..services.publishers.web_publisher import WebPublisher
@@ -169,60 +169,64 @@ async def generate_enhanced_content(
         # Step 4: Generate content with enhanced assembler
         assembler = EnhancedContentAssembler(template_style=template_style)
 
-        # Generate newsletter with tone support
-        newsletter = None
+        # Resolve per-channel tones
+        email_tone = selected_tone
         if request.send_email:
-            # Determine tone for email channel
-            email_tone = selected_tone
             if request.per_channel_tones and 'email' in request.per_channel_tones:
                 email_tone = tone_manager.get_tone_profile(request.per_channel_tones['email'])
             elif not email_tone and settings.TONE_AUTO_SELECTION:
                 email_tone = tone_manager.select_tone("newsletter", "email")
 
-            custom_data = {
-                'stats': [
-                    {'value': '10K+', 'label': 'Users'},
-                    {'value': '95%', 'label': 'Accuracy'},
-                    {'value': '4.8⭐', 'label': 'Rating'}
-                ],
-                'tone_profile': email_tone.value if email_tone else None
-            }
-            newsletter_data = assembler.generate_newsletter(content, custom_data=custom_data)
-            newsletter = NewsletterContent(**newsletter_data) if newsletter_data else None
-
-        # Generate web update with tone and SEO
-        web_update = None
+        web_tone = selected_tone
         if request.publish_web:
-            # Determine tone for web channel
-            web_tone = selected_tone
             if request.per_channel_tones and 'web' in request.per_channel_tones:
                 web_tone = tone_manager.get_tone_profile(request.per_channel_tones['web'])
             elif not web_tone and settings.TONE_AUTO_SELECTION:
                 web_tone = tone_manager.select_tone("blog_post", "web")
 
-            web_update_data = assembler.generate_web_update(
-                content,
-                seo_optimize=seo_optimize
-            )
-            web_update = WebUpdateContent(**web_update_data) if web_update_data else None
-
-        # Generate social posts with tone support for multiple platforms
-        social_posts = []
+        platforms = social_platforms or ['twitter', 'linkedin', 'instagram', 'facebook']
+        social_tone = selected_tone
         if request.generate_social:
-            platforms = social_platforms or ['twitter', 'linkedin', 'instagram', 'facebook']
-
-            # Determine tone for social channel
-            social_tone = selected_tone
             if request.per_channel_tones and 'social' in request.per_channel_tones:
                 social_tone = tone_manager.get_tone_profile(request.per_channel_tones['social'])
             elif not social_tone and settings.TONE_AUTO_SELECTION:
                 social_tone = tone_manager.select_tone("social_post", "social")
 
-            social_posts_data = assembler.generate_social_posts(
+        # Render all requested channels in one pass, sharing derived fields
+        channels = [
+            channel for channel, enabled in (
+                ('email', request.send_email),
+                ('web', request.publish_web),
+                ('social', request.generate_social)
+            ) if enabled
+        ]
+        bundle = {'newsletter': None, 'web_update': None, 'social_posts': []}
+        if channels:
+            custom_data = {
+                'stats': [
+                    {'value': '10K+', 'label': 'Users'},
+                    {'value': '95%', 'label': 'Accuracy'},
+                    {'value': '4.8⭐', 'label': 'Rating'}
+                ],
+                'tone_profile': email_tone.value if email_tone else None
+            }
+            bundle = await assemble_channels(
+                assembler,
                 content,
-                platforms
+                channels=channels,
+                custom_data=custom_data,
+                seo_optimize=seo_optimize,
+                platforms=platforms
             )
-            social_posts = [SocialPost(**post) for post in social_posts_data] if social_posts_data else []
+
+        newsletter_data = bundle['newsletter']
+        newsletter = NewsletterContent(**newsletter_data) if newsletter_data else None
+
+        web_update_data = bundle['web_update']
+        web_update = WebUpdateContent(**web_update_data) if web_update_data else None
+
+        social_posts_data = bundle['social_posts']
+        social_posts = [SocialPost(**post) for post in social_posts_data] if social_posts_data else []
 
         # If preview only, return without sending
         if request.preview_only:
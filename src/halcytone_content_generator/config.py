@@ -34,10 +34,19 @@ class Settings(BaseSettings):
     GOOGLE_CREDENTIALS_JSON: Optional[str] = None
     NOTION_API_KEY: Optional[str] = None
     NOTION_DATABASE_ID: Optional[str] = None
+    # Comma-separated sources fetched concurrently (types or URLs); empty uses LIVING_DOC_TYPE
+    LIVING_DOC_SOURCES: str = ""
+    LIVING_DOC_SOURCE_TIMEOUT: float = 10.0  # Per-source timeout (seconds) when fetching several sources
+    LIVING_DOC_CACHE_TTL: int = 60  # Seconds a fetched document is served without revalidation (0 = always revalidate)
+    LIVING_DOC_CACHE_PERSISTENT: bool = False  # Also keep fetched documents in the cache_entries table
+    LIVING_DOC_CACHE_PERSISTENT_TTL: int = 86400  # Persistent document cache TTL in seconds
+    NOTION_SNAPSHOT_DIR: str = ""  # Directory for persisted Notion delta-sync snapshots (empty = memory only)
+    NOTION_FULL_SYNC_INTERVAL: int = 86400  # Seconds between full Notion resyncs (picks up deleted pages)
 
     # AI Services Configuration
     OPENAI_API_KEY: Optional[str] = None
     OPENAI_MODEL: str = "gpt-3.5-turbo"
+    OPENAI_BASE_URL: Optional[str] = None  # Override the OpenAI API endpoint (proxies, local stubs)
 
     # Security Configuration
     API_KEY_ENCRYPTION_KEY: str = "dev-encryption-key-replace-in-production"
@@ -49,15 +58,31 @@ class Settings(BaseSettings):
     AI_ENABLE_PERSONALIZATION: bool = True  # Enable AI personalization
     AI_ENABLE_AB_TESTING: bool = False  # Enable A/B testing variations
     AI_DEFAULT_VARIATIONS: int = 3  # Default number of A/B test variations
+    AI_MAX_CONCURRENT_REQUESTS: int = 8  # Concurrent OpenAI calls per enhancer
+    AI_REQUEST_TIMEOUT: float = 60.0  # Per-request OpenAI timeout in seconds
+    AI_BATCH_MAX_ITEMS: int = 6  # Small enhancement requests packed into one OpenAI call
+    AI_PROMPT_TOKEN_BUDGET: int = 0  # Max prompt tokens per request (0 = model context window minus completion)
+    AI_RESPONSE_CACHE_SIZE: int = 512  # Cached AI completions kept in memory (0 = disabled)
+    AI_RESPONSE_CACHE_TTL: int = 3600  # AI completion cache TTL in seconds
+
+    # Quality Scoring Settings
+    QUALITY_SCORING_WORKERS: int = 0  # Process pool size for batch scoring (0 = one per CPU)
+    QUALITY_SCORING_BATCH_MAX_ITEMS: int = 100  # Maximum drafts per batch scoring request
+    QUALITY_SCORE_CACHE_SIZE: int = 1024  # Memoized quality scores kept in memory (0 = disabled)
+    QUALITY_SCORE_CACHE_PERSISTENT: bool = False  # Also persist scores in the cache_entries table
+    QUALITY_SCORE_CACHE_TTL: int = 86400  # Persistent quality score TTL in seconds
 
     # Email Configuration
     EMAIL_BATCH_SIZE: int = 100
     EMAIL_RATE_LIMIT: int = 10  # emails per second
+    EMAIL_MAX_IN_FLIGHT_BATCHES: int = 4  # Bulk send batches awaiting the CRM at once (1 = one after another)
 
     # Content Generation Settings
     NEWSLETTER_TEMPLATE: str = "default"
     WEB_UPDATE_TEMPLATE: str = "default"
     SOCIAL_PLATFORMS: list[str] = ["twitter", "linkedin"]
+    TEMPLATE_BYTECODE_CACHE: bool = True  # Cache compiled Jinja template bytecode on disk across processes
+    TEMPLATE_BYTECODE_CACHE_DIR: str = ""  # Bytecode cache directory (empty = per-user temp directory)
 
     # Monitoring & Observability
     CORRELATION_ID_HEADER: str = "X-Correlation-ID"
@@ -89,6 +114,20 @@ class Settings(BaseSettings):
     BATCH_MAX_DAYS: int = 30  # Maximum days to generate content for
     BATCH_DEFAULT_PERIOD: str = "week"  # Default batch period
     BATCH_ENABLE_SCHEDULING: bool = True  # Enable scheduled batch generation
+    BATCH_MAX_CONCURRENCY: int = 8  # Batch items generated and validated at once
+    BATCH_JOBS_PERSISTENT: bool = False  # Persist batch jobs in the batch_jobs table and resume them on startup
+    BATCH_JOB_LEASE_SECONDS: int = 300  # Heartbeat age after which another worker may resume a running batch
+
+    # Content Sync Worker Pool
+    SYNC_MAX_WORKERS: int = 5  # Content sync jobs worked at once
+    SYNC_QUEUE_MAX_SIZE: int = 1000  # Queued sync jobs before producers are held back (0 = unbounded)
+    SYNC_CHANNEL_TIMEOUT: float = 120.0  # Seconds per attempt for one channel of a sync job
+    SYNC_EMAIL_TIMEOUT: float = 900.0  # Email sends to the whole list, so it gets a longer budget
+    SYNC_CHANNEL_RETRY_DELAY: float = 0.25  # Base backoff between channel retries (doubles per attempt)
+    SYNC_VERSION_CACHE_SIZE: int = 1024  # Documents whose last synced version is kept in memory
+    CONTENT_VERSIONS_PERSISTENT: bool = False  # Share sync dedupe state across restarts and replicas via the database
+    SYNC_JOB_HISTORY_SIZE: int = 1000  # Sync jobs kept in memory; the oldest finished ones are evicted first
+    SYNC_JOB_ARCHIVE: bool = False  # Archive evicted and cleaned up sync jobs to the sync_job_archive table
 
     # User Segmentation Settings
     USER_SEGMENTS_ENABLED: bool = True
@@ -103,6 +103,8 @@ class Base(DeclarativeBase):
 from .models_content import ContentRecord, ContentVersion, ContentPublishLog
 from .models_audit import AuditLog, ApiRequestLog, UserActivity
 from .models_cache import CacheEntry, CacheInvalidation
+from .models_batch import BatchJob, BatchJobItem
+from .models_sync import SyncJobArchive
 
 
 __all__ = [
@@ -116,4 +118,7 @@ __all__ = [
     'UserActivity',
     'CacheEntry',
     'CacheInvalidation',
+    'BatchJob',
+    'BatchJobItem',
+    'SyncJobArchive',
 ]
\ No newline at end of file
@@ -0,0 +1,87 @@
+"""
+Batch Job Database Models
+Durable batch generation jobs and the state of each planned item
+"""
+
+from sqlalchemy import (
+    Column, String, Text, JSON, Boolean, Integer,
+    ForeignKey, Index, UniqueConstraint, DateTime
+)
+from sqlalchemy.orm import relationship
+
+from .models import Base
+
+
+class BatchJob(Base):
+    """
+    A batch generation job and the inputs needed to resume it
+    """
+    __tablename__ = 'batch_jobs'
+
+    # Job identification
+    batch_id = Column(String(100), nullable=False, unique=True)
+    status = Column(String(50), nullable=False, default='pending')  # pending, running, completed, failed, cancelled
+
+    # Generation inputs
+    period = Column(String(20), nullable=True)
+    channels = Column(JSON, default=list)
+    dry_run = Column(Boolean, default=False, nullable=False)
+    template_variety = Column(Boolean, default=True, nullable=False)
+    document_content = Column(JSON, nullable=True)  # Living document snapshot items are generated from
+
+    # Control and timing
+    cancel_requested = Column(Boolean, default=False, nullable=False)
+    completed_at = Column(DateTime(timezone=True), nullable=True)
+    scheduled_at = Column(DateTime(timezone=True), nullable=True)
+    errors = Column(JSON, default=list)
+
+    # Lease held by the worker running the job; expires when the heartbeat goes stale
+    owner = Column(String(150), nullable=True)
+    heartbeat_at = Column(DateTime(timezone=True), nullable=True)
+
+    # Relationships
+    items = relationship(
+        "BatchJobItem",
+        back_populates="job",
+        cascade="all, delete-orphan",
+        order_by="BatchJobItem.item_index"
+    )
+
+    # Indexes
+    __table_args__ = (
+        Index('idx_batch_job_lease', 'status', 'heartbeat_at'),
+    )
+
+
+class BatchJobItem(Base):
+    """
+    One planned item of a batch job, checkpointed as it finishes
+    """
+    __tablename__ = 'batch_job_items'
+
+    # Link to job
+    job_id = Column(String(36), ForeignKey('batch_jobs.id'), nullable=False)
+    item_index = Column(Integer, nullable=False)
+    item_id = Column(String(150), nullable=False)
+
+    # Plan
+    channel = Column(String(50), nullable=False)
+    template = Column(String(50), nullable=True)
+    platform = Column(String(50), nullable=True)
+    scheduled_for = Column(DateTime(timezone=True), nullable=True)
+
+    # Progress
+    # pending, generating, validating, completed, rejected, failed, cancelled
+    status = Column(String(50), nullable=False, default='pending')
+    started_at = Column(DateTime(timezone=True), nullable=True)
+    completed_at = Column(DateTime(timezone=True), nullable=True)
+    error = Column(Text, nullable=True)
+    result = Column(JSON, nullable=True)  # Serialized BatchContentItem
+
+    # Relationships
+    job = relationship("BatchJob", back_populates="items")
+
+    # Indexes
+    __table_args__ = (
+        UniqueConstraint('job_id', 'item_index', name='uq_batch_job_item'),
+    )
@@ -37,6 +37,7 @@ class ContentRecord(Base):
     status = Column(String(50), default="draft", index=True)  # draft, published, archived
     source_doc_id = Column(String(500), nullable=True)
     source_doc_type = Column(String(50), nullable=True)  # google_docs, notion, internal
+    content_hash = Column(String(64), nullable=True)  # SHA256 of the current version (content sync)
 
     # SEO and social
     seo_metadata = Column(JSON, default=dict)
@@ -111,6 +112,10 @@ class ContentVersion(Base):
     comment = Column(Text, nullable=True)  # Version comment/reason
     created_by = Column(String(200), nullable=True)
 
+    # Content sync tracking
+    content_hash = Column(String(64), nullable=True)  # SHA256 hash used for dedupe
+    channels_published = Column(JSON, default=dict)  # channel -> ISO publish time
+
     # Relationships
     content = relationship("ContentRecord", back_populates="versions")
 
@@ -118,6 +123,7 @@ class ContentVersion(Base):
     __table_args__ = (
         UniqueConstraint('content_id', 'version_number', name='uq_content_version'),
         Index('idx_content_versions', 'content_id', 'version_number'),
+        Index('idx_content_version_hash', 'content_id', 'content_hash'),
     )
 
 
@@ -0,0 +1,43 @@
+"""
+Content Sync Database Models
+Archive of finished content sync jobs evicted from the in-process history
+"""
+
+from sqlalchemy import (
+    Column, String, JSON, Integer,
+    Index, DateTime
+)
+
+from .models import Base
+
+
+class SyncJobArchive(Base):
+    """
+    A finished content sync job
+    """
+    __tablename__ = 'sync_job_archive'
+
+    # Job identification
+    job_id = Column(String(100), nullable=False, unique=True)
+    source_document_id = Column(String(500), nullable=False)
+    status = Column(String(50), nullable=False)  # completed, partial, failed
+    priority = Column(Integer, nullable=False, default=1)  # 0 high, 1 normal, 2 low
+    channels = Column(JSON, default=list)
+    correlation_id = Column(String(100), nullable=True)
+
+    # Timing
+    job_created_at = Column(DateTime(timezone=True), nullable=False)
+    scheduled_for = Column(DateTime(timezone=True), nullable=True)
+    started_at = Column(DateTime(timezone=True), nullable=True)
+    completed_at = Column(DateTime(timezone=True), nullable=True)
+
+    # Outcome
+    results = Column(JSON, default=dict)
+    errors = Column(JSON, default=list)
+    job_metadata = Column(JSON, default=dict)  # Per-channel outcomes, queue wait
+
+    # Indexes
+    __table_args__ = (
+        Index('idx_sync_archive_document', 'source_document_id', 'job_created_at'),
+        Index('idx_sync_archive_status', 'status', 'job_created_at'),
+    )
@@ -64,6 +64,31 @@ async def lifespan(app: FastAPI):
     from .api.websocket_endpoints import initialize_websocket_services, cleanup_websocket_services
     await initialize_websocket_services()
 
+    # Precompile AI prompt templates so the first enhancement doesn't pay for it
+    try:
+        from .templates.ai_prompts import get_prompt_templates
+        compiled = get_prompt_templates().compile_all()
+        logger.info(f"Compiled {compiled} AI prompt templates")
+    except Exception as e:
+        logger.warning(f"AI prompt template warm-up failed: {e}")
+
+    # Compile newsletter/web templates into the shared Jinja environment
+    try:
+        from .services.content_assembler_v2 import warm_templates
+        logger.info(f"Compiled {warm_templates()} content templates")
+    except Exception as e:
+        logger.warning(f"Content template warm-up failed: {e}")
+
+    # Resume batches a previous worker left unfinished
+    try:
+        from .api.endpoints_batch import build_batch_engine
+        from .services.batch_jobs import get_batch_executor
+        resumed = await get_batch_executor().resume_unfinished(build_batch_engine)
+        if resumed:
+            logger.info(f"Resumed {resumed} unfinished batches")
+    except Exception as e:
+        logger.warning(f"Batch resume failed: {e}")
+
     yield
 
     # Cleanup services
@@ -77,6 +102,28 @@ async def lifespan(app: FastAPI):
     # Cleanup WebSocket services
     await cleanup_websocket_services()
 
+    # Stop content sync workers
+    try:
+        from .api import endpoints_critical
+        if endpoints_critical._sync_service is not None:
+            await endpoints_critical._sync_service.stop()
+    except Exception as e:
+        logger.warning(f"Content sync shutdown failed: {e}")
+
+    # Stop background batches; they stay resumable
+    try:
+        from .services.batch_jobs import get_batch_executor
+        await get_batch_executor().shutdown()
+    except Exception as e:
+        logger.warning(f"Batch executor shutdown failed: {e}")
+
+    # Release batch quality scoring workers
+    try:
+        from .services.content_quality_scorer import shutdown_content_quality_scorer
+        shutdown_content_quality_scorer()
+    except Exception as e:
+        logger.warning(f"Quality scorer shutdown failed: {e}")
+
     logger.info("Shutting down Halcytone Content Generator Service...")
 
 
@@ -278,6 +325,10 @@ app.include_router(endpoints.router, prefix="/api/v1")
 from .api import endpoints_v2
 app.include_router(endpoints_v2.router, prefix="/api")
 
+# Include streaming AI enhancement endpoints
+from .api import endpoints_streaming
+app.include_router(endpoints_streaming.router, prefix="/api")
+
 # Include critical production endpoints
 from .api import endpoints_critical
 app.include_router(endpoints_critical.router)
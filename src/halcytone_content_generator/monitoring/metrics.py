@@ -177,6 +177,44 @@ cache_size_bytes = Gauge(
     'Cache size in bytes'
 )
 
+quality_score_cache_hits_total = Counter(
+    'quality_score_cache_hits_total',
+    'Quality score cache hits',
+    ['tier']
+)
+
+quality_score_cache_misses_total = Counter(
+    'quality_score_cache_misses_total',
+    'Quality score cache misses',
+    ['tier']
+)
+
+# AI token metrics
+ai_prompt_tokens_total = Counter(
+    'ai_prompt_tokens_total',
+    'Prompt tokens sent to AI models',
+    ['model']
+)
+
+ai_completion_tokens_total = Counter(
+    'ai_completion_tokens_total',
+    'Completion tokens received from AI models',
+    ['model']
+)
+
+ai_prompt_size_tokens = Histogram(
+    'ai_prompt_size_tokens',
+    'Prompt size in tokens per AI request',
+    ['model'],
+    buckets=[64, 128, 256, 512, 1024, 2048, 4096, 8192, 16384, 32768]
+)
+
+ai_prompts_trimmed_total = Counter(
+    'ai_prompts_trimmed_total',
+    'AI prompts trimmed to fit the token budget',
+    ['model']
+)
+
 # Business metrics
 active_users_total = Gauge(
     'active_users_total',
@@ -200,6 +238,29 @@ batch_processing_duration_seconds = Histogram(
     ['batch_type']
 )
 
+# Content sync worker pool metrics
+content_sync_queue_depth = Gauge(
+    'content_sync_queue_depth',
+    'Content sync jobs waiting for a worker'
+)
+
+content_sync_scheduled_jobs = Gauge(
+    'content_sync_scheduled_jobs',
+    'Content sync jobs waiting for their scheduled time'
+)
+
+content_sync_active_jobs = Gauge(
+    'content_sync_active_jobs',
+    'Content sync jobs being worked'
+)
+
+content_sync_queue_wait_seconds = Histogram(
+    'content_sync_queue_wait_seconds',
+    'Time content sync jobs wait on the queue before a worker takes them',
+    ['priority'],
+    buckets=[0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 15.0, 60.0, 300.0]
+)
+
 
 def setup_metrics(app_info_dict: Dict[str, str]) -> CollectorRegistry:
     """Setup metrics with application information"""
@@ -489,6 +550,44 @@ def track_cache_operation(operation: str, success: bool):
     ).inc()
 
 
+def record_metric(track: Callable[..., Any], *args, **kwargs):
+    """Call a track_* function from service code, logging failures instead of raising them"""
+    try:
+        track(*args, **kwargs)
+    except Exception as e:
+        logger.warning(f"Failed to record metric {track.__name__}: {e}")
+
+
+def track_quality_score_cache(tier: str, hit: bool):
+    """Track quality score cache lookups"""
+    if hit:
+        quality_score_cache_hits_total.labels(tier=tier).inc()
+    else:
+        quality_score_cache_misses_total.labels(tier=tier).inc()
+
+
+def track_ai_token_usage(model: str, prompt_tokens: int, completion_tokens: int,
+                         trimmed: bool = False):
+    """Track AI prompt and completion token usage"""
+    ai_prompt_tokens_total.labels(model=model).inc(prompt_tokens)
+    ai_completion_tokens_total.labels(model=model).inc(completion_tokens)
+    ai_prompt_size_tokens.labels(model=model).observe(prompt_tokens)
+    if trimmed:
+        ai_prompts_trimmed_total.labels(model=model).inc()
+
+
+def update_content_sync_queue(queued: int, scheduled: int, active: int):
+    """Update content sync worker pool gauges"""
+    content_sync_queue_depth.set(queued)
+    content_sync_scheduled_jobs.set(scheduled)
+    content_sync_active_jobs.set(active)
+
+
+def track_content_sync_wait(priority: str, wait_seconds: float):
+    """Track how long a content sync job waited for a worker"""
+    content_sync_queue_wait_seconds.labels(priority=priority).observe(wait_seconds)
+
+
 def update_business_metrics(active_users: int, queue_size: int):
     """Update business-related metrics"""
     active_users_total.set(active_users)
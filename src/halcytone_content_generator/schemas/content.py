@@ -237,6 +237,21 @@ class BatchScheduleResponse(BaseModel):
     dry_run: bool = Field(False, description="Whether this was a dry run")
 
 
+class BatchItemStatus(BaseModel):
+    """Live state of a single planned batch item"""
+    index: int = Field(..., description="Position of the item in the batch plan")
+    item_id: str = Field(..., description="Item identifier")
+    channel: str = Field(..., description="Channel the item is generated for")
+    status: str = Field(
+        ...,
+        description="Item status: pending, generating, validating, completed, rejected, failed, cancelled"
+    )
+    scheduled_for: Optional[datetime] = Field(None, description="Planned publish time")
+    started_at: Optional[datetime] = Field(None, description="When work on the item started")
+    completed_at: Optional[datetime] = Field(None, description="When the item reached a final state")
+    error: Optional[str] = Field(None, description="Why the item was rejected or failed")
+
+
 class BatchStatusResponse(BaseModel):
     """Response model for batch status"""
     batch_id: str = Field(..., description="Batch identifier")
@@ -245,8 +260,46 @@ class BatchStatusResponse(BaseModel):
     items_published: int = Field(..., description="Items successfully published")
     items_pending: int = Field(..., description="Items pending publication")
     items_failed: int = Field(..., description="Items that failed to publish")
+    items_cancelled: int = Field(0, description="Items cancelled before they were generated")
     last_updated: datetime = Field(..., description="Last status update time")
     errors: List[str] = Field(default_factory=list, description="Any errors encountered")
+    items: List[BatchItemStatus] = Field(default_factory=list, description="Per-item progress")
+
+
+class BatchScoreRequest(BaseModel):
+    """Request model for scoring a list of drafts"""
+    contents: List[str] = Field(..., min_length=1, description="Draft contents to score")
+    content_type: str = Field("web", description="Content type: email, web, twitter, linkedin, facebook, instagram")
+    include_ai_analysis: bool = Field(False, description="Blend in AI-powered quality assessment")
+
+
+class BatchScoreItem(BaseModel):
+    """Quality score for a single draft in a batch"""
+    index: int = Field(..., description="Position of the draft in the request")
+    overall_score: float = Field(..., description="Overall quality score (0-100)")
+    quality_level: str = Field(..., description="Quality level classification")
+    category_scores: Dict[str, float] = Field(default_factory=dict, description="Scores by category")
+    ai_assessment_score: float = Field(0.0, description="AI assessment score, if requested")
+    improvement_suggestions: List[str] = Field(default_factory=list, description="Suggested improvements")
+
+
+class BatchScoreResponse(BaseModel):
+    """Response model for batch quality scoring"""
+    content_type: str = Field(..., description="Content type the drafts were scored as")
+    results: List[BatchScoreItem] = Field(..., description="Scores in request order")
+    total_items: int = Field(..., description="Number of drafts scored")
+    average_score: float = Field(..., description="Mean overall score across drafts")
+
+
+class EnhancementStreamRequest(BaseModel):
+    """Request model for a streamed AI enhancement"""
+    content: str = Field(..., min_length=1, description="Content to enhance")
+    content_type: str = Field("web", description="Content type: email, web, twitter, linkedin, facebook, instagram")
+    mode: str = Field("improve_clarity", description="Enhancement mode, e.g. improve_clarity, increase_engagement")
+    target_audience: Optional[str] = Field(None, description="Audience to write for")
+    keywords: List[str] = Field(default_factory=list, description="Keywords to include naturally")
+    tone: Optional[str] = Field(None, description="Desired tone")
+    max_length: Optional[int] = Field(None, gt=0, description="Maximum length in characters")
 
 
 class ContentValidationRequest(BaseModel):
@@ -18,7 +18,7 @@ from enum import Enum
 from statistics import mean, stdev
 
 from ..config import get_settings
-from .ai_content_enhancer import AIContentEnhancer
+from .ai_content_enhancer import AIContentEnhancer, ContentType, EnhancementMode, EnhancementRequest, EnhancementResult
 from .personalization import ContentPersonalizationEngine
 
 
@@ -294,51 +294,68 @@ class ABTestingFramework:
         base_content: str,
         variation_count: int
     ) -> List[ABTestVariation]:
-        """Generate AI-powered content variations."""
+        """Generate AI-powered content variations in one batched AI request."""
         variations = []
         variation_types = [VariationType.VARIANT_A, VariationType.VARIANT_B,
                           VariationType.VARIANT_C, VariationType.VARIANT_D]
+        count = min(variation_count, len(variation_types))
+        content_type = (ContentType.EMAIL
+                        if test_type in [ABTestType.SUBJECT_LINE, ABTestType.EMAIL_TEMPLATE]
+                        else ContentType.WEB)
+
+        requests = [
+            EnhancementRequest(
+                content=base_content,
+                content_type=content_type,
+                mode=EnhancementMode.INCREASE_ENGAGEMENT,
+                context={
+                    "test_type": test_type.value,
+                    "variation_number": i + 1,
+                    "enhancement_prompt": self._create_variation_prompt(test_type, i + 1)
+                }
+            )
+            for i in range(count)
+        ]
 
-        for i in range(min(variation_count, len(variation_types))):
-            try:
-                # Create enhancement prompt for A/B testing
-                enhancement_prompt = self._create_variation_prompt(test_type, i + 1)
-
-                # Generate variation using AI enhancer
-                enhanced_content = await self.ai_enhancer.enhance_content(
-                    content=base_content,
-                    enhancement_type="ab_testing",
-                    context_data={
-                        "test_type": test_type.value,
-                        "variation_number": i + 1,
-                        "enhancement_prompt": enhancement_prompt
+        try:
+            results = await self.ai_enhancer.enhance_batch(requests)
+        except Exception as e:
+            logger.warning(f"Failed to generate AI variations: {e}")
+            results = [None] * count
+
+        for i, enhanced_content in enumerate(results):
+            if self._is_ai_variation(enhanced_content, base_content):
+                variation = ABTestVariation(
+                    variation_id=f"{test_id}_{variation_types[i].value}",
+                    variation_type=variation_types[i],
+                    name=f"AI Variant {chr(65 + i)}",
+                    content=enhanced_content.enhanced_content,
+                    traffic_allocation=1.0 / (variation_count + 1),
+                    metadata={
+                        "generation_method": "ai_enhanced",
+                        "enhancement_score": enhanced_content.enhancement_score
                     }
                 )
-
-                if enhanced_content and enhanced_content.enhanced_content:
-                    variation = ABTestVariation(
-                        variation_id=f"{test_id}_{variation_types[i].value}",
-                        variation_type=variation_types[i],
-                        name=f"AI Variant {chr(65 + i)}",
-                        content=enhanced_content.enhanced_content,
-                        traffic_allocation=1.0 / (variation_count + 1),
-                        metadata={
-                            "generation_method": "ai_enhanced",
-                            "enhancement_score": enhanced_content.enhancement_score
-                        }
-                    )
-                    variations.append(variation)
-
-            except Exception as e:
-                logger.warning(f"Failed to generate AI variation {i + 1}: {e}")
+            else:
                 # Fallback to rule-based generation
-                rule_variation = self._generate_single_rule_variation(
+                variation = self._generate_single_rule_variation(
                     test_id, test_type, base_content, i + 1
                 )
-                variations.append(rule_variation)
+            variations.append(variation)
 
         return variations
 
+    @staticmethod
+    def _is_ai_variation(result: Optional[EnhancementResult], base_content: str) -> bool:
+        """Whether an enhancement result is a real rewrite rather than the original echoed back"""
+        # Unconfigured or failed enhancement returns the original text with zero confidence
+        return bool(
+            result
+            and result.enhanced_content
+            and result.enhancement_score > 0
+            and result.enhanced_content.strip() != base_content.strip()
+        )
+
     def _generate_rule_based_variations(
         self,
         test_id: str,
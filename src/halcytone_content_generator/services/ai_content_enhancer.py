@@ -4,7 +4,7 @@ Sprint 8 - AI Enhancement & Personalization
 """
 import json
 import logging
-from typing import Dict, List, Optional, Any, Tuple
+from typing import AsyncIterator, Dict, List, Optional, Any, Tuple, Union
 from datetime import datetime
 from enum import Enum
 import asyncio
@@ -14,9 +14,24 @@ from ..config import get_settings
 from ..schemas.content import Content, SocialPost, NewsletterContent, WebUpdateContent
 from ..core.resilience import RetryPolicy, CircuitBreaker
 from ..templates.ai_prompts import get_prompt_templates, ToneStyle
+from .ai_response_cache import CompletionCache, make_completion_key
+from .prompt_compiler import CompiledMessages, PromptCompiler, record_token_usage
 
 logger = logging.getLogger(__name__)
 
+BATCH_PROMPT = (
+    "Complete each task in the JSON payload below independently. For every task, apply "
+    "its instructions to the content it references. Respond with JSON only, matching "
+    "this schema: {\"items\": [{\"id\": <task id>, \"content\": <rewritten content>}]}. "
+    "Return exactly one item per task id."
+)
+BATCH_MAX_OUTPUT_TOKENS = 4096
+
+SYSTEM_PROMPT = (
+    "You are a professional content writer specializing in wellness technology and "
+    "Breathscape products."
+)
+
 
 class ContentType(Enum):
     """Content types for AI enhancement"""
@@ -65,6 +80,11 @@ class EnhancementResult:
     suggestions: List[str] = field(default_factory=list)
     metadata: Dict[str, Any] = field(default_factory=dict)
 
+    @property
+    def enhancement_score(self) -> float:
+        """Alias of confidence_score used in A/B variation metadata"""
+        return self.confidence_score
+
 
 @dataclass
 class QualityScore:
@@ -82,6 +102,8 @@ class PromptManager:
 
     def __init__(self):
         self.prompts = self._initialize_prompts()
+        self._compiled: Dict[Tuple[EnhancementMode, ContentType], str] = {}
+        self.compile_all()
 
     def _initialize_prompts(self) -> Dict[str, Dict[str, str]]:
         """Initialize prompt templates"""
@@ -120,35 +142,56 @@ class PromptManager:
             }
         }
 
-    def get_prompt(self, mode: EnhancementMode, content_type: ContentType,
-                   context: Optional[Dict[str, Any]] = None) -> str:
-        """Get appropriate prompt for enhancement request"""
+    def compile_all(self) -> int:
+        """
+        Resolve the base prompt for every mode and content type once
+
+        Returns:
+            Number of compiled prompts
+        """
+        self._compiled = {
+            (mode, content_type): self._resolve_prompt(mode, content_type)
+            for mode in EnhancementMode
+            for content_type in ContentType
+        }
+        return len(self._compiled)
+
+    def _resolve_prompt(self, mode: EnhancementMode, content_type: ContentType) -> str:
+        """Pick the most specific template for a mode and content type"""
         mode_prompts = self.prompts.get(mode.value, {})
 
         # Try to get specific prompt for content type
         if content_type == ContentType.SOCIAL_TWITTER:
-            prompt = mode_prompts.get("twitter", mode_prompts.get("base", ""))
+            return mode_prompts.get("twitter", mode_prompts.get("base", ""))
         elif content_type == ContentType.SOCIAL_LINKEDIN:
-            prompt = mode_prompts.get("linkedin", mode_prompts.get("base", ""))
+            return mode_prompts.get("linkedin", mode_prompts.get("base", ""))
         elif content_type in [ContentType.SOCIAL_FACEBOOK, ContentType.SOCIAL_INSTAGRAM]:
-            prompt = mode_prompts.get("social", mode_prompts.get("base", ""))
+            return mode_prompts.get("social", mode_prompts.get("base", ""))
         elif content_type == ContentType.EMAIL:
-            prompt = mode_prompts.get("email", mode_prompts.get("base", ""))
+            return mode_prompts.get("email", mode_prompts.get("base", ""))
         elif content_type == ContentType.WEB:
-            prompt = mode_prompts.get("web", mode_prompts.get("base", ""))
-        else:
-            prompt = mode_prompts.get("base", "")
+            return mode_prompts.get("web", mode_prompts.get("base", ""))
+        return mode_prompts.get("base", "")
+
+    def get_prompt(self, mode: EnhancementMode, content_type: ContentType,
+                   context: Optional[Dict[str, Any]] = None) -> str:
+        """Get appropriate prompt for enhancement request"""
+        prompt = self._compiled.get((mode, content_type))
+        if prompt is None:
+            prompt = self._resolve_prompt(mode, content_type)
 
         # Add context if provided
         if context:
+            parts = [prompt]
             if context.get("target_audience"):
-                prompt += f"\n\nTarget Audience: {context['target_audience']}"
+                parts.append(f"Target Audience: {context['target_audience']}")
             if context.get("keywords"):
-                prompt += f"\n\nInclude these keywords naturally: {', '.join(context['keywords'])}"
+                parts.append(f"Include these keywords naturally: {', '.join(context['keywords'])}")
             if context.get("tone"):
-                prompt += f"\n\nTone: {context['tone']}"
+                parts.append(f"Tone: {context['tone']}")
             if context.get("max_length"):
-                prompt += f"\n\nMaximum length: {context['max_length']} characters"
+                parts.append(f"Maximum length: {context['max_length']} characters")
+            prompt = "\n\n".join(parts)
 
         return prompt
 
@@ -157,6 +200,7 @@ class PromptManager:
         if mode not in self.prompts:
             self.prompts[mode] = {}
         self.prompts[mode][content_type] = prompt
+        self.compile_all()
 
 
 class AIContentEnhancer:
@@ -173,15 +217,33 @@ class AIContentEnhancer:
             recovery_timeout=60,
             expected_exception=Exception
         )
+        self.max_concurrent_requests = self.settings.AI_MAX_CONCURRENT_REQUESTS
+        self.request_timeout = self.settings.AI_REQUEST_TIMEOUT
+        self.base_url = self.settings.OPENAI_BASE_URL
+        self._request_semaphore: Optional[asyncio.Semaphore] = None
+        self._semaphore_loop = None
+        self.batch_max_items = self.settings.AI_BATCH_MAX_ITEMS
+        self.response_cache = CompletionCache(
+            max_entries=self.settings.AI_RESPONSE_CACHE_SIZE,
+            ttl_seconds=self.settings.AI_RESPONSE_CACHE_TTL
+        )
+        self.prompt_compiler = PromptCompiler(
+            self.model,
+            prompt_budget=self.settings.AI_PROMPT_TOKEN_BUDGET
+        )
         self._client = None
 
     @property
     def client(self):
-        """Lazy initialization of OpenAI client"""
+        """Lazy initialization of the async OpenAI client"""
         if self._client is None and self.api_key:
             try:
                 import openai
-                self._client = openai.OpenAI(api_key=self.api_key)
+                self._client = openai.AsyncOpenAI(
+                    api_key=self.api_key,
+                    base_url=self.base_url,
+                    timeout=self.request_timeout
+                )
             except ImportError:
                 logger.warning("OpenAI library not installed. Install with: pip install openai")
             except Exception as e:
@@ -205,87 +267,327 @@ class AIContentEnhancer:
         """
         if not self.is_configured():
             logger.warning("AI enhancement not configured, returning original content")
-            return EnhancementResult(
-                original_content=request.content,
-                enhanced_content=request.content,
-                mode=request.mode,
-                confidence_score=0.0,
-                suggestions=["Configure OpenAI API key for AI enhancements"]
-            )
+            return self._unchanged_result(request, "Configure OpenAI API key for AI enhancements")
 
         try:
-            # Build context for prompt
-            context = {
-                "target_audience": request.target_audience,
-                "keywords": request.keywords,
-                "tone": request.tone,
-                "max_length": request.max_length
-            }
-
             # Get appropriate prompt
-            prompt = self.prompt_manager.get_prompt(
-                request.mode,
-                request.content_type,
-                context
-            )
+            prompt = self._build_prompt(request)
 
             # Make API call with circuit breaker
             enhanced = await self._call_openai_api(prompt, request.content)
 
-            # Calculate confidence score based on response
-            confidence = self._calculate_confidence(request.content, enhanced)
+            return await self._build_result(request, enhanced)
 
-            # Generate suggestions
-            suggestions = await self._generate_suggestions(
-                request.content,
-                enhanced,
-                request.content_type
-            )
+        except Exception as e:
+            logger.error(f"Enhancement failed: {e}")
+            return self._unchanged_result(request, f"Enhancement failed: {str(e)}")
 
-            return EnhancementResult(
-                original_content=request.content,
-                enhanced_content=enhanced,
-                mode=request.mode,
-                confidence_score=confidence,
-                suggestions=suggestions,
-                metadata={
-                    "model": self.model,
-                    "timestamp": datetime.utcnow().isoformat(),
-                    "content_type": request.content_type.value
-                }
-            )
+    async def enhance_content_stream(
+        self, request: EnhancementRequest
+    ) -> AsyncIterator[Union[str, EnhancementResult]]:
+        """
+        Enhance content, yielding text chunks as the completion arrives
+
+        The last item yielded is always the EnhancementResult for the full
+        text, with confidence and suggestions computed once the stream ends.
+        On failure the result carries the original content, as with
+        enhance_content, after whatever chunks were already yielded.
+
+        Args:
+            request: Enhancement request with content and parameters
+
+        Yields:
+            Text chunks, then the final EnhancementResult
+        """
+        if not self.is_configured():
+            logger.warning("AI enhancement not configured, returning original content")
+            yield self._unchanged_result(request, "Configure OpenAI API key for AI enhancements")
+            return
 
+        parts = []
+        chunks = self._stream_openai_api(self._build_prompt(request), request.content)
+        try:
+            async for chunk in chunks:
+                parts.append(chunk)
+                yield chunk
+            result = await self._build_result(request, "".join(parts).strip(), {"streamed": True})
         except Exception as e:
-            logger.error(f"Enhancement failed: {e}")
-            return EnhancementResult(
-                original_content=request.content,
-                enhanced_content=request.content,
-                mode=request.mode,
-                confidence_score=0.0,
-                suggestions=[f"Enhancement failed: {str(e)}"]
-            )
+            logger.error(f"Streaming enhancement failed: {e}")
+            result = self._unchanged_result(request, f"Enhancement failed: {str(e)}")
+        finally:
+            # Close the upstream stream promptly if our consumer stops early
+            await chunks.aclose()
+        yield result
+
+    @staticmethod
+    def _unchanged_result(request: EnhancementRequest, suggestion: str) -> EnhancementResult:
+        """Result returning the original content when enhancement is unavailable"""
+        return EnhancementResult(
+            original_content=request.content,
+            enhanced_content=request.content,
+            mode=request.mode,
+            confidence_score=0.0,
+            suggestions=[suggestion]
+        )
+
+    def _build_prompt(self, request: EnhancementRequest) -> str:
+        """Build the enhancement instructions for a request"""
+        context = {
+            "target_audience": request.target_audience,
+            "keywords": request.keywords,
+            "tone": request.tone,
+            "max_length": request.max_length
+        }
+        prompt = self.prompt_manager.get_prompt(request.mode, request.content_type, context)
+        if request.context.get("enhancement_prompt"):
+            prompt += f"\n\nVariation brief: {request.context['enhancement_prompt']}"
+        return prompt
+
+    async def _build_result(self, request: EnhancementRequest, enhanced: str,
+                            metadata: Optional[Dict[str, Any]] = None) -> EnhancementResult:
+        """Score an enhanced text and wrap it in an EnhancementResult"""
+        # Calculate confidence score based on response
+        confidence = self._calculate_confidence(request.content, enhanced)
+
+        # Generate suggestions
+        suggestions = await self._generate_suggestions(
+            request.content,
+            enhanced,
+            request.content_type
+        )
+
+        return EnhancementResult(
+            original_content=request.content,
+            enhanced_content=enhanced,
+            mode=request.mode,
+            confidence_score=confidence,
+            suggestions=suggestions,
+            metadata={
+                "model": self.model,
+                "timestamp": datetime.utcnow().isoformat(),
+                "content_type": request.content_type.value,
+                **(metadata or {})
+            }
+        )
+
+    async def enhance_batch(self, requests: List[EnhancementRequest]) -> List[EnhancementResult]:
+        """
+        Enhance several small requests with as few OpenAI round-trips as possible
+
+        Requests are packed, up to AI_BATCH_MAX_ITEMS at a time, into one
+        prompt that asks for a JSON list of results. Items missing from (or
+        malformed in) a batch response are retried with individual
+        enhance_content calls.
+
+        Args:
+            requests: Enhancement requests
+
+        Returns:
+            One EnhancementResult per request, in request order
+        """
+        if len(requests) < 2 or not self.is_configured():
+            return list(await asyncio.gather(*[self.enhance_content(r) for r in requests]))
+
+        chunks = [requests[i:i + self.batch_max_items]
+                  for i in range(0, len(requests), self.batch_max_items)]
+        chunk_results = await asyncio.gather(*[self._enhance_chunk(chunk) for chunk in chunks])
+        return [result for results in chunk_results for result in results]
+
+    async def _enhance_chunk(self, requests: List[EnhancementRequest]) -> List[EnhancementResult]:
+        """Enhance one batch with a single call, falling back per item"""
+        outputs: List[Optional[str]] = [None] * len(requests)
+        if len(requests) > 1:
+            try:
+                prompt, payload = self._build_batch_prompt(requests)
+                response = await self._call_openai_api(
+                    prompt,
+                    payload,
+                    max_tokens=min(1500 * len(requests), BATCH_MAX_OUTPUT_TOKENS),
+                    trim=False
+                )
+                outputs = self._parse_batch_response(response, len(requests))
+            except Exception as e:
+                logger.warning(f"Batched enhancement failed, falling back to per-item calls: {e}")
+
+        missing = [i for i, output in enumerate(outputs) if output is None]
+        if missing and len(missing) < len(requests):
+            logger.warning(f"Batch response missing {len(missing)} of {len(requests)} items, retrying individually")
+        fallbacks = await asyncio.gather(*[self.enhance_content(requests[i]) for i in missing])
+        fallback_results = dict(zip(missing, fallbacks))
+
+        results = []
+        for i, (request, output) in enumerate(zip(requests, outputs)):
+            if output is None:
+                results.append(fallback_results[i])
+            else:
+                results.append(await self._build_result(
+                    request, output, {"batched": True, "batch_size": len(requests)}
+                ))
+        return results
+
+    def _build_batch_prompt(self, requests: List[EnhancementRequest]) -> Tuple[str, str]:
+        """Pack requests into batch instructions and a JSON task payload"""
+        contents: List[str] = []
+        content_ids: Dict[str, int] = {}
+        tasks = []
+        for i, request in enumerate(requests):
+            # Identical source content (e.g. several variations of one draft) is sent once
+            if request.content not in content_ids:
+                content_ids[request.content] = len(contents)
+                contents.append(request.content)
+            tasks.append({
+                "id": i,
+                "content_id": content_ids[request.content],
+                "instructions": self._build_prompt(request)
+            })
+        payload = json.dumps({"contents": contents, "tasks": tasks}, ensure_ascii=False)
+        return BATCH_PROMPT, payload
+
+    @staticmethod
+    def _parse_batch_response(response: str, expected: int) -> List[Optional[str]]:
+        """Split a batch response into per-task outputs (None where unusable)"""
+        outputs: List[Optional[str]] = [None] * expected
+        start = response.find('{')
+        end = response.rfind('}')
+        if start == -1 or end <= start:
+            raise ValueError("Batch response contains no JSON object")
+
+        data = json.loads(response[start:end + 1])
+        items = data.get("items") if isinstance(data, dict) else None
+        if not isinstance(items, list):
+            raise ValueError("Batch response has no items list")
+
+        for item in items:
+            if not isinstance(item, dict):
+                continue
+            item_id = item.get("id")
+            content = item.get("content")
+            if (isinstance(item_id, int) and 0 <= item_id < expected and
+                    isinstance(content, str) and content.strip()):
+                outputs[item_id] = content.strip()
+        return outputs
+
+    async def _call_openai_api(self, prompt: str, content: str, max_tokens: int = 1500,
+                               trim: bool = True) -> str:
+        """Make API call to OpenAI, served from the completion cache when possible
+
+        Content over the model's prompt budget is condensed first unless trim
+        is False, in which case an over-budget prompt raises ValueError.
+        """
+        if not self.client:
+            raise ValueError("OpenAI client not initialized")
 
-    async def _call_openai_api(self, prompt: str, content: str) -> str:
-        """Make API call to OpenAI"""
+        compiled = self._compile_messages(prompt, content, max_tokens, trim)
+        messages = compiled.messages
+        params = {"temperature": 0.7, "max_tokens": max_tokens}
+        cache_key = make_completion_key(self.model, messages, params)
+
+        async def fetch():
+            # The timeout covers the request itself, not the wait for a slot
+            async with self._get_request_semaphore():
+                try:
+                    response = await asyncio.wait_for(
+                        self.client.chat.completions.create(
+                            model=self.model,
+                            messages=messages,
+                            **params
+                        ),
+                        timeout=self.request_timeout
+                    )
+                except asyncio.TimeoutError:
+                    raise TimeoutError(f"OpenAI request timed out after {self.request_timeout}s")
+            text = response.choices[0].message.content.strip()
+            self._record_usage(compiled, text, getattr(response, "usage", None))
+            return text
+
+        return await self.response_cache.get_or_fetch(cache_key, self.circuit_breaker(fetch))
+
+    async def _stream_openai_api(self, prompt: str, content: str,
+                                 max_tokens: int = 1500) -> AsyncIterator[str]:
+        """Stream completion text from OpenAI, caching the full text when done"""
         if not self.client:
             raise ValueError("OpenAI client not initialized")
 
-        def api_call():
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {"role": "system", "content": "You are a professional content writer specializing in wellness technology and Breathscape products."},
-                    {"role": "user", "content": f"{prompt}\n\nContent:\n{content}"}
-                ],
-                temperature=0.7,
-                max_tokens=1500
+        compiled = self._compile_messages(prompt, content, max_tokens)
+        messages = compiled.messages
+        params = {"temperature": 0.7, "max_tokens": max_tokens}
+        cache_key = make_completion_key(self.model, messages, params)
+        if self.response_cache.enabled:
+            cached = self.response_cache.get(cache_key)
+            if cached is not None:
+                yield cached
+                return
+
+        async def open_stream():
+            return await asyncio.wait_for(
+                self.client.chat.completions.create(
+                    model=self.model,
+                    messages=messages,
+                    stream=True,
+                    **params
+                ),
+                timeout=self.request_timeout
             )
-            return response.choices[0].message.content.strip()
 
-        # Run in executor to avoid blocking
-        loop = asyncio.get_event_loop()
-        result = await loop.run_in_executor(None, self.circuit_breaker.call, api_call)
-        return result
+        parts = []
+        async with self._get_request_semaphore():
+            try:
+                stream = await self.circuit_breaker(open_stream)()
+            except asyncio.TimeoutError:
+                raise TimeoutError(f"OpenAI request timed out after {self.request_timeout}s")
+
+            try:
+                chunks = stream.__aiter__()
+                while True:
+                    # The timeout bounds the gap between chunks, not the whole stream
+                    try:
+                        chunk = await asyncio.wait_for(chunks.__anext__(), timeout=self.request_timeout)
+                    except StopAsyncIteration:
+                        break
+                    except asyncio.TimeoutError:
+                        raise TimeoutError(f"OpenAI stream stalled for {self.request_timeout}s")
+                    text = chunk.choices[0].delta.content if chunk.choices else None
+                    if text:
+                        parts.append(text)
+                        yield text
+            finally:
+                # Release the connection if the consumer stops early
+                response = getattr(stream, "response", None)
+                if response is not None:
+                    await response.aclose()
+
+        text = "".join(parts).strip()
+        # Streamed responses carry no usage block, so the completion is estimated
+        self._record_usage(compiled, text)
+        self.response_cache.put(cache_key, text)
+
+    def _compile_messages(self, prompt: str, content: str, max_tokens: int,
+                          trim: bool = True) -> CompiledMessages:
+        """Build the chat messages for an enhancement prompt within the token budget"""
+        return self.prompt_compiler.compile(SYSTEM_PROMPT, prompt, content,
+                                            max_completion_tokens=max_tokens, trim=trim)
+
+    def _record_usage(self, compiled: CompiledMessages, completion: str, usage: Any = None):
+        """Report prompt/completion tokens, preferring the counts OpenAI returns"""
+        prompt_tokens = getattr(usage, "prompt_tokens", None)
+        completion_tokens = getattr(usage, "completion_tokens", None)
+        if not isinstance(prompt_tokens, int):
+            prompt_tokens = compiled.prompt_tokens
+        if not isinstance(completion_tokens, int):
+            completion_tokens = self.prompt_compiler.estimator.count(completion)
+        record_token_usage(self.model, prompt_tokens, completion_tokens, compiled.trimmed)
+
+    def _get_request_semaphore(self) -> asyncio.Semaphore:
+        """Semaphore bounding concurrent OpenAI calls on the running event loop"""
+        loop = asyncio.get_running_loop()
+        if self._request_semaphore is None or self._semaphore_loop is not loop:
+            self._request_semaphore = asyncio.Semaphore(self.max_concurrent_requests)
+            self._semaphore_loop = loop
+        return self._request_semaphore
+
+    def clear_response_cache(self):
+        """Drop all cached AI completions"""
+        self.response_cache.clear()
 
     def _calculate_confidence(self, original: str, enhanced: str) -> float:
         """Calculate confidence score for enhancement"""
@@ -416,6 +718,25 @@ class AIContentEnhancer:
                 suggestions=[f"Scoring failed: {str(e)}"]
             )
 
+    VARIATION_MODES = [
+        EnhancementMode.INCREASE_ENGAGEMENT,
+        EnhancementMode.CASUAL,
+        EnhancementMode.BREATHSCAPE_FOCUS
+    ]
+
+    def _variation_requests(self, content: str, content_type: ContentType,
+                            num_variations: int) -> List[EnhancementRequest]:
+        """Build one enhancement request per variation mode"""
+        return [
+            EnhancementRequest(
+                content=content,
+                content_type=content_type,
+                mode=mode,
+                context={"variation_number": i + 1}
+            )
+            for i, mode in enumerate(self.VARIATION_MODES[:num_variations])
+        ]
+
     async def generate_variations(self, content: str, content_type: ContentType,
                                  num_variations: int = 3) -> List[str]:
         """
@@ -432,26 +753,76 @@ class AIContentEnhancer:
         if not self.is_configured():
             return [content]  # Return original if not configured
 
-        variations = []
-        modes = [
-            EnhancementMode.INCREASE_ENGAGEMENT,
-            EnhancementMode.CASUAL,
-            EnhancementMode.BREATHSCAPE_FOCUS
-        ]
+        results = await self.enhance_batch(
+            self._variation_requests(content, content_type, num_variations)
+        )
+        return [result.enhanced_content for result in results]
 
-        for i, mode in enumerate(modes[:num_variations]):
-            request = EnhancementRequest(
-                content=content,
-                content_type=content_type,
-                mode=mode,
-                context={"variation_number": i + 1}
-            )
+    async def generate_campaign_variations(self, content: str, content_types: List[ContentType],
+                                           num_variations: int = 3) -> Dict[ContentType, List[str]]:
+        """
+        Generate variations of one draft for several platforms at once
 
-            result = await self.enhance_content(request)
-            variations.append(result.enhanced_content)
+        Args:
+            content: Original content
+            content_types: Platforms to generate variations for
+            num_variations: Number of variations per platform
+
+        Returns:
+            Mapping of content type to its list of variations
+        """
+        if not self.is_configured():
+            return {content_type: [content] for content_type in content_types}
 
+        requests = [
+            request
+            for content_type in content_types
+            for request in self._variation_requests(content, content_type, num_variations)
+        ]
+        results = await self.enhance_batch(requests)
+
+        variations: Dict[ContentType, List[str]] = {content_type: [] for content_type in content_types}
+        for request, result in zip(requests, results):
+            variations[request.content_type].append(result.enhanced_content)
         return variations
 
+    def _build_user_request(self, content: str, user_id: str,
+                            content_type: ContentType) -> EnhancementRequest:
+        """Build a personalization request from a user's content strategy"""
+        # Import here to avoid circular imports
+        from .user_segmentation import get_user_segmentation_service
+
+        segmentation_service = get_user_segmentation_service()
+
+        # Get user's content strategy
+        strategy = segmentation_service.get_personalized_content_strategy(user_id)
+        content_preferences = strategy.get("content_preferences", {})
+
+        # Build context from user preferences
+        context = {
+            "target_audience": content_preferences.get("tone", "general"),
+            "keywords": strategy.get("priority_topics", [])[:5],  # Top 5 topics
+            "tone": content_preferences.get("tone", "friendly")
+        }
+
+        # Determine enhancement mode based on preferences
+        mode = EnhancementMode.PERSONALIZE
+        if content_preferences.get("technical"):
+            mode = EnhancementMode.TECHNICAL
+        elif content_preferences.get("educational_content"):
+            mode = EnhancementMode.IMPROVE_CLARITY
+        elif content_preferences.get("motivational"):
+            mode = EnhancementMode.INCREASE_ENGAGEMENT
+
+        return EnhancementRequest(
+            content=content,
+            content_type=content_type,
+            mode=mode,
+            context=context,
+            target_audience=context["target_audience"],
+            keywords=context["keywords"]
+        )
+
     async def personalize_for_user(self, content: str, user_id: str,
                                   content_type: ContentType) -> str:
         """
@@ -466,40 +837,7 @@ class AIContentEnhancer:
             Personalized content
         """
         try:
-            # Import here to avoid circular imports
-            from .user_segmentation import get_user_segmentation_service
-
-            segmentation_service = get_user_segmentation_service()
-
-            # Get user's content strategy
-            strategy = segmentation_service.get_personalized_content_strategy(user_id)
-            content_preferences = strategy.get("content_preferences", {})
-
-            # Build context from user preferences
-            context = {
-                "target_audience": content_preferences.get("tone", "general"),
-                "keywords": strategy.get("priority_topics", [])[:5],  # Top 5 topics
-                "tone": content_preferences.get("tone", "friendly")
-            }
-
-            # Determine enhancement mode based on preferences
-            mode = EnhancementMode.PERSONALIZE
-            if content_preferences.get("technical"):
-                mode = EnhancementMode.TECHNICAL
-            elif content_preferences.get("educational_content"):
-                mode = EnhancementMode.IMPROVE_CLARITY
-            elif content_preferences.get("motivational"):
-                mode = EnhancementMode.INCREASE_ENGAGEMENT
-
-            request = EnhancementRequest(
-                content=content,
-                content_type=content_type,
-                mode=mode,
-                context=context,
-                target_audience=context["target_audience"],
-                keywords=context["keywords"]
-            )
-
+            request = self._build_user_request(content, user_id, content_type)
             result = await self.enhance_content(request)
             return result.enhanced_content
 
@@ -507,6 +845,36 @@ class AIContentEnhancer:
             logger.error(f"User-based personalization failed: {e}")
             return content
 
+    async def personalize_for_users(self, content: str, user_ids: List[str],
+                                   content_type: ContentType) -> Dict[str, str]:
+        """
+        Personalize content for several users with batched AI calls
+
+        Args:
+            content: Original content
+            user_ids: User identifiers
+            content_type: Type of content
+
+        Returns:
+            Mapping of user ID to personalized content (original on failure)
+        """
+        personalized = {user_id: content for user_id in user_ids}
+        requests = {}
+        for user_id in user_ids:
+            try:
+                requests[user_id] = self._build_user_request(content, user_id, content_type)
+            except Exception as e:
+                logger.error(f"User-based personalization failed for {user_id}: {e}")
+
+        try:
+            results = await self.enhance_batch(list(requests.values()))
+            for user_id, result in zip(requests, results):
+                personalized[user_id] = result.enhanced_content
+        except Exception as e:
+            logger.error(f"Batched user personalization failed: {e}")
+
+        return personalized
+
     async def personalize_for_segment(self, content: str, segment: str,
                                      content_type: ContentType) -> str:
         """
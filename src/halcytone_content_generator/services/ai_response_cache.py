@@ -0,0 +1,161 @@
+"""
+AI Response Cache
+Content-addressed completion cache with request coalescing for AI enhancement
+
+Completions are keyed by the SHA-256 of the model, the chat messages and the
+sampling parameters, so the same prompt for the same content (for example one
+segment's personalization sent to many users) is answered upstream once and
+then served from memory until its TTL expires. Identical requests that arrive
+while the first one is still in flight wait on that call instead of issuing
+their own.
+"""
+import asyncio
+import hashlib
+import json
+import logging
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+def make_completion_key(model: str, messages: List[Dict[str, str]],
+                        params: Optional[Dict[str, Any]] = None) -> str:
+    """Build the cache key for a chat completion request"""
+    payload = json.dumps(
+        {'model': model, 'messages': messages, 'params': params or {}},
+        sort_keys=True,
+        ensure_ascii=False
+    )
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+class CompletionCache:
+    """Bounded TTL cache of AI completions that coalesces in-flight requests"""
+
+    def __init__(self, max_entries: int = 512, ttl_seconds: float = 3600,
+                 clock: Callable[[], float] = time.monotonic):
+        self.max_entries = max(0, max_entries)
+        self.ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._entries: "OrderedDict[str, Tuple[float, str]]" = OrderedDict()
+        self._in_flight: Dict[str, asyncio.Task] = {}
+        self._waiters: Dict[asyncio.Task, int] = {}
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+
+    @property
+    def enabled(self) -> bool:
+        """Whether completions are cached at all"""
+        return self.max_entries > 0 and self.ttl_seconds > 0
+
+    def get(self, key: str) -> Optional[str]:
+        """Return a fresh cached completion and mark it most recently used"""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at <= self._clock():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def put(self, key: str, value: str):
+        """Store a completion, evicting expired then least recently used entries"""
+        if not self.enabled:
+            return
+        now = self._clock()
+        self._entries[key] = (now + self.ttl_seconds, value)
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.max_entries:
+            self._evict_expired(now)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def _evict_expired(self, now: float):
+        """Drop every entry whose TTL has passed"""
+        expired = [key for key, (expires_at, _) in self._entries.items() if expires_at <= now]
+        for key in expired:
+            del self._entries[key]
+
+    async def get_or_fetch(self, key: str, fetch: Callable[[], Awaitable[str]]) -> str:
+        """
+        Return the cached completion for key, fetching it at most once
+
+        Concurrent callers with the same key share a single fetch; if that
+        fetch fails every waiting caller receives the same exception and
+        nothing is cached. Cancelling one caller leaves the shared fetch
+        running for the others; cancelling the last caller cancels it.
+
+        Args:
+            key: Completion cache key from make_completion_key
+            fetch: Coroutine factory that performs the upstream call
+
+        Returns:
+            The completion text
+        """
+        if self.enabled:
+            cached = self.get(key)
+            if cached is not None:
+                self.hits += 1
+                return cached
+
+        task = self._in_flight.get(key)
+        if task is not None:
+            self.coalesced += 1
+        else:
+            self.misses += 1
+            task = asyncio.get_running_loop().create_task(self._fetch_and_store(key, fetch))
+            task.add_done_callback(self._consume_exception)
+            self._in_flight[key] = task
+        self._waiters[task] = self._waiters.get(task, 0) + 1
+        try:
+            # Shield so one cancelled caller does not cancel the call others share
+            return await asyncio.shield(task)
+        except asyncio.CancelledError:
+            if self._waiters[task] == 1:
+                task.cancel()
+            raise
+        finally:
+            self._waiters[task] -= 1
+            if not self._waiters[task]:
+                del self._waiters[task]
+
+    async def _fetch_and_store(self, key: str, fetch: Callable[[], Awaitable[str]]) -> str:
+        """Run the upstream call for key and cache its result"""
+        try:
+            result = await fetch()
+            self.put(key, result)
+            return result
+        finally:
+            self._in_flight.pop(key, None)
+
+    @staticmethod
+    def _consume_exception(task: asyncio.Task):
+        """Mark a failed fetch as retrieved even if every caller went away"""
+        if not task.cancelled():
+            task.exception()
+
+    def clear(self):
+        """Drop all cached completions"""
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache statistics"""
+        lookups = self.hits + self.misses + self.coalesced
+        return {
+            'size': len(self._entries),
+            'max_entries': self.max_entries,
+            'ttl_seconds': self.ttl_seconds,
+            'hits': self.hits,
+            'misses': self.misses,
+            'coalesced': self.coalesced,
+            'in_flight': len(self._in_flight),
+            'hit_rate': ((self.hits + self.coalesced) / lookups * 100) if lookups else 0.0
+        }
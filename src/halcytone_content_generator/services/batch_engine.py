@@ -0,0 +1,324 @@
+"""
+Batch Generation Engine
+Concurrent generation of planned batch content items
+
+A batch is planned up front: every item's channel, template or platform and
+publish time is fixed before any content is generated. Items are then worked
+by a bounded pool (assembler rendering runs in worker threads, publisher
+validation and preview overlap on the event loop) and each item's state is
+recorded on the batch run as it moves through the pipeline, so the batch
+status endpoint reports live per-item progress while the batch runs.
+"""
+import asyncio
+import logging
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from ..schemas.content import (
+    BatchContentItem, Content, NewsletterContent, SocialPost, WebUpdateContent
+)
+
+logger = logging.getLogger(__name__)
+
+# Batch states
+BATCH_PENDING = 'pending'
+BATCH_RUNNING = 'running'
+BATCH_COMPLETED = 'completed'
+BATCH_FAILED = 'failed'
+BATCH_CANCELLED = 'cancelled'
+BATCH_FINAL_STATES = (BATCH_COMPLETED, BATCH_FAILED, BATCH_CANCELLED)
+
+# Item states
+ITEM_PENDING = 'pending'
+ITEM_GENERATING = 'generating'
+ITEM_VALIDATING = 'validating'
+ITEM_COMPLETED = 'completed'
+ITEM_REJECTED = 'rejected'
+ITEM_FAILED = 'failed'
+ITEM_CANCELLED = 'cancelled'
+ITEM_ACTIVE_STATES = (ITEM_PENDING, ITEM_GENERATING, ITEM_VALIDATING)
+
+EMAIL_TEMPLATES = ['modern', 'minimal', 'plain']
+SOCIAL_PLATFORMS = ['twitter', 'linkedin']
+# Planned items are spread this far apart over the batch period
+SCHEDULE_SPACING = timedelta(hours=2)
+DEFAULT_MAX_CONCURRENCY = 8
+
+# Called after each item reaches a final state; returning True requests cancellation
+ItemCheckpoint = Callable[['BatchRun', 'BatchItemProgress'], Awaitable[bool]]
+
+
+@dataclass
+class BatchItemPlan:
+    """What one batch item will be, fixed before generation starts"""
+    index: int
+    item_id: str
+    channel: str
+    template: Optional[str] = None
+    platform: Optional[str] = None
+    scheduled_for: Optional[datetime] = None
+
+
+@dataclass
+class BatchItemProgress:
+    """Live state of one planned item"""
+    plan: BatchItemPlan
+    status: str = ITEM_PENDING
+    started_at: Optional[datetime] = None
+    completed_at: Optional[datetime] = None
+    error: Optional[str] = None
+    result: Optional[BatchContentItem] = None
+
+    def advance(self, status: str):
+        """Move to an in-progress state"""
+        if self.started_at is None:
+            self.started_at = datetime.now()
+        self.status = status
+
+    def finish(self, status: str, error: Optional[str] = None):
+        """Move to a final state"""
+        self.status = status
+        self.error = error
+        self.completed_at = datetime.now()
+
+
+@dataclass
+class BatchRun:
+    """A planned batch and the progress of its items"""
+    batch_id: str
+    items: List[BatchItemProgress]
+    dry_run: bool = False
+    template_variety: bool = True
+    status: str = BATCH_PENDING
+    created_at: datetime = field(default_factory=datetime.now)
+    completed_at: Optional[datetime] = None
+    errors: List[str] = field(default_factory=list)
+    cancel_requested: bool = False
+    scheduled_at: Optional[datetime] = None
+    period: Optional[str] = None
+
+    @property
+    def is_finished(self) -> bool:
+        return self.status in BATCH_FINAL_STATES
+
+    @property
+    def last_updated(self) -> datetime:
+        """Most recent change to the batch or any of its items"""
+        times = [self.created_at, self.completed_at, self.scheduled_at]
+        for item in self.items:
+            times.extend((item.started_at, item.completed_at))
+        return max(t for t in times if t is not None)
+
+    @property
+    def channels(self) -> List[str]:
+        """Channels in the plan, in first-use order"""
+        return list(dict.fromkeys(item.plan.channel for item in self.items))
+
+    def count(self, *statuses: str) -> int:
+        """Number of items in any of the given states"""
+        return sum(1 for item in self.items if item.status in statuses)
+
+    def completed_items(self) -> List[BatchContentItem]:
+        """Generated items in plan order"""
+        return [item.result for item in self.items if item.status == ITEM_COMPLETED]
+
+    def cancel(self) -> int:
+        """Request cancellation; items not yet started are cancelled at once"""
+        self.cancel_requested = True
+        cancelled = 0
+        for item in self.items:
+            if item.status == ITEM_PENDING:
+                item.finish(ITEM_CANCELLED)
+                cancelled += 1
+        return cancelled
+
+
+def plan_batch(batch_id: str, channels: List[str], item_count: int, start_date: datetime,
+               template_variety: bool = True, include_scheduling: bool = True) -> List[BatchItemPlan]:
+    """
+    Plan every item of a batch
+
+    Channels rotate across items; email templates and social platforms
+    rotate with the item index, and scheduled items are spread
+    SCHEDULE_SPACING apart from the start date.
+    """
+    plans = []
+    for index in range(item_count):
+        channel = channels[index % len(channels)]
+        plans.append(BatchItemPlan(
+            index=index,
+            item_id=f"{batch_id}-{channel}-{index:03d}",
+            channel=channel,
+            template=(EMAIL_TEMPLATES[index % len(EMAIL_TEMPLATES)] if template_variety else 'modern')
+            if channel == 'email' else None,
+            platform=SOCIAL_PLATFORMS[index % len(SOCIAL_PLATFORMS)] if channel == 'social' else None,
+            scheduled_for=start_date + SCHEDULE_SPACING * index if include_scheduling else None
+        ))
+    return plans
+
+
+class BatchGenerationEngine:
+    """Generates the items of a batch run concurrently"""
+
+    def __init__(self, assembler, publishers: Dict[str, Any],
+                 max_concurrency: int = DEFAULT_MAX_CONCURRENCY):
+        """
+        Initialize the engine
+
+        Args:
+            assembler: Content assembler used to render each item
+            publishers: Publisher per channel, used to validate and preview items
+            max_concurrency: Items in flight at once
+        """
+        self.assembler = assembler
+        self.publishers = publishers
+        self.max_concurrency = max(1, max_concurrency)
+
+    async def run(self, run: BatchRun, document_content: Dict[str, Any],
+                  checkpoint: Optional[ItemCheckpoint] = None) -> BatchRun:
+        """
+        Generate every pending item of a run, updating its progress in place
+
+        Args:
+            run: Batch run; only items still pending are worked
+            document_content: Living document content the items are generated from
+            checkpoint: Optional hook awaited as each item finishes
+
+        A run cancelled with BatchRun.cancel() lets items already in flight
+        finish and skips the rest. If the task itself is cancelled (shutdown)
+        the run stays running so it can be resumed.
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def work(progress: BatchItemProgress):
+            async with semaphore:
+                if progress.status != ITEM_PENDING:
+                    return  # Cancelled while waiting for a worker
+                await self._run_item(run, progress, document_content)
+                if checkpoint is not None and await checkpoint(run, progress):
+                    run.cancel()
+
+        run.status = BATCH_RUNNING
+        try:
+            await asyncio.gather(*(work(item) for item in run.items if item.status == ITEM_PENDING))
+            run.status = BATCH_CANCELLED if run.cancel_requested else BATCH_COMPLETED
+        except Exception as e:
+            logger.error(f"Batch {run.batch_id} failed: {e}")
+            run.status = BATCH_FAILED
+            run.errors.append(str(e))
+
+        run.completed_at = datetime.now()
+        logger.info(f"Batch {run.batch_id} {run.status}: {run.count(ITEM_COMPLETED)}/{len(run.items)} items generated")
+        return run
+
+    async def _run_item(self, run: BatchRun, progress: BatchItemProgress, document_content: Dict[str, Any]):
+        """Generate, validate and preview one item"""
+        plan = progress.plan
+        try:
+            progress.advance(ITEM_GENERATING)
+            content = await asyncio.to_thread(self._generate_content, plan, document_content, run.dry_run)
+            if content is None:
+                logger.warning(f"No social content generated for {plan.platform}")
+                progress.finish(ITEM_REJECTED, f"No {plan.platform} content generated")
+                return
+
+            progress.advance(ITEM_VALIDATING)
+            publisher = self.publishers[plan.channel]
+            validation_result = await publisher.validate(content)
+            if not validation_result.is_valid:
+                logger.warning(f"Content validation failed for {plan.channel}: {validation_result.issues}")
+                issues = '; '.join(issue.message for issue in validation_result.issues)
+                progress.finish(ITEM_REJECTED, f"Validation failed: {issues}" if issues else "Validation failed")
+                return
+
+            preview_result = await publisher.preview(content)
+            progress.result = BatchContentItem(
+                item_id=plan.item_id,
+                content_type=plan.channel,
+                content=content,
+                scheduled_for=plan.scheduled_for,
+                priority=1 if plan.channel == 'email' else 2,  # Email priority
+                estimated_engagement=preview_result.estimated_engagement or 0.05,
+                metadata={
+                    "channel": plan.channel,
+                    "generation_index": plan.index,
+                    "validation_passed": True,
+                    "template_used": "varied" if run.template_variety else "default"
+                }
+            )
+            progress.finish(ITEM_COMPLETED)
+
+        except Exception as e:
+            logger.error(f"Failed to generate content for {plan.channel}: {e}")
+            progress.finish(ITEM_FAILED, str(e))
+
+    def _generate_content(self, plan: BatchItemPlan, document_content: Dict[str, Any],
+                          dry_run: bool) -> Optional[Content]:
+        """Render one item's content (runs in a worker thread)"""
+        if plan.channel == 'email':
+            newsletter_data = self.assembler.generate_newsletter(document_content, template=plan.template)
+            return Content.from_newsletter(NewsletterContent(**newsletter_data), dry_run=dry_run)
+
+        if plan.channel == 'web':
+            web_data = self.assembler.generate_web_update(document_content, seo_optimize=True)
+            return Content.from_web_update(WebUpdateContent(**web_data), dry_run=dry_run)
+
+        if plan.channel == 'social':
+            social_posts = self.assembler.generate_social_posts(document_content, platforms=[plan.platform])
+            if not social_posts:
+                return None
+            post_data = social_posts[0]
+            social_content = SocialPost(
+                platform=post_data['platform'],
+                content=post_data['content'],
+                hashtags=post_data.get('hashtags', []),
+                media_urls=post_data.get('media_urls', [])
+            )
+            return Content.from_social_post(social_content, dry_run=dry_run)
+
+        raise ValueError(f"Unsupported batch channel: {plan.channel}")
+
+
+class BatchProgressStore:
+    """Process-wide registry of batch runs, most recent last"""
+
+    def __init__(self, max_batches: int = 100):
+        self.max_batches = max(1, max_batches)
+        self._runs: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+
+    def put(self, run: BatchRun):
+        """Register a run, evicting the oldest finished runs beyond max_batches"""
+        with self._lock:
+            self._runs[run.batch_id] = run
+            self._runs.move_to_end(run.batch_id)
+            for batch_id in list(self._runs):
+                if len(self._runs) <= self.max_batches:
+                    break
+                if self._runs[batch_id].is_finished:
+                    del self._runs[batch_id]
+
+    def get(self, batch_id: str) -> Optional[BatchRun]:
+        with self._lock:
+            return self._runs.get(batch_id)
+
+    def clear(self):
+        with self._lock:
+            self._runs.clear()
+
+    def __len__(self) -> int:
+        return len(self._runs)
+
+
+_batch_progress_store: Optional[BatchProgressStore] = None
+
+
+def get_batch_progress_store() -> BatchProgressStore:
+    """Get the process-wide batch progress store"""
+    global _batch_progress_store
+    if _batch_progress_store is None:
+        _batch_progress_store = BatchProgressStore()
+    return _batch_progress_store
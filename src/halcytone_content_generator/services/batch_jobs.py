@@ -0,0 +1,504 @@
+"""
+Durable Batch Jobs
+Persists batch runs so they survive restarts, and executes them in the background
+
+Every batch is written to the batch_jobs / batch_job_items tables before work
+starts and each item is checkpointed as it reaches a final state. On startup
+the executor picks up batches that were still pending or running and
+generates only the items that had not finished. A job is leased to the worker
+running it: the owner column names the worker and each checkpoint refreshes
+the heartbeat, so when several workers start they claim only jobs with no
+owner or a stale heartbeat and never resume a batch a sibling is still
+running. Cancellation is cooperative:
+the cancel flag is stored on the job, items not yet started are cancelled at
+once, items in flight finish, and a worker running the batch in another
+process sees the flag at its next checkpoint.
+
+The SQL store follows the other persistent tiers: database imports are lazy,
+and if the database layer is unavailable the store disables itself and the
+executor keeps working from the in-process progress store.
+"""
+import asyncio
+import logging
+import os
+import socket
+import uuid
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from ..schemas.content import BatchContentItem
+from .batch_engine import (
+    BatchGenerationEngine, BatchItemPlan, BatchItemProgress, BatchProgressStore, BatchRun,
+    get_batch_progress_store,
+    BATCH_PENDING, BATCH_RUNNING, ITEM_CANCELLED, ITEM_GENERATING, ITEM_PENDING, ITEM_VALIDATING
+)
+
+logger = logging.getLogger(__name__)
+
+# Batch states a restarted worker picks up again
+RESUMABLE_STATES = (BATCH_PENDING, BATCH_RUNNING)
+
+StoredRun = Tuple[BatchRun, Dict[str, Any]]
+
+
+def default_worker_id() -> str:
+    """Identify this process among the workers sharing the batch tables"""
+    return f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+
+
+class SqlBatchJobStore:
+    """Batch runs persisted in the batch_jobs and batch_job_items tables"""
+
+    def __init__(self, worker_id: Optional[str] = None, lease_seconds: float = 300):
+        """
+        Initialize the store
+
+        Args:
+            worker_id: Lease owner name for this process
+            lease_seconds: Heartbeat age after which another worker may take over a job
+        """
+        self.worker_id = worker_id or default_worker_id()
+        self.lease_seconds = lease_seconds
+        self._available = True
+
+    @property
+    def available(self) -> bool:
+        return self._available
+
+    async def save_run(self, run: BatchRun, document_content: Optional[Dict[str, Any]] = None):
+        """
+        Insert or update a run and all of its items
+
+        Args:
+            run: Batch run to persist
+            document_content: Document snapshot the run generates from (kept if omitted)
+        """
+        if not self._available:
+            return
+
+        try:
+            from ..database import get_database
+            from ..database.models_batch import BatchJob, BatchJobItem
+
+            async with get_database().async_session_scope() as session:
+                job = await self._select_job(session, run.batch_id)
+                if job is None:
+                    job = BatchJob(batch_id=run.batch_id, items=[], owner=self.worker_id)
+                    session.add(job)
+                self._renew_lease(job)
+
+                job.status = run.status
+                job.period = run.period
+                job.channels = run.channels
+                job.dry_run = run.dry_run
+                job.template_variety = run.template_variety
+                # A cancel stored by another worker must not be cleared
+                job.cancel_requested = bool(job.cancel_requested) or run.cancel_requested
+                job.completed_at = run.completed_at
+                job.scheduled_at = run.scheduled_at
+                job.errors = list(run.errors)
+                if document_content is not None:
+                    job.document_content = document_content
+
+                rows = {row.item_index: row for row in job.items}
+                for progress in run.items:
+                    row = rows.get(progress.plan.index)
+                    if row is None:
+                        row = BatchJobItem(item_index=progress.plan.index)
+                        job.items.append(row)
+                    _write_item(row, progress)
+        except ImportError as e:
+            self._disable(e)
+        except Exception as e:
+            logger.warning(f"Failed to persist batch {run.batch_id}: {e}")
+
+    async def checkpoint(self, run: BatchRun, progress: BatchItemProgress) -> bool:
+        """
+        Record one finished item and report whether cancellation was requested
+
+        Used as the engine's per-item checkpoint, so it returns True when the
+        stored job has been cancelled (possibly by another worker).
+        """
+        if not self._available:
+            return False
+
+        try:
+            from sqlalchemy import select
+            from ..database import get_database
+            from ..database.models_batch import BatchJob, BatchJobItem
+
+            async with get_database().async_session_scope() as session:
+                result = await session.execute(select(BatchJob).where(BatchJob.batch_id == run.batch_id))
+                job = result.scalar_one_or_none()
+                if job is None:
+                    return False
+
+                result = await session.execute(
+                    select(BatchJobItem).where(
+                        BatchJobItem.job_id == job.id,
+                        BatchJobItem.item_index == progress.plan.index
+                    )
+                )
+                row = result.scalar_one_or_none()
+                if row is not None:
+                    _write_item(row, progress)
+                job.status = run.status
+                self._renew_lease(job)
+                return bool(job.cancel_requested)
+        except ImportError as e:
+            self._disable(e)
+        except Exception as e:
+            logger.warning(f"Failed to checkpoint batch item {progress.plan.item_id}: {e}")
+        return False
+
+    async def request_cancel(self, batch_id: str) -> bool:
+        """
+        Flag a stored job as cancelled and cancel its items not yet started
+
+        Only the flag and pending items are touched, so a worker running the
+        batch elsewhere keeps ownership of the items it is working on.
+
+        Returns:
+            True if the job exists in the store
+        """
+        if not self._available:
+            return False
+
+        try:
+            from ..database import get_database
+
+            async with get_database().async_session_scope() as session:
+                job = await self._select_job(session, batch_id)
+                if job is None:
+                    return False
+                job.cancel_requested = True
+                for row in job.items:
+                    if row.status == ITEM_PENDING:
+                        row.status = ITEM_CANCELLED
+                        row.completed_at = datetime.now()
+                return True
+        except ImportError as e:
+            self._disable(e)
+        except Exception as e:
+            logger.warning(f"Failed to cancel batch {batch_id}: {e}")
+        return False
+
+    async def load(self, batch_id: str) -> Optional[StoredRun]:
+        """Load a run and its document snapshot, or None if unknown or unavailable"""
+        if not self._available:
+            return None
+
+        try:
+            from ..database import get_database
+
+            async with get_database().async_session_scope() as session:
+                job = await self._select_job(session, batch_id)
+                if job is not None:
+                    return _read_job(job)
+        except ImportError as e:
+            self._disable(e)
+        except Exception as e:
+            logger.warning(f"Failed to load batch {batch_id}: {e}")
+        return None
+
+    async def claim_unfinished(self) -> List[StoredRun]:
+        """
+        Claim runs left pending or running by a stopped worker, oldest first
+
+        The claim is a single conditional UPDATE, so when several workers
+        start together each unowned or stale job goes to exactly one of them.
+        Jobs whose owner is still heartbeating are left alone.
+        """
+        if not self._available:
+            return []
+
+        try:
+            from sqlalchemy import or_, select, update
+            from sqlalchemy.orm import selectinload
+            from ..database import get_database
+            from ..database.models_batch import BatchJob
+
+            now = datetime.now()
+            stale = now - timedelta(seconds=self.lease_seconds)
+            async with get_database().async_session_scope() as session:
+                await session.execute(
+                    update(BatchJob)
+                    .where(
+                        BatchJob.status.in_(RESUMABLE_STATES),
+                        or_(
+                            BatchJob.owner.is_(None),
+                            BatchJob.heartbeat_at.is_(None),
+                            BatchJob.heartbeat_at < stale
+                        )
+                    )
+                    .values(owner=self.worker_id, heartbeat_at=now)
+                    .execution_options(synchronize_session=False)
+                )
+                result = await session.execute(
+                    select(BatchJob)
+                    .options(selectinload(BatchJob.items))
+                    .where(
+                        BatchJob.status.in_(RESUMABLE_STATES),
+                        BatchJob.owner == self.worker_id
+                    )
+                    .order_by(BatchJob.created_at)
+                )
+                return [_read_job(job) for job in result.scalars().all()]
+        except ImportError as e:
+            self._disable(e)
+        except Exception as e:
+            logger.warning(f"Failed to claim unfinished batches: {e}")
+        return []
+
+    async def release(self, batch_ids: List[str]):
+        """Give up this worker's lease on jobs so the next worker can resume them at once"""
+        if not self._available or not batch_ids:
+            return
+
+        try:
+            from sqlalchemy import update
+            from ..database import get_database
+            from ..database.models_batch import BatchJob
+
+            async with get_database().async_session_scope() as session:
+                await session.execute(
+                    update(BatchJob)
+                    .where(BatchJob.batch_id.in_(batch_ids), BatchJob.owner == self.worker_id)
+                    .values(owner=None, heartbeat_at=None)
+                    .execution_options(synchronize_session=False)
+                )
+        except ImportError as e:
+            self._disable(e)
+        except Exception as e:
+            logger.warning(f"Failed to release batch leases: {e}")
+
+    def _renew_lease(self, job):
+        """Refresh the heartbeat of a job this worker owns; other workers' leases are left alone"""
+        if job.owner == self.worker_id:
+            job.heartbeat_at = datetime.now()
+
+    @staticmethod
+    async def _select_job(session, batch_id: str):
+        """Load a job with its items eagerly (lazy loads are not allowed on async sessions)"""
+        from sqlalchemy import select
+        from sqlalchemy.orm import selectinload
+        from ..database.models_batch import BatchJob
+
+        result = await session.execute(
+            select(BatchJob).options(selectinload(BatchJob.items)).where(BatchJob.batch_id == batch_id)
+        )
+        return result.scalar_one_or_none()
+
+    def _disable(self, error: Exception):
+        self._available = False
+        logger.warning(f"Persistent batch jobs disabled: {error}")
+
+
+def _write_item(row, progress: BatchItemProgress):
+    """Copy an item's plan and progress onto its row"""
+    plan = progress.plan
+    row.item_id = plan.item_id
+    row.channel = plan.channel
+    row.template = plan.template
+    row.platform = plan.platform
+    row.scheduled_for = plan.scheduled_for
+    row.status = progress.status
+    row.started_at = progress.started_at
+    row.completed_at = progress.completed_at
+    row.error = progress.error
+    row.result = progress.result.model_dump(mode='json') if progress.result is not None else None
+
+
+def _read_job(job) -> StoredRun:
+    """Rebuild a batch run and its document snapshot from a job row"""
+    items = []
+    for row in job.items:
+        items.append(BatchItemProgress(
+            plan=BatchItemPlan(
+                index=row.item_index,
+                item_id=row.item_id,
+                channel=row.channel,
+                template=row.template,
+                platform=row.platform,
+                scheduled_for=row.scheduled_for
+            ),
+            status=row.status,
+            started_at=row.started_at,
+            completed_at=row.completed_at,
+            error=row.error,
+            result=BatchContentItem.model_validate(row.result) if row.result else None
+        ))
+
+    run = BatchRun(
+        batch_id=job.batch_id,
+        items=items,
+        dry_run=job.dry_run,
+        template_variety=job.template_variety,
+        status=job.status,
+        completed_at=job.completed_at,
+        errors=list(job.errors or []),
+        cancel_requested=job.cancel_requested,
+        scheduled_at=job.scheduled_at,
+        period=job.period
+    )
+    if job.created_at is not None:
+        run.created_at = job.created_at
+    return run, job.document_content or {}
+
+
+class BatchJobExecutor:
+    """Runs batches inline or as background tasks, checkpointing them to a durable store"""
+
+    def __init__(self, store: Optional[SqlBatchJobStore] = None,
+                 progress_store: Optional[BatchProgressStore] = None):
+        """
+        Initialize the executor
+
+        Args:
+            store: Durable job store; None keeps batches in this process only
+            progress_store: Registry of live runs served by the status endpoint
+        """
+        self.store = store
+        self.progress_store = progress_store if progress_store is not None else get_batch_progress_store()
+        # Strong references so background tasks are not garbage collected mid-run
+        self._tasks: Dict[str, asyncio.Task] = {}
+
+    async def execute(self, run: BatchRun, document_content: Dict[str, Any],
+                      engine: BatchGenerationEngine) -> BatchRun:
+        """Persist a run, generate its pending items and persist the outcome"""
+        self.progress_store.put(run)
+        if self.store is not None:
+            await self.store.save_run(run, document_content)
+        return await self._run(run, document_content, engine)
+
+    async def submit(self, run: BatchRun, document_content: Dict[str, Any],
+                     engine: BatchGenerationEngine) -> asyncio.Task:
+        """
+        Persist a run and generate it in a background task
+
+        The run is stored before this returns, so a restart between the
+        response and the first item does not lose the batch.
+        """
+        self.progress_store.put(run)
+        if self.store is not None:
+            await self.store.save_run(run, document_content)
+
+        task = asyncio.create_task(self._run(run, document_content, engine))
+        self._tasks[run.batch_id] = task
+        task.add_done_callback(lambda _: self._tasks.pop(run.batch_id, None))
+        logger.info(f"Batch {run.batch_id} submitted with {len(run.items)} planned items")
+        return task
+
+    async def cancel(self, batch_id: str) -> Optional[BatchRun]:
+        """
+        Request cancellation of a batch
+
+        Returns:
+            The run, or None if the batch is unknown
+        """
+        run = await self.get_run(batch_id)
+        if run is None:
+            return None
+        if run.is_finished:
+            return run
+
+        cancelled = run.cancel()
+        if self.store is not None:
+            await self.store.request_cancel(batch_id)
+        logger.info(f"Batch {batch_id} cancellation requested ({cancelled} pending items cancelled)")
+        return run
+
+    async def get_run(self, batch_id: str) -> Optional[BatchRun]:
+        """A live run from this process, else the stored run"""
+        run = self.progress_store.get(batch_id)
+        if run is not None or self.store is None:
+            return run
+
+        stored = await self.store.load(batch_id)
+        return stored[0] if stored is not None else None
+
+    async def save(self, run: BatchRun):
+        """Persist changes made to a run outside of generation (e.g. scheduling)"""
+        if self.store is not None:
+            await self.store.save_run(run)
+
+    async def resume_unfinished(self, engine_factory: Callable[[], BatchGenerationEngine]) -> int:
+        """
+        Restart batches left pending or running by a previous worker
+
+        Only batches this worker claims are restarted; a batch whose owner
+        is still heartbeating keeps running where it is. Items that were
+        mid-generation are put back to pending; finished items keep their
+        stored results and are not generated again.
+
+        Returns:
+            Number of batches resumed
+        """
+        if self.store is None:
+            return 0
+
+        resumed = 0
+        for run, document_content in await self.store.claim_unfinished():
+            if run.batch_id in self._tasks or self.progress_store.get(run.batch_id) is not None:
+                continue
+            for progress in run.items:
+                if progress.status in (ITEM_GENERATING, ITEM_VALIDATING):
+                    progress.status = ITEM_PENDING
+                    progress.started_at = None
+            if run.cancel_requested:
+                run.cancel()
+
+            self.progress_store.put(run)
+            task = asyncio.create_task(self._run(run, document_content, engine_factory()))
+            self._tasks[run.batch_id] = task
+            task.add_done_callback(lambda _, batch_id=run.batch_id: self._tasks.pop(batch_id, None))
+            remaining = run.count(ITEM_PENDING)
+            logger.info(f"Resuming batch {run.batch_id}: {remaining}/{len(run.items)} items remaining")
+            resumed += 1
+        return resumed
+
+    async def wait(self, batch_id: str):
+        """Wait for a background batch of this process to finish"""
+        task = self._tasks.get(batch_id)
+        if task is not None:
+            await asyncio.shield(task)
+
+    async def shutdown(self):
+        """
+        Stop background batches
+
+        Runs are left in the running state and their leases released, so the
+        next worker resumes them.
+        """
+        batch_ids = list(self._tasks)
+        tasks = list(self._tasks.values())
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._tasks.clear()
+        if self.store is not None:
+            await self.store.release(batch_ids)
+
+    async def _run(self, run: BatchRun, document_content: Dict[str, Any],
+                   engine: BatchGenerationEngine) -> BatchRun:
+        checkpoint = self.store.checkpoint if self.store is not None else None
+        await engine.run(run, document_content, checkpoint=checkpoint)
+        if self.store is not None:
+            await self.store.save_run(run)
+        return run
+
+
+_batch_job_executor: Optional[BatchJobExecutor] = None
+
+
+def get_batch_executor() -> BatchJobExecutor:
+    """Get the process-wide batch executor"""
+    global _batch_job_executor
+    if _batch_job_executor is None:
+        from ..config import get_settings
+        settings = get_settings()
+        store = None
+        if settings.BATCH_JOBS_PERSISTENT:
+            store = SqlBatchJobStore(lease_seconds=settings.BATCH_JOB_LEASE_SECONDS)
+        _batch_job_executor = BatchJobExecutor(store=store)
+    return _batch_job_executor
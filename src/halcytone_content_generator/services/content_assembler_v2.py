@@ -1,18 +1,21 @@
 """
 Enhanced content assembler with multiple templates and advanced formatting
 """
-from jinja2 import Template, Environment, BaseLoader, TemplateNotFound
+from jinja2 import Template, Environment, BaseLoader, TemplateNotFound, FileSystemBytecodeCache
 from datetime import datetime
+from functools import cached_property
 from typing import Dict, List, Optional, Any
+import asyncio
 import logging
 import random
 import re
+import threading
 import html2text
 
 from ..templates.email_templates import MODERN_TEMPLATE, MINIMAL_TEMPLATE, PLAIN_TEXT_TEMPLATE
 from ..templates.social_templates import SocialMediaTemplates
 from ..templates.breathscape_templates import (
-    BREATHSCAPE_EMAIL_TEMPLATE, BREATHSCAPE_WEB_TEMPLATE, BREATHSCAPE_SOCIAL_TEMPLATES,
+    BREATHSCAPE_EMAIL_TEMPLATE, BREATHSCAPE_TEXT_TEMPLATE, BREATHSCAPE_WEB_TEMPLATE, BREATHSCAPE_SOCIAL_TEMPLATES,
     get_breathscape_template_for_content, get_breathscape_content_themes
 )
 from ..schemas.content import NewsletterContent, WebUpdateContent, SocialPost
@@ -28,7 +31,9 @@ class TemplateLoader(BaseLoader):
             'modern': MODERN_TEMPLATE,
             'minimal': MINIMAL_TEMPLATE,
             'plain': PLAIN_TEXT_TEMPLATE,
-            'breathscape': BREATHSCAPE_EMAIL_TEMPLATE
+            'breathscape': BREATHSCAPE_EMAIL_TEMPLATE,
+            'breathscape_text': BREATHSCAPE_TEXT_TEMPLATE,
+            'breathscape_web': BREATHSCAPE_WEB_TEMPLATE
         }
 
     def get_source(self, environment, template):
@@ -38,6 +43,132 @@ class TemplateLoader(BaseLoader):
         raise TemplateNotFound(template)
 
 
+_template_environment: Optional[Environment] = None
+_template_environment_lock = threading.Lock()
+
+WHITESPACE_RUN = re.compile(r'\s+')
+BLANK_LINE_RUN = re.compile(r'\n{3,}')
+# Content html2text would interpret or escape (markup, entities, backslashes,
+# list/heading-like line starts, link-breaking URL characters); the text
+# template is only used when no context string matches
+HTML_SENSITIVE = re.compile(r'[<>&\\\[\]()]|^\s*(?:\d+\.(?=\s)|\+(?=\s)|-(?=\s|-))', re.MULTILINE)
+
+
+def squash_whitespace(value: Any) -> str:
+    """Collapse whitespace runs like an HTML block renders them (leading space dropped)"""
+    return WHITESPACE_RUN.sub(' ', str(value)).lstrip()
+
+
+def is_plain_text_context(value: Any) -> bool:
+    """Whether every string in a template context renders the same in HTML and text"""
+    if isinstance(value, str):
+        return HTML_SENSITIVE.search(value) is None
+    if isinstance(value, dict):
+        return all(is_plain_text_context(v) for v in value.values())
+    if isinstance(value, (list, tuple)):
+        return all(is_plain_text_context(v) for v in value)
+    return True
+
+
+def _create_bytecode_cache() -> Optional[FileSystemBytecodeCache]:
+    """Bytecode cache per settings, shared by every process using the directory"""
+    try:
+        from ..config import get_settings
+        settings = get_settings()
+        if not settings.TEMPLATE_BYTECODE_CACHE:
+            return None
+        return FileSystemBytecodeCache(settings.TEMPLATE_BYTECODE_CACHE_DIR or None)
+    except Exception as e:
+        logger.warning(f"Template bytecode cache unavailable: {e}")
+        return None
+
+
+def get_template_environment() -> Environment:
+    """
+    Get the process-wide Jinja environment for assembler templates
+
+    Templates are compiled once per process and shared by every
+    EnhancedContentAssembler; the bytecode cache lets new worker processes
+    skip compilation as well. Sources are in-code constants, so templates
+    are never checked for changes.
+    """
+    global _template_environment
+    if _template_environment is None:
+        with _template_environment_lock:
+            if _template_environment is None:
+                env = Environment(
+                    loader=TemplateLoader(),
+                    bytecode_cache=_create_bytecode_cache(),
+                    auto_reload=False
+                )
+                env.filters['squash'] = squash_whitespace
+                _template_environment = env
+    return _template_environment
+
+
+def warm_templates() -> int:
+    """
+    Compile every assembler template into the shared environment
+
+    Returns:
+        Number of templates compiled
+    """
+    env = get_template_environment()
+    names = env.loader.templates
+    for name in names:
+        env.get_template(name)
+    return len(names)
+
+
+ASSEMBLY_CHANNELS = ('email', 'web', 'social')
+
+
+class SharedDerivations:
+    """
+    Content-derived fields shared by every channel of one generation
+
+    Each field is computed on first use, so a single-channel call only pays
+    for what it reads while assemble_all computes each field once for all
+    channels.
+    """
+
+    def __init__(self, assembler: 'EnhancedContentAssembler', content: Dict[str, List[Dict]]):
+        self._assembler = assembler
+        self.content = content
+
+    @cached_property
+    def newsletter_data(self) -> Dict:
+        return self._assembler._prepare_newsletter_data(self.content)
+
+    @cached_property
+    def stats(self) -> List[Dict]:
+        return self._assembler._generate_stats(self.content)
+
+    @cached_property
+    def subject(self) -> str:
+        return self._assembler._generate_subject_line(self.content)
+
+    @cached_property
+    def preview_text(self) -> str:
+        return self._assembler._generate_preview_text(self.content)
+
+    @cached_property
+    def excerpt(self) -> str:
+        return self._assembler._generate_excerpt(self.content, 160)  # SEO optimal length
+
+    @cached_property
+    def meta_description(self) -> str:
+        return self._assembler._generate_meta_description(self.content)
+
+    @cached_property
+    def tags(self) -> List[str]:
+        return self._assembler._generate_seo_tags(self.content)
+
+    @cached_property
+    def featured_image(self) -> str:
+        return self._assembler._select_featured_image(self.content)
+
+
 class EnhancedContentAssembler:
     """
     Advanced content assembler with multiple templates and rich formatting
@@ -51,17 +182,16 @@ class EnhancedContentAssembler:
             template_style: Template style to use (modern, minimal, plain, breathscape)
         """
         self.template_style = template_style
-        self.env = Environment(loader=TemplateLoader())
+        self.env = get_template_environment()
         self.social_templates = SocialMediaTemplates()
-        self.h2t = html2text.HTML2Text()
-        self.h2t.ignore_links = False
-        self.h2t.body_width = 0
+        self.h2t = self._create_html2text()
 
     def generate_newsletter(
         self,
         content: Dict[str, List[Dict]],
         template: Optional[str] = None,
-        custom_data: Optional[Dict] = None
+        custom_data: Optional[Dict] = None,
+        shared: Optional[SharedDerivations] = None
     ) -> Dict[str, str]:
         """
         Generate enhanced email newsletter with rich formatting
@@ -70,22 +200,25 @@ class EnhancedContentAssembler:
             content: Categorized content dictionary
             template: Optional template style override
             custom_data: Optional custom data for template
+            shared: Derived fields shared with other channels
 
         Returns:
             Newsletter content with subject, HTML, and text versions
         """
+        shared = shared or SharedDerivations(self, content)
+
         # Use provided template or default
         template_style = template or self.template_style
 
         # Prepare template data
-        template_data = self._prepare_newsletter_data(content)
+        template_data = dict(shared.newsletter_data)
 
         # Add custom data if provided
         if custom_data:
             template_data.update(custom_data)
 
         # Add statistics
-        template_data['stats'] = self._generate_stats(content)
+        template_data['stats'] = shared.stats
 
         # Add call to action
         template_data['call_to_action'] = {
@@ -107,19 +240,20 @@ class EnhancedContentAssembler:
             text = text_template.render(**template_data)
 
         # Generate subject line
-        subject = self._generate_subject_line(content)
+        subject = shared.subject
 
         return {
             'subject': subject,
             'html': html,
             'text': text,
-            'preview_text': self._generate_preview_text(content)
+            'preview_text': shared.preview_text
         }
 
     def generate_web_update(
         self,
         content: Dict[str, List[Dict]],
-        seo_optimize: bool = True
+        seo_optimize: bool = True,
+        shared: Optional[SharedDerivations] = None
     ) -> Dict[str, Any]:
         """
         Generate SEO-optimized website content
@@ -127,17 +261,19 @@ class EnhancedContentAssembler:
         Args:
             content: Categorized content dictionary
             seo_optimize: Whether to add SEO enhancements
+            shared: Derived fields shared with other channels
 
         Returns:
             Web update with SEO metadata
         """
+        shared = shared or SharedDerivations(self, content)
         title = f"Halcytone Updates - {datetime.now().strftime('%B %Y')}"
 
         # Build structured content with headings
         body = f"# {title}\n\n"
 
         # Add meta description
-        meta_description = self._generate_meta_description(content)
+        meta_description = shared.meta_description
 
         # Add publication date
         body += f"*Published: {datetime.now().strftime('%B %d, %Y')}*\n\n"
@@ -181,10 +317,10 @@ class EnhancedContentAssembler:
             schema_data = self._generate_schema_markup(title, body, meta_description)
 
         # Generate excerpt
-        excerpt = self._generate_excerpt(content, 160)  # SEO optimal length
+        excerpt = shared.excerpt
 
         # Generate SEO tags
-        tags = self._generate_seo_tags(content)
+        tags = list(shared.tags)
 
         # Generate slug
         slug = self._generate_slug(title)
@@ -199,7 +335,7 @@ class EnhancedContentAssembler:
             'schema_markup': schema_data,
             'reading_time': self._estimate_reading_time(body),
             'word_count': len(body.split()),
-            'featured_image': self._select_featured_image(content)
+            'featured_image': shared.featured_image
         }
 
     def generate_social_posts(
@@ -234,6 +370,26 @@ class EnhancedContentAssembler:
 
         return posts
 
+    async def assemble_all(
+        self,
+        content: Dict[str, List[Dict]],
+        channels: Optional[List[str]] = None,
+        template: Optional[str] = None,
+        custom_data: Optional[Dict] = None,
+        seo_optimize: bool = True,
+        platforms: Optional[List[str]] = None
+    ) -> Dict[str, Any]:
+        """
+        Generate several channels from one content dict in a single pass
+
+        See assemble_channels.
+        """
+        return await assemble_channels(
+            self, content, channels,
+            template=template, custom_data=custom_data,
+            seo_optimize=seo_optimize, platforms=platforms
+        )
+
     def _generate_twitter_posts(self, content: Dict[str, List[Dict]]) -> List[Dict]:
         """Generate Twitter/X posts and threads"""
         posts = []
@@ -617,7 +773,7 @@ class EnhancedContentAssembler:
         html = template.render(**template_data)
 
         # Generate plain text version
-        text = self.h2t.handle(html)
+        text = self._render_breathscape_text(template_data, html)
 
         # Generate Breathscape-specific subject line
         subject = self._generate_breathscape_subject_line(content)
@@ -644,10 +800,8 @@ class EnhancedContentAssembler:
         Returns:
             Web content with Breathscape theming and SEO
         """
-        from jinja2 import Template
-
         # Use Breathscape web template
-        template = Template(BREATHSCAPE_WEB_TEMPLATE)
+        template = self.env.get_template('breathscape_web')
 
         title = f"Breathscape Updates - {datetime.now().strftime('%B %Y')}"
 
@@ -728,6 +882,29 @@ class EnhancedContentAssembler:
 
         return posts
 
+    @staticmethod
+    def _create_html2text() -> html2text.HTML2Text:
+        """html2text converter configured for newsletter plain-text parts"""
+        converter = html2text.HTML2Text()
+        converter.ignore_links = False
+        converter.body_width = 0
+        return converter
+
+    def _render_breathscape_text(self, template_data: Dict, html: str) -> str:
+        """
+        Plain-text alternative of the Breathscape newsletter
+
+        Rendered from the same context with the dedicated text template,
+        which matches html2text's output for plain-text content at a fraction
+        of the cost. Content containing markup or characters html2text would
+        escape falls back to converting the HTML.
+        """
+        if not is_plain_text_context(template_data):
+            # HTML2Text keeps state between handle() calls, so use a fresh one
+            return self._create_html2text().handle(html)
+        text = self.env.get_template('breathscape_text').render(**template_data)
+        return BLANK_LINE_RUN.sub('\n\n', text)
+
     def _prepare_breathscape_newsletter_data(self, content: Dict[str, List[Dict]]) -> Dict:
         """Prepare data specifically for Breathscape newsletter template"""
         return {
@@ -976,4 +1153,66 @@ class EnhancedContentAssembler:
             'hashtags': ['#BreathingScience', '#Wellness', '#Mindfulness'],
             'media_urls': [],
             'type': 'default'
-        }
\ No newline at end of file
+        }
+
+
+async def assemble_channels(
+    assembler: EnhancedContentAssembler,
+    content: Dict[str, List[Dict]],
+    channels: Optional[List[str]] = None,
+    template: Optional[str] = None,
+    custom_data: Optional[Dict] = None,
+    seo_optimize: bool = True,
+    platforms: Optional[List[str]] = None
+) -> Dict[str, Any]:
+    """
+    Generate several channels from one content dict in a single pass
+
+    Derived fields (subject, excerpt, tags, stats, ...) are computed once and
+    shared, and channels render concurrently in worker threads so the event
+    loop stays free.
+
+    Args:
+        assembler: Assembler used to render each channel
+        content: Categorized content dictionary
+        channels: Channels to generate (email, web, social); all if omitted
+        template: Optional newsletter template style override
+        custom_data: Optional custom data for the newsletter template
+        seo_optimize: Whether to add SEO enhancements to the web update
+        platforms: Social platforms to generate for
+
+    Returns:
+        Bundle with newsletter, web_update and social_posts (None/empty for
+        channels not requested), the channels rendered and metadata common
+        to all channels
+    """
+    channels = list(channels) if channels else list(ASSEMBLY_CHANNELS)
+    unknown = [channel for channel in channels if channel not in ASSEMBLY_CHANNELS]
+    if unknown:
+        raise ValueError(f"Unknown channels: {', '.join(unknown)}")
+
+    shared = SharedDerivations(assembler, content)
+    renderers = {
+        'email': lambda: assembler.generate_newsletter(
+            content, template=template, custom_data=custom_data, shared=shared
+        ),
+        'web': lambda: assembler.generate_web_update(content, seo_optimize=seo_optimize, shared=shared),
+        'social': lambda: assembler.generate_social_posts(content, platforms)
+    }
+    rendered = await asyncio.gather(*(asyncio.to_thread(renderers[channel]) for channel in channels))
+    results = dict(zip(channels, rendered))
+
+    return {
+        'newsletter': results.get('email'),
+        'web_update': results.get('web'),
+        'social_posts': results.get('social') or [],
+        'channels': channels,
+        'metadata': {
+            'subject': shared.subject,
+            'preview_text': shared.preview_text,
+            'excerpt': shared.excerpt,
+            'meta_description': shared.meta_description,
+            'tags': shared.tags,
+            'featured_image': shared.featured_image
+        }
+    }
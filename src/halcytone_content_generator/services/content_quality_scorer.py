@@ -6,20 +6,34 @@ This module provides comprehensive content quality assessment using AI analysis,
 readability metrics, engagement factors, and quality thresholds.
 """
 import re
+import copy
+import heapq
 import math
+import asyncio
 import statistics
-from typing import Dict, List, Optional, Tuple, Any
+from collections import Counter
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import Dict, List, Optional, Tuple, Any, AsyncIterator, Sequence
 from datetime import datetime
 from enum import Enum
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace, asdict
 import logging
 
 from ..config import get_settings
 from ..services.ai_content_enhancer import AIContentEnhancer, ContentType
 from ..templates.ai_prompts import get_prompt_templates
+from .lexicon_matcher import LexiconMatcher
+from .quality_score_cache import (
+    CacheEntryScoreStore, LRUScoreCache, ScoreCacheKey, make_score_cache_key
+)
+from .text_analysis import TextAnalysis, TextEdit, count_syllables
 
 logger = logging.getLogger(__name__)
 
+# Part of every score cache key; bump whenever scoring logic or word lists
+# change so memoized and persisted scores from older versions are ignored
+SCORER_VERSION = "3"
+
 
 class QualityLevel(Enum):
     """Quality level classifications"""
@@ -198,6 +212,43 @@ class QualityScore:
         )
         return min(100, cta_elements)
 
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to a JSON-serializable dictionary"""
+        data = asdict(self)
+        feedback = data["detailed_feedback"]
+        if "category_scores" in feedback:
+            feedback["category_scores"] = {
+                category.value if isinstance(category, ScoreCategory) else category: value
+                for category, value in feedback["category_scores"].items()
+            }
+        data["quality_level"] = self.quality_level.value
+        data["timestamp"] = self.timestamp.isoformat()
+        return data
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'QualityScore':
+        """Rebuild a quality score from to_dict output"""
+        feedback = dict(data.get("detailed_feedback", {}))
+        if "category_scores" in feedback:
+            feedback["category_scores"] = {
+                ScoreCategory(category): value
+                for category, value in feedback["category_scores"].items()
+            }
+        return cls(
+            overall_score=data["overall_score"],
+            readability_metrics=ReadabilityMetrics(**data["readability_metrics"]),
+            engagement_metrics=EngagementMetrics(**data["engagement_metrics"]),
+            seo_metrics=SEOMetrics(**data["seo_metrics"]),
+            brand_alignment_score=data["brand_alignment_score"],
+            structure_score=data["structure_score"],
+            clarity_score=data["clarity_score"],
+            ai_assessment_score=data["ai_assessment_score"],
+            quality_level=QualityLevel(data["quality_level"]),
+            improvement_suggestions=list(data.get("improvement_suggestions", [])),
+            detailed_feedback=feedback,
+            timestamp=datetime.fromisoformat(data["timestamp"])
+        )
+
 
 class QualityThresholds:
     """Quality thresholds and standards"""
@@ -309,6 +360,13 @@ class ContentQualityScorer:
         self.ai_enhancer = None  # Lazy initialization
         self.prompt_templates = get_prompt_templates()
         self.thresholds = QualityThresholds()
+        self._executor: Optional[Executor] = None
+
+        # Memoized scores keyed by content hash; the persistent tier is opt-in
+        self.score_cache = LRUScoreCache(self.settings.QUALITY_SCORE_CACHE_SIZE)
+        self.score_store: Optional[CacheEntryScoreStore] = None
+        if self.settings.QUALITY_SCORE_CACHE_PERSISTENT:
+            self.score_store = CacheEntryScoreStore(ttl_seconds=self.settings.QUALITY_SCORE_CACHE_TTL)
 
         # Word lists for analysis
         self.emotional_words = self._load_emotional_words()
@@ -316,6 +374,28 @@ class ContentQualityScorer:
         self.sensory_words = self._load_sensory_words()
         self.urgency_indicators = self._load_urgency_indicators()
         self.complex_words = self._load_complex_words()
+        self.social_proof_terms = self._load_social_proof_terms()
+        self.storytelling_elements = self._load_storytelling_elements()
+        self.curiosity_triggers = self._load_curiosity_triggers()
+        self.brand_terms = self._load_brand_terms()
+        self.brand_value_terms = self._load_brand_value_terms()
+        self.transition_words = self._load_transition_words()
+
+        # Compile every word list into one automaton so each scoring run
+        # counts all lexicons in a single scan of the word tokens
+        self.lexicon_matcher = LexiconMatcher({
+            'emotional': self.emotional_words,
+            'power': self.power_words,
+            'sensory': self.sensory_words,
+            'urgency': self.urgency_indicators,
+            'complex': self.complex_words,
+            'social_proof': self.social_proof_terms,
+            'storytelling': self.storytelling_elements,
+            'curiosity': self.curiosity_triggers,
+            'brand': self.brand_terms,
+            'brand_values': self.brand_value_terms,
+            'transitions': self.transition_words
+        })
 
     @property
     def ai_enhancer_instance(self):
@@ -374,6 +454,49 @@ class ContentQualityScorer:
             "substantial", "technology", "transformation", "utilization", "verification"
         ]
 
+    def _load_social_proof_terms(self) -> List[str]:
+        """Load social proof indicator terms"""
+        return [
+            "testimonial", "review", "customer", "user", "client",
+            "success story", "case study", "proven", "trusted"
+        ]
+
+    def _load_storytelling_elements(self) -> List[str]:
+        """Load storytelling element phrases"""
+        return [
+            "once", "story", "imagine", "picture this", "example",
+            "for instance", "let me tell you"
+        ]
+
+    def _load_curiosity_triggers(self) -> List[str]:
+        """Load curiosity trigger words"""
+        return [
+            "secret", "hidden", "revealed", "discover", "unknown",
+            "mystery", "surprise", "shocking"
+        ]
+
+    def _load_brand_terms(self) -> List[str]:
+        """Load Breathscape brand terms"""
+        return [
+            "breathscape", "wellness", "mindfulness", "breathing", "meditation",
+            "health", "wellbeing", "balance", "calm", "peace", "tranquility",
+            "stress relief", "relaxation", "mental health", "self-care"
+        ]
+
+    def _load_brand_value_terms(self) -> List[str]:
+        """Load Breathscape brand value terms"""
+        return [
+            "innovation", "technology", "personalized", "data-driven", "science",
+            "research", "evidence-based", "user-friendly", "accessible", "empowering"
+        ]
+
+    def _load_transition_words(self) -> List[str]:
+        """Load transition words that improve clarity"""
+        return [
+            "however", "therefore", "furthermore", "meanwhile", "consequently",
+            "additionally", "moreover", "nevertheless", "subsequently", "thus"
+        ]
+
     async def score_content(self, content: str, content_type: ContentType,
                            include_ai_analysis: bool = True) -> QualityScore:
         """
@@ -388,98 +511,296 @@ class ContentQualityScorer:
             Comprehensive quality score with metrics and suggestions
         """
         try:
-            # Calculate individual metrics
-            readability = self._calculate_readability_metrics(content)
-            engagement = self._calculate_engagement_metrics(content)
-            seo = self._calculate_seo_metrics(content, content_type)
-
-            # Calculate other scores
-            brand_alignment = self._calculate_brand_alignment_score(content)
-            structure_score = self._calculate_structure_score(content, content_type)
-            clarity_score = self._calculate_clarity_score(content)
-
-            # AI-powered assessment (if enabled and configured)
-            ai_score = 0.0
-            if include_ai_analysis and self.ai_enhancer_instance.is_configured():
-                ai_assessment = await self.ai_enhancer_instance.score_content_quality(
-                    content, content_type
-                )
-                ai_score = ai_assessment.overall_score
-
-            # Calculate overall score with weights
-            category_scores = {
-                ScoreCategory.READABILITY: readability.overall_readability_score,
-                ScoreCategory.ENGAGEMENT: engagement.engagement_score,
-                ScoreCategory.SEO_OPTIMIZATION: seo.seo_score,
-                ScoreCategory.BRAND_ALIGNMENT: brand_alignment,
-                ScoreCategory.STRUCTURE: structure_score,
-                ScoreCategory.CLARITY: clarity_score
-            }
+            cache_key = self._score_cache_key(content, content_type, include_ai_analysis)
+            cached = await self._get_cached_score(cache_key)
+            if cached is not None:
+                return cached
 
-            # Weight categories based on content type
-            weights = self._get_category_weights(content_type)
-            overall_score = sum(
-                category_scores[category] * weights.get(category, 0.1)
-                for category in category_scores
-            )
-
-            # Include AI score if available
-            if ai_score > 0:
-                overall_score = (overall_score * 0.8) + (ai_score * 0.2)
-
-            # Determine quality level
-            quality_level = self.thresholds.classify_quality(overall_score)
-
-            # Generate improvement suggestions
-            suggestions = self._generate_improvement_suggestions(
-                category_scores, content_type, quality_level
-            )
-
-            # Create detailed feedback
-            detailed_feedback = self._create_detailed_feedback(
-                content, category_scores, readability, engagement, seo
-            )
-
-            return QualityScore(
-                overall_score=overall_score,
-                readability_metrics=readability,
-                engagement_metrics=engagement,
-                seo_metrics=seo,
-                brand_alignment_score=brand_alignment,
-                structure_score=structure_score,
-                clarity_score=clarity_score,
-                ai_assessment_score=ai_score,
-                quality_level=quality_level,
-                improvement_suggestions=suggestions,
-                detailed_feedback=detailed_feedback
-            )
+            score = self.score_metrics(content, content_type)
+            score = await self._apply_ai_analysis(score, content, content_type, include_ai_analysis)
+            await self._cache_score(cache_key, score, include_ai_analysis)
+            return score
 
         except Exception as e:
             logger.error(f"Content quality scoring failed: {e}")
             # Return minimal score on error
             return self._create_error_score(str(e))
 
-    def _calculate_readability_metrics(self, content: str) -> ReadabilityMetrics:
+    async def score_many(self, contents: Sequence[str], content_type: ContentType,
+                         include_ai_analysis: bool = False,
+                         executor: Optional[Executor] = None
+                         ) -> AsyncIterator[Tuple[int, QualityScore]]:
+        """
+        Score many pieces of content, yielding results as they finish
+
+        The CPU-bound metric calculations run in a process pool so the event
+        loop stays free; AI analysis (if requested) is awaited on the loop
+        once the metrics for an item are ready.
+
+        Args:
+            contents: Content strings to analyze
+            content_type: Type of content for context-specific analysis
+            include_ai_analysis: Whether to include AI-powered analysis
+            executor: Executor for metric calculation (defaults to the scorer's process pool)
+
+        Yields:
+            Tuples of (index into contents, quality score) in completion order
+        """
+        loop = asyncio.get_running_loop()
+        pool = executor or self._get_executor()
+
+        async def score_item(index: int, content: str) -> Tuple[int, QualityScore]:
+            try:
+                cache_key = self._score_cache_key(content, content_type, include_ai_analysis)
+                score = await self._get_cached_score(cache_key)
+                if score is not None:
+                    return index, score
+
+                score = await loop.run_in_executor(pool, _score_metrics_in_worker, content, content_type)
+                score = await self._apply_ai_analysis(score, content, content_type, include_ai_analysis)
+                await self._cache_score(cache_key, score, include_ai_analysis)
+            except Exception as e:
+                logger.error(f"Content quality scoring failed for batch item {index}: {e}")
+                score = self._create_error_score(str(e))
+            return index, score
+
+        tasks = [asyncio.create_task(score_item(index, content))
+                 for index, content in enumerate(contents)]
+        try:
+            for next_result in asyncio.as_completed(tasks):
+                yield await next_result
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def rescore_content(self, previous: TextAnalysis, edits: Sequence[TextEdit],
+                              content_type: ContentType,
+                              include_ai_analysis: bool = False
+                              ) -> Tuple[QualityScore, TextAnalysis]:
+        """
+        Re-score an edited draft from the analysis of its previous version
+
+        Only the paragraphs touched by the edits are re-tokenized; the other
+        aggregates are carried over from the previous analysis as running sums.
+
+        Args:
+            previous: Analysis of the draft before the edits (from analyze_text
+                or an earlier rescore_content call)
+            edits: Non-overlapping replacements relative to the previous content
+                (TextEdit.between(old, new) builds one from two versions)
+            content_type: Type of content for context-specific analysis
+            include_ai_analysis: Whether to include AI-powered analysis
+
+        Returns:
+            Tuple of (quality score, analysis of the edited content) so the
+            next edit can be scored incrementally as well
+
+        Raises:
+            ValueError: If an edit falls outside the previous content
+        """
+        analysis = self.analyze_edit(previous, edits)
+        content = analysis.content
+        try:
+            cache_key = self._score_cache_key(content, content_type, include_ai_analysis)
+            cached = await self._get_cached_score(cache_key)
+            if cached is not None:
+                return cached, analysis
+
+            score = self.score_metrics(content, content_type, analysis)
+            score = await self._apply_ai_analysis(score, content, content_type, include_ai_analysis)
+            await self._cache_score(cache_key, score, include_ai_analysis)
+            return score, analysis
+
+        except Exception as e:
+            logger.error(f"Content quality re-scoring failed: {e}")
+            return self._create_error_score(str(e)), analysis
+
+    def score_metrics(self, content: str, content_type: ContentType,
+                      analysis: Optional[TextAnalysis] = None) -> QualityScore:
+        """
+        Calculate the non-AI quality score synchronously
+
+        This is the CPU-bound part of scoring and is safe to run in a worker
+        process; score_content and score_many layer AI analysis on top.
+        """
+        # Tokenize once and share the analysis across all metrics
+        analysis = analysis or self.analyze_text(content)
+
+        # Calculate individual metrics
+        readability = self._calculate_readability_metrics(content, analysis)
+        engagement = self._calculate_engagement_metrics(content, analysis)
+        seo = self._calculate_seo_metrics(content, content_type, analysis)
+
+        # Calculate other scores
+        brand_alignment = self._calculate_brand_alignment_score(content, analysis)
+        structure_score = self._calculate_structure_score(content, content_type, analysis)
+        clarity_score = self._calculate_clarity_score(content, analysis)
+
+        # Calculate overall score with weights
+        category_scores = {
+            ScoreCategory.READABILITY: readability.overall_readability_score,
+            ScoreCategory.ENGAGEMENT: engagement.engagement_score,
+            ScoreCategory.SEO_OPTIMIZATION: seo.seo_score,
+            ScoreCategory.BRAND_ALIGNMENT: brand_alignment,
+            ScoreCategory.STRUCTURE: structure_score,
+            ScoreCategory.CLARITY: clarity_score
+        }
+
+        # Weight categories based on content type
+        weights = self._get_category_weights(content_type)
+        overall_score = sum(
+            category_scores[category] * weights.get(category, 0.1)
+            for category in category_scores
+        )
+
+        # Determine quality level
+        quality_level = self.thresholds.classify_quality(overall_score)
+
+        # Generate improvement suggestions
+        suggestions = self._generate_improvement_suggestions(
+            category_scores, content_type, quality_level
+        )
+
+        # Create detailed feedback
+        detailed_feedback = self._create_detailed_feedback(
+            content, category_scores, readability, engagement, seo, analysis
+        )
+
+        return QualityScore(
+            overall_score=overall_score,
+            readability_metrics=readability,
+            engagement_metrics=engagement,
+            seo_metrics=seo,
+            brand_alignment_score=brand_alignment,
+            structure_score=structure_score,
+            clarity_score=clarity_score,
+            ai_assessment_score=0.0,
+            quality_level=quality_level,
+            improvement_suggestions=suggestions,
+            detailed_feedback=detailed_feedback
+        )
+
+    async def _apply_ai_analysis(self, score: QualityScore, content: str,
+                                 content_type: ContentType,
+                                 include_ai_analysis: bool) -> QualityScore:
+        """Blend AI-powered assessment (if enabled and configured) into a metric score"""
+        if not include_ai_analysis or not self.ai_enhancer_instance.is_configured():
+            return score
+
+        ai_assessment = await self.ai_enhancer_instance.score_content_quality(
+            content, content_type
+        )
+        ai_score = ai_assessment.overall_score
+        if ai_score <= 0:
+            return replace(score, ai_assessment_score=ai_score)
+
+        # Include AI score and re-derive level and suggestions from the blend
+        overall_score = (score.overall_score * 0.8) + (ai_score * 0.2)
+        quality_level = self.thresholds.classify_quality(overall_score)
+        suggestions = self._generate_improvement_suggestions(
+            score.detailed_feedback["category_scores"], content_type, quality_level
+        )
+        return replace(
+            score,
+            overall_score=overall_score,
+            ai_assessment_score=ai_score,
+            quality_level=quality_level,
+            improvement_suggestions=suggestions
+        )
+
+    def _score_cache_key(self, content: str, content_type: ContentType,
+                         include_ai_analysis: bool) -> ScoreCacheKey:
+        """Cache key for a scoring request"""
+        return make_score_cache_key(content, content_type.value, include_ai_analysis, SCORER_VERSION)
+
+    async def _get_cached_score(self, key: ScoreCacheKey) -> Optional[QualityScore]:
+        """Look up a memoized score in memory, then in the persistent tier"""
+        if not self.score_cache.enabled:
+            return None
+
+        score = self.score_cache.get(key)
+        if score is None and self.score_store is not None:
+            payload = await self.score_store.load(key)
+            if payload is not None:
+                score = QualityScore.from_dict(payload)
+                self.score_cache.put(key, score)
+
+        if score is None:
+            return None
+
+        # Hand out copies so callers cannot mutate the cached score, stamped
+        # with the time they are served like a freshly computed score
+        served = copy.deepcopy(score)
+        served.timestamp = datetime.utcnow()
+        return served
+
+    async def _cache_score(self, key: ScoreCacheKey, score: QualityScore,
+                           include_ai_analysis: bool):
+        """Memoize a freshly computed score"""
+        if not self.score_cache.enabled:
+            return
+
+        # A zero AI score with AI configured means the assessment failed;
+        # leave it uncached so the next request retries the AI call
+        if (include_ai_analysis and score.ai_assessment_score <= 0
+                and self.ai_enhancer_instance.is_configured()):
+            return
+
+        self.score_cache.put(key, copy.deepcopy(score))
+        if self.score_store is not None:
+            await self.score_store.save(key, score.to_dict())
+
+    def clear_score_cache(self):
+        """Drop memoized scores held in memory"""
+        self.score_cache.clear()
+
+    def _get_executor(self) -> Executor:
+        """Lazily create the process pool used for batch metric calculation"""
+        if self._executor is None:
+            max_workers = self.settings.QUALITY_SCORING_WORKERS or None  # 0 means one worker per CPU
+            self._executor = ProcessPoolExecutor(max_workers=max_workers)
+        return self._executor
+
+    def shutdown(self, wait: bool = True):
+        """Shut down the batch scoring process pool"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=wait, cancel_futures=True)
+            self._executor = None
+
+    def analyze_text(self, content: str) -> TextAnalysis:
+        """Tokenize content once for use by every metric calculation"""
+        return TextAnalysis.from_content(content, self.lexicon_matcher)
+
+    def analyze_edit(self, previous: TextAnalysis, edits: Sequence[TextEdit]) -> TextAnalysis:
+        """Update a previous analysis for edits, re-tokenizing only touched paragraphs"""
+        if previous.lexicon_matcher is not self.lexicon_matcher:
+            # Lexicon hits from another scorer cannot be updated incrementally
+            previous = self.analyze_text(previous.content)
+        return previous.apply_edits(edits)
+
+    def _lexicon_count(self, analysis: TextAnalysis, lexicon: str) -> int:
+        """Number of distinct terms from a lexicon that appear in the content"""
+        return len(analysis.lexicon_hits.get(lexicon, {}))
+
+    def _calculate_readability_metrics(self, content: str,
+                                       analysis: Optional[TextAnalysis] = None) -> ReadabilityMetrics:
         """Calculate comprehensive readability metrics"""
-        # Clean content for analysis
-        sentences = self._split_sentences(content)
-        words = self._split_words(content)
-        syllables = [self._count_syllables(word) for word in words]
+        analysis = analysis or self.analyze_text(content)
+        word_count = analysis.word_count
+        sentence_count = analysis.sentence_count
 
-        if not sentences or not words:
+        if not sentence_count or not word_count:
             return self._create_default_readability_metrics()
 
         # Basic metrics
-        avg_sentence_length = len(words) / len(sentences)
-        avg_syllables_per_word = sum(syllables) / len(syllables) if syllables else 1.0
+        avg_sentence_length = word_count / sentence_count
+        avg_syllables_per_word = analysis.total_syllables / word_count
 
         # Complex words (3+ syllables)
-        complex_words = [s for s in syllables if s >= 3]
-        complex_words_percentage = (len(complex_words) / len(words)) * 100
+        complex_words_percentage = (analysis.complex_word_count / word_count) * 100
 
         # Passive voice detection
-        passive_count = self._count_passive_voice(content)
-        passive_voice_percentage = (passive_count / len(sentences)) * 100
+        passive_voice_percentage = (analysis.passive_voice_count / sentence_count) * 100
 
         # Flesch Reading Ease
         flesch_ease = 206.835 - (1.015 * avg_sentence_length) - (84.6 * avg_syllables_per_word)
@@ -493,13 +814,13 @@ class ContentQualityScorer:
         fog_index = 0.4 * (avg_sentence_length + complex_words_percentage)
 
         # Automated Readability Index
-        characters = sum(len(word) for word in words)
-        ari = 4.71 * (characters / len(words)) + 0.5 * (len(words) / len(sentences)) - 21.43
+        characters = analysis.character_count
+        ari = 4.71 * (characters / word_count) + 0.5 * (word_count / sentence_count) - 21.43
         ari = max(0, ari)
 
         # Coleman-Liau Index
-        l_value = (characters / len(words)) * 100
-        s_value = (len(sentences) / len(words)) * 100
+        l_value = (characters / word_count) * 100
+        s_value = (sentence_count / word_count) * 100
         cli = 0.0588 * l_value - 0.296 * s_value - 15.8
         cli = max(0, cli)
 
@@ -515,41 +836,27 @@ class ContentQualityScorer:
             passive_voice_percentage=passive_voice_percentage
         )
 
-    def _calculate_engagement_metrics(self, content: str) -> EngagementMetrics:
+    def _calculate_engagement_metrics(self, content: str,
+                                      analysis: Optional[TextAnalysis] = None) -> EngagementMetrics:
         """Calculate engagement-related metrics"""
-        content_lower = content.lower()
+        analysis = analysis or self.analyze_text(content)
 
         # Count various engagement factors
-        emotional_words = sum(1 for word in self.emotional_words if word in content_lower)
-        power_words = sum(1 for word in self.power_words if word in content_lower)
+        emotional_words = self._lexicon_count(analysis, 'emotional')
+        power_words = self._lexicon_count(analysis, 'power')
         questions = content.count('?')
         exclamations = content.count('!')
 
         # Personal pronouns
         pronouns = ['you', 'your', 'yours', 'we', 'our', 'ours', 'i', 'my', 'mine']
-        personal_pronouns = sum(len(re.findall(rf'\b{pronoun}\b', content_lower))
-                               for pronoun in pronouns)
-
-        # Sensory words
-        sensory_words = sum(1 for word in self.sensory_words if word in content_lower)
-
-        # Urgency indicators
-        urgency = sum(1 for indicator in self.urgency_indicators if indicator in content_lower)
+        personal_pronouns = sum(analysis.word_counts[pronoun] for pronoun in pronouns)
 
-        # Social proof indicators
-        social_proof_terms = ['testimonial', 'review', 'customer', 'user', 'client',
-                             'success story', 'case study', 'proven', 'trusted']
-        social_proof = sum(1 for term in social_proof_terms if term in content_lower)
-
-        # Storytelling elements
-        story_elements = ['once', 'story', 'imagine', 'picture this', 'example',
-                         'for instance', 'let me tell you']
-        storytelling = sum(1 for element in story_elements if element in content_lower)
-
-        # Curiosity triggers
-        curiosity_triggers = ['secret', 'hidden', 'revealed', 'discover', 'unknown',
-                             'mystery', 'surprise', 'shocking']
-        curiosity = sum(1 for trigger in curiosity_triggers if trigger in content_lower)
+        # Sensory words, urgency, social proof, storytelling and curiosity
+        sensory_words = self._lexicon_count(analysis, 'sensory')
+        urgency = self._lexicon_count(analysis, 'urgency')
+        social_proof = self._lexicon_count(analysis, 'social_proof')
+        storytelling = self._lexicon_count(analysis, 'storytelling')
+        curiosity = self._lexicon_count(analysis, 'curiosity')
 
         return EngagementMetrics(
             emotional_words_count=emotional_words,
@@ -564,30 +871,31 @@ class ContentQualityScorer:
             curiosity_triggers=curiosity
         )
 
-    def _calculate_seo_metrics(self, content: str, content_type: ContentType) -> SEOMetrics:
+    def _calculate_seo_metrics(self, content: str, content_type: ContentType,
+                               analysis: Optional[TextAnalysis] = None) -> SEOMetrics:
         """Calculate SEO optimization metrics"""
-        words = self._split_words(content.lower())
+        analysis = analysis or self.analyze_text(content)
 
         # Basic keyword density (placeholder - would need target keywords)
-        keyword_density = self._calculate_keyword_density(words)
+        keyword_density = self._calculate_keyword_density(analysis.words, analysis.word_counts)
 
         # Title optimization (look for title-like content at beginning)
-        title_score = self._score_title_optimization(content)
+        title_score = self._score_title_optimization(content, analysis)
 
         # Meta description score (if content suggests meta description)
-        meta_score = self._score_meta_description(content)
+        meta_score = self._score_meta_description(content, analysis)
 
         # Header structure (look for header patterns)
-        header_score = self._score_header_structure(content)
+        header_score = self._score_header_structure(content, analysis)
 
         # Link opportunities
-        internal_links = len(re.findall(r'\[([^\]]+)\]\([^)]+\)', content))  # Markdown links
+        internal_links = len(analysis.link_spans)  # Markdown links
 
         # Content length optimization
-        length_score = self._score_content_length(content, content_type)
+        length_score = self._score_content_length(content, content_type, analysis)
 
         # Semantic keywords (related terms)
-        semantic_count = self._count_semantic_keywords(content)
+        semantic_count = self._count_semantic_keywords(content, analysis)
 
         return SEOMetrics(
             keyword_density=keyword_density,
@@ -601,64 +909,56 @@ class ContentQualityScorer:
             semantic_keywords_count=semantic_count
         )
 
-    def _calculate_brand_alignment_score(self, content: str) -> float:
+    def _calculate_brand_alignment_score(self, content: str,
+                                         analysis: Optional[TextAnalysis] = None) -> float:
         """Calculate brand alignment score for Breathscape"""
-        content_lower = content.lower()
+        analysis = analysis or self.analyze_text(content)
 
-        # Breathscape brand terms
-        brand_terms = [
-            'breathscape', 'wellness', 'mindfulness', 'breathing', 'meditation',
-            'health', 'wellbeing', 'balance', 'calm', 'peace', 'tranquility',
-            'stress relief', 'relaxation', 'mental health', 'self-care'
-        ]
-
-        # Brand values terms
-        value_terms = [
-            'innovation', 'technology', 'personalized', 'data-driven', 'science',
-            'research', 'evidence-based', 'user-friendly', 'accessible', 'empowering'
-        ]
-
-        # Count brand-related terms
-        brand_count = sum(1 for term in brand_terms if term in content_lower)
-        value_count = sum(1 for term in value_terms if term in content_lower)
+        # Count brand-related and brand value terms
+        brand_count = self._lexicon_count(analysis, 'brand')
+        value_count = self._lexicon_count(analysis, 'brand_values')
 
         # Calculate score based on presence and frequency
-        total_words = len(content.split())
+        total_words = analysis.whitespace_word_count
         brand_density = (brand_count + value_count) / max(total_words / 100, 1)
 
         # Base score on brand term presence and appropriate messaging
         base_score = min(100, brand_density * 20)
 
         # Bonus for mentioning Breathscape specifically
-        if 'breathscape' in content_lower:
+        if 'breathscape' in analysis.content_lower:
             base_score += 20
 
         return min(100, base_score)
 
-    def _calculate_structure_score(self, content: str, content_type: ContentType) -> float:
+    def _calculate_structure_score(self, content: str, content_type: ContentType,
+                                   analysis: Optional[TextAnalysis] = None) -> float:
         """Calculate content structure score"""
+        analysis = analysis or self.analyze_text(content)
+
         # Different structure requirements by content type
         if content_type == ContentType.EMAIL:
-            return self._score_email_structure(content)
+            return self._score_email_structure(content, analysis)
         elif content_type == ContentType.WEB:
-            return self._score_web_structure(content)
+            return self._score_web_structure(content, analysis)
         elif content_type in [ContentType.SOCIAL_TWITTER, ContentType.SOCIAL_LINKEDIN,
                              ContentType.SOCIAL_FACEBOOK, ContentType.SOCIAL_INSTAGRAM]:
-            return self._score_social_structure(content)
+            return self._score_social_structure(content, analysis)
         else:
-            return self._score_general_structure(content)
+            return self._score_general_structure(content, analysis)
 
-    def _calculate_clarity_score(self, content: str) -> float:
+    def _calculate_clarity_score(self, content: str,
+                                 analysis: Optional[TextAnalysis] = None) -> float:
         """Calculate content clarity score"""
+        analysis = analysis or self.analyze_text(content)
+
         # Factors affecting clarity
         factors = []
 
         # Sentence length variation
-        sentences = self._split_sentences(content)
-        if sentences:
-            lengths = [len(sentence.split()) for sentence in sentences]
-            avg_length = statistics.mean(lengths)
-            variation = statistics.stdev(lengths) if len(lengths) > 1 else 0
+        if analysis.sentence_count:
+            avg_length = analysis.sentence_length_mean
+            variation = analysis.sentence_length_stdev
 
             # Optimal sentence length is 15-20 words
             length_score = max(0, 100 - abs(avg_length - 17.5) * 4)
@@ -669,15 +969,12 @@ class ContentQualityScorer:
             factors.append(variation_score)
 
         # Use of transition words
-        transitions = ['however', 'therefore', 'furthermore', 'meanwhile', 'consequently',
-                      'additionally', 'moreover', 'nevertheless', 'subsequently', 'thus']
-        transition_count = sum(1 for trans in transitions if trans in content.lower())
+        transition_count = self._lexicon_count(analysis, 'transitions')
         transition_score = min(100, transition_count * 15)
         factors.append(transition_score)
 
         # Avoid jargon and complex words
-        complex_count = sum(1 for word in self.complex_words
-                           if word in content.lower())
+        complex_count = self._lexicon_count(analysis, 'complex')
         jargon_penalty = min(50, complex_count * 5)
         complexity_score = max(0, 100 - jargon_penalty)
         factors.append(complexity_score)
@@ -697,49 +994,33 @@ class ContentQualityScorer:
 
     def _count_syllables(self, word: str) -> int:
         """Count syllables in a word (approximation)"""
-        word = word.lower()
-        count = 0
-        vowels = 'aeiouy'
-        if word[0] in vowels:
-            count += 1
-        for index in range(1, len(word)):
-            if word[index] in vowels and word[index - 1] not in vowels:
-                count += 1
-        if word.endswith('e'):
-            count -= 1
-        if count == 0:
-            count += 1
-        return count
+        return count_syllables(word)
 
     def _count_passive_voice(self, content: str) -> int:
         """Count passive voice constructions"""
-        # Simple passive voice detection
-        passive_patterns = [
-            r'\bis\s+\w+ed\b', r'\bare\s+\w+ed\b', r'\bwas\s+\w+ed\b',
-            r'\bwere\s+\w+ed\b', r'\bbeen\s+\w+ed\b', r'\bbeing\s+\w+ed\b'
-        ]
-        count = 0
-        for pattern in passive_patterns:
-            count += len(re.findall(pattern, content, re.IGNORECASE))
-        return count
+        return self.analyze_text(content).passive_voice_count
 
-    def _calculate_keyword_density(self, words: List[str]) -> Dict[str, float]:
+    def _calculate_keyword_density(self, words: List[str],
+                                   word_counts: Optional[Counter] = None) -> Dict[str, float]:
         """Calculate keyword density for common terms"""
-        from collections import Counter
-        word_counts = Counter(words)
+        if word_counts is None:
+            word_counts = Counter(words)
         total_words = len(words)
 
-        # Return density for most common words
+        # Return density for most common words (ties broken alphabetically so
+        # the result does not depend on the order words were counted in)
         density = {}
-        for word, count in word_counts.most_common(10):
+        for word, count in heapq.nsmallest(10, word_counts.items(),
+                                           key=lambda item: (-item[1], item[0])):
             if len(word) > 3:  # Skip short words
                 density[word] = (count / total_words) * 100
 
         return density
 
-    def _score_title_optimization(self, content: str) -> float:
+    def _score_title_optimization(self, content: str,
+                                  analysis: Optional[TextAnalysis] = None) -> float:
         """Score title optimization"""
-        lines = content.split('\n')
+        lines = analysis.lines if analysis else content.split('\n')
         if not lines:
             return 0.0
 
@@ -760,10 +1041,11 @@ class ContentQualityScorer:
 
         return title_score
 
-    def _score_meta_description(self, content: str) -> float:
+    def _score_meta_description(self, content: str,
+                                analysis: Optional[TextAnalysis] = None) -> float:
         """Score meta description optimization"""
         # Look for description-like content (usually 2nd paragraph)
-        paragraphs = content.split('\n\n')
+        paragraphs = analysis.paragraphs if analysis else content.split('\n\n')
         if len(paragraphs) < 2:
             return 50.0  # Default score if no clear description
 
@@ -784,17 +1066,18 @@ class ContentQualityScorer:
 
         return score
 
-    def _score_header_structure(self, content: str) -> float:
+    def _score_header_structure(self, content: str,
+                                analysis: Optional[TextAnalysis] = None) -> float:
         """Score header structure"""
         # Look for markdown headers or structured text
-        headers = re.findall(r'^#{1,6}\s+.+$', content, re.MULTILINE)
+        headers = (analysis or self.analyze_text(content)).headers
 
         score = 0.0
         if headers:
             score += 40  # Has headers
 
             # Check hierarchy
-            header_levels = [len(re.match(r'^#+', h).group()) for h in headers]
+            header_levels = [header.level for header in headers]
             if len(set(header_levels)) > 1:
                 score += 30  # Multiple levels
 
@@ -804,9 +1087,10 @@ class ContentQualityScorer:
 
         return score
 
-    def _score_content_length(self, content: str, content_type: ContentType) -> float:
+    def _score_content_length(self, content: str, content_type: ContentType,
+                              analysis: Optional[TextAnalysis] = None) -> float:
         """Score content length appropriateness"""
-        word_count = len(content.split())
+        word_count = analysis.whitespace_word_count if analysis else len(content.split())
 
         # Optimal lengths by content type
         optimal_ranges = {
@@ -827,7 +1111,8 @@ class ContentQualityScorer:
         else:
             return max(0, 100 - (word_count - max_words) * 0.5)
 
-    def _count_semantic_keywords(self, content: str) -> int:
+    def _count_semantic_keywords(self, content: str,
+                                 analysis: Optional[TextAnalysis] = None) -> int:
         """Count semantic keywords related to wellness/tech"""
         semantic_terms = [
             'algorithm', 'analytics', 'artificial intelligence', 'biometric',
@@ -837,46 +1122,53 @@ class ContentQualityScorer:
             'stress management', 'user experience', 'wearable', 'wellness journey'
         ]
 
-        content_lower = content.lower()
+        content_lower = analysis.content_lower if analysis else content.lower()
         return sum(1 for term in semantic_terms if term in content_lower)
 
     # Structure scoring methods
-    def _score_email_structure(self, content: str) -> float:
+    def _score_email_structure(self, content: str,
+                               analysis: Optional[TextAnalysis] = None) -> float:
         """Score email-specific structure"""
+        analysis = analysis or self.analyze_text(content)
+        content_lower = analysis.content_lower
+        opening_text = content_lower[:100]
+        closing_text = content_lower[-200:]
         score = 0.0
 
         # Has clear subject line suggestion
-        if content.lower().startswith('subject:') or 'subject line' in content.lower():
+        if content_lower.startswith('subject:') or 'subject line' in content_lower:
             score += 20
 
         # Has greeting/opening
         openings = ['dear', 'hello', 'hi', 'greetings', 'welcome']
-        if any(opening in content.lower()[:100] for opening in openings):
+        if any(opening in opening_text for opening in openings):
             score += 15
 
         # Has clear call to action
         cta_terms = ['click', 'visit', 'download', 'register', 'subscribe', 'learn more']
-        if any(cta in content.lower() for cta in cta_terms):
+        if any(cta in content_lower for cta in cta_terms):
             score += 25
 
         # Has signature/closing
         closings = ['best regards', 'sincerely', 'thanks', 'cheers', 'team']
-        if any(closing in content.lower()[-200:] for closing in closings):
+        if any(closing in closing_text for closing in closings):
             score += 15
 
         # Proper paragraph breaks
-        paragraphs = content.split('\n\n')
+        paragraphs = analysis.paragraphs
         if 2 <= len(paragraphs) <= 6:
             score += 25
 
         return score
 
-    def _score_web_structure(self, content: str) -> float:
+    def _score_web_structure(self, content: str,
+                             analysis: Optional[TextAnalysis] = None) -> float:
         """Score web content structure"""
+        analysis = analysis or self.analyze_text(content)
         score = 0.0
 
         # Has clear title/heading
-        if content.strip().startswith('#') or re.match(r'^[A-Z][^.!?]*$', content.split('\n')[0]):
+        if content.strip().startswith('#') or re.match(r'^[A-Z][^.!?]*$', analysis.lines[0]):
             score += 25
 
         # Has subheadings
@@ -888,19 +1180,20 @@ class ContentQualityScorer:
             score += 20
 
         # Has clear sections
-        paragraphs = content.split('\n\n')
-        if len(paragraphs) >= 3:
+        if len(analysis.paragraphs) >= 3:
             score += 15
 
         # Has conclusion/summary
         conclusion_terms = ['conclusion', 'summary', 'in summary', 'to summarize', 'final thoughts']
-        if any(term in content.lower() for term in conclusion_terms):
+        if any(term in analysis.content_lower for term in conclusion_terms):
             score += 15
 
         return score
 
-    def _score_social_structure(self, content: str) -> float:
+    def _score_social_structure(self, content: str,
+                                analysis: Optional[TextAnalysis] = None) -> float:
         """Score social media structure"""
+        analysis = analysis or self.analyze_text(content)
         score = 0.0
 
         # Has attention-grabbing opening
@@ -920,23 +1213,24 @@ class ContentQualityScorer:
             score += 15
 
         # Clear call to action
-        if any(cta in content.lower() for cta in ['follow', 'share', 'comment', 'like', 'tag']):
+        if any(cta in analysis.content_lower for cta in ['follow', 'share', 'comment', 'like', 'tag']):
             score += 30
 
         return score
 
-    def _score_general_structure(self, content: str) -> float:
+    def _score_general_structure(self, content: str,
+                                 analysis: Optional[TextAnalysis] = None) -> float:
         """Score general content structure"""
+        analysis = analysis or self.analyze_text(content)
         score = 0.0
 
         # Has clear beginning, middle, end
-        paragraphs = content.split('\n\n')
-        if len(paragraphs) >= 3:
+        if len(analysis.paragraphs) >= 3:
             score += 40
 
         # Has logical flow
         transition_words = ['first', 'second', 'then', 'next', 'finally', 'however', 'therefore']
-        if sum(1 for word in transition_words if word in content.lower()) >= 2:
+        if sum(1 for word in transition_words if word in analysis.content_lower) >= 2:
             score += 30
 
         # Proper formatting
@@ -1041,13 +1335,15 @@ class ContentQualityScorer:
 
     def _create_detailed_feedback(self, content: str, category_scores: Dict[ScoreCategory, float],
                                 readability: ReadabilityMetrics, engagement: EngagementMetrics,
-                                seo: SEOMetrics) -> Dict[str, Any]:
+                                seo: SEOMetrics,
+                                analysis: Optional[TextAnalysis] = None) -> Dict[str, Any]:
         """Create detailed feedback dictionary"""
+        analysis = analysis or self.analyze_text(content)
         return {
             "content_stats": {
-                "word_count": len(content.split()),
-                "sentence_count": len(self._split_sentences(content)),
-                "paragraph_count": len(content.split('\n\n')),
+                "word_count": analysis.whitespace_word_count,
+                "sentence_count": analysis.sentence_count,
+                "paragraph_count": len(analysis.paragraphs),
                 "character_count": len(content)
             },
             "readability_details": {
@@ -1105,6 +1401,18 @@ class ContentQualityScorer:
         )
 
 
+# Per-process scorer for ProcessPoolExecutor workers
+_worker_scorer = None
+
+
+def _score_metrics_in_worker(content: str, content_type: ContentType) -> QualityScore:
+    """Calculate non-AI metrics inside a worker process"""
+    global _worker_scorer
+    if _worker_scorer is None:
+        _worker_scorer = ContentQualityScorer()
+    return _worker_scorer.score_metrics(content, content_type)
+
+
 # Singleton instance
 _quality_scorer = None
 
@@ -1113,4 +1421,10 @@ def get_content_quality_scorer() -> ContentQualityScorer:
     global _quality_scorer
     if _quality_scorer is None:
         _quality_scorer = ContentQualityScorer()
-    return _quality_scorer
\ No newline at end of file
+    return _quality_scorer
+
+
+def shutdown_content_quality_scorer():
+    """Release the singleton scorer's batch process pool"""
+    if _quality_scorer is not None:
+        _quality_scorer.shutdown(wait=False)
\ No newline at end of file
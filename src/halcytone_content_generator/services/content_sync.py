@@ -1,22 +1,35 @@
 """
 Content synchronization service for multi-channel publishing
 """
-from typing import Dict, List, Optional, Any, Tuple
+from typing import Dict, List, Optional, Any, Set, Tuple
 from datetime import datetime, timedelta
 from dataclasses import dataclass, field
-from enum import Enum
+from enum import Enum, IntEnum
 import asyncio
+import heapq
 import logging
 import json
-from collections import defaultdict
+import time
+import uuid
+from collections import OrderedDict
 
 from ..services.document_fetcher import DocumentFetcher
 from ..services.content_assembler_v2 import EnhancedContentAssembler
 from ..services.crm_client_v2 import EnhancedCRMClient
 from ..services.platform_client_v2 import EnhancedPlatformClient
 from ..services.monitoring import monitoring_service, EventType
+from ..services.sync_scheduler import FairPriorityQueue, JobTimer
+from ..services.content_version_store import SqlContentVersionStore
+from ..services.sync_history import SqlSyncJobArchive, SyncJobHistory
 from ..config import Settings
 
+# Prometheus metrics (optional if installed)
+try:
+    from ..monitoring.metrics import record_metric, track_content_sync_wait, update_content_sync_queue
+    HAS_METRICS = True
+except ImportError:
+    HAS_METRICS = False
+
 logger = logging.getLogger(__name__)
 
 
@@ -29,6 +42,13 @@ class SyncStatus(Enum):
     PARTIAL = "partial"
 
 
+class SyncPriority(IntEnum):
+    """Sync job priority; lower values are worked first"""
+    HIGH = 0
+    NORMAL = 1
+    LOW = 2
+
+
 class Channel(Enum):
     """Content distribution channels"""
     EMAIL = "email"
@@ -53,6 +73,9 @@ class SyncJob:
     scheduled_for: Optional[datetime] = None
     completed_at: Optional[datetime] = None
     metadata: Dict[str, Any] = field(default_factory=dict)
+    priority: SyncPriority = SyncPriority.NORMAL
+    queued_at: Optional[datetime] = None
+    started_at: Optional[datetime] = None
 
 
 @dataclass
@@ -68,6 +91,11 @@ class ContentVersion:
 class ContentSyncService:
     """
     Orchestrates content synchronization across all channels
+
+    Jobs are worked by a fixed pool of worker coroutines (start()/stop())
+    pulling from a bounded priority queue that takes source documents in
+    turn. Scheduled jobs wait in a timer heap served by a single timer
+    coroutine and join the queue when due.
     """
 
     def __init__(self, settings: Settings):
@@ -85,26 +113,60 @@ class ContentSyncService:
         self.crm_client = EnhancedCRMClient(settings)
         self.platform_client = EnhancedPlatformClient(settings)
 
-        # Job management
-        self.jobs: Dict[str, SyncJob] = {}
-        self.active_jobs: List[str] = []
-        self.job_queue: asyncio.Queue = asyncio.Queue()
-
-        # Content versioning
-        self.content_versions: Dict[str, ContentVersion] = {}
-        self.last_sync_times: Dict[str, datetime] = {}
-
         # Configuration
-        self.max_concurrent_jobs = 5
+        self.max_concurrent_jobs = max(1, settings.SYNC_MAX_WORKERS)
         self.retry_attempts = 3
         self.sync_interval_minutes = 30
 
+        # Per-channel budgets; channels of a job are synced concurrently
+        self.channel_timeouts: Dict[Channel, float] = {channel: settings.SYNC_CHANNEL_TIMEOUT for channel in Channel}
+        self.channel_timeouts[Channel.EMAIL] = settings.SYNC_EMAIL_TIMEOUT
+        self.channel_attempts: Dict[Channel, int] = {channel: self.retry_attempts for channel in Channel}
+        # A bulk send that timed out may still have gone out; never resend it automatically
+        self.channel_attempts[Channel.EMAIL] = 1
+        self.channel_retry_delay = settings.SYNC_CHANNEL_RETRY_DELAY
+
+        # Job management
+        # Job history: bounded, with running statistics; evicted jobs optionally archived
+        self.job_archive: Optional[SqlSyncJobArchive] = SqlSyncJobArchive() if settings.SYNC_JOB_ARCHIVE else None
+        self.jobs = SyncJobHistory(
+            max_jobs=settings.SYNC_JOB_HISTORY_SIZE,
+            archive=self.job_archive is not None
+        )
+        self.active_jobs: Set[str] = set()
+        self.job_queue: FairPriorityQueue = FairPriorityQueue(
+            maxsize=settings.SYNC_QUEUE_MAX_SIZE,
+            priority_of=lambda job: job.priority,
+            group_of=lambda job: job.source_document_id
+        )
+        self.scheduled_jobs = JobTimer()
+
+        # Worker pool
+        self._workers: List[asyncio.Task] = []
+        self._timer_task: Optional[asyncio.Task] = None
+        self._timer_wakeup = asyncio.Event()
+
+        # Queue wait statistics (seconds)
+        self._wait_count = 0
+        self._wait_total = 0.0
+        self._wait_max = 0.0
+
+        # Content versioning: a bounded LRU in front of the optional persistent store
+        self.max_cached_versions = max(1, settings.SYNC_VERSION_CACHE_SIZE)
+        self.content_versions: 'OrderedDict[str, ContentVersion]' = OrderedDict()
+        self.version_store: Optional[SqlContentVersionStore] = (
+            SqlContentVersionStore() if settings.CONTENT_VERSIONS_PERSISTENT else None
+        )
+        self.last_sync_times: Dict[str, datetime] = {}
+
     async def sync_content(
         self,
         document_id: str,
         channels: Optional[List[Channel]] = None,
         correlation_id: Optional[str] = None,
-        schedule_time: Optional[datetime] = None
+        schedule_time: Optional[datetime] = None,
+        priority: SyncPriority = SyncPriority.NORMAL,
+        wait: bool = True
     ) -> SyncJob:
         """
         Synchronize content from document to specified channels
@@ -114,12 +176,15 @@ class ContentSyncService:
             channels: Target channels (defaults to all)
             correlation_id: Request correlation ID
             schedule_time: Optional scheduled time
+            priority: Queue priority of the job
+            wait: Wait for room when the queue is full; if False a full
+                queue raises asyncio.QueueFull and the job is discarded
 
         Returns:
             Sync job object
         """
-        # Create job
-        job_id = f"sync_{datetime.now().strftime('%Y%m%d%H%M%S')}_{document_id[:8]}"
+        # Create job (suffixed so jobs for one document in the same second stay distinct)
+        job_id = f"sync_{datetime.now().strftime('%Y%m%d%H%M%S')}_{document_id[:8]}_{uuid.uuid4().hex[:6]}"
         job = SyncJob(
             job_id=job_id,
             created_at=datetime.now(),
@@ -127,47 +192,140 @@ class ContentSyncService:
             source_document_id=document_id,
             channels=channels or list(Channel),
             correlation_id=correlation_id,
-            scheduled_for=schedule_time
+            scheduled_for=schedule_time,
+            priority=SyncPriority(priority)
         )
 
-        self.jobs[job_id] = job
-
         # Schedule or execute immediately
         if schedule_time and schedule_time > datetime.now():
-            asyncio.create_task(self._schedule_job(job))
+            self.jobs[job_id] = job
+            self.scheduled_jobs.schedule(schedule_time, job)
+            self._timer_wakeup.set()  # The new job may be due before the timer's current deadline
             logger.info(f"Scheduled job {job_id} for {schedule_time}")
         else:
-            await self.job_queue.put(job)
+            await self._enqueue(job, wait=wait)
+            self.jobs[job_id] = job
             logger.info(f"Queued job {job_id} for immediate execution")
 
+        self._update_queue_metrics()
         return job
 
-    async def _schedule_job(self, job: SyncJob):
-        """Schedule a job for future execution"""
-        if job.scheduled_for:
-            wait_seconds = (job.scheduled_for - datetime.now()).total_seconds()
-            if wait_seconds > 0:
-                await asyncio.sleep(wait_seconds)
+    async def _enqueue(self, job: SyncJob, wait: bool = True):
+        """Put a job on the worker queue, applying backpressure when it is full"""
+        job.queued_at = datetime.now()
+        if wait:
             await self.job_queue.put(job)
+        else:
+            self.job_queue.put_nowait(job)
 
-    async def process_sync_queue(self):
-        """Process queued sync jobs"""
-        while True:
-            try:
-                # Wait for jobs
-                job = await self.job_queue.get()
+    @property
+    def is_running(self) -> bool:
+        return any(not worker.done() for worker in self._workers)
 
-                # Check concurrent job limit
-                while len(self.active_jobs) >= self.max_concurrent_jobs:
-                    await asyncio.sleep(1)
+    def start(self):
+        """
+        Start the worker pool and the scheduled job timer
 
-                # Process job
-                self.active_jobs.append(job.job_id)
-                asyncio.create_task(self._execute_sync_job(job))
+        Idempotent; must be called from a running event loop.
+        """
+        if self.is_running:
+            return
+        self._workers = [
+            asyncio.create_task(self._worker(index), name=f"content-sync-worker-{index}")
+            for index in range(self.max_concurrent_jobs)
+        ]
+        self._timer_task = asyncio.create_task(self._run_timer(), name="content-sync-timer")
+        logger.info(f"Started {self.max_concurrent_jobs} content sync workers")
+
+    async def stop(self):
+        """Stop the worker pool; jobs in flight are cancelled, queued and scheduled jobs are kept"""
+        tasks = self._workers + ([self._timer_task] if self._timer_task else [])
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._workers = []
+        self._timer_task = None
+        await self.archive_jobs()
+
+    async def process_sync_queue(self):
+        """Start the worker pool and run until it is stopped"""
+        self.start()
+        await asyncio.gather(*self._workers, return_exceptions=True)
 
+    async def _worker(self, index: int):
+        """Take jobs off the queue one at a time until cancelled"""
+        while True:
+            job = await self.job_queue.get()
+            try:
+                self._record_wait(job)
+                self.active_jobs.add(job.job_id)
+                self._update_queue_metrics()
+                await self._execute_sync_job(job)
             except Exception as e:
-                logger.error(f"Error processing sync queue: {e}")
-                await asyncio.sleep(5)
+                logger.error(f"Content sync worker {index} error on job {job.job_id}: {e}")
+            finally:
+                self.jobs.refresh(job)
+                self.job_queue.task_done()
+                self._update_queue_metrics()
+            await self.archive_jobs()
+
+    async def _run_timer(self):
+        """Move scheduled jobs onto the queue as they become due"""
+        while True:
+            self._timer_wakeup.clear()
+            due_jobs = self.scheduled_jobs.pop_due(datetime.now())
+            for job in due_jobs:
+                await self._enqueue(job)
+                logger.info(f"Scheduled job {job.job_id} is due")
+            if due_jobs:
+                self._update_queue_metrics()
+
+            next_due = self.scheduled_jobs.next_due()
+            timeout = max(0.0, (next_due - datetime.now()).total_seconds()) if next_due else None
+            try:
+                await asyncio.wait_for(self._timer_wakeup.wait(), timeout)
+            except asyncio.TimeoutError:
+                pass
+
+    def _record_wait(self, job: SyncJob):
+        """Record how long a job waited on the queue"""
+        if job.queued_at is None:
+            return
+        wait_seconds = (datetime.now() - job.queued_at).total_seconds()
+        self._wait_count += 1
+        self._wait_total += wait_seconds
+        self._wait_max = max(self._wait_max, wait_seconds)
+        job.metadata['queue_wait_ms'] = round(wait_seconds * 1000, 2)
+        if HAS_METRICS:
+            record_metric(track_content_sync_wait, job.priority.name.lower(), wait_seconds)
+
+    def _update_queue_metrics(self):
+        """Report queue depth and worker activity to Prometheus"""
+        if HAS_METRICS:
+            record_metric(update_content_sync_queue, self.job_queue.qsize(), len(self.scheduled_jobs),
+                          len(self.active_jobs))
+
+    def get_queue_statistics(self) -> Dict[str, Any]:
+        """
+        Get worker pool and queue statistics
+
+        Returns:
+            Queue depth, scheduled jobs, active jobs and queue wait times
+        """
+        return {
+            'workers': self.max_concurrent_jobs,
+            'running': self.is_running,
+            'queue_depth': self.job_queue.qsize(),
+            'queue_capacity': self.job_queue.maxsize,
+            'queue_depth_by_priority': {
+                SyncPriority(priority).name.lower(): depth
+                for priority, depth in self.job_queue.depth_by_priority().items()
+            },
+            'scheduled_jobs': len(self.scheduled_jobs),
+            'active_jobs': len(self.active_jobs),
+            'avg_queue_wait_ms': round(self._wait_total / self._wait_count * 1000, 2) if self._wait_count else 0.0,
+            'max_queue_wait_ms': round(self._wait_max * 1000, 2)
+        }
 
     async def _execute_sync_job(self, job: SyncJob):
         """
@@ -179,6 +337,8 @@ class ContentSyncService:
         try:
             job.status = SyncStatus.IN_PROGRESS
             start_time = datetime.now()
+            job.started_at = start_time
+            self.jobs.refresh(job)
 
             with monitoring_service.trace_operation(
                 "content_sync",
@@ -190,50 +350,63 @@ class ContentSyncService:
                 content = await self._fetch_content(job.source_document_id, job.correlation_id)
                 job.content = content
 
-                # Step 2: Check for changes
+                # Step 2: Check for changes; channels that already published this content are done
                 content_hash = self._calculate_content_hash(content)
-                if self._is_duplicate_content(job.source_document_id, content_hash):
+                channels = self._unpublished_channels(job.source_document_id, content_hash, job.channels)
+                if channels and self.version_store is not None:
+                    # Another replica (or this one before a restart) may have published them
+                    await self._refresh_content_version(job.source_document_id)
+                    channels = self._unpublished_channels(job.source_document_id, content_hash, job.channels)
+                if not channels:
                     logger.info(f"No changes detected for job {job.job_id}, skipping")
                     job.status = SyncStatus.COMPLETED
                     job.metadata['skipped'] = True
                     return
+                if len(channels) < len(job.channels):
+                    job.metadata['already_published'] = [c.value for c in job.channels if c not in channels]
+
+                # Step 3: Sync all channels concurrently, each within its own timeout and retry budget
+                outcomes = await asyncio.gather(*(
+                    self._sync_channel(channel, content, job.correlation_id) for channel in channels
+                ))
 
-                # Step 3: Process each channel
                 results = {}
                 errors = []
-
-                for channel in job.channels:
-                    try:
-                        result = await self._sync_to_channel(
-                            channel,
-                            content,
-                            job.correlation_id
-                        )
-                        results[channel.value] = result
+                channel_outcomes = {}
+                for channel, outcome in zip(channels, outcomes):
+                    if outcome['status'] == 'succeeded':
+                        results[channel.value] = outcome.pop('result')
                         logger.info(f"Successfully synced to {channel.value}")
-
-                    except Exception as e:
-                        import traceback
-                        error_msg = f"Failed to sync to {channel.value}: {str(e)}"
-                        logger.error(f"{error_msg}\n{traceback.format_exc()}")
-                        errors.append(error_msg)
-                        results[channel.value] = {'error': str(e)}
+                    else:
+                        errors.append(f"Failed to sync to {channel.value}: {outcome['error']}")
+                        results[channel.value] = {'error': outcome['error']}
+                    channel_outcomes[channel.value] = outcome
 
                 # Update job status
                 job.results = results
                 job.errors = errors
+                job.metadata['channels'] = channel_outcomes
 
                 if errors:
-                    job.status = SyncStatus.PARTIAL if len(errors) < len(job.channels) else SyncStatus.FAILED
+                    job.status = SyncStatus.PARTIAL if len(errors) < len(channels) else SyncStatus.FAILED
                 else:
                     job.status = SyncStatus.COMPLETED
 
-                # Record content version
-                self._record_content_version(
-                    job.source_document_id,
-                    content_hash,
-                    {c: datetime.now() for c in results.keys() if 'error' not in results[c]}
-                )
+                # Record content version, keeping channels that published this content earlier
+                now = datetime.now()
+                newly_published = {c: now for c in results.keys() if 'error' not in results[c]}
+                published = newly_published
+                previous = self.content_versions.get(job.source_document_id)
+                if previous is not None and previous.content_hash == content_hash:
+                    published = {**previous.channels_published, **newly_published}
+                self._record_content_version(job.source_document_id, content_hash, published)
+                if self.version_store is not None and newly_published:
+                    await self.version_store.save(
+                        job.source_document_id,
+                        content_hash,
+                        newly_published,
+                        title=content.get('title') if isinstance(content, dict) else None
+                    )
 
                 # Record metrics
                 duration_ms = (datetime.now() - start_time).total_seconds() * 1000
@@ -257,8 +430,65 @@ class ContentSyncService:
 
         finally:
             job.completed_at = datetime.now()
-            if job.job_id in self.active_jobs:
-                self.active_jobs.remove(job.job_id)
+            self.active_jobs.discard(job.job_id)
+            self.jobs.refresh(job)
+
+    async def _sync_channel(
+        self,
+        channel: Channel,
+        content: Dict[str, Any],
+        correlation_id: Optional[str]
+    ) -> Dict[str, Any]:
+        """
+        Sync one channel within its timeout and retry budget
+
+        Never raises; failures are reported in the returned outcome.
+
+        Returns:
+            Outcome with status ('succeeded' or 'failed'), attempts, duration_ms
+            and either the channel result or the last error
+        """
+        timeout = self.channel_timeouts.get(channel, 120.0)
+        attempts = max(1, self.channel_attempts.get(channel, 1))
+        start_time = time.perf_counter()
+        error = None
+
+        for attempt in range(1, attempts + 1):
+            try:
+                result = await asyncio.wait_for(
+                    self._sync_to_channel(channel, content, correlation_id),
+                    timeout
+                )
+                return {
+                    'status': 'succeeded',
+                    'result': result,
+                    'attempts': attempt,
+                    'duration_ms': round((time.perf_counter() - start_time) * 1000, 2)
+                }
+            except asyncio.TimeoutError:
+                error = f"timed out after {timeout:g}s"
+            except ValueError as e:
+                # Bad channel or content; retrying cannot help
+                error = str(e)
+                logger.error(f"Failed to sync to {channel.value}: {error}")
+                break
+            except Exception as e:
+                error = str(e)
+
+            if attempt < attempts:
+                delay = self.channel_retry_delay * (2 ** (attempt - 1))
+                logger.warning(f"Sync to {channel.value} failed (attempt {attempt}/{attempts}): {error}; "
+                               f"retrying in {delay:g}s")
+                await asyncio.sleep(delay)
+            else:
+                logger.error(f"Failed to sync to {channel.value} after {attempts} attempt(s): {error}")
+
+        return {
+            'status': 'failed',
+            'error': error,
+            'attempts': attempt,
+            'duration_ms': round((time.perf_counter() - start_time) * 1000, 2)
+        }
 
     async def _fetch_content(self, document_id: str, correlation_id: Optional[str]) -> Dict[str, Any]:
         """
@@ -356,9 +586,10 @@ class ContentSyncService:
         # Handle both dict and object responses
         if hasattr(result, 'content_id'):
             # PublishedContent object
+            status = getattr(result, 'status', None)
             return {
                 'content_id': result.content_id,
-                'status': getattr(result, 'status', 'published').value if hasattr(getattr(result, 'status', ''), 'value') else 'published',
+                'status': status.value if hasattr(status, 'value') else 'published',
                 'url': getattr(result, 'url', getattr(result, 'permalink', ''))
             }
         else:
@@ -406,13 +637,46 @@ class ContentSyncService:
         content_str = json.dumps(content, sort_keys=True)
         return hashlib.sha256(content_str.encode()).hexdigest()
 
+    def _unpublished_channels(
+        self,
+        document_id: str,
+        content_hash: str,
+        channels: List[Channel]
+    ) -> List[Channel]:
+        """Channels that have not yet published this version of the document"""
+        if not self._is_duplicate_content(document_id, content_hash):
+            return list(channels)
+        published = self.content_versions[document_id].channels_published
+        return [channel for channel in channels if channel.value not in published]
+
     def _is_duplicate_content(self, document_id: str, content_hash: str) -> bool:
         """Check if content is duplicate of last sync"""
         if document_id in self.content_versions:
+            self.content_versions.move_to_end(document_id)
             last_version = self.content_versions[document_id]
             return last_version.content_hash == content_hash
         return False
 
+    async def _refresh_content_version(self, document_id: str):
+        """Replace the cached version of a document with the persisted one, if any"""
+        stored = await self.version_store.load(document_id)
+        if stored is None:
+            return
+        self._cache_content_version(document_id, ContentVersion(
+            version_id=stored['version_id'],
+            content_hash=stored['content_hash'],
+            created_at=stored['created_at'] or datetime.now(),
+            channels_published=stored['channels_published'],
+            source_document_version=document_id
+        ))
+
+    def _cache_content_version(self, document_id: str, version: ContentVersion):
+        """Cache a version as most recently used, evicting the least recently used"""
+        self.content_versions[document_id] = version
+        self.content_versions.move_to_end(document_id)
+        while len(self.content_versions) > self.max_cached_versions:
+            self.content_versions.popitem(last=False)
+
     def _record_content_version(
         self,
         document_id: str,
@@ -428,7 +692,7 @@ class ContentSyncService:
             channels_published=channels_published,
             source_document_version=document_id
         )
-        self.content_versions[document_id] = version
+        self._cache_content_version(document_id, version)
         self.last_sync_times[document_id] = datetime.now()
 
     async def auto_sync_documents(self, document_ids: List[str]):
@@ -453,7 +717,8 @@ class ContentSyncService:
                     await self.sync_content(
                         doc_id,
                         channels=[Channel.EMAIL, Channel.WEBSITE],
-                        correlation_id=f"auto_sync_{datetime.now().isoformat()}"
+                        correlation_id=f"auto_sync_{datetime.now().isoformat()}",
+                        priority=SyncPriority.LOW
                     )
 
                 # Wait before next check
@@ -485,56 +750,28 @@ class ContentSyncService:
         Returns:
             List of recent jobs
         """
-        sorted_jobs = sorted(
-            self.jobs.values(),
-            key=lambda j: j.created_at,
-            reverse=True
-        )
-        return sorted_jobs[:limit]
+        return heapq.nlargest(limit, self.jobs.values(), key=lambda j: j.created_at)
 
     def get_sync_statistics(self) -> Dict[str, Any]:
         """
         Get synchronization statistics
 
+        Counts cover all jobs since startup, including ones no longer retained.
+
         Returns:
             Statistics dictionary
         """
-        total_jobs = len(self.jobs)
-        status_counts = defaultdict(int)
-        channel_counts = defaultdict(int)
-        error_counts = defaultdict(int)
-
-        for job in self.jobs.values():
-            status_counts[job.status.value] += 1
-
-            for channel in job.channels:
-                channel_counts[channel.value] += 1
-
-            for error in job.errors:
-                # Extract error type
-                error_type = error.split(':')[0] if ':' in error else 'unknown'
-                error_counts[error_type] += 1
-
-        # Calculate success rate
-        completed = status_counts.get(SyncStatus.COMPLETED.value, 0)
-        partial = status_counts.get(SyncStatus.PARTIAL.value, 0)
-        failed = status_counts.get(SyncStatus.FAILED.value, 0)
-        total_finished = completed + partial + failed
-
-        success_rate = (completed / total_finished * 100) if total_finished > 0 else 0
-
-        return {
-            'total_jobs': total_jobs,
+        stats = self.jobs.statistics()
+        stats.update({
             'active_jobs': len(self.active_jobs),
-            'status_breakdown': dict(status_counts),
-            'channel_breakdown': dict(channel_counts),
-            'error_breakdown': dict(error_counts),
-            'success_rate': round(success_rate, 2),
+            'queue': self.get_queue_statistics(),
+            'archived_jobs': self.job_archive.archived if self.job_archive is not None else 0,
             'last_sync_times': {
                 doc_id: last_sync.isoformat()
                 for doc_id, last_sync in self.last_sync_times.items()
             }
-        }
+        })
+        return stats
 
     async def retry_failed_jobs(self, max_age_hours: int = 24):
         """
@@ -557,23 +794,32 @@ class ContentSyncService:
             await self.sync_content(
                 document_id=job.source_document_id,
                 channels=job.channels,
-                correlation_id=f"retry_{job.correlation_id}" if job.correlation_id else None
+                correlation_id=f"retry_{job.correlation_id}" if job.correlation_id else None,
+                priority=SyncPriority.LOW
             )
 
     def cleanup_old_jobs(self, days: int = 7):
         """
         Clean up old job records
 
+        Finished jobs are archived by the next worker iteration (or stop())
+        when SYNC_JOB_ARCHIVE is enabled.
+
         Args:
             days: Number of days to keep
         """
         cutoff = datetime.now() - timedelta(days=days)
-        old_jobs = [
-            job_id for job_id, job in self.jobs.items()
-            if job.created_at < cutoff
-        ]
+        removed = self.jobs.expire(cutoff)
+        logger.info(f"Cleaned up {removed} old jobs")
 
-        for job_id in old_jobs:
-            del self.jobs[job_id]
+    async def archive_jobs(self) -> int:
+        """
+        Archive finished jobs that left the history
 
-        logger.info(f"Cleaned up {len(old_jobs)} old jobs")
\ No newline at end of file
+        Returns:
+            Number of jobs archived
+        """
+        if self.job_archive is None:
+            return 0
+        jobs = self.jobs.drain_archive()
+        return await self.job_archive.archive(jobs) if jobs else 0
\ No newline at end of file
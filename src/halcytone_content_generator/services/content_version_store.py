@@ -0,0 +1,169 @@
+"""
+Content Version Store
+Persistent record of which content each synced document last published, and where
+
+Each source document is a ContentRecord (content_type 'synced_document',
+slug = document id) whose content_hash is the hash of its current version.
+Every distinct hash gets a ContentVersion row carrying the channels it was
+published to, so a duplicate check is one indexed lookup and survives
+restarts and is shared by every replica.
+"""
+import logging
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+SYNCED_CONTENT_TYPE = 'synced_document'
+
+
+def _encode_channels(channels_published: Dict[str, datetime]) -> Dict[str, str]:
+    return {channel: published_at.isoformat() for channel, published_at in channels_published.items()}
+
+
+def _decode_channels(channels_published: Optional[Dict[str, str]]) -> Dict[str, datetime]:
+    return {
+        channel: datetime.fromisoformat(published_at)
+        for channel, published_at in (channels_published or {}).items()
+    }
+
+
+class SqlContentVersionStore:
+    """Content versions persisted in the content_records and content_versions tables"""
+
+    def __init__(self):
+        self._available = True
+
+    @property
+    def available(self) -> bool:
+        return self._available
+
+    async def load(self, document_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Load the current version of a document
+
+        Returns:
+            Dict with version_id, content_hash, created_at and channels_published,
+            or None if the document was never synced or the store is unavailable
+        """
+        if not self._available:
+            return None
+
+        try:
+            from sqlalchemy import select
+            from ..database import get_database
+            from ..database.models_content import ContentRecord, ContentVersion
+
+            async with get_database().async_session_scope() as session:
+                result = await session.execute(
+                    select(ContentVersion)
+                    .join(ContentRecord, ContentVersion.content_id == ContentRecord.id)
+                    .where(
+                        ContentRecord.content_type == SYNCED_CONTENT_TYPE,
+                        ContentRecord.slug == document_id,
+                        ContentVersion.content_hash == ContentRecord.content_hash
+                    )
+                    .order_by(ContentVersion.version_number.desc())
+                    .limit(1)
+                )
+                version = result.scalar_one_or_none()
+                if version is None:
+                    return None
+                return {
+                    'version_id': version.id,
+                    'content_hash': version.content_hash,
+                    'created_at': version.created_at,
+                    'channels_published': _decode_channels(version.channels_published)
+                }
+        except ImportError as e:
+            self._disable(e)
+        except Exception as e:
+            logger.warning(f"Failed to load content version for {document_id}: {e}")
+        return None
+
+    async def save(
+        self,
+        document_id: str,
+        content_hash: str,
+        channels_published: Dict[str, datetime],
+        title: Optional[str] = None
+    ):
+        """
+        Record that a version of a document was published to some channels
+
+        Channels already stored for the same version are kept, so replicas
+        publishing different channels of one version add up rather than
+        overwrite each other.
+        """
+        if not self._available:
+            return
+
+        try:
+            from sqlalchemy import func, select
+            from ..database import get_database
+            from ..database.models_content import ContentRecord, ContentVersion
+
+            title = (title or document_id)[:500]
+            async with get_database().async_session_scope() as session:
+                result = await session.execute(
+                    select(ContentRecord).where(
+                        ContentRecord.content_type == SYNCED_CONTENT_TYPE,
+                        ContentRecord.slug == document_id
+                    )
+                )
+                record = result.scalar_one_or_none()
+                if record is None:
+                    record = ContentRecord(
+                        content_type=SYNCED_CONTENT_TYPE,
+                        slug=document_id,
+                        title=title,
+                        source_doc_id=document_id,
+                        status='published'
+                    )
+                    session.add(record)
+                    await session.flush()
+
+                version = None
+                if record.content_hash == content_hash:
+                    result = await session.execute(
+                        select(ContentVersion)
+                        .where(
+                            ContentVersion.content_id == record.id,
+                            ContentVersion.content_hash == content_hash
+                        )
+                        .order_by(ContentVersion.version_number.desc())
+                        .limit(1)
+                    )
+                    version = result.scalar_one_or_none()
+
+                if version is None:
+                    latest = await session.execute(
+                        select(func.max(ContentVersion.version_number))
+                        .where(ContentVersion.content_id == record.id)
+                    )
+                    version = ContentVersion(
+                        content_id=record.id,
+                        version_number=(latest.scalar() or 0) + 1,
+                        title=title,
+                        content_hash=content_hash,
+                        channels_published={},
+                        comment='content sync'
+                    )
+                    session.add(version)
+
+                # Reassign rather than mutate so the JSON column is marked dirty
+                version.channels_published = {
+                    **(version.channels_published or {}),
+                    **_encode_channels(channels_published)
+                }
+                record.title = title
+                record.content_hash = content_hash
+                record.published_at = datetime.utcnow()
+        except ImportError as e:
+            self._disable(e)
+        except Exception as e:
+            logger.warning(f"Failed to persist content version for {document_id}: {e}")
+
+    def _disable(self, error: Exception):
+        self._available = False
+        logger.warning(f"Persistent content versions disabled: {error}")
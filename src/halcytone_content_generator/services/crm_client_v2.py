@@ -11,10 +11,12 @@ import json
 from enum import Enum
 import hashlib
 import time
+from contextlib import asynccontextmanager
 
 from ..config import Settings
 from ..core.resilience import CircuitBreaker, RetryPolicy, TimeoutHandler
 from ..schemas.content import EmailDeliveryResult
+from .newsletter_skeleton import NewsletterSkeleton
 
 logger = logging.getLogger(__name__)
 
@@ -123,6 +125,7 @@ class EnhancedCRMClient:
 
         self.batch_size = settings.EMAIL_BATCH_SIZE
         self.rate_limit = settings.EMAIL_RATE_LIMIT
+        self.max_in_flight_batches = max(1, settings.EMAIL_MAX_IN_FLIGHT_BATCHES)
 
         # Initialize circuit breaker
         self.breaker = CircuitBreaker(
@@ -187,7 +190,8 @@ class EnhancedCRMClient:
         html: str,
         text: str,
         recipient_filter: Optional[Dict] = None,
-        test_mode: bool = False
+        test_mode: bool = False,
+        skeleton: Optional[NewsletterSkeleton] = None
     ) -> BulkEmailJob:
         """
         Send newsletter to multiple recipients with advanced handling
@@ -198,6 +202,8 @@ class EnhancedCRMClient:
             text: Plain text content
             recipient_filter: Optional filter for recipients
             test_mode: If true, only send to test recipients
+            skeleton: Optional compiled newsletter; each recipient then gets
+                their own personalized html and text, rendered batch by batch
 
         Returns:
             BulkEmailJob with results
@@ -236,7 +242,7 @@ class EnhancedCRMClient:
             else:
                 # Use original batch processing
                 async for batch_result in self._process_batches(
-                    recipients, subject, html, text
+                    recipients, subject, html, text, skeleton
                 ):
                     job.sent_count += batch_result['sent']
                     job.failed_count += batch_result['failed']
@@ -259,32 +265,81 @@ class EnhancedCRMClient:
         recipients: List[EmailRecipient],
         subject: str,
         html: str,
-        text: str
+        text: str,
+        skeleton: Optional[NewsletterSkeleton] = None
     ) -> AsyncGenerator[Dict, None]:
         """
         Process recipients in batches with rate limiting
 
+        Up to max_in_flight_batches batches are sent at once; each batch
+        still acquires the rate limiter before it is dispatched. Results are
+        yielded in batch order as soon as every earlier batch has finished.
+        If a batch raises, no further batches are dispatched; batches already
+        in flight finish, their results are yielded and the error is raised.
+
         Args:
             recipients: List of recipients
             subject: Email subject
             html: HTML content
             text: Plain text content
+            skeleton: Optional compiled newsletter for personalized bodies
 
         Yields:
             Batch results
         """
-        for i in range(0, len(recipients), self.batch_size):
-            batch = recipients[i:i + self.batch_size]
-
-            # Apply rate limiting
-            await self.rate_limiter.acquire()
-
-            # Send batch with circuit breaker protection
-            result = await self._send_batch_with_circuit_breaker(
-                batch, subject, html, text
-            )
-
-            yield result
+        batch_starts = iter(range(0, len(recipients), self.batch_size))
+        in_flight: Dict[asyncio.Task, int] = {}
+        finished: Dict[int, asyncio.Task] = {}
+        dispatched = 0
+        next_to_yield = 0
+        error: Optional[BaseException] = None
+
+        # One pooled client for the whole job; building one per batch costs
+        # tens of milliseconds of event loop time and serializes the window
+        async with httpx.AsyncClient() as http_client:
+            try:
+                while True:
+                    # Refill the window
+                    while error is None and len(in_flight) < self.max_in_flight_batches:
+                        start = next(batch_starts, None)
+                        if start is None:
+                            break
+                        batch = recipients[start:start + self.batch_size]
+
+                        # Apply rate limiting
+                        await self.rate_limiter.acquire()
+
+                        # Send batch with circuit breaker protection
+                        task = asyncio.create_task(self._send_batch_with_circuit_breaker(
+                            batch, subject, html, text, skeleton, http_client
+                        ))
+                        in_flight[task] = dispatched
+                        dispatched += 1
+
+                    if not in_flight:
+                        break
+
+                    done, _ = await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+                    for task in done:
+                        finished[in_flight.pop(task)] = task
+                        if error is None and task.exception() is not None:
+                            error = task.exception()
+
+                    # Yield in batch order
+                    while next_to_yield in finished:
+                        task = finished.pop(next_to_yield)
+                        next_to_yield += 1
+                        if task.exception() is None:
+                            yield task.result()
+
+                if error is not None:
+                    raise error
+            finally:
+                # Consumer stopped early or failed: do not leave sends running
+                for task in in_flight:
+                    task.cancel()
+                if in_flight:
+                    await asyncio.gather(*in_flight, return_exceptions=True)
 
     @CircuitBreaker(failure_threshold=5, recovery_timeout=60)
     @RetryPolicy(max_retries=3, base_delay=2.0)
@@ -293,7 +348,9 @@ class EnhancedCRMClient:
         batch: List[EmailRecipient],
         subject: str,
         html: str,
-        text: str
+        text: str,
+        skeleton: Optional[NewsletterSkeleton] = None,
+        http_client: Optional[httpx.AsyncClient] = None
     ) -> Dict:
         """
         Send a batch of emails with circuit breaker protection
@@ -303,22 +360,19 @@ class EnhancedCRMClient:
             subject: Email subject
             html: HTML content
             text: Plain text content
+            skeleton: Optional compiled newsletter for personalized bodies
+            http_client: Optional shared client; a new one is opened if omitted
 
         Returns:
             Batch result
         """
         try:
-            async with httpx.AsyncClient() as client:
+            async with self._batch_client(http_client) as client:
                 response = await client.post(
                     f"{self.base_url}/api/v1/email/batch",
                     json={
                         "recipients": [
-                            {
-                                "email": r.email,
-                                "name": r.name,
-                                "user_id": r.user_id,
-                                "merge_vars": self._get_merge_vars(r)
-                            }
+                            self._recipient_payload(r, skeleton)
                             for r in batch
                         ],
                         "subject": subject,
@@ -352,7 +406,7 @@ class EnhancedCRMClient:
                 logger.warning("CRM rate limit hit, backing off")
                 await asyncio.sleep(10)  # Back off for 10 seconds
                 return await self._send_batch_with_circuit_breaker(
-                    batch, subject, html, text
+                    batch, subject, html, text, skeleton, http_client
                 )
             raise
 
@@ -364,6 +418,15 @@ class EnhancedCRMClient:
                 'errors': [str(e)]
             }
 
+    @asynccontextmanager
+    async def _batch_client(self, http_client: Optional[httpx.AsyncClient] = None):
+        """Yield the shared client if one is given, otherwise a short-lived one"""
+        if http_client is not None:
+            yield http_client
+        else:
+            async with httpx.AsyncClient() as client:
+                yield client
+
     async def _fetch_recipients(
         self,
         filter_criteria: Optional[Dict] = None,
@@ -688,6 +751,20 @@ class EnhancedCRMClient:
             'unsubscribe_url': f"https://halcytone.com/unsubscribe?u={recipient.user_id}"
         }
 
+    def _recipient_payload(self, recipient: EmailRecipient,
+                           skeleton: Optional[NewsletterSkeleton] = None) -> Dict:
+        """Batch API entry for a recipient, with its own bodies when a skeleton is given"""
+        merge_vars = self._get_merge_vars(recipient)
+        payload = {
+            "email": recipient.email,
+            "name": recipient.name,
+            "user_id": recipient.user_id,
+            "merge_vars": merge_vars
+        }
+        if skeleton is not None:
+            payload.update(skeleton.render(merge_vars))
+        return payload
+
     async def _send_via_mock_service(self, subject: str, html: str, text: str, recipients: List[EmailRecipient]) -> Dict:
         """Send email via mock CRM service for dry run testing"""
 
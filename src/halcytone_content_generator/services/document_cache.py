@@ -0,0 +1,222 @@
+"""
+Document Fetch Cache
+Revision-aware caching of parsed living documents
+
+Entries hold the parsed category dict for one source document together with
+the revision markers the source exposes (Google Docs revisionId, Notion
+last_edited_time, HTTP ETag/Last-Modified). Within the TTL an
+entry is served as-is; after that it is revalidated against the source with
+a cheap revision check, so an unchanged document is neither downloaded nor
+parsed again. The in-process tier is shared by every DocumentFetcher (they
+are created per request); an optional persistent tier keeps entries in the
+cache_entries table across restarts.
+"""
+import hashlib
+import json
+import logging
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+PERSISTENT_NAMESPACE = 'living_documents'
+
+DocumentKey = Tuple[str, str]
+
+
+@dataclass
+class DocumentCacheEntry:
+    """Parsed document content with the markers needed to revalidate it"""
+    source: str
+    doc_id: str
+    content: Dict[str, List[Dict]]
+    revision: Optional[str] = None
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    fetched_at: float = field(default_factory=time.monotonic)
+
+    @property
+    def key(self) -> DocumentKey:
+        return (self.source, self.doc_id)
+
+    @property
+    def has_validator(self) -> bool:
+        """Whether the entry can be revalidated without a full download"""
+        return bool(self.revision or self.etag or self.last_modified)
+
+    def to_payload(self) -> Dict[str, Any]:
+        """Serialize for the persistent tier"""
+        payload = asdict(self)
+        payload.pop('fetched_at')
+        return payload
+
+    @classmethod
+    def from_payload(cls, payload: Dict[str, Any]) -> 'DocumentCacheEntry':
+        """Rebuild an entry loaded from the persistent tier (always stale)"""
+        return cls(fetched_at=float('-inf'), **payload)
+
+
+class DocumentFetchCache:
+    """Bounded in-process cache of parsed documents"""
+
+    def __init__(self, max_entries: int = 64, clock: Callable[[], float] = time.monotonic):
+        self.max_entries = max(0, max_entries)
+        self._clock = clock
+        self._entries: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.revalidated = 0
+        self.misses = 0
+
+    @property
+    def enabled(self) -> bool:
+        """Whether the cache holds any entries at all"""
+        return self.max_entries > 0
+
+    def get(self, source: str, doc_id: str) -> Optional[DocumentCacheEntry]:
+        """Return the entry for a document (fresh or stale) and mark it recently used"""
+        with self._lock:
+            entry = self._entries.get((source, doc_id))
+            if entry is not None:
+                self._entries.move_to_end((source, doc_id))
+            return entry
+
+    def is_fresh(self, entry: DocumentCacheEntry, ttl_seconds: float) -> bool:
+        """Whether an entry is within the TTL and can be served without revalidation"""
+        return self._clock() - entry.fetched_at < ttl_seconds
+
+    def put(self, entry: DocumentCacheEntry):
+        """Store an entry, stamping it as fetched now"""
+        if not self.enabled:
+            return
+        entry.fetched_at = self._clock()
+        with self._lock:
+            self._entries[entry.key] = entry
+            self._entries.move_to_end(entry.key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, source: str, doc_id: str):
+        """Drop the entry for one document"""
+        with self._lock:
+            self._entries.pop((source, doc_id), None)
+
+    def clear(self):
+        """Drop all cached documents and reset statistics"""
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.revalidated = self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache statistics"""
+        lookups = self.hits + self.revalidated + self.misses
+        return {
+            'size': len(self._entries),
+            'max_entries': self.max_entries,
+            'hits': self.hits,
+            'revalidated': self.revalidated,
+            'misses': self.misses,
+            'hit_rate': ((self.hits + self.revalidated) / lookups * 100) if lookups else 0.0
+        }
+
+
+class CacheEntryDocumentStore:
+    """Persistent document tier backed by CacheEntry rows"""
+
+    def __init__(self, ttl_seconds: int = 86400, namespace: str = PERSISTENT_NAMESPACE):
+        self.ttl_seconds = ttl_seconds
+        self.namespace = namespace
+        self._available = True
+
+    @staticmethod
+    def entry_key(source: str, doc_id: str) -> str:
+        """Flatten a document key into a cache_entries key"""
+        return f"{source}:{doc_id}"
+
+    async def load(self, source: str, doc_id: str) -> Optional[DocumentCacheEntry]:
+        """Load a cached document, or None if missing, expired or unavailable"""
+        if not self._available:
+            return None
+
+        try:
+            from sqlalchemy import select
+            from ..database import get_database
+            from ..database.models_cache import CacheEntry
+
+            async with get_database().async_session_scope() as session:
+                result = await session.execute(
+                    select(CacheEntry).where(
+                        CacheEntry.cache_key == self.entry_key(source, doc_id),
+                        CacheEntry.namespace == self.namespace
+                    )
+                )
+                entry = result.scalar_one_or_none()
+                if entry is not None and not entry.is_expired():
+                    entry.increment_access()
+                    return DocumentCacheEntry.from_payload(json.loads(entry.value))
+        except ImportError as e:
+            self._available = False
+            logger.warning(f"Persistent document cache disabled: {e}")
+        except Exception as e:
+            logger.warning(f"Failed to load cached document: {e}")
+        return None
+
+    async def save(self, document: DocumentCacheEntry):
+        """Insert or refresh a cached document"""
+        if not self._available:
+            return
+
+        try:
+            from sqlalchemy import select
+            from ..database import get_database
+            from ..database.models_cache import CacheEntry
+
+            value = json.dumps(document.to_payload())
+            expires_at = datetime.utcnow() + timedelta(seconds=self.ttl_seconds)
+            cache_key = self.entry_key(document.source, document.doc_id)
+            async with get_database().async_session_scope() as session:
+                result = await session.execute(
+                    select(CacheEntry).where(
+                        CacheEntry.cache_key == cache_key,
+                        CacheEntry.namespace == self.namespace
+                    )
+                )
+                entry = result.scalar_one_or_none()
+                if entry is None:
+                    entry = CacheEntry(
+                        cache_key=cache_key,
+                        namespace=self.namespace,
+                        value_type='json',
+                        source_type='external',
+                        source_id=document.source,
+                        tags=[document.source]
+                    )
+                    session.add(entry)
+                entry.value = value
+                entry.content_hash = hashlib.sha256(value.encode('utf-8')).hexdigest()
+                entry.size_bytes = len(value)
+                entry.ttl_seconds = self.ttl_seconds
+                entry.expires_at = expires_at
+        except ImportError as e:
+            self._available = False
+            logger.warning(f"Persistent document cache disabled: {e}")
+        except Exception as e:
+            logger.warning(f"Failed to persist cached document: {e}")
+
+
+_document_cache: Optional[DocumentFetchCache] = None
+
+
+def get_document_cache() -> DocumentFetchCache:
+    """Get the process-wide document fetch cache"""
+    global _document_cache
+    if _document_cache is None:
+        _document_cache = DocumentFetchCache()
+    return _document_cache
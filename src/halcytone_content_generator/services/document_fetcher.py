@@ -1,20 +1,46 @@
 """
 Document fetcher service for retrieving content from living documents
 """
+import copy
 import json
-import re
 import asyncio
-from typing import Dict, List, Optional, Any
+import time
+from typing import AsyncIterator, Awaitable, Callable, Dict, List, Optional, Any
 from datetime import datetime
 import logging
 import httpx
 
 from ..config import Settings
 from ..schemas.content import ContentItem, DocumentContent
-from ..core.resilience import RetryPolicy, TimeoutHandler
+from ..core.resilience import RetryPolicy, TimeoutHandler, CircuitBreaker
+from .document_cache import CacheEntryDocumentStore, DocumentCacheEntry, get_document_cache
+from .notion_sync import NotionSnapshot, get_notion_snapshot_store
+from .document_stream_parser import (
+    FREEFORM, MARKDOWN, MARKDOWN_INDICATORS, STRUCTURED, STRUCTURED_MARKERS,
+    CategorizedItem, StreamingDocumentParser, collect, iter_file_chunks, parse_text
+)
 
 logger = logging.getLogger(__name__)
 
+NOTION_PAGE_SIZE = 100
+
+SOURCE_TYPES = ("google_docs", "notion", "internal")
+
+# Circuit breakers per source, shared across fetcher instances (which are
+# created per request) so a failing source stays tripped between fetches
+_source_breakers: Dict[str, CircuitBreaker] = {}
+
+
+def _get_source_breaker(source: str) -> CircuitBreaker:
+    """Get the circuit breaker guarding a document source"""
+    if source not in _source_breakers:
+        _source_breakers[source] = CircuitBreaker(
+            failure_threshold=3,
+            recovery_timeout=60,
+            expected_exception=Exception
+        )
+    return _source_breakers[source]
+
 
 class DocumentFetcher:
     """
@@ -34,15 +60,33 @@ class DocumentFetcher:
         self._google_service = None
         self._notion_client = None
 
+        self.sources = [s.strip() for s in settings.LIVING_DOC_SOURCES.split(',') if s.strip()]
+        self.source_timeout = settings.LIVING_DOC_SOURCE_TIMEOUT
+        self.last_source_status: Dict[str, str] = {}
+
+        self.cache_ttl = settings.LIVING_DOC_CACHE_TTL
+        self.document_cache = get_document_cache()
+        self.document_store: Optional[CacheEntryDocumentStore] = None
+        if settings.LIVING_DOC_CACHE_PERSISTENT:
+            self.document_store = CacheEntryDocumentStore(ttl_seconds=settings.LIVING_DOC_CACHE_PERSISTENT_TTL)
+
+        self.notion_snapshots = get_notion_snapshot_store(settings.NOTION_SNAPSHOT_DIR)
+        self.notion_full_sync_interval = settings.NOTION_FULL_SYNC_INTERVAL
+
     async def fetch_content(self) -> Dict[str, List[Dict]]:
         """
         Fetch and parse living document into categorized content
 
+        When several sources are configured (LIVING_DOC_SOURCES) they are
+        fetched concurrently and merged; see fetch_all_sources.
+
         Returns:
             Dictionary with categorized content items
         """
         try:
-            if self.doc_type == "google_docs":
+            if len(self.sources) > 1:
+                return await self.fetch_all_sources()
+            elif self.doc_type == "google_docs":
                 return await self._fetch_google_docs()
             elif self.doc_type == "notion":
                 return await self._fetch_notion()
@@ -69,18 +113,7 @@ class DocumentFetcher:
         logger.info(f"Fetching Google Doc: {self.doc_id}")
 
         try:
-            # Initialize Google Docs service if not already done
-            if not self._google_service:
-                self._google_service = await self._init_google_service()
-
-            # Fetch document content
-            document = await self._get_google_document()
-
-            # Extract text content
-            content_text = self._extract_google_doc_text(document)
-
-            # Parse and categorize content
-            categorized_content = self._parse_content(content_text)
+            categorized_content = await self._fetch_cached("google_docs", self.doc_id, self._load_google_docs)
 
             logger.info(f"Successfully fetched {sum(len(v) for v in categorized_content.values())} items from Google Doc")
             return categorized_content
@@ -91,6 +124,35 @@ class DocumentFetcher:
                 return self._get_mock_content()
             raise
 
+    async def _load_google_docs(self, cached: Optional[DocumentCacheEntry]) -> Optional[DocumentCacheEntry]:
+        """
+        Download and parse the Google Doc unless its revision is unchanged
+
+        Args:
+            cached: Previously fetched entry, if any
+
+        Returns:
+            New cache entry, or None if the cached entry is still current
+        """
+        # Initialize Google Docs service if not already done
+        if not self._google_service:
+            self._google_service = await self._init_google_service()
+
+        if cached is not None and cached.revision:
+            if await self._get_google_revision() == cached.revision:
+                return None
+
+        # Fetch document content
+        document = await self._get_google_document()
+        revision = document.get('revisionId')
+        if cached is not None and revision and revision == cached.revision:
+            return None
+
+        # Extract text content and categorize it
+        content_text = self._extract_google_doc_text(document)
+        categorized_content = self._parse_content(content_text)
+        return DocumentCacheEntry("google_docs", self.doc_id, categorized_content, revision=revision)
+
     async def _init_google_service(self):
         """
         Initialize Google Docs API service
@@ -144,6 +206,27 @@ class DocumentFetcher:
             logger.error(f"Failed to retrieve Google Doc: {e}")
             raise
 
+    async def _get_google_revision(self) -> Optional[str]:
+        """
+        Retrieve only the current revision ID of the Google Doc
+
+        Returns:
+            Revision ID, or None if it could not be determined
+        """
+        try:
+            loop = asyncio.get_event_loop()
+            document = await loop.run_in_executor(
+                None,
+                lambda: self._google_service.documents().get(
+                    documentId=self.doc_id,
+                    fields='revisionId'
+                ).execute()
+            )
+            return document.get('revisionId')
+        except Exception as e:
+            logger.warning(f"Google Doc revision check failed, refetching: {e}")
+            return None
+
     def _extract_google_doc_text(self, document: Dict) -> str:
         """
         Extract text content from Google Doc structure
@@ -183,34 +266,11 @@ class DocumentFetcher:
             if not self.settings.NOTION_API_KEY:
                 raise ValueError("Notion API key not configured")
 
-            # Initialize Notion client
-            headers = {
-                "Authorization": f"Bearer {self.settings.NOTION_API_KEY}",
-                "Notion-Version": "2022-06-28",
-                "Content-Type": "application/json"
-            }
-
-            # Query the database
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    f"https://api.notion.com/v1/databases/{self.settings.NOTION_DATABASE_ID}/query",
-                    headers=headers,
-                    json={
-                        "sorts": [{"timestamp": "created_time", "direction": "descending"}],
-                        "page_size": 100
-                    },
-                    timeout=30.0
-                )
-                response.raise_for_status()
-                data = response.json()
-
-            # Parse Notion results
-            content_items = self._parse_notion_results(data.get('results', []))
-
-            # Categorize content
-            categorized_content = self._categorize_notion_content(content_items)
+            categorized_content = await self._fetch_cached(
+                "notion", str(self.settings.NOTION_DATABASE_ID), self._load_notion
+            )
 
-            logger.info(f"Successfully fetched {len(content_items)} items from Notion")
+            logger.info(f"Successfully fetched {sum(len(v) for v in categorized_content.values())} items from Notion")
             return categorized_content
 
         except Exception as e:
@@ -219,6 +279,103 @@ class DocumentFetcher:
                 return self._get_mock_content()
             raise
 
+    async def _load_notion(self, cached: Optional[DocumentCacheEntry]) -> Optional[DocumentCacheEntry]:
+        """
+        Sync the Notion database snapshot and categorize its content
+
+        Once a snapshot exists only pages edited since its watermark are
+        queried and merged; a full paginated query runs on the first sync
+        and every NOTION_FULL_SYNC_INTERVAL seconds to drop deleted pages.
+
+        Args:
+            cached: Previously fetched entry, if any
+
+        Returns:
+            New cache entry, or None if nothing changed since the cached entry
+        """
+        database_id = str(self.settings.NOTION_DATABASE_ID)
+        previous = self.notion_snapshots.load(database_id)
+        full_sync = previous is None or previous.needs_full_sync(self.notion_full_sync_interval)
+
+        query: Dict[str, Any] = {
+            "sorts": [{"timestamp": "last_edited_time", "direction": "ascending"}],
+            "page_size": NOTION_PAGE_SIZE
+        }
+        if full_sync:
+            snapshot = NotionSnapshot(database_id, full_synced_at=time.time())
+        else:
+            # Work on a copy so a failed sync leaves the stored snapshot intact
+            snapshot = previous.copy()
+            query["filter"] = {
+                "timestamp": "last_edited_time",
+                "last_edited_time": {"on_or_after": previous.watermark}
+            }
+
+        changed = False
+        fetched = 0
+        async for results in self._iter_notion_pages(query):
+            for page in results:
+                fetched += 1
+                if not isinstance(page, dict):
+                    continue
+                page_id = page.get('id') or f"position:{fetched}"
+                if page.get('archived') or page.get('in_trash'):
+                    changed = snapshot.remove(page_id) or changed
+                    continue
+                changed = snapshot.apply(
+                    page_id,
+                    page.get('created_time', ''),
+                    page.get('last_edited_time', ''),
+                    # Creation time keeps undated items stable across syncs
+                    self._parse_notion_page(page, default_date=page.get('created_time'))
+                ) or changed
+
+        if full_sync and previous is not None:
+            changed = snapshot.pages != previous.pages
+        self.notion_snapshots.save(snapshot)
+        logger.info(f"Notion {'full' if full_sync else 'delta'} sync: {fetched} pages fetched, "
+                    f"{len(snapshot.pages)} in snapshot")
+
+        if cached is not None and not changed:
+            return None
+        return DocumentCacheEntry(
+            "notion",
+            database_id,
+            self._categorize_notion_content(snapshot.items()),
+            revision=snapshot.watermark
+        )
+
+    async def _iter_notion_pages(self, query: Dict[str, Any]) -> AsyncIterator[List[Dict]]:
+        """
+        Query the Notion database, yielding each page of results as it arrives
+
+        Args:
+            query: Database query body (filter, sorts, page_size)
+
+        Yields:
+            Lists of Notion page objects
+        """
+        headers = {
+            "Authorization": f"Bearer {self.settings.NOTION_API_KEY}",
+            "Notion-Version": "2022-06-28",
+            "Content-Type": "application/json"
+        }
+        query_url = f"https://api.notion.com/v1/databases/{self.settings.NOTION_DATABASE_ID}/query"
+
+        async with httpx.AsyncClient() as client:
+            cursor = None
+            while True:
+                body = dict(query, start_cursor=cursor) if cursor else query
+                response = await client.post(query_url, headers=headers, json=body, timeout=30.0)
+                response.raise_for_status()
+                data = response.json()
+
+                yield data.get('results', [])
+
+                cursor = data.get('next_cursor')
+                if data.get('has_more') is not True or not cursor:
+                    break
+
     def _parse_notion_results(self, results: List[Dict]) -> List[Dict]:
         """
         Parse Notion API results into content items
@@ -232,29 +389,47 @@ class DocumentFetcher:
         content_items = []
 
         for page in results:
-            try:
-                properties = page.get('properties', {})
-
-                # Extract common fields
-                title = self._extract_notion_text(properties.get('Title', properties.get('Name', {})))
-                content = self._extract_notion_text(properties.get('Content', properties.get('Description', {})))
-                category = self._extract_notion_select(properties.get('Category', properties.get('Type', {})))
-                date = properties.get('Date', {}).get('date', {}).get('start', datetime.now().isoformat())
-
-                if title or content:
-                    content_items.append({
-                        'title': title or 'Untitled',
-                        'content': content or '',
-                        'category': category or 'general',
-                        'date': date
-                    })
-
-            except Exception as e:
-                logger.warning(f"Failed to parse Notion page: {e}")
-                continue
+            item = self._parse_notion_page(page)
+            if item is not None:
+                content_items.append(item)
 
         return content_items
 
+    def _parse_notion_page(self, page: Dict, default_date: Optional[str] = None) -> Optional[Dict]:
+        """
+        Parse one Notion page into a content item
+
+        Args:
+            page: Notion page object
+            default_date: Date for pages without a Date property (defaults to now)
+
+        Returns:
+            Content item, or None if the page has no title or content
+        """
+        try:
+            properties = page.get('properties', {})
+
+            # Extract common fields
+            title = self._extract_notion_text(properties.get('Title', properties.get('Name', {})))
+            content = self._extract_notion_text(properties.get('Content', properties.get('Description', {})))
+            category = self._extract_notion_select(properties.get('Category', properties.get('Type', {})))
+            date = properties.get('Date', {}).get('date', {}).get(
+                'start', default_date or datetime.now().isoformat()
+            )
+
+            if title or content:
+                return {
+                    'title': title or 'Untitled',
+                    'content': content or '',
+                    'category': category or 'general',
+                    'date': date
+                }
+
+        except Exception as e:
+            logger.warning(f"Failed to parse Notion page: {e}")
+
+        return None
+
     def _extract_notion_text(self, property_value: Dict) -> str:
         """Extract text from Notion property"""
         if not property_value:
@@ -362,19 +537,178 @@ class DocumentFetcher:
         Returns:
             Parsed content dictionary
         """
+        async def load(cached: Optional[DocumentCacheEntry]) -> Optional[DocumentCacheEntry]:
+            return await self._load_url(url, cached)
+
+        return await self._fetch_cached("url", url, load)
+
+    async def _load_url(self, url: str, cached: Optional[DocumentCacheEntry]) -> Optional[DocumentCacheEntry]:
+        """
+        Conditionally GET and parse a URL
+
+        Args:
+            url: URL to fetch content from
+            cached: Previously fetched entry, if any
+
+        Returns:
+            New cache entry, or None if the server reports it unchanged (304)
+        """
+        headers = {}
+        if cached is not None:
+            if cached.etag:
+                headers["If-None-Match"] = cached.etag
+            if cached.last_modified:
+                headers["If-Modified-Since"] = cached.last_modified
+
         # Simple URL fetching (would be more sophisticated in production)
-        import httpx
         async with httpx.AsyncClient() as client:
-            response = await client.get(url)
+            response = await client.get(url, headers=headers) if headers else await client.get(url)
+            if cached is not None and response.status_code == 304:
+                return None
             response.raise_for_status()
 
             content_text = response.text
 
             # Simple parsing based on content
             if "breathscape" in content_text.lower():
-                return self._get_mock_content()
+                content = self._get_mock_content()
             else:
-                return {"content": [{"title": "URL Content", "content": content_text}]}
+                content = {"content": [{"title": "URL Content", "content": content_text}]}
+
+        return DocumentCacheEntry(
+            "url", url, content,
+            etag=response.headers.get("ETag"),
+            last_modified=response.headers.get("Last-Modified")
+        )
+
+    async def stream_document(self, source: str, format: Optional[str] = None) -> AsyncIterator[CategorizedItem]:
+        """
+        Parse a large document from a URL or local file without loading it whole
+
+        The document is read as a byte stream and parsed line by line, so
+        memory use is bounded by the largest single item. Streamed documents
+        bypass the document cache.
+
+        Args:
+            source: http(s) URL or local file path
+            format: 'markdown', 'structured' or 'freeform'; detected if omitted
+
+        Yields:
+            (category, item) pairs in document order
+        """
+        parser = StreamingDocumentParser(format)
+        if source.startswith(("http://", "https://")):
+            async with httpx.AsyncClient() as client:
+                async with client.stream("GET", source) as response:
+                    response.raise_for_status()
+                    async for item in parser.parse_bytes(response.aiter_bytes(), response.encoding or 'utf-8'):
+                        yield item
+        else:
+            async for item in parser.parse_bytes(iter_file_chunks(source)):
+                yield item
+
+    async def fetch_streamed(self, source: str, format: Optional[str] = None) -> Dict[str, List[Dict]]:
+        """
+        Fetch and categorize a large document via stream_document
+
+        Args:
+            source: http(s) URL or local file path
+            format: Optional document format
+
+        Returns:
+            Categorized content dictionary
+        """
+        return collect([item async for item in self.stream_document(source, format)])
+
+    async def fetch_all_sources(self, sources: Optional[List[str]] = None,
+                                timeout: Optional[float] = None) -> Dict[str, List[Dict]]:
+        """
+        Fetch several document sources concurrently and merge their content
+
+        Each source gets its own timeout and circuit breaker. A source that is
+        slow, failing or tripped is skipped and the others' content is
+        returned; per-source outcomes are recorded in last_source_status.
+
+        Args:
+            sources: Source types ("google_docs", "notion", "internal") or URLs,
+                defaults to LIVING_DOC_SOURCES
+            timeout: Per-source timeout in seconds, defaults to LIVING_DOC_SOURCE_TIMEOUT
+
+        Returns:
+            Categorized content merged across sources
+
+        Raises:
+            RuntimeError: If no source returned content
+        """
+        sources = sources if sources is not None else self.sources
+        timeout = timeout if timeout is not None else self.source_timeout
+        self.last_source_status = {}
+
+        results = await asyncio.gather(*[self._fetch_source(source, timeout) for source in sources])
+        fetched = [content for content in results if content is not None]
+        if not fetched:
+            raise RuntimeError(f"All document sources failed: {self.last_source_status}")
+
+        merged = self._merge_content(fetched)
+        logger.info(f"Fetched {sum(len(v) for v in merged.values())} items from "
+                    f"{len(fetched)}/{len(sources)} sources")
+        return merged
+
+    async def _fetch_source(self, source: str, timeout: float) -> Optional[Dict[str, List[Dict]]]:
+        """Fetch one source under its timeout and circuit breaker, None on failure"""
+        async def fetch():
+            return await asyncio.wait_for(self._load_source(source), timeout=timeout)
+
+        try:
+            content = await _get_source_breaker(source)(fetch)()
+            self.last_source_status[source] = "ok"
+            return content
+        except asyncio.TimeoutError:
+            logger.warning(f"Document source {source} timed out after {timeout}s, skipping")
+            self.last_source_status[source] = "timeout"
+        except Exception as e:
+            logger.warning(f"Document source {source} failed, skipping: {e}")
+            self.last_source_status[source] = "failed"
+        return None
+
+    async def _load_source(self, source: str) -> Dict[str, List[Dict]]:
+        """Fetch a single source by type or URL"""
+        if source == "google_docs":
+            return await self._fetch_google_docs()
+        elif source == "notion":
+            return await self._fetch_notion()
+        elif source == "internal":
+            return await self._fetch_internal()
+        elif source.startswith(("http://", "https://")):
+            return await self.fetch_from_url(source)
+        raise ValueError(f"Unsupported document source: {source}")
+
+    def _merge_content(self, contents: List[Dict[str, List[Dict]]]) -> Dict[str, List[Dict]]:
+        """
+        Merge categorized content from several sources
+
+        Categories keep source order; items duplicated across sources (same
+        title and content) are included once.
+
+        Args:
+            contents: Categorized content per source
+
+        Returns:
+            Merged categorized content
+        """
+        merged: Dict[str, List[Dict]] = {}
+        seen: Dict[str, set] = {}
+        for content in contents:
+            for category, items in content.items():
+                bucket = merged.setdefault(category, [])
+                keys = seen.setdefault(category, set())
+                for item in items:
+                    key = (item.get('title'), item.get('content'))
+                    if key in keys:
+                        continue
+                    keys.add(key)
+                    bucket.append(item)
+        return merged
 
     async def _fetch_internal(self) -> Dict[str, List[Dict]]:
         """
@@ -408,6 +742,50 @@ class DocumentFetcher:
                 return self._get_mock_content()
             raise
 
+    async def _fetch_cached(
+        self,
+        source: str,
+        doc_id: str,
+        load: Callable[[Optional[DocumentCacheEntry]], Awaitable[Optional[DocumentCacheEntry]]]
+    ) -> Dict[str, List[Dict]]:
+        """
+        Fetch a document through the fetch cache
+
+        A cached entry within LIVING_DOC_CACHE_TTL is returned directly.
+        Otherwise the loader is given the cached entry (from memory or the
+        persistent tier) so it can revalidate cheaply; it returns None when
+        the document is unchanged, or a freshly parsed entry.
+
+        Args:
+            source: Source type
+            doc_id: Document identifier within the source
+            load: Loader for the source
+
+        Returns:
+            Categorized content (a copy callers may modify)
+        """
+        cache = self.document_cache
+        cached = cache.get(source, doc_id)
+        if cached is not None and cache.is_fresh(cached, self.cache_ttl):
+            cache.hits += 1
+            return copy.deepcopy(cached.content)
+
+        if cached is None and self.document_store is not None:
+            cached = await self.document_store.load(source, doc_id)
+
+        entry = await load(cached if cached is not None and cached.has_validator else None)
+        if entry is None:
+            logger.info(f"{source} document {doc_id} unchanged, reusing parsed content")
+            cache.revalidated += 1
+            cache.put(cached)
+            return copy.deepcopy(cached.content)
+
+        cache.misses += 1
+        cache.put(entry)
+        if self.document_store is not None and entry.has_validator:
+            await self.document_store.save(entry)
+        return copy.deepcopy(entry.content)
+
     def _parse_content(self, raw_content: str) -> Dict[str, List[Dict]]:
         """
         Advanced content parser with multiple format support
@@ -418,13 +796,6 @@ class DocumentFetcher:
         Returns:
             Categorized content dictionary
         """
-        categories = {
-            'breathscape': [],
-            'hardware': [],
-            'tips': [],
-            'vision': []
-        }
-
         # Try different parsing strategies
         if self._is_markdown_format(raw_content):
             return self._parse_markdown_content(raw_content)
@@ -435,12 +806,11 @@ class DocumentFetcher:
 
     def _is_markdown_format(self, content: str) -> bool:
         """Check if content is in markdown format"""
-        markdown_indicators = ['##', '###', '**', '- ', '* ', '[', ']']
-        return any(indicator in content for indicator in markdown_indicators)
+        return any(indicator in content for indicator in MARKDOWN_INDICATORS)
 
     def _is_structured_format(self, content: str) -> bool:
         """Check if content has structured markers"""
-        return any(marker in content for marker in ['[Breathscape]', '[Hardware]', '[Tips]', '[Vision]'])
+        return any(marker in content for marker in STRUCTURED_MARKERS)
 
     def _parse_markdown_content(self, raw_content: str) -> Dict[str, List[Dict]]:
         """
@@ -452,83 +822,7 @@ class DocumentFetcher:
         Returns:
             Categorized content
         """
-        categories = {
-            'breathscape': [],
-            'hardware': [],
-            'tips': [],
-            'vision': []
-        }
-
-        current_category = None
-        current_item = {}
-        content_buffer = []
-        in_section = False
-
-        lines = raw_content.split('\n')
-
-        for line in lines:
-            # Check for main section headers (## or ###)
-            if line.startswith('##'):
-                # Save previous item if exists
-                if current_item and current_category:
-                    if content_buffer:
-                        current_item['content'] = '\n'.join(content_buffer).strip()
-                    if current_item.get('title') or current_item.get('content'):
-                        categories[current_category].append(current_item)
-                    current_item = {}
-                    content_buffer = []
-
-                # Determine category from header
-                header_lower = line.lower()
-                if any(keyword in header_lower for keyword in ['breathscape', 'app', 'software', 'update']):
-                    current_category = 'breathscape'
-                    in_section = True
-                elif any(keyword in header_lower for keyword in ['hardware', 'device', 'sensor', 'prototype']):
-                    current_category = 'hardware'
-                    in_section = True
-                elif any(keyword in header_lower for keyword in ['tip', 'wellness', 'breathing', 'technique']):
-                    current_category = 'tips'
-                    in_section = True
-                elif any(keyword in header_lower for keyword in ['vision', 'mission', 'about', 'company']):
-                    current_category = 'vision'
-                    in_section = True
-
-            # Check for item headers (### or bold text)
-            elif line.startswith('###') or (line.startswith('**') and line.endswith('**')):
-                if current_item and current_category:
-                    if content_buffer:
-                        current_item['content'] = '\n'.join(content_buffer).strip()
-                    if current_item.get('title') or current_item.get('content'):
-                        categories[current_category].append(current_item)
-
-                # Start new item
-                title = line.replace('###', '').replace('**', '').strip()
-                current_item = {'title': title, 'date': datetime.now().isoformat()}
-                content_buffer = []
-
-            # Check for metadata lines
-            elif line.strip().startswith('- **Date:**') or line.strip().startswith('**Date:**'):
-                date_str = re.search(r'Date:\s*(.+)', line)
-                if date_str and current_item:
-                    current_item['date'] = date_str.group(1).strip()
-
-            elif line.strip().startswith('- **Title:**') or line.strip().startswith('**Title:**'):
-                title_str = re.search(r'Title:\s*(.+)', line)
-                if title_str and current_item:
-                    current_item['title'] = title_str.group(1).strip()
-
-            # Collect content lines
-            elif in_section and line.strip() and not line.startswith('#'):
-                content_buffer.append(line.strip())
-
-        # Save last item
-        if current_item and current_category:
-            if content_buffer:
-                current_item['content'] = '\n'.join(content_buffer).strip()
-            if current_item.get('title') or current_item.get('content'):
-                categories[current_category].append(current_item)
-
-        return categories
+        return parse_text(raw_content, MARKDOWN)
 
     def _parse_structured_content(self, raw_content: str) -> Dict[str, List[Dict]]:
         """
@@ -540,55 +834,7 @@ class DocumentFetcher:
         Returns:
             Categorized content
         """
-        categories = {
-            'breathscape': [],
-            'hardware': [],
-            'tips': [],
-            'vision': []
-        }
-
-        current_category = None
-        current_item = {}
-        content_lines = []
-
-        for line in raw_content.split('\n'):
-            # Check for category markers
-            if '[Breathscape]' in line:
-                self._save_current_item(categories, current_category, current_item, content_lines)
-                current_category = 'breathscape'
-                current_item = {}
-                content_lines = []
-            elif '[Hardware]' in line:
-                self._save_current_item(categories, current_category, current_item, content_lines)
-                current_category = 'hardware'
-                current_item = {}
-                content_lines = []
-            elif '[Tips]' in line:
-                self._save_current_item(categories, current_category, current_item, content_lines)
-                current_category = 'tips'
-                current_item = {}
-                content_lines = []
-            elif '[Vision]' in line:
-                self._save_current_item(categories, current_category, current_item, content_lines)
-                current_category = 'vision'
-                current_item = {}
-                content_lines = []
-            # Parse metadata
-            elif line.strip().startswith('**Date:**') or line.strip().startswith('- Date:'):
-                current_item['date'] = line.split(':', 1)[1].strip().replace('**', '')
-            elif line.strip().startswith('**Title:**') or line.strip().startswith('- Title:'):
-                current_item['title'] = line.split(':', 1)[1].strip().replace('**', '')
-            elif line.strip().startswith('**Content:**') or line.strip().startswith('- Content:'):
-                content = line.split(':', 1)[1].strip().replace('**', '')
-                content_lines = [content] if content else []
-            # Collect content
-            elif line.strip() and current_category:
-                content_lines.append(line.strip())
-
-        # Save last item
-        self._save_current_item(categories, current_category, current_item, content_lines)
-
-        return categories
+        return parse_text(raw_content, STRUCTURED)
 
     def _parse_freeform_content(self, raw_content: str) -> Dict[str, List[Dict]]:
         """
@@ -600,47 +846,7 @@ class DocumentFetcher:
         Returns:
             Categorized content
         """
-        # Use keyword matching to categorize paragraphs
-        categories = {
-            'breathscape': [],
-            'hardware': [],
-            'tips': [],
-            'vision': []
-        }
-
-        # Split into paragraphs
-        paragraphs = re.split(r'\n\n+', raw_content)
-
-        for para in paragraphs:
-            if not para.strip():
-                continue
-
-            # Extract potential title (first line or bold text)
-            lines = para.strip().split('\n')
-            title = lines[0] if lines else 'Update'
-            content = '\n'.join(lines[1:]) if len(lines) > 1 else para
-
-            # Categorize based on keywords
-            para_lower = para.lower()
-            item = {
-                'title': title[:100],  # Limit title length
-                'content': content,
-                'date': datetime.now().isoformat()
-            }
-
-            if any(kw in para_lower for kw in ['app', 'software', 'breathscape', 'algorithm', 'ml', 'model']):
-                categories['breathscape'].append(item)
-            elif any(kw in para_lower for kw in ['hardware', 'sensor', 'device', 'prototype', 'circuit']):
-                categories['hardware'].append(item)
-            elif any(kw in para_lower for kw in ['tip', 'technique', 'exercise', 'practice', 'breathing']):
-                categories['tips'].append(item)
-            elif any(kw in para_lower for kw in ['vision', 'mission', 'believe', 'goal', 'company']):
-                categories['vision'].append(item)
-            else:
-                # Default to breathscape for uncategorized
-                categories['breathscape'].append(item)
-
-        return categories
+        return parse_text(raw_content, FREEFORM)
 
     def _save_current_item(self, categories: Dict, category: str, item: Dict, content_lines: List[str]):
         """Helper to save current item to categories"""
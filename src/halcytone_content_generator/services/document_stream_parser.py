@@ -0,0 +1,343 @@
+"""
+Streaming Document Parser
+Line-at-a-time categorization of living documents
+
+Documents are consumed line by line from an async byte stream (an HTTP
+response or a local file) and categorized items are emitted as soon as they
+are complete, so memory is bounded by the largest single item rather than
+the document. Markdown, structured ([Category] markers) and freeform
+documents share one state machine: the current category, the item being
+built and its content lines; only the per-line rules differ.
+"""
+import asyncio
+import codecs
+import re
+from datetime import datetime
+from typing import AsyncIterator, Dict, Iterator, List, Optional, Tuple
+
+CATEGORIES = ('breathscape', 'hardware', 'tips', 'vision')
+
+MARKDOWN = 'markdown'
+STRUCTURED = 'structured'
+FREEFORM = 'freeform'
+
+MARKDOWN_INDICATORS = ('##', '###', '**', '- ', '* ', '[', ']')
+STRUCTURED_MARKERS = {
+    '[Breathscape]': 'breathscape',
+    '[Hardware]': 'hardware',
+    '[Tips]': 'tips',
+    '[Vision]': 'vision'
+}
+
+# Lines buffered while detecting the format before falling back to freeform
+DEFAULT_DETECTION_WINDOW = 1024 * 1024
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+SECTION_KEYWORDS = (
+    ('breathscape', ('breathscape', 'app', 'software', 'update')),
+    ('hardware', ('hardware', 'device', 'sensor', 'prototype')),
+    ('tips', ('tip', 'wellness', 'breathing', 'technique')),
+    ('vision', ('vision', 'mission', 'about', 'company'))
+)
+FREEFORM_KEYWORDS = (
+    ('breathscape', ('app', 'software', 'breathscape', 'algorithm', 'ml', 'model')),
+    ('hardware', ('hardware', 'sensor', 'device', 'prototype', 'circuit')),
+    ('tips', ('tip', 'technique', 'exercise', 'practice', 'breathing')),
+    ('vision', ('vision', 'mission', 'believe', 'goal', 'company'))
+)
+
+DATE_PATTERN = re.compile(r'Date:\s*(.+)')
+TITLE_PATTERN = re.compile(r'Title:\s*(.+)')
+
+CategorizedItem = Tuple[str, Dict]
+
+
+def detect_format(line: str) -> Optional[str]:
+    """Format implied by a single line, if any (markdown wins over structured)"""
+    if any(indicator in line for indicator in MARKDOWN_INDICATORS):
+        return MARKDOWN
+    if any(marker in line for marker in STRUCTURED_MARKERS):
+        return STRUCTURED
+    return None
+
+
+class StreamingDocumentParser:
+    """
+    Incremental parser emitting (category, item) pairs
+
+    Feed lines (without their trailing newline) with feed() and call close()
+    at the end of the document; both return the items completed by that
+    input. With no explicit format, lines are buffered until one identifies
+    the document as markdown, or until detection_window characters have been
+    seen, mirroring the whole-document format detection of DocumentFetcher.
+    """
+
+    def __init__(self, format: Optional[str] = None,
+                 detection_window: int = DEFAULT_DETECTION_WINDOW):
+        if format not in (None, MARKDOWN, STRUCTURED, FREEFORM):
+            raise ValueError(f"Unsupported document format: {format}")
+        self.format = format
+        self.detection_window = detection_window
+        self._pending: List[str] = []
+        self._pending_size = 0
+        self._structured_seen = False
+
+        # Shared parse state
+        self._category: Optional[str] = None
+        self._item: Dict = {}
+        self._lines: List[str] = []
+        self._in_section = False
+        self._blank_run = 0
+        self._started = False
+
+    def feed(self, line: str) -> List[CategorizedItem]:
+        """Consume one line and return any items it completed"""
+        return self.feed_lines((line,))
+
+    def feed_lines(self, lines) -> List[CategorizedItem]:
+        """Consume a batch of lines and return the items they completed"""
+        emitted: List[CategorizedItem] = []
+        handle = self._handler()
+        for line in lines:
+            if handle is not None:
+                handle(line, emitted)
+                continue
+
+            detected = detect_format(line)
+            self._structured_seen = self._structured_seen or detected == STRUCTURED
+            self._pending.append(line)
+            self._pending_size += len(line) + 1
+            if detected == MARKDOWN:
+                emitted.extend(self._resolve_format(MARKDOWN))
+            elif self._pending_size >= self.detection_window:
+                emitted.extend(self._resolve_format(STRUCTURED if self._structured_seen else FREEFORM))
+            handle = self._handler()
+        return emitted
+
+    def _handler(self):
+        """Per-line handler for the detected format, or None while detecting"""
+        if self.format == MARKDOWN:
+            return self._markdown_line
+        if self.format == STRUCTURED:
+            return self._structured_line
+        if self.format == FREEFORM:
+            return self._freeform_line
+        return None
+
+    def close(self) -> List[CategorizedItem]:
+        """Finish the document and return the remaining items"""
+        emitted: List[CategorizedItem] = []
+        if self.format is None:
+            emitted.extend(self._resolve_format(STRUCTURED if self._structured_seen else FREEFORM))
+
+        if self.format == MARKDOWN:
+            self._save_markdown_item(emitted)
+        elif self.format == STRUCTURED:
+            self._save_structured_item(emitted)
+        else:
+            if self._lines and self._blank_run == 1:
+                # A single trailing newline belongs to the last paragraph
+                self._lines.append('')
+            self._save_paragraph(emitted)
+        return emitted
+
+    def _resolve_format(self, format: str) -> List[CategorizedItem]:
+        """Fix the format and replay the lines buffered during detection"""
+        self.format = format
+        pending, self._pending, self._pending_size = self._pending, [], 0
+        return self.feed_lines(pending)
+
+    # Markdown: ## section headers pick the category, **bold** lines start items
+
+    def _markdown_line(self, line: str, emitted: List[CategorizedItem]):
+        stripped = line.strip()
+        if stripped and stripped[0] not in '#*-':
+            # Fast path: most lines are plain content
+            if self._in_section and self._item:
+                self._lines.append(stripped)
+            return
+
+        if line.startswith('##'):
+            if self._item and self._category:
+                self._save_markdown_item(emitted)
+                self._item = {}
+                self._lines = []
+
+            header_lower = line.lower()
+            for category, keywords in SECTION_KEYWORDS:
+                if any(keyword in header_lower for keyword in keywords):
+                    self._category = category
+                    self._in_section = True
+                    break
+
+        elif line.startswith('###') or (line.startswith('**') and line.endswith('**')):
+            self._save_markdown_item(emitted)
+
+            title = line.replace('###', '').replace('**', '').strip()
+            self._item = {'title': title, 'date': datetime.now().isoformat()}
+            self._lines = []
+
+        elif stripped.startswith('- **Date:**') or stripped.startswith('**Date:**'):
+            match = DATE_PATTERN.search(line)
+            if match and self._item:
+                self._item['date'] = match.group(1).strip()
+
+        elif stripped.startswith('- **Title:**') or stripped.startswith('**Title:**'):
+            match = TITLE_PATTERN.search(line)
+            if match and self._item:
+                self._item['title'] = match.group(1).strip()
+
+        elif self._in_section and stripped and not line.startswith('#') and self._item:
+            # Lines outside an item are discarded when the next item starts
+            self._lines.append(stripped)
+
+    def _save_markdown_item(self, emitted: List[CategorizedItem]):
+        """Emit the current item if it has a category and a title or content"""
+        if not (self._category and self._item):
+            return
+        if self._lines:
+            self._item['content'] = '\n'.join(self._lines).strip()
+        if self._item.get('title') or self._item.get('content'):
+            emitted.append((self._category, self._item))
+
+    # Structured: [Category] markers and **Title:**/**Date:**/**Content:** fields
+
+    def _structured_line(self, line: str, emitted: List[CategorizedItem]):
+        stripped = line.strip()
+        marker = next((m for m in STRUCTURED_MARKERS if m in line), None)
+        if marker is not None:
+            self._save_structured_item(emitted)
+            self._category = STRUCTURED_MARKERS[marker]
+            self._item = {}
+            self._lines = []
+        elif stripped.startswith('**Date:**') or stripped.startswith('- Date:'):
+            self._item['date'] = line.split(':', 1)[1].strip().replace('**', '')
+        elif stripped.startswith('**Title:**') or stripped.startswith('- Title:'):
+            self._item['title'] = line.split(':', 1)[1].strip().replace('**', '')
+        elif stripped.startswith('**Content:**') or stripped.startswith('- Content:'):
+            content = line.split(':', 1)[1].strip().replace('**', '')
+            self._lines = [content] if content else []
+        elif stripped and self._category:
+            self._lines.append(stripped)
+
+    def _save_structured_item(self, emitted: List[CategorizedItem]):
+        if self._category and self._item:
+            if self._lines:
+                self._item['content'] = '\n'.join(self._lines).strip()
+            if self._item.get('title') or self._item.get('content'):
+                self._item.setdefault('date', datetime.now().isoformat())
+                emitted.append((self._category, self._item))
+
+    # Freeform: paragraphs separated by empty lines, categorized by keywords
+
+    def _freeform_line(self, line: str, emitted: List[CategorizedItem]):
+        if line == '':
+            self._blank_run += 1
+            return
+        if self._blank_run:
+            if self._lines:
+                self._save_paragraph(emitted)
+            elif not self._started and self._blank_run == 1:
+                # A single leading newline belongs to the first paragraph
+                self._lines.append('')
+            self._blank_run = 0
+        self._started = True
+        self._lines.append(line)
+
+    def _save_paragraph(self, emitted: List[CategorizedItem]):
+        paragraph = '\n'.join(self._lines)
+        self._lines = []
+        if not paragraph.strip():
+            return
+
+        lines = paragraph.strip().split('\n')
+        title = lines[0] if lines else 'Update'
+        content = '\n'.join(lines[1:]) if len(lines) > 1 else paragraph
+        item = {
+            'title': title[:100],
+            'content': content,
+            'date': datetime.now().isoformat()
+        }
+
+        paragraph_lower = paragraph.lower()
+        for category, keywords in FREEFORM_KEYWORDS:
+            if any(keyword in paragraph_lower for keyword in keywords):
+                emitted.append((category, item))
+                return
+        # Default to breathscape for uncategorized
+        emitted.append(('breathscape', item))
+
+    # Drivers
+
+    def parse_lines(self, lines) -> Iterator[CategorizedItem]:
+        """Parse an iterable of lines, yielding items as they complete"""
+        for line in lines:
+            yield from self.feed(line)
+        yield from self.close()
+
+    async def parse_stream(self, lines: AsyncIterator[str]) -> AsyncIterator[CategorizedItem]:
+        """Parse an async iterator of lines, yielding items as they complete"""
+        async for line in lines:
+            for item in self.feed(line):
+                yield item
+        for item in self.close():
+            yield item
+
+    async def parse_bytes(self, chunks: AsyncIterator[bytes],
+                          encoding: str = 'utf-8') -> AsyncIterator[CategorizedItem]:
+        """Parse an async byte stream, feeding each chunk's lines as a batch"""
+        async for lines in iter_line_batches(chunks, encoding):
+            for item in self.feed_lines(lines):
+                yield item
+        for item in self.close():
+            yield item
+
+
+def parse_text(raw_content: str, format: Optional[str] = None) -> Dict[str, List[Dict]]:
+    """Parse a whole document into the category dict"""
+    return collect(StreamingDocumentParser(format).parse_lines(raw_content.split('\n')))
+
+
+def collect(items) -> Dict[str, List[Dict]]:
+    """Gather (category, item) pairs into the category dict"""
+    categories: Dict[str, List[Dict]] = {category: [] for category in CATEGORIES}
+    for category, item in items:
+        categories[category].append(item)
+    return categories
+
+
+async def iter_line_batches(chunks: AsyncIterator[bytes],
+                            encoding: str = 'utf-8') -> AsyncIterator[List[str]]:
+    """
+    Split an async byte stream into batches of lines without their newline
+
+    Each chunk yields the lines it completes. Multi-byte characters split
+    across chunks are decoded correctly; only the current partial line is
+    carried between chunks.
+    """
+    decoder = codecs.getincrementaldecoder(encoding)(errors='replace')
+    partial = ''
+    async for chunk in chunks:
+        lines = (partial + decoder.decode(chunk)).split('\n')
+        partial = lines.pop()
+        if lines:
+            yield lines
+    yield [partial + decoder.decode(b'', final=True)]
+
+
+async def iter_lines(chunks: AsyncIterator[bytes], encoding: str = 'utf-8') -> AsyncIterator[str]:
+    """Split an async byte stream into lines without their newline"""
+    async for lines in iter_line_batches(chunks, encoding):
+        for line in lines:
+            yield line
+
+
+async def iter_file_chunks(path: str, chunk_size: int = DEFAULT_CHUNK_SIZE) -> AsyncIterator[bytes]:
+    """Read a local file in chunks without blocking the event loop"""
+    loop = asyncio.get_running_loop()
+    with open(path, 'rb') as f:
+        while True:
+            chunk = await loop.run_in_executor(None, f.read, chunk_size)
+            if not chunk:
+                break
+            yield chunk
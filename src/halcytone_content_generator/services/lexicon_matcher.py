@@ -0,0 +1,128 @@
+"""
+Lexicon Matcher
+Multi-pattern word list matching for content quality scoring
+
+This module compiles any number of named word lists into a single Aho-Corasick
+automaton over word tokens. All lexicons are counted in one linear scan of the
+text, and because the automaton walks whole word tokens a term only matches on
+word boundaries ("once" no longer matches inside "concentrate").
+"""
+import re
+from collections import deque
+from typing import Dict, Iterable, List, Mapping, Tuple
+
+_WORD_PATTERN = re.compile(r'\w+')
+
+LexiconHits = Dict[str, Dict[str, int]]
+
+
+def tokenize_term(term: str) -> Tuple[str, ...]:
+    """Split a lexicon term into lowercase word tokens"""
+    return tuple(_WORD_PATTERN.findall(term.lower()))
+
+
+class LexiconMatcher:
+    """Aho-Corasick automaton over word tokens for several named lexicons
+
+    Multi-word terms such as "limited time" or "don't wait" match as
+    consecutive word tokens; punctuation and whitespace between the words
+    are not significant. Overlapping terms are all reported, so "limited"
+    and "limited time" can both match the same text.
+    """
+
+    def __init__(self, lexicons: Mapping[str, Iterable[str]]):
+        self.lexicon_names: List[str] = list(lexicons)
+        # goto[state] maps a word token to the next state; state 0 is the root
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._outputs: List[List[Tuple[str, str]]] = [[]]
+
+        for name, terms in lexicons.items():
+            for term in terms:
+                tokens = tokenize_term(term)
+                if tokens:
+                    self._add_term(name, term, tokens)
+
+        self._build_failure_links()
+
+    def _add_term(self, name: str, term: str, tokens: Tuple[str, ...]) -> None:
+        """Insert a term into the token trie"""
+        state = 0
+        for token in tokens:
+            next_state = self._goto[state].get(token)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto.append({})
+                self._fail.append(0)
+                self._outputs.append([])
+                self._goto[state][token] = next_state
+            state = next_state
+        if (name, term) not in self._outputs[state]:
+            self._outputs[state].append((name, term))
+
+    def _build_failure_links(self) -> None:
+        """Compute failure links breadth-first and merge suffix outputs"""
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for token, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fallback = self._fail[state]
+                while fallback and token not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[next_state] = self._goto[fallback].get(token, 0)
+                self._outputs[next_state].extend(self._outputs[self._fail[next_state]])
+
+    @property
+    def state_count(self) -> int:
+        """Number of automaton states (trie nodes)"""
+        return len(self._goto)
+
+    def match(self, words: Iterable[str]) -> LexiconHits:
+        """
+        Scan lowercase word tokens once and count matches for every lexicon
+
+        Args:
+            words: Lowercase word tokens, e.g. TextAnalysis.words
+
+        Returns:
+            Mapping of lexicon name to {term: occurrence count} for matched terms
+        """
+        hits = {name: {} for name in self.lexicon_names}
+        hits.update(self.scan(words)[0])
+        return hits
+
+    def scan(self, words: Iterable[str], state: int = 0) -> Tuple[LexiconHits, int]:
+        """
+        Count matches ending within words, resuming from an automaton state
+
+        Scanning a document piece by piece and passing each piece's final
+        state into the next gives the same counts as one scan of the whole
+        document, with each match attributed to the piece it ends in.
+
+        Args:
+            words: Lowercase word tokens
+            state: Automaton state left by the preceding words (0 = start)
+
+        Returns:
+            Tuple of (lexicon hits, automaton state after the last word); only
+            lexicons with at least one match appear in the hits
+        """
+        goto = self._goto
+        fail = self._fail
+        outputs = self._outputs
+
+        hits: LexiconHits = {name: {} for name in self.lexicon_names}
+        for word in words:
+            while state and word not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(word, 0)
+            if state:
+                for name, term in outputs[state]:
+                    terms = hits[name]
+                    terms[term] = terms.get(term, 0) + 1
+        return {name: terms for name, terms in hits.items() if terms}, state
+
+    def match_text(self, text: str) -> LexiconHits:
+        """Tokenize text and count lexicon matches"""
+        return self.match(_WORD_PATTERN.findall(text.lower()))
@@ -0,0 +1,165 @@
+"""
+Newsletter Skeleton
+Personalized newsletter bodies rendered from a precompiled skeleton
+
+The static parts of an email template (everything except the per-recipient
+merge variables) are rendered once with sentinel values in the personalized
+slots and split into fixed segments. Each recipient's body is then a join of
+those segments with their own values, so rendering 100k personalized
+newsletters costs one template render plus 100k string joins, and bodies
+are produced lazily so memory stays bounded by the batch being sent.
+"""
+import asyncio
+import logging
+import re
+import secrets
+from typing import Any, AsyncIterator, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from jinja2 import Environment
+
+from ..templates.email_templates import get_email_template
+from .content_assembler_v2 import EnhancedContentAssembler, is_plain_text_context
+
+logger = logging.getLogger(__name__)
+
+# Merge variables supplied per recipient by EnhancedCRMClient._get_merge_vars
+PERSONALIZED_SLOTS = ('name', 'email', 'preferences_url', 'unsubscribe_url')
+# Recipients rendered between event loop yields when streaming
+STREAM_YIELD_EVERY = 500
+
+_environment = Environment()
+
+
+class NewsletterSkeleton:
+    """
+    Email template pre-rendered around its personalized slots
+
+    The skeleton is only used when the slots are plain output in the template:
+    it must split identically for two different sentinel sets and reproduce
+    the render with empty slots. If a slot drives a condition or filter those
+    checks fail and every recipient gets a full template render instead.
+    """
+
+    def __init__(self, template_name: str, data: Dict[str, Any],
+                 slots: Sequence[str] = PERSONALIZED_SLOTS):
+        """
+        Compile the skeleton
+
+        Args:
+            template_name: Email template name (modern, minimal, plain, breathscape)
+            data: Shared template context for every recipient
+            slots: Context keys filled per recipient
+        """
+        template_str = get_email_template(template_name)
+        if not template_str:
+            raise ValueError(f"Unknown email template: {template_name}")
+
+        self.template_name = template_name
+        self.template = _environment.from_string(template_str)
+        self.data = {k: v for k, v in data.items() if k not in slots}
+        self.slots = tuple(slots)
+        self.h2t_factory = EnhancedContentAssembler._create_html2text
+
+        self.html_parts: Optional[List] = None
+        self.text_parts: Optional[List] = None
+        self._compile()
+
+    @property
+    def is_static(self) -> bool:
+        """Whether recipients are rendered by filling the skeleton"""
+        return self.html_parts is not None
+
+    def _compile(self):
+        """Build the skeleton, keeping it only if the sentinel and empty renders agree"""
+        first_html, first_pattern = self._render_sentinels()
+        second_html, second_pattern = self._render_sentinels()
+
+        html_parts = self._split(first_html, first_pattern)
+        empty_html = self.template.render(**self.data, **{slot: '' for slot in self.slots})
+        if (html_parts != self._split(second_html, second_pattern)
+                or self._fill(html_parts, [''] * len(self.slots)) != empty_html):
+            logger.warning(f"Template {self.template_name} uses personalized slots outside plain output; "
+                           f"rendering each recipient in full")
+            return
+
+        first_text = self.h2t_factory().handle(first_html)
+        second_text = self.h2t_factory().handle(second_html)
+        text_parts = self._split(first_text, first_pattern)
+        if text_parts != self._split(second_text, second_pattern):
+            logger.warning(f"Template {self.template_name} text conversion alters personalized slots; "
+                           f"rendering each recipient in full")
+            return
+
+        self.html_parts = html_parts
+        self.text_parts = text_parts
+
+    def _render_sentinels(self) -> Tuple[str, re.Pattern]:
+        """Render with a unique alphanumeric marker in each slot"""
+        token = secrets.token_hex(6)
+        sentinels = {slot: f"hcgslot{token}n{i}x" for i, slot in enumerate(self.slots)}
+        html = self.template.render(**self.data, **sentinels)
+        return html, re.compile(f"hcgslot{token}n(\\d+)x")
+
+    def _split(self, rendered: str, pattern: re.Pattern) -> List:
+        """Split rendered output into static strings and slot indices"""
+        parts: List = []
+        position = 0
+        for match in pattern.finditer(rendered):
+            parts.append(rendered[position:match.start()])
+            parts.append(int(match.group(1)))
+            position = match.end()
+        parts.append(rendered[position:])
+        return parts
+
+    @staticmethod
+    def _fill(parts: List, values: Sequence[str]) -> str:
+        return ''.join([values[part] if part.__class__ is int else part for part in parts])
+
+    def render(self, merge_vars: Dict[str, Any]) -> Dict[str, str]:
+        """
+        Render one recipient's newsletter
+
+        Args:
+            merge_vars: Slot values for the recipient; missing slots render empty
+
+        Returns:
+            Dict with html and text bodies
+        """
+        if not self.is_static:
+            return self._render_full(merge_vars)
+
+        values = [str(merge_vars.get(slot) or '') for slot in self.slots]
+        html = self._fill(self.html_parts, values)
+        if all(' '.join(value.split()) == value for value in values) and is_plain_text_context(values):
+            text = self._fill(self.text_parts, values)
+        else:
+            # Values html2text would escape or reflow are converted for real
+            text = self.h2t_factory().handle(html)
+        return {'html': html, 'text': text}
+
+    def _render_full(self, merge_vars: Dict[str, Any]) -> Dict[str, str]:
+        html = self.template.render(**self.data, **{slot: merge_vars.get(slot) or '' for slot in self.slots})
+        return {'html': html, 'text': self.h2t_factory().handle(html)}
+
+    def iter_rendered(self, recipients: Iterable[Any],
+                      merge_vars: Callable[[Any], Dict[str, Any]]) -> Iterator[Tuple[Any, Dict[str, str]]]:
+        """
+        Lazily render newsletters for a stream of recipients
+
+        Args:
+            recipients: Any iterable of recipients, consumed one at a time
+            merge_vars: Maps a recipient to its slot values
+
+        Yields:
+            (recipient, {'html', 'text'}) pairs
+        """
+        for recipient in recipients:
+            yield recipient, self.render(merge_vars(recipient))
+
+    async def stream_rendered(self, recipients: Iterable[Any],
+                              merge_vars: Callable[[Any], Dict[str, Any]]) -> AsyncIterator[Tuple[Any, Dict[str, str]]]:
+        """Async variant of iter_rendered that periodically yields to the event loop"""
+        for count, pair in enumerate(self.iter_rendered(recipients, merge_vars), 1):
+            yield pair
+            if count % STREAM_YIELD_EVERY == 0:
+                await asyncio.sleep(0)
@@ -0,0 +1,167 @@
+"""
+Notion Delta Sync
+Locally persisted snapshots of Notion databases for incremental fetching
+
+A snapshot keeps the parsed content item for every page in a database with
+the page's created/last-edited times, plus a watermark: the latest
+last_edited_time seen. Later syncs only query pages edited on or after the
+watermark and merge them in, so API calls and parsing scale with the number
+of changes rather than the size of the database. Notion rounds edit times
+to the minute, so pages at the watermark are fetched again and compared
+rather than trusted. Deleted (archived) pages drop out of query results,
+which a periodic full resync picks up.
+"""
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class NotionSnapshot:
+    """Parsed pages of one Notion database as of the last sync"""
+    database_id: str
+    pages: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+    watermark: Optional[str] = None
+    full_synced_at: Optional[float] = None
+
+    def apply(self, page_id: str, created_time: str, last_edited_time: str,
+              item: Optional[Dict]) -> bool:
+        """
+        Merge one page into the snapshot
+
+        Args:
+            page_id: Notion page ID
+            created_time: Page creation time (ISO 8601)
+            last_edited_time: Page last edit time (ISO 8601)
+            item: Parsed content item, or None if the page has no content
+
+        Returns:
+            True if the page's content changed
+        """
+        if last_edited_time and (self.watermark is None or last_edited_time > self.watermark):
+            self.watermark = last_edited_time
+        previous = self.pages.get(page_id)
+        self.pages[page_id] = {
+            'created_time': created_time,
+            'last_edited_time': last_edited_time,
+            'item': item
+        }
+        return previous is None or previous['item'] != item
+
+    def remove(self, page_id: str) -> bool:
+        """Drop a page (archived or trashed); True if it was present"""
+        return self.pages.pop(page_id, None) is not None
+
+    def copy(self) -> 'NotionSnapshot':
+        """Copy whose page map can be modified without touching this snapshot"""
+        return NotionSnapshot(self.database_id, dict(self.pages), self.watermark, self.full_synced_at)
+
+    def needs_full_sync(self, interval_seconds: float) -> bool:
+        """Whether a full resync is due (no watermark, or the interval has passed)"""
+        if self.watermark is None or self.full_synced_at is None:
+            return True
+        return time.time() - self.full_synced_at >= interval_seconds
+
+    def items(self) -> List[Dict]:
+        """Content items, newest page first"""
+        pages = sorted(self.pages.values(), key=lambda page: page['created_time'] or '', reverse=True)
+        return [dict(page['item']) for page in pages if page['item'] is not None]
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'database_id': self.database_id,
+            'pages': self.pages,
+            'watermark': self.watermark,
+            'full_synced_at': self.full_synced_at
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'NotionSnapshot':
+        return cls(
+            database_id=data['database_id'],
+            pages=data.get('pages', {}),
+            watermark=data.get('watermark'),
+            full_synced_at=data.get('full_synced_at')
+        )
+
+
+class NotionSnapshotStore:
+    """Keeps snapshots in memory and, when a directory is set, on disk"""
+
+    def __init__(self, directory: Optional[str] = None):
+        self.directory = directory or None
+        self._snapshots: Dict[str, NotionSnapshot] = {}
+        self._lock = threading.Lock()
+
+    def _path(self, database_id: str) -> str:
+        safe_id = "".join(c if c.isalnum() or c in '-_' else '_' for c in database_id)
+        return os.path.join(self.directory, f"notion_{safe_id}.json")
+
+    def load(self, database_id: str) -> Optional[NotionSnapshot]:
+        """Get the snapshot for a database, or None if it was never synced"""
+        with self._lock:
+            snapshot = self._snapshots.get(database_id)
+        if snapshot is not None or self.directory is None:
+            return snapshot
+
+        path = self._path(database_id)
+        if not os.path.exists(path):
+            return None
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                snapshot = NotionSnapshot.from_dict(json.load(f))
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable Notion snapshot {path}: {e}")
+            return None
+
+        with self._lock:
+            self._snapshots[database_id] = snapshot
+        return snapshot
+
+    def save(self, snapshot: NotionSnapshot):
+        """Store a snapshot, writing it to disk atomically if persistence is enabled"""
+        with self._lock:
+            self._snapshots[snapshot.database_id] = snapshot
+        if self.directory is None:
+            return
+
+        tmp_path = None
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(snapshot.to_dict(), f)
+            os.replace(tmp_path, self._path(snapshot.database_id))
+        except Exception as e:
+            logger.warning(f"Failed to persist Notion snapshot for {snapshot.database_id}: {e}")
+            if tmp_path and os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+
+    def clear(self):
+        """Forget in-memory snapshots (files on disk are kept)"""
+        with self._lock:
+            self._snapshots.clear()
+
+
+_snapshot_stores: Dict[Optional[str], NotionSnapshotStore] = {}
+
+
+def get_notion_snapshot_store(directory: Optional[str] = None) -> NotionSnapshotStore:
+    """Get the process-wide snapshot store for a directory (None = memory only)"""
+    directory = directory or None
+    if directory not in _snapshot_stores:
+        _snapshot_stores[directory] = NotionSnapshotStore(directory)
+    return _snapshot_stores[directory]
+
+
+def clear_notion_snapshots():
+    """Forget all in-memory snapshots"""
+    for store in _snapshot_stores.values():
+        store.clear()
@@ -0,0 +1,235 @@
+"""
+Prompt Compiler
+Token-budget aware assembly of chat prompts for AI enhancement
+
+Prompts are measured locally before they are sent: with tiktoken when it is
+installed, otherwise with a word-piece heuristic that tracks it closely for
+English prose. When instructions plus content exceed the model's prompt
+budget, the content is condensed extractively (leading paragraphs are kept
+whole, later ones are reduced to their first sentence) so long drafts no
+longer fail upstream or burn tokens on context the model would truncate.
+"""
+import logging
+import math
+import re
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+# Prometheus metrics (optional if installed)
+try:
+    from ..monitoring.metrics import record_metric, track_ai_token_usage
+    HAS_METRICS = True
+except ImportError:
+    HAS_METRICS = False
+
+logger = logging.getLogger(__name__)
+
+# Context window sizes in tokens; longer names are matched first
+MODEL_CONTEXT_WINDOWS = {
+    "gpt-3.5-turbo-16k": 16385,
+    "gpt-3.5-turbo": 16385,
+    "gpt-4-32k": 32768,
+    "gpt-4-turbo": 128000,
+    "gpt-4o-mini": 128000,
+    "gpt-4o": 128000,
+    "gpt-4": 8192,
+}
+DEFAULT_CONTEXT_WINDOW = 4096
+
+# Chat formatting overhead per message and for priming the reply
+MESSAGE_OVERHEAD_TOKENS = 4
+REPLY_OVERHEAD_TOKENS = 3
+
+OMISSION_MARKER = "[...]"
+
+_TOKEN_PIECE_PATTERN = re.compile(r'\w+|[^\w\s]')
+_SENTENCE_END_PATTERN = re.compile(r'(?<=[.!?])\s+')
+
+
+def context_window(model: str) -> int:
+    """Context window size for a model name (or its family)"""
+    for name in sorted(MODEL_CONTEXT_WINDOWS, key=len, reverse=True):
+        if model == name or model.startswith(f"{name}-"):
+            return MODEL_CONTEXT_WINDOWS[name]
+    return DEFAULT_CONTEXT_WINDOW
+
+
+def record_token_usage(model: str, prompt_tokens: int, completion_tokens: int,
+                       trimmed: bool = False):
+    """Report token usage to Prometheus (skipped if monitoring is unavailable)"""
+    if HAS_METRICS:
+        record_metric(track_ai_token_usage, model, prompt_tokens, completion_tokens, trimmed)
+
+
+class TokenEstimator:
+    """Local token counter for a model"""
+
+    def __init__(self, model: str):
+        self.model = model
+        self._encoding = None
+        try:
+            import tiktoken
+            self._encoding = tiktoken.encoding_for_model(model)
+        except ImportError:
+            pass
+        except Exception as e:
+            logger.debug(f"No tiktoken encoding for {model}, estimating tokens: {e}")
+
+    @property
+    def exact(self) -> bool:
+        """Whether counts come from the model's tokenizer"""
+        return self._encoding is not None
+
+    def count(self, text: str) -> int:
+        """Count (or estimate) the tokens in text"""
+        if not text:
+            return 0
+        if self._encoding is not None:
+            return len(self._encoding.encode(text))
+        # BPE vocabularies cover most short words whole and split longer
+        # ones into roughly four-character pieces
+        return sum(math.ceil(len(piece) / 4) for piece in _TOKEN_PIECE_PATTERN.findall(text))
+
+    def count_messages(self, messages: List[Dict[str, str]]) -> int:
+        """Count the prompt tokens for a list of chat messages"""
+        return REPLY_OVERHEAD_TOKENS + sum(
+            MESSAGE_OVERHEAD_TOKENS + self.count(message["content"]) for message in messages
+        )
+
+
+@dataclass
+class CompiledMessages:
+    """Chat messages fitted to a token budget"""
+    messages: List[Dict[str, str]]
+    prompt_tokens: int
+    budget: int
+    trimmed: bool = False
+
+
+class PromptCompiler:
+    """Assembles enhancement prompts within a per-model token budget"""
+
+    def __init__(self, model: str, prompt_budget: Optional[int] = None):
+        self.model = model
+        self.prompt_budget = prompt_budget if prompt_budget and prompt_budget > 0 else None
+        self.estimator = TokenEstimator(model)
+
+    def budget_for(self, max_completion_tokens: int) -> int:
+        """Prompt tokens available once the completion is reserved"""
+        budget = context_window(self.model) - max_completion_tokens
+        if self.prompt_budget is not None:
+            budget = min(budget, self.prompt_budget)
+        return budget
+
+    def compile(self, system: str, instructions: str, content: str,
+                max_completion_tokens: int = 1500, trim: bool = True) -> CompiledMessages:
+        """
+        Build the chat messages for an enhancement, trimming content to fit
+
+        Args:
+            system: System message
+            instructions: Enhancement instructions
+            content: Content to enhance (the part that may be condensed)
+            max_completion_tokens: Tokens reserved for the response
+            trim: Condense over-budget content; when False (structured payloads
+                that must stay intact) an over-budget prompt is an error
+
+        Returns:
+            CompiledMessages with the fitted messages and their token count
+
+        Raises:
+            ValueError: If the prompt cannot be fitted to the budget
+        """
+        budget = self.budget_for(max_completion_tokens)
+        messages = self.build_messages(system, instructions, content)
+        prompt_tokens = self.estimator.count_messages(messages)
+        if prompt_tokens <= budget:
+            return CompiledMessages(messages, prompt_tokens, budget)
+        if not trim:
+            raise ValueError(f"Prompt needs {prompt_tokens} tokens; budget for {self.model} is {budget}")
+
+        fixed_tokens = self.estimator.count_messages(self.build_messages(system, instructions, ""))
+        available = budget - fixed_tokens
+        if available <= 0:
+            raise ValueError(
+                f"Prompt instructions need {fixed_tokens} tokens; budget for {self.model} is {budget}"
+            )
+
+        fitted = self.fit_text(content, available)
+        messages = self.build_messages(system, instructions, fitted)
+        prompt_tokens = self.estimator.count_messages(messages)
+        logger.info(f"Trimmed prompt content for {self.model} to fit {budget} tokens")
+        return CompiledMessages(messages, prompt_tokens, budget, trimmed=True)
+
+    @staticmethod
+    def build_messages(system: str, instructions: str, content: str) -> List[Dict[str, str]]:
+        """Chat messages for an enhancement prompt"""
+        return [
+            {"role": "system", "content": system},
+            {"role": "user", "content": f"{instructions}\n\nContent:\n{content}"}
+        ]
+
+    def fit_text(self, text: str, max_tokens: int) -> str:
+        """
+        Condense text to at most max_tokens
+
+        Leading paragraphs are kept whole while they fit; each later paragraph
+        contributes its first sentence while room remains. Omitted stretches
+        are marked with OMISSION_MARKER.
+        """
+        if self.estimator.count(text) <= max_tokens:
+            return text
+
+        count = self.estimator.count
+        marker_tokens = count(OMISSION_MARKER) + 1
+        budget = max_tokens - marker_tokens
+        paragraphs = [p for p in re.split(r'\n\s*\n', text) if p.strip()]
+
+        kept: List[str] = []
+        used = 0
+        index = 0
+        for index, paragraph in enumerate(paragraphs):
+            tokens = count(paragraph) + 1
+            if used + tokens > budget:
+                break
+            kept.append(paragraph)
+            used += tokens
+        else:
+            index = len(paragraphs)
+
+        if not kept and paragraphs:
+            # Even the first paragraph is too long: keep its leading sentences or words
+            kept.append(self._truncate(paragraphs[0], budget))
+            return f"{kept[0]} {OMISSION_MARKER}" if kept[0] else OMISSION_MARKER
+
+        omitted = False
+        for paragraph in paragraphs[index:]:
+            lead = _SENTENCE_END_PATTERN.split(paragraph.strip(), 1)[0]
+            tokens = count(lead) + marker_tokens + 1
+            if used + tokens > budget:
+                omitted = True
+                break
+            kept.append(f"{lead} {OMISSION_MARKER}" if lead != paragraph.strip() else lead)
+            used += tokens
+
+        if omitted:
+            kept.append(OMISSION_MARKER)
+        return "\n\n".join(kept)
+
+    def _truncate(self, text: str, max_tokens: int) -> str:
+        """Keep the leading sentences (or words) of text that fit max_tokens"""
+        result = ""
+        for sentence in _SENTENCE_END_PATTERN.split(text.strip()):
+            candidate = f"{result} {sentence}".strip()
+            if self.estimator.count(candidate) > max_tokens:
+                break
+            result = candidate
+        if result:
+            return result
+
+        for word in text.split():
+            candidate = f"{result} {word}".strip()
+            if self.estimator.count(candidate) > max_tokens:
+                break
+            result = candidate
+        return result
@@ -0,0 +1,188 @@
+"""
+Quality Score Cache
+Content-hash memoization for content quality scoring
+
+Scores are keyed by the SHA-256 of the content together with the content type,
+whether AI analysis was requested and the scorer version, so a draft that is
+scored several times along one request path (validation, A/B analysis,
+enhancement feedback) only runs the scoring pipeline once. The in-process tier
+is a bounded LRU; an optional persistent tier stores serialized scores in the
+cache_entries table.
+"""
+import hashlib
+import json
+import logging
+import threading
+from collections import OrderedDict
+from datetime import datetime, timedelta
+from typing import Any, Dict, Optional, Tuple
+
+# Prometheus metrics (optional if installed)
+try:
+    from ..monitoring.metrics import record_metric, track_quality_score_cache
+    HAS_METRICS = True
+except ImportError:
+    HAS_METRICS = False
+
+logger = logging.getLogger(__name__)
+
+PERSISTENT_NAMESPACE = 'quality_scores'
+
+ScoreCacheKey = Tuple[str, str, bool, str]
+
+
+def make_score_cache_key(content: str, content_type: str, include_ai_analysis: bool,
+                         scorer_version: str) -> ScoreCacheKey:
+    """Build the cache key for a scoring request"""
+    content_hash = hashlib.sha256(content.encode('utf-8')).hexdigest()
+    return (content_hash, content_type, bool(include_ai_analysis), scorer_version)
+
+
+def _record_lookup(tier: str, hit: bool):
+    """Report a cache lookup to Prometheus (skipped if monitoring is unavailable)"""
+    if HAS_METRICS:
+        record_metric(track_quality_score_cache, tier, hit)
+
+
+class LRUScoreCache:
+    """Bounded in-process LRU cache of quality scores"""
+
+    def __init__(self, max_entries: int = 1024):
+        self.max_entries = max(0, max_entries)
+        self._entries: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def enabled(self) -> bool:
+        """Whether the cache holds any entries at all"""
+        return self.max_entries > 0
+
+    def get(self, key: ScoreCacheKey) -> Optional[Any]:
+        """Return the cached value for a key and mark it most recently used"""
+        with self._lock:
+            value = self._entries.get(key)
+            if value is None:
+                self.misses += 1
+            else:
+                self._entries.move_to_end(key)
+                self.hits += 1
+        _record_lookup('memory', value is not None)
+        return value
+
+    def put(self, key: ScoreCacheKey, value: Any):
+        """Store a value, evicting the least recently used entries when full"""
+        if not self.enabled:
+            return
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        """Drop all cached entries"""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache statistics"""
+        lookups = self.hits + self.misses
+        return {
+            'size': len(self._entries),
+            'max_entries': self.max_entries,
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': (self.hits / lookups * 100) if lookups else 0.0
+        }
+
+
+class CacheEntryScoreStore:
+    """Persistent quality score tier backed by CacheEntry rows"""
+
+    def __init__(self, ttl_seconds: int = 86400, namespace: str = PERSISTENT_NAMESPACE):
+        self.ttl_seconds = ttl_seconds
+        self.namespace = namespace
+        self._available = True
+
+    @staticmethod
+    def entry_key(key: ScoreCacheKey) -> str:
+        """Flatten a score cache key into a cache_entries key"""
+        content_hash, content_type, include_ai_analysis, scorer_version = key
+        return f"{scorer_version}:{content_type}:{int(include_ai_analysis)}:{content_hash}"
+
+    async def load(self, key: ScoreCacheKey) -> Optional[Dict[str, Any]]:
+        """Load a serialized score, or None if missing, expired or unavailable"""
+        if not self._available:
+            return None
+
+        payload = None
+        try:
+            from sqlalchemy import select
+            from ..database import get_database
+            from ..database.models_cache import CacheEntry
+
+            async with get_database().async_session_scope() as session:
+                result = await session.execute(
+                    select(CacheEntry).where(
+                        CacheEntry.cache_key == self.entry_key(key),
+                        CacheEntry.namespace == self.namespace
+                    )
+                )
+                entry = result.scalar_one_or_none()
+                if entry is not None and not entry.is_expired():
+                    entry.increment_access()
+                    payload = json.loads(entry.value)
+        except ImportError as e:
+            self._available = False
+            logger.warning(f"Persistent quality score cache disabled: {e}")
+        except Exception as e:
+            logger.warning(f"Failed to load cached quality score: {e}")
+
+        _record_lookup('persistent', payload is not None)
+        return payload
+
+    async def save(self, key: ScoreCacheKey, payload: Dict[str, Any]):
+        """Insert or refresh a serialized score"""
+        if not self._available:
+            return
+
+        try:
+            from sqlalchemy import select
+            from ..database import get_database
+            from ..database.models_cache import CacheEntry
+
+            value = json.dumps(payload)
+            expires_at = datetime.utcnow() + timedelta(seconds=self.ttl_seconds)
+            async with get_database().async_session_scope() as session:
+                result = await session.execute(
+                    select(CacheEntry).where(
+                        CacheEntry.cache_key == self.entry_key(key),
+                        CacheEntry.namespace == self.namespace
+                    )
+                )
+                entry = result.scalar_one_or_none()
+                if entry is None:
+                    entry = CacheEntry(
+                        cache_key=self.entry_key(key),
+                        namespace=self.namespace,
+                        value_type='json',
+                        content_hash=key[0],
+                        source_type='computation',
+                        source_id='content_quality_scorer',
+                        tags=[key[1], key[3]]
+                    )
+                    session.add(entry)
+                entry.value = value
+                entry.size_bytes = len(value)
+                entry.ttl_seconds = self.ttl_seconds
+                entry.expires_at = expires_at
+        except ImportError as e:
+            self._available = False
+            logger.warning(f"Persistent quality score cache disabled: {e}")
+        except Exception as e:
+            logger.warning(f"Failed to persist quality score: {e}")
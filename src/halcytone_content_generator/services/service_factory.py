@@ -210,6 +210,7 @@ class ServiceFactory:
                 # Email settings (with defaults for existing clients)
                 self.EMAIL_BATCH_SIZE = getattr(prod_settings, 'EMAIL_BATCH_SIZE', 50)
                 self.EMAIL_RATE_LIMIT = getattr(prod_settings, 'EMAIL_RATE_LIMIT', 100)
+                self.EMAIL_MAX_IN_FLIGHT_BATCHES = getattr(prod_settings, 'EMAIL_MAX_IN_FLIGHT_BATCHES', 4)
 
                 # Circuit breaker settings (with defaults)
                 self.CIRCUIT_BREAKER_FAILURE_THRESHOLD = getattr(prod_settings, 'CIRCUIT_BREAKER_FAILURE_THRESHOLD', 5)
@@ -0,0 +1,287 @@
+"""
+Sync job history
+Bounded job retention with incrementally maintained statistics for content sync
+
+The service keeps every job it creates in a SyncJobHistory. Finished jobs are
+retained up to a fixed capacity and then evicted oldest-finished first, so
+memory stays flat in long-running processes; unfinished jobs are never
+evicted. Statistics are counted as jobs are added and change status, which
+makes reading them independent of how many jobs were ever run. Evicted jobs
+can be archived to the sync_job_archive table.
+"""
+import logging
+from collections import OrderedDict, defaultdict, deque
+from collections.abc import MutableMapping
+from datetime import datetime
+from typing import Any, Dict, Iterable, Iterator, List, Tuple
+
+logger = logging.getLogger(__name__)
+
+FINISHED_STATUSES = frozenset({'completed', 'partial', 'failed'})
+
+# Upper bounds (ms) of the job duration histogram; slower jobs land in the overflow bucket
+DURATION_BUCKETS_MS = (100, 500, 1000, 5000, 30000, 120000)
+
+
+def _duration_bucket(duration_ms: float) -> str:
+    for bound in DURATION_BUCKETS_MS:
+        if duration_ms <= bound:
+            return f"<={bound}"
+    return f">{DURATION_BUCKETS_MS[-1]}"
+
+
+def _error_type(error: str) -> str:
+    return error.split(':')[0] if ':' in error else 'unknown'
+
+
+class SyncJobHistory(MutableMapping):
+    """
+    Job id -> sync job mapping with bounded retention and running statistics
+
+    Counters cover every job added since startup, including jobs that have
+    since been evicted or cleaned up; only jobs removed before they finished
+    are taken back out. Status changes made after a job is added must be
+    reported with refresh() to be counted.
+    """
+
+    def __init__(self, max_jobs: int = 1000, archive: bool = False):
+        """
+        Initialize the history
+
+        Args:
+            max_jobs: Jobs retained before finished ones are evicted
+            archive: Keep evicted and expired jobs for drain_archive()
+        """
+        self.max_jobs = max(1, max_jobs)
+        self.archive = archive
+        self._jobs: Dict[str, Any] = {}
+        self._finished: 'OrderedDict[str, None]' = OrderedDict()  # In finishing order
+        self._counted: Dict[str, Tuple[str, bool]] = {}  # Status counted under, counted as finished
+        self._to_archive: deque = deque(maxlen=self.max_jobs)
+
+        self.total_jobs = 0
+        self.evicted_jobs = 0
+        self.status_counts: Dict[str, int] = defaultdict(int)
+        self.channel_counts: Dict[str, int] = defaultdict(int)
+        self.channel_outcomes: Dict[str, Dict[str, int]] = defaultdict(lambda: defaultdict(int))
+        self.error_counts: Dict[str, int] = defaultdict(int)
+        self.duration_buckets: Dict[str, int] = defaultdict(int)
+        self._duration_count = 0
+        self._duration_total = 0.0
+        self._duration_max = 0.0
+
+    # Mapping interface
+
+    def __getitem__(self, job_id: str) -> Any:
+        return self._jobs[job_id]
+
+    def __setitem__(self, job_id: str, job: Any):
+        if self._jobs.get(job_id) is job:
+            self.refresh(job)
+            return
+        if job_id in self._jobs:
+            self._remove(job_id)
+        self._jobs[job_id] = job
+        self._count(job_id, job)
+        self._evict()
+
+    def __delitem__(self, job_id: str):
+        self._remove(job_id)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._jobs)
+
+    def __len__(self) -> int:
+        return len(self._jobs)
+
+    # Status tracking
+
+    def refresh(self, job: Any):
+        """Count a status change of a retained job (no-op for unknown jobs)"""
+        job_id = job.job_id
+        if self._jobs.get(job_id) is not job:
+            return
+        counted_status, counted_finished = self._counted[job_id]
+        status = job.status.value
+        if status != counted_status:
+            self._decrement(self.status_counts, counted_status)
+            self.status_counts[status] += 1
+        finished = counted_finished or status in FINISHED_STATUSES
+        self._counted[job_id] = (status, finished)
+        if finished and not counted_finished:
+            self._count_finished(job_id, job)
+            self._evict()
+
+    def _count(self, job_id: str, job: Any):
+        status = job.status.value
+        self.total_jobs += 1
+        self.status_counts[status] += 1
+        for channel in job.channels:
+            self.channel_counts[channel.value] += 1
+        self._counted[job_id] = (status, status in FINISHED_STATUSES)
+        if status in FINISHED_STATUSES:
+            self._count_finished(job_id, job)
+
+    def _count_finished(self, job_id: str, job: Any):
+        self._finished[job_id] = None
+        for error in job.errors:
+            self.error_counts[_error_type(error)] += 1
+        for channel, outcome in job.metadata.get('channels', {}).items():
+            self.channel_outcomes[channel][outcome.get('status', 'unknown')] += 1
+
+        started_at = getattr(job, 'started_at', None)
+        if started_at is not None and job.completed_at is not None:
+            duration_ms = (job.completed_at - started_at).total_seconds() * 1000
+            self.duration_buckets[_duration_bucket(duration_ms)] += 1
+            self._duration_count += 1
+            self._duration_total += duration_ms
+            self._duration_max = max(self._duration_max, duration_ms)
+
+    def _uncount(self, job: Any, status: str):
+        """Take back a job that is removed before it finished"""
+        self.total_jobs -= 1
+        self._decrement(self.status_counts, status)
+        for channel in job.channels:
+            self._decrement(self.channel_counts, channel.value)
+
+    @staticmethod
+    def _decrement(counts: Dict[str, int], key: str):
+        counts[key] -= 1
+        if counts[key] <= 0:
+            del counts[key]
+
+    # Retention
+
+    def _remove(self, job_id: str, archive: bool = False) -> Any:
+        job = self._jobs.pop(job_id)
+        status, finished = self._counted.pop(job_id)
+        if finished:
+            del self._finished[job_id]
+            if archive and self.archive:
+                self._to_archive.append(job)
+        else:
+            self._uncount(job, status)
+        return job
+
+    def _evict(self):
+        while len(self._jobs) > self.max_jobs and self._finished:
+            job_id = next(iter(self._finished))
+            self._remove(job_id, archive=True)
+            self.evicted_jobs += 1
+
+    def expire(self, cutoff: datetime) -> int:
+        """
+        Remove jobs created before a cutoff
+
+        Finished jobs are archived; unfinished ones are dropped and uncounted.
+
+        Returns:
+            Number of jobs removed
+        """
+        expired = [job_id for job_id, job in self._jobs.items() if job.created_at < cutoff]
+        for job_id in expired:
+            self._remove(job_id, archive=True)
+        return len(expired)
+
+    def drain_archive(self) -> List[Any]:
+        """Take the finished jobs removed since the last drain"""
+        jobs = list(self._to_archive)
+        self._to_archive.clear()
+        return jobs
+
+    # Statistics
+
+    def statistics(self) -> Dict[str, Any]:
+        """Running statistics; cost depends on the number of distinct keys, not jobs"""
+        completed = self.status_counts.get('completed', 0)
+        partial = self.status_counts.get('partial', 0)
+        failed = self.status_counts.get('failed', 0)
+        total_finished = completed + partial + failed
+
+        return {
+            'total_jobs': self.total_jobs,
+            'retained_jobs': len(self._jobs),
+            'evicted_jobs': self.evicted_jobs,
+            'status_breakdown': dict(self.status_counts),
+            'channel_breakdown': dict(self.channel_counts),
+            'channel_outcomes': {
+                channel: dict(outcomes) for channel, outcomes in self.channel_outcomes.items()
+            },
+            'error_breakdown': dict(self.error_counts),
+            'success_rate': round(completed / total_finished * 100, 2) if total_finished else 0,
+            'duration_ms': {
+                'count': self._duration_count,
+                'avg': round(self._duration_total / self._duration_count, 2) if self._duration_count else 0.0,
+                'max': round(self._duration_max, 2),
+                'buckets': dict(self.duration_buckets)
+            }
+        }
+
+
+def _archive_row(job: Any, row_class: Any) -> Any:
+    return row_class(
+        job_id=job.job_id,
+        source_document_id=job.source_document_id,
+        status=job.status.value,
+        priority=int(getattr(job, 'priority', 1)),
+        channels=[channel.value for channel in job.channels],
+        correlation_id=job.correlation_id,
+        job_created_at=job.created_at,
+        scheduled_for=job.scheduled_for,
+        started_at=getattr(job, 'started_at', None),
+        completed_at=job.completed_at,
+        results=_json_safe(job.results),
+        errors=list(job.errors),
+        job_metadata=_json_safe(job.metadata)
+    )
+
+
+def _json_safe(value: Any) -> Any:
+    """Reduce channel results (which may hold client objects) to JSON types"""
+    if isinstance(value, dict):
+        return {str(key): _json_safe(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_json_safe(item) for item in value]
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if value is None or isinstance(value, (str, int, float, bool)):
+        return value
+    return str(value)
+
+
+class SqlSyncJobArchive:
+    """Finished sync jobs archived in the sync_job_archive table"""
+
+    def __init__(self):
+        self._available = True
+        self.archived = 0
+
+    @property
+    def available(self) -> bool:
+        return self._available
+
+    async def archive(self, jobs: Iterable[Any]) -> int:
+        """
+        Write finished jobs to the archive
+
+        Returns:
+            Number of jobs archived
+        """
+        jobs = list(jobs)
+        if not jobs or not self._available:
+            return 0
+
+        try:
+            from ..database import get_database
+            from ..database.models_sync import SyncJobArchive
+
+            async with get_database().async_session_scope() as session:
+                session.add_all(_archive_row(job, SyncJobArchive) for job in jobs)
+            self.archived += len(jobs)
+            return len(jobs)
+        except ImportError as e:
+            self._available = False
+            logger.warning(f"Sync job archive disabled: {e}")
+        except Exception as e:
+            logger.warning(f"Failed to archive {len(jobs)} sync jobs: {e}")
+        return 0
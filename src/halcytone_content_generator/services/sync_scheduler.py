@@ -0,0 +1,124 @@
+"""
+Sync job scheduling primitives
+Fair priority queue and timer heap used by the content sync worker pool
+"""
+import asyncio
+import heapq
+import itertools
+from collections import OrderedDict, deque
+from datetime import datetime
+from typing import Any, Callable, Dict, Hashable, Iterator, List, Optional, Tuple
+
+
+class _FairLanes:
+    """Items by priority level, then by group in turn order"""
+
+    def __init__(self, priority_of: Callable[[Any], int], group_of: Callable[[Any], Hashable]):
+        self._priority_of = priority_of
+        self._group_of = group_of
+        self._levels: Dict[int, OrderedDict] = {}
+        self._size = 0
+
+    def append(self, item: Any):
+        lanes = self._levels.setdefault(self._priority_of(item), OrderedDict())
+        group = self._group_of(item)
+        if group not in lanes:
+            lanes[group] = deque()
+        lanes[group].append(item)
+        self._size += 1
+
+    def popleft(self) -> Any:
+        priority = min(self._levels)
+        lanes = self._levels[priority]
+        group, items = next(iter(lanes.items()))
+        item = items.popleft()
+        if items:
+            lanes.move_to_end(group)  # Next group's turn
+        else:
+            del lanes[group]
+            if not lanes:
+                del self._levels[priority]
+        self._size -= 1
+        return item
+
+    def depth_by_priority(self) -> Dict[int, int]:
+        return {
+            priority: sum(len(items) for items in lanes.values())
+            for priority, lanes in self._levels.items()
+        }
+
+    def __iter__(self) -> Iterator[Any]:
+        for priority in sorted(self._levels):
+            for items in self._levels[priority].values():
+                yield from items
+
+    def __len__(self) -> int:
+        return self._size
+
+
+class FairPriorityQueue(asyncio.Queue):
+    """
+    Bounded asyncio queue ordered by priority, round-robin across groups
+
+    Lower priority values are served first. Within a priority level items are
+    grouped (e.g. by source document) and groups take turns, so one group
+    with many queued items cannot starve the others; items of a group keep
+    their arrival order. Like asyncio.Queue, put() waits while the queue is
+    full and put_nowait() raises asyncio.QueueFull, which is how producers get
+    backpressure.
+    """
+
+    def __init__(self, maxsize: int = 0,
+                 priority_of: Callable[[Any], int] = lambda item: 0,
+                 group_of: Callable[[Any], Hashable] = lambda item: None):
+        """
+        Initialize the queue
+
+        Args:
+            maxsize: Maximum queued items (0 = unbounded)
+            priority_of: Priority of an item; lower is served first
+            group_of: Fairness group of an item
+        """
+        self._priority_of = priority_of
+        self._group_of = group_of
+        super().__init__(maxsize)
+
+    # asyncio.Queue storage hooks (the same ones PriorityQueue overrides)
+
+    def _init(self, maxsize):
+        self._queue = _FairLanes(self._priority_of, self._group_of)
+
+    def _put(self, item):
+        self._queue.append(item)
+
+    def _get(self):
+        return self._queue.popleft()
+
+    def depth_by_priority(self) -> Dict[int, int]:
+        """Queued items per priority level"""
+        return self._queue.depth_by_priority()
+
+
+class JobTimer:
+    """Min-heap of items waiting for their due time"""
+
+    def __init__(self):
+        self._heap: List[Tuple[datetime, int, Any]] = []
+        self._sequence = itertools.count()  # Keeps equal due times in insertion order
+
+    def schedule(self, due: datetime, item: Any):
+        heapq.heappush(self._heap, (due, next(self._sequence), item))
+
+    def next_due(self) -> Optional[datetime]:
+        """Earliest due time, or None if nothing is scheduled"""
+        return self._heap[0][0] if self._heap else None
+
+    def pop_due(self, now: datetime) -> List[Any]:
+        """Remove and return every item due at or before now, earliest first"""
+        due = []
+        while self._heap and self._heap[0][0] <= now:
+            due.append(heapq.heappop(self._heap)[2])
+        return due
+
+    def __len__(self) -> int:
+        return len(self._heap)
@@ -0,0 +1,465 @@
+"""
+Shared Text Analysis
+Single-pass tokenization for content quality scoring
+
+This module tokenizes content once into words, sentence boundaries, lines,
+paragraphs, headers and links so that every quality metric can read from the
+same analysis instead of re-splitting and re-scanning the raw text.
+
+Content is analyzed in blocks of paragraphs. A block ends at a paragraph break
+that no sentence, header, link or passive-voice match can cross, so per-block
+results add up exactly to the whole-document result. Document totals are kept
+as running sums over the blocks, which lets an edit re-analyze only the blocks
+it touches (see TextAnalysis.apply_edits).
+"""
+import math
+import re
+from copy import copy
+from bisect import bisect_right
+from collections import Counter
+from dataclasses import dataclass, field, replace
+from fractions import Fraction
+from functools import cached_property, lru_cache
+from itertools import chain
+from operator import mul
+from typing import List, Optional, Sequence, Tuple
+
+from .lexicon_matcher import LexiconHits, LexiconMatcher
+
+_WORD_PATTERN = re.compile(r'\w+')
+_SENTENCE_BOUNDARY_PATTERN = re.compile(r'[.!?]+')
+_HEADER_PATTERN = re.compile(r'^(#{1,6})\s+.+$', re.MULTILINE)
+_LINK_PATTERN = re.compile(r'\[([^\]]+)\]\([^)]+\)')
+_PASSIVE_VOICE_PATTERN = re.compile(r'\b(?:is|are|was|were|been|being)\s+\w+ed\b')
+
+_VOWELS = 'aeiouy'
+_SENTENCE_TERMINATORS = '.!?'
+_PARAGRAPH_SEPARATOR = '\n\n'
+
+# Per-block counts that are summed into document totals
+_BLOCK_TOTALS = (
+    'word_count', 'whitespace_word_count', 'sentence_count',
+    'sentence_length_sum', 'sentence_length_sum_squares',
+    'total_syllables', 'complex_word_count', 'character_count',
+    'passive_voice_count'
+)
+
+
+@lru_cache(maxsize=65536)
+def count_syllables(word: str) -> int:
+    """Count syllables in a word (approximation, memoized per word)"""
+    word = word.lower()
+    count = 0
+    if word[0] in _VOWELS:
+        count += 1
+    for index in range(1, len(word)):
+        if word[index] in _VOWELS and word[index - 1] not in _VOWELS:
+            count += 1
+    if word.endswith('e'):
+        count -= 1
+    if count == 0:
+        count += 1
+    return count
+
+
+def _split_sentences(text: str) -> List[str]:
+    """Slice sentences between terminator runs, mirroring re.split(r'[.!?]+')"""
+    sentences: List[str] = []
+    sentence_start = 0
+    for match in _SENTENCE_BOUNDARY_PATTERN.finditer(text):
+        sentence = text[sentence_start:match.start()].strip()
+        if sentence:
+            sentences.append(sentence)
+        sentence_start = match.end()
+    trailing = text[sentence_start:].strip()
+    if trailing:
+        sentences.append(trailing)
+    return sentences
+
+
+def _group_paragraphs(paragraphs: List[str]) -> Tuple[List[List[str]], bool]:
+    """
+    Group consecutive paragraphs into blocks at safe boundaries
+
+    A paragraph break is a safe block boundary when the paragraph before it
+    finishes a sentence and every link bracket and parenthesis opened in the
+    block so far is closed; then no sentence, header, link or passive-voice
+    match can continue into the next paragraph.
+
+    Returns:
+        Tuple of (paragraph groups, whether the last group ends on a safe boundary)
+    """
+    groups: List[List[str]] = []
+    current: List[str] = []
+    bracket_open = paren_open = False
+    for paragraph in paragraphs:
+        current.append(paragraph)
+
+        last_open, last_close = paragraph.rfind('['), paragraph.rfind(']')
+        if last_open != last_close:
+            bracket_open = last_open > last_close
+        last_open, last_close = paragraph.rfind('('), paragraph.rfind(')')
+        if last_open != last_close:
+            paren_open = last_open > last_close
+
+        stripped = paragraph.rstrip()
+        if stripped and stripped[-1] in _SENTENCE_TERMINATORS and not (bracket_open or paren_open):
+            groups.append(current)
+            current = []
+
+    closed = not current
+    if current or not groups:
+        groups.append(current)
+    return groups, closed
+
+
+def _merge_hits(total: LexiconHits, hits: LexiconHits, sign: int = 1):
+    """Add (or subtract) lexicon hits into a running total, dropping zero counts"""
+    for name, terms in hits.items():
+        total_terms = total.setdefault(name, {})
+        for term, count in terms.items():
+            updated = total_terms.get(term, 0) + sign * count
+            if updated > 0:
+                total_terms[term] = updated
+            else:
+                total_terms.pop(term, None)
+
+
+@dataclass
+class HeaderInfo:
+    """Markdown header found in content"""
+    offset: int
+    level: int
+    text: str
+
+
+@dataclass
+class TextEdit:
+    """Replacement of content[start:end] with new text"""
+    start: int
+    end: int
+    text: str
+
+    @classmethod
+    def between(cls, old: str, new: str) -> 'TextEdit':
+        """Smallest single replacement that turns old into new"""
+        limit = min(len(old), len(new))
+
+        # Binary search on slice equality keeps the comparison in C
+        low, high = 0, limit
+        while low < high:
+            mid = (low + high + 1) // 2
+            if old[:mid] == new[:mid]:
+                low = mid
+            else:
+                high = mid - 1
+        prefix = low
+
+        low, high = 0, limit - prefix
+        while low < high:
+            mid = (low + high + 1) // 2
+            if old[len(old) - mid:] == new[len(new) - mid:]:
+                low = mid
+            else:
+                high = mid - 1
+        suffix = low
+
+        return cls(start=prefix, end=len(old) - suffix, text=new[prefix:len(new) - suffix])
+
+
+@dataclass
+class TextBlock:
+    """Run of paragraphs analyzed independently of the rest of the document"""
+    text: str
+    words: List[str]
+    sentences: List[str]
+    sentence_lengths: List[int]
+    paragraphs: List[str]
+    headers: List[HeaderInfo]  # Offsets relative to the block
+    link_spans: List[Tuple[int, int]]  # Offsets relative to the block
+    word_count: int
+    whitespace_word_count: int
+    sentence_count: int
+    sentence_length_sum: int
+    sentence_length_sum_squares: int
+    total_syllables: int
+    complex_word_count: int
+    character_count: int
+    passive_voice_count: int
+    lexicon_hits: LexiconHits = field(default_factory=dict)
+    lexicon_state_in: int = 0
+    lexicon_state_out: int = 0
+
+    @classmethod
+    def from_paragraphs(cls, paragraphs: List[str]) -> 'TextBlock':
+        """Tokenize a group of paragraphs"""
+        text = _PARAGRAPH_SEPARATOR.join(paragraphs)
+        text_lower = text.lower()
+        words = _WORD_PATTERN.findall(text_lower)
+        sentences = _split_sentences(text)
+        sentence_lengths = [len(sentence.split()) for sentence in sentences]
+
+        # map() keeps the per-word loops in C; count_syllables is memoized
+        syllables = list(map(count_syllables, words))
+
+        # Most paragraphs have no headers or links; skip those scans cheaply
+        headers = []
+        if '#' in text:
+            headers = [
+                HeaderInfo(offset=match.start(), level=len(match.group(1)), text=match.group())
+                for match in _HEADER_PATTERN.finditer(text)
+            ]
+        link_spans = []
+        if '](' in text:
+            link_spans = [match.span() for match in _LINK_PATTERN.finditer(text)]
+
+        return cls(
+            text=text,
+            words=words,
+            sentences=sentences,
+            sentence_lengths=sentence_lengths,
+            paragraphs=paragraphs,
+            headers=headers,
+            link_spans=link_spans,
+            word_count=len(words),
+            whitespace_word_count=len(text.split()),
+            sentence_count=len(sentences),
+            sentence_length_sum=sum(sentence_lengths),
+            sentence_length_sum_squares=sum(map(mul, sentence_lengths, sentence_lengths)),
+            total_syllables=sum(syllables),
+            complex_word_count=sum(map((3).__le__, syllables)),
+            character_count=len(''.join(words)),
+            passive_voice_count=len(_PASSIVE_VOICE_PATTERN.findall(text_lower))
+        )
+
+    @cached_property
+    def word_counts(self) -> Counter:
+        """Occurrences of each word token in the block"""
+        return Counter(self.words)
+
+    def match_lexicons(self, matcher: LexiconMatcher, state: int) -> int:
+        """Match lexicons over the block's words, resuming from the previous block's state"""
+        self.lexicon_hits, self.lexicon_state_out = matcher.scan(self.words, state)
+        self.lexicon_state_in = state
+        return self.lexicon_state_out
+
+
+@dataclass
+class TextAnalysis:
+    """Tokenized view of a piece of content shared by all quality metrics"""
+    content: str
+    blocks: List[TextBlock]
+    word_counts: Counter
+    lexicon_hits: LexiconHits
+    word_count: int = 0
+    whitespace_word_count: int = 0
+    sentence_count: int = 0
+    sentence_length_sum: int = 0
+    sentence_length_sum_squares: int = 0
+    total_syllables: int = 0
+    complex_word_count: int = 0
+    character_count: int = 0
+    passive_voice_count: int = 0
+    lexicon_matcher: Optional[LexiconMatcher] = field(default=None, repr=False, compare=False)
+
+    @classmethod
+    def from_content(cls, content: str,
+                     lexicon_matcher: Optional[LexiconMatcher] = None) -> 'TextAnalysis':
+        """Tokenize content once and build the shared analysis"""
+        blocks = [
+            TextBlock.from_paragraphs(paragraphs)
+            for paragraphs in _group_paragraphs(content.split(_PARAGRAPH_SEPARATOR))[0]
+        ]
+
+        lexicon_hits: LexiconHits = {}
+        if lexicon_matcher is not None:
+            lexicon_hits = {name: {} for name in lexicon_matcher.lexicon_names}
+            state = 0
+            for block in blocks:
+                state = block.match_lexicons(lexicon_matcher, state)
+                _merge_hits(lexicon_hits, block.lexicon_hits)
+
+        return cls(
+            content=content,
+            blocks=blocks,
+            word_counts=Counter(chain.from_iterable(block.words for block in blocks)),
+            lexicon_hits=lexicon_hits,
+            lexicon_matcher=lexicon_matcher,
+            **{name: sum(getattr(block, name) for block in blocks) for name in _BLOCK_TOTALS}
+        )
+
+    def apply_edits(self, edits: Sequence[TextEdit]) -> 'TextAnalysis':
+        """
+        Analyze edited content, re-tokenizing only the blocks the edits touch
+
+        Args:
+            edits: Non-overlapping replacements, each relative to this analysis' content
+
+        Returns:
+            Analysis of the edited content, equal to TextAnalysis.from_content on it
+        """
+        analysis = self
+        for edit in sorted(edits, key=lambda edit: edit.start, reverse=True):
+            analysis = analysis._apply_edit(edit)
+        return analysis
+
+    def _apply_edit(self, edit: TextEdit) -> 'TextAnalysis':
+        """Apply a single edit and update the running totals"""
+        content = self.content
+        if not 0 <= edit.start <= edit.end <= len(content):
+            raise ValueError(f"Edit range {edit.start}:{edit.end} outside content of length {len(content)}")
+
+        new_content = content[:edit.start] + edit.text + content[edit.end:]
+        delta = len(edit.text) - (edit.end - edit.start)
+        blocks = self.blocks
+        offsets = self.block_offsets
+
+        # Blocks touched by the edit; reaching into a paragraph separator
+        # also touches the block after it
+        first = bisect_right(offsets, edit.start) - 1
+        last = bisect_right(offsets, edit.end) - 1
+        if edit.end > offsets[last] + len(blocks[last].text) and last + 1 < len(blocks):
+            last += 1
+
+        # Grow the region until it ends on a safe block boundary that the
+        # following paragraph separator is still split at
+        region_start = offsets[first]
+        while True:
+            region_text = new_content[region_start:offsets[last] + len(blocks[last].text) + delta]
+            groups, closed = _group_paragraphs(region_text.split(_PARAGRAPH_SEPARATOR))
+            if last + 1 == len(blocks) or (closed and not region_text.endswith('\n')):
+                break
+            last += 1
+
+        new_blocks = [TextBlock.from_paragraphs(group) for group in groups]
+        removed = blocks[first:last + 1]
+        tail = blocks[last + 1:]
+
+        # Lexicon automaton state flows across blocks; re-match following
+        # blocks only while the state entering them has changed
+        matcher = self.lexicon_matcher
+        lexicon_hits: LexiconHits = {}
+        if matcher is not None:
+            state = blocks[first - 1].lexicon_state_out if first else 0
+            for block in new_blocks:
+                state = block.match_lexicons(matcher, state)
+            for index, block in enumerate(tail):
+                if block.lexicon_state_in == state:
+                    break
+                # Blocks are shared with the previous analysis, so re-match a copy
+                tail[index] = block = copy(block)
+                state = block.match_lexicons(matcher, state)
+
+            lexicon_hits = {name: dict(terms) for name, terms in self.lexicon_hits.items()}
+            for block in removed:
+                _merge_hits(lexicon_hits, block.lexicon_hits, -1)
+            for block in new_blocks:
+                _merge_hits(lexicon_hits, block.lexicon_hits)
+            for old_block, new_block in zip(blocks[last + 1:], tail):
+                if old_block is new_block:
+                    break
+                _merge_hits(lexicon_hits, old_block.lexicon_hits, -1)
+                _merge_hits(lexicon_hits, new_block.lexicon_hits)
+
+        word_counts = self.word_counts.copy()
+        for block in removed:
+            word_counts.subtract(block.word_counts)
+        for block in new_blocks:
+            word_counts.update(block.word_counts)
+        for block in removed:
+            for word in block.word_counts:
+                if word_counts[word] <= 0:
+                    word_counts.pop(word, None)
+
+        totals = {
+            name: getattr(self, name)
+            - sum(getattr(block, name) for block in removed)
+            + sum(getattr(block, name) for block in new_blocks)
+            for name in _BLOCK_TOTALS
+        }
+
+        return TextAnalysis(
+            content=new_content,
+            blocks=blocks[:first] + new_blocks + tail,
+            word_counts=word_counts,
+            lexicon_hits=lexicon_hits,
+            lexicon_matcher=matcher,
+            **totals
+        )
+
+    @cached_property
+    def block_offsets(self) -> List[int]:
+        """Start offset of each block within the content"""
+        offsets = []
+        offset = 0
+        for block in self.blocks:
+            offsets.append(offset)
+            offset += len(block.text) + len(_PARAGRAPH_SEPARATOR)
+        return offsets
+
+    @cached_property
+    def content_lower(self) -> str:
+        """Lowercased content"""
+        return self.content.lower()
+
+    @cached_property
+    def words(self) -> List[str]:
+        """Lowercase word tokens"""
+        return list(chain.from_iterable(block.words for block in self.blocks))
+
+    @cached_property
+    def sentences(self) -> List[str]:
+        """Stripped, non-empty sentences"""
+        return list(chain.from_iterable(block.sentences for block in self.blocks))
+
+    @cached_property
+    def sentence_lengths(self) -> List[int]:
+        """Whitespace-delimited token count of each sentence"""
+        return list(chain.from_iterable(block.sentence_lengths for block in self.blocks))
+
+    @cached_property
+    def lines(self) -> List[str]:
+        """Content split on newlines"""
+        return self.content.split('\n')
+
+    @cached_property
+    def paragraphs(self) -> List[str]:
+        """Content split on blank lines"""
+        return list(chain.from_iterable(block.paragraphs for block in self.blocks))
+
+    @cached_property
+    def headers(self) -> List[HeaderInfo]:
+        """Markdown headers with offsets into the content"""
+        return [
+            replace(header, offset=offset + header.offset)
+            for offset, block in zip(self.block_offsets, self.blocks)
+            for header in block.headers
+        ]
+
+    @cached_property
+    def link_spans(self) -> List[Tuple[int, int]]:
+        """Spans of markdown links within the content"""
+        return [
+            (offset + start, offset + end)
+            for offset, block in zip(self.block_offsets, self.blocks)
+            for start, end in block.link_spans
+        ]
+
+    @property
+    def sentence_length_mean(self) -> float:
+        """Mean sentence length in whitespace-delimited tokens"""
+        if not self.sentence_count:
+            return 0.0
+        return self.sentence_length_sum / self.sentence_count
+
+    @property
+    def sentence_length_stdev(self) -> float:
+        """Sample standard deviation of sentence lengths"""
+        count = self.sentence_count
+        if count < 2:
+            return 0.0
+        variance = Fraction(
+            count * self.sentence_length_sum_squares - self.sentence_length_sum ** 2,
+            count * (count - 1)
+        )
+        return math.sqrt(variance)
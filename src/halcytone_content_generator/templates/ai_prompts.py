@@ -5,10 +5,27 @@ Sprint 8 - AI Enhancement & Personalization
 This module provides comprehensive prompt templates for AI-powered content generation
 across different channels, styles, and purposes.
 """
-from typing import Dict, List, Optional
+import re
+from typing import Dict, FrozenSet, Iterator, List, NamedTuple, Optional, Tuple
 from enum import Enum
 
 
+_PLACEHOLDER_PATTERN = re.compile(r'\{([^{}]+)\}')
+
+# Content types whose prompts accept {placeholder} context variables
+_CONTEXT_CONTENT_TYPES = ("email", "web", "social")
+
+
+class CompiledPrompt(NamedTuple):
+    """A fully assembled prompt and the context placeholders it contains"""
+    text: str
+    placeholders: FrozenSet[str]
+
+    @classmethod
+    def from_text(cls, text: str) -> "CompiledPrompt":
+        return cls(text, frozenset(_PLACEHOLDER_PATTERN.findall(text)))
+
+
 class ToneStyle(Enum):
     """Available tone styles for content"""
     PROFESSIONAL = "professional"
@@ -48,6 +65,8 @@ class AIPromptTemplates:
         self.breathscape_prompts = self._initialize_breathscape_prompts()
         self.tone_modifiers = self._initialize_tone_modifiers()
         self.optimization_prompts = self._initialize_optimization_prompts()
+        self._compiled: Dict[Tuple[str, str, Optional[ToneStyle]], CompiledPrompt] = {}
+        self.compile_all()
 
     def _get_base_context(self) -> str:
         """Base context for all prompts"""
@@ -410,21 +429,40 @@ class AIPromptTemplates:
             - Include captions or transcripts"""
         }
 
-    def get_prompt(self, content_type: str, purpose: str,
-                   tone: Optional[ToneStyle] = None,
-                   context: Optional[Dict[str, str]] = None) -> str:
+    def _iter_purposes(self) -> Iterator[Tuple[str, str]]:
+        """Yield every (content_type, purpose) pair the templates define"""
+        for content_type, prompts in (("email", self.email_prompts),
+                                      ("web", self.web_prompts),
+                                      ("social", self.social_prompts)):
+            for category, value in prompts.items():
+                yield content_type, category
+                if isinstance(value, dict):
+                    for sub in value:
+                        yield content_type, f"{category}.{sub}"
+        for focus in self.breathscape_prompts:
+            yield "breathscape", focus
+        for optimization_type in self.optimization_prompts:
+            yield "optimization", optimization_type
+
+    def compile_all(self) -> int:
         """
-        Get a specific prompt based on content type and purpose
-
-        Args:
-            content_type: Type of content (email, web, social)
-            purpose: Specific purpose or template name
-            tone: Optional tone modifier
-            context: Optional context variables for template
+        Assemble every template and tone combination once
 
         Returns:
-            Complete prompt string
+            Number of compiled prompts
         """
+        self._compiled.clear()
+        tones: List[Optional[ToneStyle]] = [None, *self.tone_modifiers]
+        for content_type, purpose in self._iter_purposes():
+            for tone in tones:
+                self._compiled[(content_type, purpose, tone)] = CompiledPrompt.from_text(
+                    self._render_prompt(content_type, purpose, tone)
+                )
+        return len(self._compiled)
+
+    def _render_prompt(self, content_type: str, purpose: str,
+                       tone: Optional[ToneStyle] = None) -> str:
+        """Assemble a prompt from the template dictionaries (without context)"""
         # Build base prompt
         prompt = self.base_context + "\n\n"
 
@@ -461,10 +499,35 @@ class AIPromptTemplates:
         if tone:
             prompt += f"\n\nTone guidance: {self.tone_modifiers[tone]}"
 
+        return prompt
+
+    def get_prompt(self, content_type: str, purpose: str,
+                   tone: Optional[ToneStyle] = None,
+                   context: Optional[Dict[str, str]] = None) -> str:
+        """
+        Get a specific prompt based on content type and purpose
+
+        Args:
+            content_type: Type of content (email, web, social)
+            purpose: Specific purpose or template name
+            tone: Optional tone modifier
+            context: Optional context variables for template
+
+        Returns:
+            Complete prompt string
+        """
+        compiled = self._compiled.get((content_type, purpose, tone))
+        if compiled is None:
+            # Unknown purposes are rendered on demand and not cached
+            compiled = CompiledPrompt.from_text(self._render_prompt(content_type, purpose, tone))
+
+        prompt = compiled.text
+
         # Replace context variables if provided
-        if context:
+        if context and content_type in _CONTEXT_CONTENT_TYPES:
             for key, value in context.items():
-                prompt = prompt.replace(f"{{{key}}}", value)
+                if key in compiled.placeholders:
+                    prompt = prompt.replace(f"{{{key}}}", value)
 
         return prompt
 
@@ -539,14 +602,7 @@ class AIPromptTemplates:
         Returns:
             Combined prompt string
         """
-        if not prompts:
-            return ""
-
-        combined = prompts[0]
-        for prompt in prompts[1:]:
-            combined += connector + prompt
-
-        return combined
+        return connector.join(prompts)
 
 
 # Export singleton instance
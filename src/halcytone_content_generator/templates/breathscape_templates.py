@@ -316,6 +316,87 @@ BREATHSCAPE_EMAIL_TEMPLATE = """
 </html>
 """
 
+# Plain-text alternative of BREATHSCAPE_EMAIL_TEMPLATE, rendered from the same
+# context. Mirrors what html2text produces from the HTML version: each block
+# has its whitespace collapsed (the squash filter) and blocks are separated by
+# blank lines; runs of blank lines left by empty blocks are collapsed after
+# rendering. The extra final newline survives Jinja trimming the last one.
+BREATHSCAPE_TEXT_TEMPLATE = """Halcytone
+
+Your Journey to Mindful Breathing
+
+Hello, Breathing Explorer! 🌿
+
+{% filter squash %}
+Welcome to your {{ month_year }} breathing journey update. Discover new techniques,
+insights, and ways to enhance your mindful breathing practice.
+{% endfilter %}
+
+{% if breathscape_updates %}
+Breathscape Updates
+
+{% for item in breathscape_updates %}
+{% filter squash %}{{ item.title }}{% endfilter %}
+
+{% filter squash %}{{ item.content }}{% endfilter %}
+
+{% endfor %}
+{% endif %}
+🧘‍♀️ Quick Breathing Exercise
+
+**4-7-8 Technique:**{{ "  " }}
+Inhale for 4 counts → Hold for 7 counts → Exhale for 8 counts{{ "  " }}
+_Repeat 3-4 times for instant calm_
+
+{% if hardware_updates %}
+Tech & Innovation
+
+{% for item in hardware_updates %}
+{% filter squash %}{{ item.title }}{% endfilter %}
+
+{% filter squash %}{{ item.content }}{% endfilter %}
+
+{% endfor %}
+{% endif %}
+{% if tips %}
+Mindful Moments
+
+{% for tip in tips %}
+{% filter squash %}{{ tip.title }}{% endfilter %}
+
+{% filter squash %}{{ tip.content }}{% endfilter %}
+
+{% endfor %}
+{% endif %}
+{% if stats %}
+{% for stat in stats %}
+{% filter squash %}{{ stat.value }}{% endfilter %}
+
+{% filter squash %}{{ stat.label }}{% endfilter %}
+
+{% endfor %}
+{% endif %}
+{% if vision %}
+Our Shared Vision
+
+{% filter squash %}{{ vision }}{% endfilter %}
+
+{% endif %}
+{% if call_to_action %}
+[ {% filter squash %}{{ call_to_action.button_text }} {% endfilter %}]({{ call_to_action.link }})
+
+{% filter squash %}
+{{ call_to_action.text }}
+{% endfilter %}
+
+{% endif %}
+[Visit Website]({{ website_url }}) [Download App]({{ website_url }}/app) [Join Community]({{ website_url }}/community)
+
+You're receiving this because you're part of our breathing community.{{ "  " }}
+Unsubscribe | Update Preferences
+
+"""
+
 BREATHSCAPE_WEB_TEMPLATE = """
 # {{ title }}
 
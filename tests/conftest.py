@@ -0,0 +1,17 @@
+"""
+Shared pytest fixtures
+"""
+import pytest
+
+from halcytone_content_generator.services.document_cache import get_document_cache
+from halcytone_content_generator.services.notion_sync import clear_notion_snapshots
+
+
+@pytest.fixture(autouse=True)
+def reset_document_cache():
+    """Start every test with empty process-wide document caches"""
+    get_document_cache().clear()
+    clear_notion_snapshots()
+    yield
+    get_document_cache().clear()
+    clear_notion_snapshots()
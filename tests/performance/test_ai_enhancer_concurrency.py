@@ -0,0 +1,140 @@
+"""
+Performance tests for concurrent AI content enhancement
+Runs the async OpenAI client against a local stub chat completions server
+"""
+import asyncio
+import socket
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+import uvicorn
+from fastapi import FastAPI, Request
+
+from src.halcytone_content_generator.config import Settings
+from src.halcytone_content_generator.services.ai_content_enhancer import (
+    AIContentEnhancer,
+    ContentType,
+    EnhancementMode,
+    EnhancementRequest
+)
+
+
+STUB_LATENCY = 0.2
+CONCURRENCY_LIMIT = 20
+ENHANCEMENTS = 100
+
+
+class StubOpenAIServer:
+    """Chat completions endpoint with fixed latency that records peak concurrency"""
+
+    def __init__(self, latency: float):
+        self.latency = latency
+        self.active = 0
+        self.peak = 0
+        self.requests = 0
+        self.app = FastAPI()
+        self.app.post("/v1/chat/completions")(self.chat_completions)
+
+        self.socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self.socket.bind(("127.0.0.1", 0))
+        self.port = self.socket.getsockname()[1]
+        self.server = uvicorn.Server(uvicorn.Config(self.app, log_level="warning"))
+        self.thread = threading.Thread(target=self.server.run, kwargs={"sockets": [self.socket]},
+                                       daemon=True)
+
+    @property
+    def base_url(self) -> str:
+        return f"http://127.0.0.1:{self.port}/v1"
+
+    async def chat_completions(self, request: Request):
+        body = await request.json()
+        self.requests += 1
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        try:
+            await asyncio.sleep(self.latency)
+        finally:
+            self.active -= 1
+        content = body["messages"][-1]["content"].split("Content:\n", 1)[-1]
+        return {
+            "id": f"chatcmpl-{self.requests}",
+            "object": "chat.completion",
+            "created": int(time.time()),
+            "model": body["model"],
+            "choices": [{
+                "index": 0,
+                "message": {"role": "assistant", "content": f"Enhanced: {content}"},
+                "finish_reason": "stop"
+            }],
+            "usage": {"prompt_tokens": 10, "completion_tokens": 10, "total_tokens": 20}
+        }
+
+    def start(self):
+        self.thread.start()
+        deadline = time.time() + 10
+        while not self.server.started:
+            if time.time() > deadline:
+                raise RuntimeError("Stub OpenAI server did not start")
+            time.sleep(0.01)
+
+    def stop(self):
+        self.server.should_exit = True
+        self.thread.join(timeout=10)
+
+
+class TestAIEnhancerConcurrency:
+    """Throughput of the async enhancer under concurrent load"""
+
+    @pytest.fixture
+    def stub_server(self):
+        server = StubOpenAIServer(STUB_LATENCY)
+        server.start()
+        yield server
+        server.stop()
+
+    @pytest.fixture
+    def enhancer(self, stub_server):
+        settings = Settings(
+            OPENAI_API_KEY="stub-key",
+            OPENAI_MODEL="gpt-3.5-turbo",
+            OPENAI_BASE_URL=stub_server.base_url,
+            AI_MAX_CONCURRENT_REQUESTS=CONCURRENCY_LIMIT,
+            AI_REQUEST_TIMEOUT=5.0
+        )
+        with patch('src.halcytone_content_generator.services.ai_content_enhancer.get_settings',
+                   return_value=settings):
+            return AIContentEnhancer()
+
+    @pytest.mark.asyncio
+    async def test_100_concurrent_enhancements(self, enhancer, stub_server):
+        """100 enhancements finish in a few latency rounds without exceeding the limit"""
+        requests = [
+            EnhancementRequest(
+                content=f"Draft {i}: slow breathing lowers your heart rate.",
+                content_type=ContentType.EMAIL,
+                mode=EnhancementMode.IMPROVE_CLARITY
+            )
+            for i in range(ENHANCEMENTS)
+        ]
+
+        # Create the client (and import openai) outside the timed region
+        assert enhancer.is_configured()
+
+        start_time = time.perf_counter()
+        results = await asyncio.gather(*[enhancer.enhance_content(r) for r in requests])
+        elapsed = time.perf_counter() - start_time
+
+        serial_time = ENHANCEMENTS * STUB_LATENCY
+        print(f"\nAI Enhancement Concurrency ({ENHANCEMENTS} requests, limit {CONCURRENCY_LIMIT}):")
+        print(f"  Elapsed: {elapsed*1000:.0f}ms (serial would be {serial_time*1000:.0f}ms)")
+        print(f"  Throughput: {ENHANCEMENTS / elapsed:.0f} enhancements/s")
+        print(f"  Peak upstream concurrency: {stub_server.peak}")
+
+        for request, result in zip(requests, results):
+            assert result.enhanced_content == f"Enhanced: {request.content}"
+        assert stub_server.requests == ENHANCEMENTS
+        assert stub_server.peak <= CONCURRENCY_LIMIT
+        assert elapsed < serial_time / 4, "Concurrent enhancement should be at least 4x faster than serial"
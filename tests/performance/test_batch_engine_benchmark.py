@@ -0,0 +1,76 @@
+"""
+Benchmark for concurrent batch generation
+Runs a month-long, three-channel batch sequentially and through the bounded worker pool
+"""
+import asyncio
+import time
+from datetime import datetime
+
+import pytest
+
+from src.halcytone_content_generator.services.batch_engine import (
+    BatchGenerationEngine,
+    BatchItemProgress,
+    BatchRun,
+    plan_batch
+)
+from src.halcytone_content_generator.services.content_assembler_v2 import EnhancedContentAssembler
+from src.halcytone_content_generator.services.publishers.base import PreviewResult, ValidationResult
+
+
+CHANNELS = ['email', 'web', 'social']
+MONTH_ITEMS = len(CHANNELS) * 15  # Item count the endpoint plans for period=month
+# Round trip of a remote validation or preview check
+PUBLISHER_LATENCY = 0.02
+CONTENT = {
+    "breathscape": [{"title": "Adaptive Sessions", "content": "Sessions now adapt to your breathing rhythm."}],
+    "hardware": [{"title": "Sensor v2", "content": "Smaller sensor with longer battery life."}],
+    "tips": [{"title": "Box Breathing", "content": "Inhale four, hold four, exhale four, hold four."}],
+    "vision": [{"title": "Our Mission", "content": "Better breathing for everyone."}]
+}
+
+
+class RemotePublisher:
+    """Publisher whose checks take a network round trip"""
+
+    async def validate(self, content):
+        await asyncio.sleep(PUBLISHER_LATENCY)
+        return ValidationResult(is_valid=True, issues=[], metadata={})
+
+    async def preview(self, content):
+        await asyncio.sleep(PUBLISHER_LATENCY)
+        return PreviewResult(preview_data={}, formatted_content="", metadata={}, estimated_engagement=0.1)
+
+
+async def time_month_batch(max_concurrency: int) -> float:
+    """Wall time of a month batch for all three channels"""
+    publisher = RemotePublisher()
+    engine = BatchGenerationEngine(
+        EnhancedContentAssembler(),
+        {channel: publisher for channel in CHANNELS},
+        max_concurrency=max_concurrency
+    )
+    plans = plan_batch("bench", CHANNELS, MONTH_ITEMS, datetime.now())
+    run = BatchRun(batch_id="bench", items=[BatchItemProgress(plan=plan) for plan in plans])
+
+    start_time = time.perf_counter()
+    await engine.run(run, CONTENT)
+    elapsed = time.perf_counter() - start_time
+
+    assert run.count('completed') == MONTH_ITEMS
+    return elapsed
+
+
+class TestBatchEngineBenchmark:
+    """Wall time of sequential versus concurrent batch generation"""
+
+    @pytest.mark.asyncio
+    async def test_month_batch_runs_in_fraction_of_sequential_time(self):
+        """Benchmark: the worker pool finishes a month batch in under a third of the sequential time"""
+        sequential = await time_month_batch(max_concurrency=1)
+        concurrent = await time_month_batch(max_concurrency=8)
+
+        print(f"\nMonth batch ({MONTH_ITEMS} items, 3 channels): sequential {sequential:.2f}s, "
+              f"concurrent {concurrent:.2f}s ({sequential / concurrent:.1f}x)")
+
+        assert concurrent < sequential / 3
@@ -0,0 +1,153 @@
+"""
+Load tests for windowed bulk newsletter dispatch
+Runs EnhancedCRMClient.send_newsletter_bulk against mocks/crm_service.py
+"""
+import importlib.util
+import logging
+import socket
+import threading
+import time
+from pathlib import Path
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+import uvicorn
+
+from src.halcytone_content_generator.services.crm_client_v2 import (
+    EmailRecipient,
+    EnhancedCRMClient
+)
+
+
+MOCK_CRM_PATH = Path(__file__).resolve().parents[2] / "mocks" / "crm_service.py"
+BATCH_LATENCY = 0.05
+BATCH_SIZE = 50
+BATCHES = 40
+WINDOW_SIZES = [1, 2, 4, 8]
+
+
+def load_mock_crm():
+    """Import the mock CRM service module from the mocks directory"""
+    spec = importlib.util.spec_from_file_location("mock_crm_service", MOCK_CRM_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    logging.getLogger("mock-crm").setLevel(logging.WARNING)
+    return module
+
+
+class MockCRMServer:
+    """Mock CRM app served by uvicorn on an ephemeral port"""
+
+    def __init__(self, batch_latency: float):
+        self.module = load_mock_crm()
+        self.module.BATCH_LATENCY = batch_latency
+
+        self.socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self.socket.bind(("127.0.0.1", 0))
+        self.port = self.socket.getsockname()[1]
+        self.server = uvicorn.Server(uvicorn.Config(self.module.app, log_level="warning"))
+        self.thread = threading.Thread(target=self.server.run, kwargs={"sockets": [self.socket]},
+                                       daemon=True)
+
+    @property
+    def base_url(self) -> str:
+        return f"http://127.0.0.1:{self.port}"
+
+    @property
+    def batches_received(self) -> int:
+        return len(self.module.mock_emails)
+
+    def start(self):
+        self.thread.start()
+        deadline = time.time() + 10
+        while not self.server.started:
+            if time.time() > deadline:
+                raise RuntimeError("Mock CRM server did not start")
+            time.sleep(0.01)
+
+    def stop(self):
+        self.server.should_exit = True
+        self.thread.join(timeout=10)
+
+
+def make_client(base_url: str, window: int, rate_limit: int) -> EnhancedCRMClient:
+    settings = Mock()
+    settings.CRM_BASE_URL = base_url
+    settings.CRM_API_KEY = "load-test-key"
+    settings.DRY_RUN_MODE = False
+    settings.DRY_RUN = False
+    settings.USE_MOCK_SERVICES = False
+    settings.ENVIRONMENT = "development"
+    settings.EMAIL_BATCH_SIZE = BATCH_SIZE
+    settings.EMAIL_RATE_LIMIT = rate_limit
+    settings.EMAIL_MAX_IN_FLIGHT_BATCHES = window
+    settings.CIRCUIT_BREAKER_FAILURE_THRESHOLD = 5
+    settings.CIRCUIT_BREAKER_RECOVERY_TIMEOUT = 60
+    settings.MAX_RETRIES = 3
+    settings.RETRY_MAX_WAIT = 60
+    return EnhancedCRMClient(settings)
+
+
+class TestBulkDispatchLoad:
+    """Sends per second of send_newsletter_bulk as the in-flight window grows"""
+
+    @pytest.fixture
+    def mock_crm(self):
+        server = MockCRMServer(BATCH_LATENCY)
+        server.start()
+        yield server
+        server.stop()
+
+    @pytest.fixture
+    def recipients(self):
+        return [EmailRecipient(email=f"user{i}@example.com", name=f"User {i}", user_id=f"u{i}")
+                for i in range(BATCH_SIZE * BATCHES)]
+
+    async def _send(self, client, recipients):
+        with patch.object(client, '_fetch_recipients', AsyncMock(return_value=recipients)):
+            start_time = time.perf_counter()
+            job = await client.send_newsletter_bulk(
+                subject="Weekly Breathscape update",
+                html="<h1>Hello {{name}}</h1>",
+                text="Hello {{name}}"
+            )
+            return job, time.perf_counter() - start_time
+
+    @pytest.mark.asyncio
+    async def test_throughput_scales_with_window(self, mock_crm, recipients):
+        """Wider windows send faster until the mock CRM latency is overlapped"""
+        throughput = {}
+
+        print(f"\nBulk dispatch ({len(recipients)} recipients, {BATCHES} batches, "
+              f"{BATCH_LATENCY*1000:.0f}ms per batch):")
+        for window in WINDOW_SIZES:
+            client = make_client(mock_crm.base_url, window, rate_limit=10000)
+            job, elapsed = await self._send(client, recipients)
+
+            assert job.status == "completed", job.errors
+            assert job.sent_count == len(recipients)
+            assert job.failed_count == 0
+
+            throughput[window] = job.sent_count / elapsed
+            print(f"  window={window}: {elapsed*1000:.0f}ms, {throughput[window]:.0f} sends/s")
+
+        assert mock_crm.batches_received == BATCHES * len(WINDOW_SIZES)
+        for narrower, wider in zip(WINDOW_SIZES, WINDOW_SIZES[1:]):
+            assert throughput[wider] > throughput[narrower]
+        assert throughput[8] > throughput[1] * 3, "A window of 8 should be at least 3x faster than serial"
+
+    @pytest.mark.asyncio
+    async def test_rate_limiter_still_bounds_dispatch(self, mock_crm, recipients):
+        """A wide window cannot dispatch more batches per second than the rate limit"""
+        rate_limit = 20
+        client = make_client(mock_crm.base_url, window=8, rate_limit=rate_limit)
+
+        job, elapsed = await self._send(client, recipients)
+
+        print(f"\nRate limited dispatch ({rate_limit} batches/s, window 8): "
+              f"{elapsed*1000:.0f}ms, {job.sent_count / elapsed:.0f} sends/s")
+        assert job.status == "completed", job.errors
+        assert job.sent_count == len(recipients)
+        # 40 batches at 20 per second need at least one full window of waiting
+        assert elapsed >= (BATCHES / rate_limit) - 1
@@ -0,0 +1,79 @@
+"""
+Benchmark for personalized newsletter rendering
+Streams 100k personalized bodies from a compiled skeleton with bounded memory
+"""
+import resource
+import time
+
+import pytest
+from jinja2 import Template
+
+from src.halcytone_content_generator.services.content_assembler_v2 import EnhancedContentAssembler
+from src.halcytone_content_generator.services.newsletter_skeleton import NewsletterSkeleton
+from src.halcytone_content_generator.templates.email_templates import get_email_template
+
+
+RECIPIENTS = 100_000
+FULL_RENDER_SAMPLE = 200
+DATA = {
+    'subject': 'Halcytone Monthly',
+    'month_year': 'May 2025',
+    'breathscape_updates': [{'title': f'Update {i}', 'content': 'Sessions now adapt to you. ' * 10}
+                            for i in range(3)],
+    'tips': [{'title': 'Box Breathing', 'content': 'Inhale four, hold four, exhale four.'}],
+    'vision': 'Breathing for everyone.',
+    'website_url': 'https://halcytone.com'
+}
+# Resident memory growth must not scale with the number of recipients
+MEMORY_BUDGET_MB = 32
+
+
+def max_rss_mb() -> float:
+    """Process high-water resident set size (ru_maxrss is KiB on Linux)"""
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def recipient_merge_vars(i):
+    return {
+        'name': f'Subscriber {i}',
+        'email': f'user{i}@example.com',
+        'preferences_url': f'https://halcytone.com/preferences?u={i}',
+        'unsubscribe_url': f'https://halcytone.com/unsubscribe?u={i}'
+    }
+
+
+class TestNewsletterSkeletonBenchmark:
+    """Throughput and memory of skeleton rendering"""
+
+    @pytest.mark.asyncio
+    async def test_100k_personalized_bodies_stream_with_bounded_memory(self):
+        """Benchmark: 100k bodies stream within the memory budget, far faster than full renders"""
+        template = Template(get_email_template('modern'))
+        start_time = time.perf_counter()
+        for i in range(FULL_RENDER_SAMPLE):
+            html = template.render(**DATA, **recipient_merge_vars(i))
+            EnhancedContentAssembler._create_html2text().handle(html)
+        full_per_body = (time.perf_counter() - start_time) / FULL_RENDER_SAMPLE
+
+        skeleton = NewsletterSkeleton('modern', DATA)
+        count = 0
+        total_bytes = 0
+
+        rss_before = max_rss_mb()
+        start_time = time.perf_counter()
+        async for i, body in skeleton.stream_rendered(range(RECIPIENTS), recipient_merge_vars):
+            count += 1
+            total_bytes += len(body['html']) + len(body['text'])
+        elapsed = time.perf_counter() - start_time
+        rss_growth = max_rss_mb() - rss_before
+
+        skeleton_per_body = elapsed / RECIPIENTS
+        print(f"\nPersonalized newsletters: {count} bodies ({total_bytes / 1024 / 1024:.0f} MB) in {elapsed:.2f}s, "
+              f"{skeleton_per_body * 1e6:.1f}us vs full render {full_per_body * 1e6:.0f}us "
+              f"({full_per_body / skeleton_per_body:.0f}x), peak RSS growth {rss_growth:.1f} MB")
+
+        assert skeleton.is_static
+        assert count == RECIPIENTS
+        assert total_bytes > MEMORY_BUDGET_MB * 1024 * 1024
+        assert rss_growth < MEMORY_BUDGET_MB
+        assert skeleton_per_body < full_per_body / 10
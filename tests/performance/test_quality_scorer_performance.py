@@ -0,0 +1,774 @@
+"""
+Performance tests for content quality scoring
+Benchmarks shared text analysis and lexicon matching on long-form web content
+"""
+import pytest
+import random
+import re
+import statistics
+import time
+from typing import Any, Dict, List
+from unittest.mock import patch
+
+from src.halcytone_content_generator.config import Settings
+from src.halcytone_content_generator.services.content_quality_scorer import (
+    ContentQualityScorer,
+    EngagementMetrics,
+    QualityScore,
+    ReadabilityMetrics,
+    ScoreCategory,
+    SEOMetrics
+)
+from src.halcytone_content_generator.services.ai_content_enhancer import ContentType
+from src.halcytone_content_generator.services.lexicon_matcher import LexiconMatcher
+from src.halcytone_content_generator.services.text_analysis import TextAnalysis
+
+
+VOCABULARY = (
+    "the breathing practice helps you feel calm and focused every day because wellness "
+    "matters discover amazing results today with comprehensive implementation of "
+    "mindfulness technology was improved were tested our team"
+).split()
+
+
+def build_document(word_target: int = 5000, seed: int = 7) -> str:
+    """Build a synthetic long-form web post of roughly word_target words"""
+    rng = random.Random(seed)
+    paragraphs = []
+    words = 0
+    section = 0
+    while words < word_target:
+        sentences = []
+        for _ in range(5):
+            sentence = " ".join(rng.choice(VOCABULARY) for _ in range(10))
+            sentences.append(sentence.capitalize() + rng.choice([".", ".", "!", "?"]))
+            words += 10
+        prefix = f"## Section {section}\n" if len(paragraphs) % 10 == 0 else ""
+        paragraphs.append(prefix + " ".join(sentences))
+        section += 1
+    return "# Breathing Techniques for Everyday Wellness\n\n" + "\n\n".join(paragraphs)
+
+
+class BaselineQualityScorer(ContentQualityScorer):
+    """ContentQualityScorer metrics as they were before the shared TextAnalysis
+
+    Frozen copy of the original per-metric implementation: every metric
+    re-splits sentences and words, syllables are re-counted per token, each
+    pronoun and passive pattern is a separate regex scan and every word list
+    is a substring scan. Only used as the benchmark baseline.
+    """
+
+    def score_metrics(self, content: str, content_type: ContentType, analysis=None) -> QualityScore:
+        """Non-AI part of the original score_content"""
+        readability = self._calculate_readability_metrics(content)
+        engagement = self._calculate_engagement_metrics(content)
+        seo = self._calculate_seo_metrics(content, content_type)
+        brand_alignment = self._calculate_brand_alignment_score(content)
+        structure_score = self._calculate_structure_score(content, content_type)
+        clarity_score = self._calculate_clarity_score(content)
+
+        category_scores = {
+            ScoreCategory.READABILITY: readability.overall_readability_score,
+            ScoreCategory.ENGAGEMENT: engagement.engagement_score,
+            ScoreCategory.SEO_OPTIMIZATION: seo.seo_score,
+            ScoreCategory.BRAND_ALIGNMENT: brand_alignment,
+            ScoreCategory.STRUCTURE: structure_score,
+            ScoreCategory.CLARITY: clarity_score
+        }
+        weights = self._get_category_weights(content_type)
+        overall_score = sum(
+            category_scores[category] * weights.get(category, 0.1)
+            for category in category_scores
+        )
+        quality_level = self.thresholds.classify_quality(overall_score)
+        suggestions = self._generate_improvement_suggestions(
+            category_scores, content_type, quality_level
+        )
+        detailed_feedback = self._create_detailed_feedback(
+            content, category_scores, readability, engagement, seo
+        )
+
+        return QualityScore(
+            overall_score=overall_score,
+            readability_metrics=readability,
+            engagement_metrics=engagement,
+            seo_metrics=seo,
+            brand_alignment_score=brand_alignment,
+            structure_score=structure_score,
+            clarity_score=clarity_score,
+            ai_assessment_score=0.0,
+            quality_level=quality_level,
+            improvement_suggestions=suggestions,
+            detailed_feedback=detailed_feedback
+        )
+
+    def _calculate_readability_metrics(self, content: str) -> ReadabilityMetrics:
+        """Calculate comprehensive readability metrics"""
+        # Clean content for analysis
+        sentences = self._split_sentences(content)
+        words = self._split_words(content)
+        syllables = [self._count_syllables(word) for word in words]
+
+        if not sentences or not words:
+            return self._create_default_readability_metrics()
+
+        # Basic metrics
+        avg_sentence_length = len(words) / len(sentences)
+        avg_syllables_per_word = sum(syllables) / len(syllables) if syllables else 1.0
+
+        # Complex words (3+ syllables)
+        complex_words = [s for s in syllables if s >= 3]
+        complex_words_percentage = (len(complex_words) / len(words)) * 100
+
+        # Passive voice detection
+        passive_count = self._count_passive_voice(content)
+        passive_voice_percentage = (passive_count / len(sentences)) * 100
+
+        # Flesch Reading Ease
+        flesch_ease = 206.835 - (1.015 * avg_sentence_length) - (84.6 * avg_syllables_per_word)
+        flesch_ease = max(0, min(100, flesch_ease))
+
+        # Flesch-Kincaid Grade Level
+        fk_grade = (0.39 * avg_sentence_length) + (11.8 * avg_syllables_per_word) - 15.59
+        fk_grade = max(0, fk_grade)
+
+        # Gunning Fog Index
+        fog_index = 0.4 * (avg_sentence_length + complex_words_percentage)
+
+        # Automated Readability Index
+        characters = sum(len(word) for word in words)
+        ari = 4.71 * (characters / len(words)) + 0.5 * (len(words) / len(sentences)) - 21.43
+        ari = max(0, ari)
+
+        # Coleman-Liau Index
+        l_value = (characters / len(words)) * 100
+        s_value = (len(sentences) / len(words)) * 100
+        cli = 0.0588 * l_value - 0.296 * s_value - 15.8
+        cli = max(0, cli)
+
+        return ReadabilityMetrics(
+            flesch_reading_ease=flesch_ease,
+            flesch_kincaid_grade=fk_grade,
+            gunning_fog_index=fog_index,
+            automated_readability_index=ari,
+            coleman_liau_index=cli,
+            average_sentence_length=avg_sentence_length,
+            average_syllables_per_word=avg_syllables_per_word,
+            complex_words_percentage=complex_words_percentage,
+            passive_voice_percentage=passive_voice_percentage
+        )
+
+    def _calculate_engagement_metrics(self, content: str) -> EngagementMetrics:
+        """Calculate engagement-related metrics"""
+        content_lower = content.lower()
+
+        # Count various engagement factors
+        emotional_words = sum(1 for word in self.emotional_words if word in content_lower)
+        power_words = sum(1 for word in self.power_words if word in content_lower)
+        questions = content.count('?')
+        exclamations = content.count('!')
+
+        # Personal pronouns
+        pronouns = ['you', 'your', 'yours', 'we', 'our', 'ours', 'i', 'my', 'mine']
+        personal_pronouns = sum(len(re.findall(rf'\b{pronoun}\b', content_lower))
+                                for pronoun in pronouns)
+
+        # Sensory words
+        sensory_words = sum(1 for word in self.sensory_words if word in content_lower)
+
+        # Urgency indicators
+        urgency = sum(1 for indicator in self.urgency_indicators if indicator in content_lower)
+
+        # Social proof indicators
+        social_proof_terms = ['testimonial', 'review', 'customer', 'user', 'client',
+                              'success story', 'case study', 'proven', 'trusted']
+        social_proof = sum(1 for term in social_proof_terms if term in content_lower)
+
+        # Storytelling elements
+        story_elements = ['once', 'story', 'imagine', 'picture this', 'example',
+                          'for instance', 'let me tell you']
+        storytelling = sum(1 for element in story_elements if element in content_lower)
+
+        # Curiosity triggers
+        curiosity_triggers = ['secret', 'hidden', 'revealed', 'discover', 'unknown',
+                              'mystery', 'surprise', 'shocking']
+        curiosity = sum(1 for trigger in curiosity_triggers if trigger in content_lower)
+
+        return EngagementMetrics(
+            emotional_words_count=emotional_words,
+            power_words_count=power_words,
+            question_count=questions,
+            exclamation_count=exclamations,
+            personal_pronouns_count=personal_pronouns,
+            sensory_words_count=sensory_words,
+            urgency_indicators_count=urgency,
+            social_proof_indicators=social_proof,
+            storytelling_elements=storytelling,
+            curiosity_triggers=curiosity
+        )
+
+    def _calculate_seo_metrics(self, content: str, content_type: ContentType) -> SEOMetrics:
+        """Calculate SEO optimization metrics"""
+        words = self._split_words(content.lower())
+
+        # Basic keyword density (placeholder - would need target keywords)
+        keyword_density = self._calculate_keyword_density(words)
+
+        # Title optimization (look for title-like content at beginning)
+        title_score = self._score_title_optimization(content)
+
+        # Meta description score (if content suggests meta description)
+        meta_score = self._score_meta_description(content)
+
+        # Header structure (look for header patterns)
+        header_score = self._score_header_structure(content)
+
+        # Link opportunities
+        internal_links = len(re.findall(r'\[([^\]]+)\]\([^)]+\)', content))  # Markdown links
+
+        # Content length optimization
+        length_score = self._score_content_length(content, content_type)
+
+        # Semantic keywords (related terms)
+        semantic_count = self._count_semantic_keywords(content)
+
+        return SEOMetrics(
+            keyword_density=keyword_density,
+            title_optimization_score=title_score,
+            meta_description_score=meta_score,
+            header_structure_score=header_score,
+            internal_link_opportunities=internal_links,
+            external_link_quality=75.0,  # Placeholder
+            image_alt_optimization=50.0,  # Placeholder
+            content_length_score=length_score,
+            semantic_keywords_count=semantic_count
+        )
+
+    def _calculate_brand_alignment_score(self, content: str) -> float:
+        """Calculate brand alignment score for Breathscape"""
+        content_lower = content.lower()
+
+        # Breathscape brand terms
+        brand_terms = [
+            'breathscape', 'wellness', 'mindfulness', 'breathing', 'meditation',
+            'health', 'wellbeing', 'balance', 'calm', 'peace', 'tranquility',
+            'stress relief', 'relaxation', 'mental health', 'self-care'
+        ]
+
+        # Brand values terms
+        value_terms = [
+            'innovation', 'technology', 'personalized', 'data-driven', 'science',
+            'research', 'evidence-based', 'user-friendly', 'accessible', 'empowering'
+        ]
+
+        # Count brand-related terms
+        brand_count = sum(1 for term in brand_terms if term in content_lower)
+        value_count = sum(1 for term in value_terms if term in content_lower)
+
+        # Calculate score based on presence and frequency
+        total_words = len(content.split())
+        brand_density = (brand_count + value_count) / max(total_words / 100, 1)
+
+        # Base score on brand term presence and appropriate messaging
+        base_score = min(100, brand_density * 20)
+
+        # Bonus for mentioning Breathscape specifically
+        if 'breathscape' in content_lower:
+            base_score += 20
+
+        return min(100, base_score)
+
+    def _calculate_structure_score(self, content: str, content_type: ContentType) -> float:
+        """Calculate content structure score"""
+        # Different structure requirements by content type
+        if content_type == ContentType.EMAIL:
+            return self._score_email_structure(content)
+        elif content_type == ContentType.WEB:
+            return self._score_web_structure(content)
+        elif content_type in [ContentType.SOCIAL_TWITTER, ContentType.SOCIAL_LINKEDIN,
+                              ContentType.SOCIAL_FACEBOOK, ContentType.SOCIAL_INSTAGRAM]:
+            return self._score_social_structure(content)
+        else:
+            return self._score_general_structure(content)
+
+    def _calculate_clarity_score(self, content: str) -> float:
+        """Calculate content clarity score"""
+        # Factors affecting clarity
+        factors = []
+
+        # Sentence length variation
+        sentences = self._split_sentences(content)
+        if sentences:
+            lengths = [len(sentence.split()) for sentence in sentences]
+            avg_length = statistics.mean(lengths)
+            variation = statistics.stdev(lengths) if len(lengths) > 1 else 0
+
+            # Optimal sentence length is 15-20 words
+            length_score = max(0, 100 - abs(avg_length - 17.5) * 4)
+            factors.append(length_score)
+
+            # Good variation in sentence length
+            variation_score = min(100, variation * 10)
+            factors.append(variation_score)
+
+        # Use of transition words
+        transitions = ['however', 'therefore', 'furthermore', 'meanwhile', 'consequently',
+                       'additionally', 'moreover', 'nevertheless', 'subsequently', 'thus']
+        transition_count = sum(1 for trans in transitions if trans in content.lower())
+        transition_score = min(100, transition_count * 15)
+        factors.append(transition_score)
+
+        # Avoid jargon and complex words
+        complex_count = sum(1 for word in self.complex_words
+                            if word in content.lower())
+        jargon_penalty = min(50, complex_count * 5)
+        complexity_score = max(0, 100 - jargon_penalty)
+        factors.append(complexity_score)
+
+        return statistics.mean(factors) if factors else 50.0
+
+    # Helper methods for detailed calculations
+    def _split_sentences(self, content: str) -> List[str]:
+        """Split content into sentences"""
+        sentences = re.split(r'[.!?]+', content)
+        return [s.strip() for s in sentences if s.strip()]
+
+    def _split_words(self, content: str) -> List[str]:
+        """Split content into words"""
+        words = re.findall(r'\b\w+\b', content.lower())
+        return [w for w in words if len(w) > 0]
+
+    def _count_syllables(self, word: str) -> int:
+        """Count syllables in a word (approximation)"""
+        word = word.lower()
+        count = 0
+        vowels = 'aeiouy'
+        if word[0] in vowels:
+            count += 1
+        for index in range(1, len(word)):
+            if word[index] in vowels and word[index - 1] not in vowels:
+                count += 1
+        if word.endswith('e'):
+            count -= 1
+        if count == 0:
+            count += 1
+        return count
+
+    def _count_passive_voice(self, content: str) -> int:
+        """Count passive voice constructions"""
+        # Simple passive voice detection
+        passive_patterns = [
+            r'\bis\s+\w+ed\b', r'\bare\s+\w+ed\b', r'\bwas\s+\w+ed\b',
+            r'\bwere\s+\w+ed\b', r'\bbeen\s+\w+ed\b', r'\bbeing\s+\w+ed\b'
+        ]
+        count = 0
+        for pattern in passive_patterns:
+            count += len(re.findall(pattern, content, re.IGNORECASE))
+        return count
+
+    def _calculate_keyword_density(self, words: List[str]) -> Dict[str, float]:
+        """Calculate keyword density for common terms"""
+        from collections import Counter
+        word_counts = Counter(words)
+        total_words = len(words)
+
+        # Return density for most common words
+        density = {}
+        for word, count in word_counts.most_common(10):
+            if len(word) > 3:  # Skip short words
+                density[word] = (count / total_words) * 100
+
+        return density
+
+    def _score_title_optimization(self, content: str) -> float:
+        """Score title optimization"""
+        lines = content.split('\n')
+        if not lines:
+            return 0.0
+
+        first_line = lines[0].strip()
+        title_score = 0.0
+
+        # Length optimization (50-60 characters for SEO)
+        if 40 <= len(first_line) <= 70:
+            title_score += 40
+
+        # Contains power words
+        if any(word in first_line.lower() for word in self.power_words[:10]):
+            title_score += 30
+
+        # Not too many capital letters
+        if sum(1 for c in first_line if c.isupper()) <= len(first_line) * 0.3:
+            title_score += 30
+
+        return title_score
+
+    def _score_meta_description(self, content: str) -> float:
+        """Score meta description optimization"""
+        # Look for description-like content (usually 2nd paragraph)
+        paragraphs = content.split('\n\n')
+        if len(paragraphs) < 2:
+            return 50.0  # Default score if no clear description
+
+        description = paragraphs[1].strip()
+        score = 0.0
+
+        # Length optimization (150-160 characters)
+        if 140 <= len(description) <= 170:
+            score += 50
+
+        # Contains call to action
+        if any(cta in description.lower() for cta in ['learn', 'discover', 'find out']):
+            score += 25
+
+        # Compelling language
+        if any(word in description.lower() for word in self.emotional_words[:5]):
+            score += 25
+
+        return score
+
+    def _score_header_structure(self, content: str) -> float:
+        """Score header structure"""
+        # Look for markdown headers or structured text
+        headers = re.findall(r'^#{1,6}\s+.+$', content, re.MULTILINE)
+
+        score = 0.0
+        if headers:
+            score += 40  # Has headers
+
+            # Check hierarchy
+            header_levels = [len(re.match(r'^#+', h).group()) for h in headers]
+            if len(set(header_levels)) > 1:
+                score += 30  # Multiple levels
+
+            # Reasonable number of headers
+            if 2 <= len(headers) <= 8:
+                score += 30
+
+        return score
+
+    def _score_content_length(self, content: str, content_type: ContentType) -> float:
+        """Score content length appropriateness"""
+        word_count = len(content.split())
+
+        # Optimal lengths by content type
+        optimal_ranges = {
+            ContentType.EMAIL: (150, 500),
+            ContentType.WEB: (300, 2000),
+            ContentType.SOCIAL_TWITTER: (10, 35),
+            ContentType.SOCIAL_LINKEDIN: (50, 200),
+            ContentType.SOCIAL_FACEBOOK: (25, 80),
+            ContentType.SOCIAL_INSTAGRAM: (50, 150)
+        }
+
+        min_words, max_words = optimal_ranges.get(content_type, (100, 1000))
+
+        if min_words <= word_count <= max_words:
+            return 100.0
+        elif word_count < min_words:
+            return max(0, 100 - (min_words - word_count) * 2)
+        else:
+            return max(0, 100 - (word_count - max_words) * 0.5)
+
+    def _count_semantic_keywords(self, content: str) -> int:
+        """Count semantic keywords related to wellness/tech"""
+        semantic_terms = [
+            'algorithm', 'analytics', 'artificial intelligence', 'biometric',
+            'breathing pattern', 'cognitive', 'data analysis', 'digital health',
+            'health tracking', 'machine learning', 'mindfulness practice',
+            'personalization', 'predictive', 'real-time', 'smart technology',
+            'stress management', 'user experience', 'wearable', 'wellness journey'
+        ]
+
+        content_lower = content.lower()
+        return sum(1 for term in semantic_terms if term in content_lower)
+
+    # Structure scoring methods
+    def _score_email_structure(self, content: str) -> float:
+        """Score email-specific structure"""
+        score = 0.0
+
+        # Has clear subject line suggestion
+        if content.lower().startswith('subject:') or 'subject line' in content.lower():
+            score += 20
+
+        # Has greeting/opening
+        openings = ['dear', 'hello', 'hi', 'greetings', 'welcome']
+        if any(opening in content.lower()[:100] for opening in openings):
+            score += 15
+
+        # Has clear call to action
+        cta_terms = ['click', 'visit', 'download', 'register', 'subscribe', 'learn more']
+        if any(cta in content.lower() for cta in cta_terms):
+            score += 25
+
+        # Has signature/closing
+        closings = ['best regards', 'sincerely', 'thanks', 'cheers', 'team']
+        if any(closing in content.lower()[-200:] for closing in closings):
+            score += 15
+
+        # Proper paragraph breaks
+        paragraphs = content.split('\n\n')
+        if 2 <= len(paragraphs) <= 6:
+            score += 25
+
+        return score
+
+    def _score_web_structure(self, content: str) -> float:
+        """Score web content structure"""
+        score = 0.0
+
+        # Has clear title/heading
+        if content.strip().startswith('#') or re.match(r'^[A-Z][^.!?]*$', content.split('\n')[0]):
+            score += 25
+
+        # Has subheadings
+        if re.search(r'^#{2,6}\s+', content, re.MULTILINE):
+            score += 25
+
+        # Has bullet points or lists
+        if re.search(r'^\s*[-*+]\s+', content, re.MULTILINE) or re.search(r'^\s*\d+\.\s+', content, re.MULTILINE):
+            score += 20
+
+        # Has clear sections
+        paragraphs = content.split('\n\n')
+        if len(paragraphs) >= 3:
+            score += 15
+
+        # Has conclusion/summary
+        conclusion_terms = ['conclusion', 'summary', 'in summary', 'to summarize', 'final thoughts']
+        if any(term in content.lower() for term in conclusion_terms):
+            score += 15
+
+        return score
+
+    def _score_social_structure(self, content: str) -> float:
+        """Score social media structure"""
+        score = 0.0
+
+        # Has attention-grabbing opening
+        first_line = content.split('\n')[0] if '\n' in content else content[:50]
+        if any(word in first_line.lower() for word in self.power_words[:10]):
+            score += 30
+
+        # Appropriate use of hashtags
+        hashtag_count = content.count('#')
+        if 1 <= hashtag_count <= 5:
+            score += 25
+        elif hashtag_count == 0:
+            score += 10  # OK for some platforms
+
+        # Has emoji usage (for engagement)
+        emoji = r'[\U0001F600-\U0001F64F\U0001F300-\U0001F5FF\U0001F680-\U0001F6FF\U0001F1E0-\U0001F1FF]'
+        if re.search(emoji, content):
+            score += 15
+
+        # Clear call to action
+        if any(cta in content.lower() for cta in ['follow', 'share', 'comment', 'like', 'tag']):
+            score += 30
+
+        return score
+
+    def _score_general_structure(self, content: str) -> float:
+        """Score general content structure"""
+        score = 0.0
+
+        # Has clear beginning, middle, end
+        paragraphs = content.split('\n\n')
+        if len(paragraphs) >= 3:
+            score += 40
+
+        # Has logical flow
+        transition_words = ['first', 'second', 'then', 'next', 'finally', 'however', 'therefore']
+        if sum(1 for word in transition_words if word in content.lower()) >= 2:
+            score += 30
+
+        # Proper formatting
+        if '\n' in content:  # Has line breaks
+            score += 30
+
+        return score
+
+    def _create_detailed_feedback(self, content: str, category_scores: Dict[ScoreCategory, float],
+                                  readability: ReadabilityMetrics, engagement: EngagementMetrics,
+                                  seo: SEOMetrics) -> Dict[str, Any]:
+        """Create detailed feedback dictionary"""
+        return {
+            "content_stats": {
+                "word_count": len(content.split()),
+                "sentence_count": len(self._split_sentences(content)),
+                "paragraph_count": len(content.split('\n\n')),
+                "character_count": len(content)
+            },
+            "readability_details": {
+                "grade_level": readability.flesch_kincaid_grade,
+                "reading_ease": readability.flesch_reading_ease,
+                "avg_sentence_length": readability.average_sentence_length,
+                "complex_words_pct": readability.complex_words_percentage
+            },
+            "engagement_details": {
+                "emotional_words": engagement.emotional_words_count,
+                "power_words": engagement.power_words_count,
+                "questions": engagement.question_count,
+                "personal_pronouns": engagement.personal_pronouns_count
+            },
+            "seo_details": {
+                "keyword_density": seo.keyword_density,
+                "internal_links": seo.internal_link_opportunities,
+                "content_length_score": seo.content_length_score
+            },
+            "category_scores": category_scores
+        }
+
+
+class TestQualityScorerPerformance:
+    """Performance benchmarks for ContentQualityScorer on long documents"""
+
+    @pytest.fixture
+    def scorer(self):
+        """Create scorer instance"""
+        with patch('src.halcytone_content_generator.services.content_quality_scorer.get_settings',
+                   return_value=Settings()):
+            return ContentQualityScorer()
+
+    @pytest.fixture
+    def baseline_scorer(self):
+        """Scorer running the original per-metric implementation"""
+        with patch('src.halcytone_content_generator.services.content_quality_scorer.get_settings',
+                   return_value=Settings()):
+            return BaselineQualityScorer()
+
+    @pytest.fixture
+    def long_document(self):
+        """Synthetic 5k-word web post"""
+        return build_document(5000)
+
+    def _time(self, func, iterations: int = 20) -> float:
+        times = []
+        for _ in range(iterations):
+            start_time = time.perf_counter()
+            func()
+            times.append(time.perf_counter() - start_time)
+        return statistics.median(times)
+
+    def test_score_metrics_speedup_on_5k_words(self, scorer, baseline_scorer, long_document):
+        """Scoring with a shared TextAnalysis is at least 3x faster than the original scorer"""
+        assert len(long_document.split()) >= 5000
+
+        def run_baseline():
+            return baseline_scorer.score_metrics(long_document, ContentType.WEB)
+
+        def run_shared():
+            return scorer.score_metrics(long_document, ContentType.WEB)
+
+        # Warm up per-process caches (syllable counts, compiled patterns), then
+        # interleave the runs and compare best times so machine noise hits both equally
+        run_baseline()
+        run_shared()
+        baseline_times, shared_times = [], []
+        for _ in range(20):
+            baseline_times.append(self._time(run_baseline, iterations=1))
+            shared_times.append(self._time(run_shared, iterations=1))
+        baseline_time = min(baseline_times)
+        shared_time = min(shared_times)
+        speedup = baseline_time / shared_time
+
+        print("\nScore Metrics Performance (5k words):")
+        print(f"  Original per-metric scorer: {baseline_time*1000:.2f}ms")
+        print(f"  Shared analysis scorer: {shared_time*1000:.2f}ms")
+        print(f"  Speedup: {speedup:.1f}x")
+
+        assert speedup >= 3.0, f"score_metrics speedup {speedup:.1f}x is below 3x"
+
+    @pytest.mark.asyncio
+    async def test_score_content_5k_words(self, scorer, long_document):
+        """Report full non-AI scoring time for a 5k-word post"""
+        # Warm up lazy imports (e.g. metrics) outside the timed loop
+        await scorer.score_content(build_document(50), ContentType.WEB, include_ai_analysis=False)
+
+        times = []
+        for _ in range(20):
+            scorer.clear_score_cache()
+            start_time = time.perf_counter()
+            score = await scorer.score_content(long_document, ContentType.WEB,
+                                               include_ai_analysis=False)
+            times.append(time.perf_counter() - start_time)
+
+        avg_time = statistics.mean(times)
+        print("\nScore Content Performance (5k words):")
+        print(f"  Average time: {avg_time*1000:.2f}ms")
+
+        assert score.overall_score > 0
+
+    @pytest.mark.asyncio
+    async def test_memoized_rescoring_5k_words(self, scorer, long_document):
+        """Re-scoring an unchanged 5k-word post is served from the score cache"""
+        scorer.clear_score_cache()
+        start_time = time.perf_counter()
+        await scorer.score_content(long_document, ContentType.WEB, include_ai_analysis=False)
+        cold_time = time.perf_counter() - start_time
+
+        times = []
+        for _ in range(20):
+            start_time = time.perf_counter()
+            score = await scorer.score_content(long_document, ContentType.WEB,
+                                               include_ai_analysis=False)
+            times.append(time.perf_counter() - start_time)
+
+        warm_time = statistics.median(times)
+        print("\nMemoized Scoring Performance (5k words):")
+        print(f"  Cold: {cold_time*1000:.2f}ms")
+        print(f"  Cached: {warm_time*1000:.2f}ms")
+
+        assert score.overall_score > 0
+        assert warm_time * 5 < cold_time, "Cached re-scoring should be at least 5x faster"
+
+    def test_incremental_rescoring_5k_words(self, scorer, long_document):
+        """Re-scoring a one-paragraph edit costs far less than a full re-score"""
+        from src.halcytone_content_generator.services.text_analysis import TextEdit
+
+        previous = scorer.analyze_text(long_document)
+        start = long_document.index("\n\n", len(long_document) // 2) + 2
+        edit = TextEdit(start, start, "Breathe slowly and notice the change. ")
+        edited = long_document[:start] + edit.text + long_document[start:]
+
+        full_time = self._time(lambda: scorer.score_metrics(edited, ContentType.WEB))
+        incremental_time = self._time(lambda: scorer.score_metrics(
+            edited, ContentType.WEB, scorer.analyze_edit(previous, [edit])
+        ))
+        edit_time = self._time(lambda: scorer.analyze_edit(previous, [edit]))
+
+        print("\nIncremental Re-scoring Performance (5k words):")
+        print(f"  Full re-score: {full_time*1000:.2f}ms")
+        print(f"  Incremental re-score: {incremental_time*1000:.2f}ms")
+        print(f"  Analysis update: {edit_time*1000:.3f}ms")
+
+        incremental = scorer.score_metrics(edited, ContentType.WEB, scorer.analyze_edit(previous, [edit]))
+        assert incremental.overall_score == scorer.score_metrics(edited, ContentType.WEB).overall_score
+        assert incremental_time * 2 < full_time, "Incremental re-scoring should be at least 2x faster"
+        assert edit_time * 10 < full_time, "Analysis update should be at least 10x faster than a full re-score"
+
+    def test_lexicon_matching_scales_with_lexicon_size(self, long_document):
+        """Matching cost stays flat as word lists grow to thousands of terms"""
+        words = TextAnalysis.from_content(long_document).words
+        rng = random.Random(11)
+        synthetic_terms = [
+            "".join(rng.choice("abcdefghijklmnopqrstuvwxyz") for _ in range(8))
+            for _ in range(5000)
+        ]
+
+        small = LexiconMatcher({'power': VOCABULARY[:10]})
+        large = LexiconMatcher({
+            'power': VOCABULARY[:10] + synthetic_terms[:2500],
+            'emotional': [f"{a} {b}" for a, b in zip(synthetic_terms[2500:], synthetic_terms)],
+        })
+
+        small_time = self._time(lambda: small.match(words))
+        large_time = self._time(lambda: large.match(words))
+
+        print("\nLexicon Matching Performance (5k words):")
+        print(f"  10 terms: {small_time*1000:.2f}ms")
+        print(f"  5010 terms: {large_time*1000:.2f}ms")
+
+        assert large.match(words)['power'] == small.match(words)['power']
+        assert large_time < small_time * 3, "Lexicon matching slowed with lexicon size"
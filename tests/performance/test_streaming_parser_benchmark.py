@@ -0,0 +1,88 @@
+"""
+Benchmark for streaming living document parsing
+Parses a synthetic 50 MB markdown document from disk with bounded memory
+"""
+import resource
+import time
+
+import pytest
+
+from src.halcytone_content_generator.services.document_stream_parser import (
+    StreamingDocumentParser,
+    iter_file_chunks
+)
+
+
+DOCUMENT_SIZE = 50 * 1024 * 1024
+SECTIONS = [
+    "## Breathscape Updates",
+    "## Hardware Progress",
+    "## Breathing Tips",
+    "## Company Vision"
+]
+ITEM_TEMPLATE = (
+    "**Update {n}**\n"
+    "- **Date:** 2025-01-{day:02d}\n"
+    "Paragraph one of update {n} describes the change in some detail.\n"
+    "Paragraph two adds context, numbers and a note for the team.\n"
+    "\n"
+)
+# Resident memory growth while parsing must stay well below the document size
+MEMORY_BUDGET_MB = 16
+THROUGHPUT_FLOOR_MB_S = 5.0
+
+
+def max_rss_mb() -> float:
+    """Process high-water resident set size (ru_maxrss is KiB on Linux)"""
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+@pytest.fixture(scope="module")
+def large_document(tmp_path_factory):
+    """Write the synthetic document and return (path, item_count)"""
+    path = tmp_path_factory.mktemp("living_docs") / "living_50mb.md"
+    written = 0
+    items = 0
+    sections = 0
+    with open(path, "w", encoding="utf-8") as f:
+        while written < DOCUMENT_SIZE:
+            header = SECTIONS[sections % len(SECTIONS)] + "\n\n"
+            sections += 1
+            f.write(header)
+            written += len(header)
+            for _ in range(100):
+                item = ITEM_TEMPLATE.format(n=items, day=items % 28 + 1)
+                f.write(item)
+                written += len(item)
+                items += 1
+    return str(path), items
+
+
+class TestStreamingParserBenchmark:
+    """Throughput and memory of streamed parsing"""
+
+    @pytest.mark.asyncio
+    async def test_50mb_document_streams_with_bounded_memory(self, large_document):
+        """Benchmark: 50 MB parses above the throughput floor within the memory budget"""
+        path, expected_items = large_document
+        parser = StreamingDocumentParser()
+        count = 0
+        per_category = {}
+
+        rss_before = max_rss_mb()
+        start_time = time.perf_counter()
+        async for category, _ in parser.parse_bytes(iter_file_chunks(path)):
+            count += 1
+            per_category[category] = per_category.get(category, 0) + 1
+        elapsed = time.perf_counter() - start_time
+        rss_growth = max_rss_mb() - rss_before
+
+        throughput = DOCUMENT_SIZE / (1024 * 1024) / elapsed
+        print(f"\nStreaming parse: {count} items in {elapsed:.2f}s "
+              f"({throughput:.1f} MB/s), peak RSS growth {rss_growth:.1f} MB")
+
+        assert parser.format == 'markdown'
+        assert count == expected_items
+        assert set(per_category) == {'breathscape', 'hardware', 'tips', 'vision'}
+        assert rss_growth < MEMORY_BUDGET_MB
+        assert throughput > THROUGHPUT_FLOOR_MB_S
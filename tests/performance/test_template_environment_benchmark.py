@@ -0,0 +1,89 @@
+"""
+Micro-benchmark for the shared Jinja template environment
+Compares generate_newsletter on per-request assemblers before and after sharing compiled templates,
+and the Breathscape plain-text part rendered by template versus html2text
+"""
+import time
+
+from jinja2 import Environment
+
+from src.halcytone_content_generator.services.content_assembler_v2 import (
+    EnhancedContentAssembler,
+    TemplateLoader,
+    warm_templates
+)
+
+
+ITERATIONS = 50
+CONTENT = {
+    "breathscape": [{"title": "Adaptive Sessions", "content": "Sessions now adapt to your breathing rhythm."}],
+    "hardware": [{"title": "Sensor v2", "content": "Smaller sensor with longer battery life."}],
+    "tips": [{"title": "Box Breathing", "content": "Inhale four, hold four, exhale four, hold four."}],
+    "vision": [{"title": "Our Mission", "content": "Better breathing for everyone."}]
+}
+
+
+def time_newsletters(make_assembler) -> float:
+    """Mean seconds per generate_newsletter with a new assembler per call, as endpoints do"""
+    start_time = time.perf_counter()
+    for _ in range(ITERATIONS):
+        make_assembler().generate_newsletter(CONTENT)
+    return (time.perf_counter() - start_time) / ITERATIONS
+
+
+def per_instance_environment() -> EnhancedContentAssembler:
+    """Assembler with its own environment, as before templates were shared"""
+    assembler = EnhancedContentAssembler()
+    assembler.env = Environment(loader=TemplateLoader())
+    return assembler
+
+
+def html_matches() -> bool:
+    """Shared and per-instance environments render identical newsletters"""
+    old = per_instance_environment().generate_newsletter(CONTENT)
+    new = EnhancedContentAssembler().generate_newsletter(CONTENT)
+    return old['html'] == new['html'] and old['text'] == new['text']
+
+
+class TestTemplateEnvironmentBenchmark:
+    """Template compilation cost per request"""
+
+    def test_shared_environment_speeds_up_generate_newsletter(self):
+        """Benchmark: shared precompiled templates beat per-assembler compilation"""
+        warm_templates()
+
+        before = time_newsletters(per_instance_environment)
+        after = time_newsletters(EnhancedContentAssembler)
+
+        print(f"\ngenerate_newsletter: per-instance environment {before * 1000:.2f}ms, "
+              f"shared environment {after * 1000:.2f}ms ({before / after:.1f}x)")
+
+        assert html_matches()
+        assert after < before / 2
+
+    def test_breathscape_text_template_beats_html2text(self):
+        """Benchmark: the text template renders the plain-text part faster than html2text"""
+        assembler = EnhancedContentAssembler()
+        long_content = {
+            category: [{"title": f"{category} {i}", "content": item["content"] * 20} for i in range(3)]
+            for category, items in CONTENT.items() for item in items
+        }
+        template_data = assembler._prepare_breathscape_newsletter_data(long_content)
+        template_data['stats'] = assembler._generate_breathscape_stats(long_content)
+        html = assembler.env.get_template('breathscape').render(**template_data)
+
+        start_time = time.perf_counter()
+        for _ in range(ITERATIONS):
+            html2text_output = assembler._create_html2text().handle(html)
+        html2text_time = (time.perf_counter() - start_time) / ITERATIONS
+
+        start_time = time.perf_counter()
+        for _ in range(ITERATIONS):
+            template_output = assembler._render_breathscape_text(template_data, html)
+        template_time = (time.perf_counter() - start_time) / ITERATIONS
+
+        print(f"\nBreathscape plain text: html2text {html2text_time * 1000:.2f}ms, "
+              f"text template {template_time * 1000:.2f}ms ({html2text_time / template_time:.1f}x)")
+
+        assert template_output == html2text_output
+        assert template_time < html2text_time / 2
@@ -24,6 +24,8 @@ from halcytone_content_generator.services.ab_testing import (
     ABTest,
     get_ab_testing_framework
 )
+from halcytone_content_generator.services.ai_content_enhancer import AIContentEnhancer
+from halcytone_content_generator.config import Settings
 
 
 class TestABTestingFrameworkInitialization:
@@ -236,7 +238,7 @@ class TestVariationGeneration:
         mock_enhanced = Mock()
         mock_enhanced.enhanced_content = "AI-enhanced content variation"
         mock_enhanced.enhancement_score = 0.85
-        ab_framework_ai_enabled.ai_enhancer.enhance_content = AsyncMock(return_value=mock_enhanced)
+        ab_framework_ai_enabled.ai_enhancer.enhance_batch = AsyncMock(return_value=[mock_enhanced, mock_enhanced])
 
         variations = await ab_framework_ai_enabled._generate_ai_variations(
             test_id="test_ai",
@@ -253,7 +255,7 @@ class TestVariationGeneration:
     @pytest.mark.asyncio
     async def test_ai_variation_fallback_to_rule_based(self, ab_framework_ai_enabled):
         """Test fallback to rule-based when AI fails."""
-        ab_framework_ai_enabled.ai_enhancer.enhance_content = AsyncMock(side_effect=Exception("AI Error"))
+        ab_framework_ai_enabled.ai_enhancer.enhance_batch = AsyncMock(side_effect=Exception("AI Error"))
 
         variations = await ab_framework_ai_enabled._generate_ai_variations(
             test_id="test_fallback",
@@ -266,6 +268,25 @@ class TestVariationGeneration:
         # Should have fallen back to rule-based generation
         assert all(v.metadata.get("generation_method") == "rule_based" for v in variations)
 
+    @pytest.mark.asyncio
+    async def test_ai_variation_fallback_when_enhancer_unconfigured(self, ab_framework_ai_enabled):
+        """An enhancer without an OpenAI key echoes the control, so rule-based variants are used."""
+        settings = Settings(OPENAI_API_KEY=None)
+        with patch('halcytone_content_generator.services.ai_content_enhancer.get_settings',
+                   return_value=settings):
+            ab_framework_ai_enabled.ai_enhancer = AIContentEnhancer()
+
+        variations = await ab_framework_ai_enabled._generate_ai_variations(
+            test_id="test_unconfigured",
+            test_type=ABTestType.CONTENT_VARIATION,
+            base_content="This is great content.",
+            variation_count=2
+        )
+
+        assert len(variations) == 2
+        assert all(v.metadata.get("generation_method") == "rule_based" for v in variations)
+        assert all(v.content != "This is great content." for v in variations)
+
     def test_create_variation_prompt(self, ab_framework_ai_disabled):
         """Test variation prompt creation."""
         prompt1 = ab_framework_ai_disabled._create_variation_prompt(ABTestType.CONTENT_VARIATION, 1)
@@ -9,6 +9,7 @@ from datetime import datetime
 import json
 import asyncio
 
+from halcytone_content_generator.config import Settings
 from halcytone_content_generator.services.ai_content_enhancer import (
     AIContentEnhancer,
     EnhancementRequest,
@@ -97,10 +98,11 @@ class TestAIContentEnhancer:
 
     @pytest.fixture
     def mock_settings(self):
-        """Mock settings for testing"""
-        settings = Mock()
-        settings.OPENAI_API_KEY = "test-api-key"
-        settings.OPENAI_MODEL = "gpt-3.5-turbo"
+        """Settings for testing"""
+        settings = Settings(
+            OPENAI_API_KEY="test-api-key",
+            OPENAI_MODEL="gpt-3.5-turbo"
+        )
         return settings
 
     @pytest.fixture
@@ -240,15 +242,21 @@ class TestAIContentEnhancer:
         async def async_enhance(*args, **kwargs):
             return mock_result
 
-        with patch.object(enhancer, 'enhance_content', side_effect=async_enhance) as mock_enhance:
+        batch_response = json.dumps({"items": [
+            {"id": 0, "content": "Engaging variation"},
+            {"id": 1, "content": "Casual variation"}
+        ]})
+        with patch.object(enhancer, 'enhance_content', side_effect=async_enhance) as mock_enhance, \
+             patch.object(enhancer, '_call_openai_api', return_value=batch_response) as mock_api:
             variations = await enhancer.generate_variations(
                 "Original content",
                 ContentType.EMAIL,
                 num_variations=2
             )
 
-            assert len(variations) == 2
-            assert mock_enhance.call_count == 2
+            assert variations == ["Engaging variation", "Casual variation"]
+            assert mock_api.call_count == 1  # One batched round-trip
+            assert mock_enhance.call_count == 0
 
     @pytest.mark.asyncio
     async def test_personalize_for_segment_wellness(self, enhancer):
@@ -389,15 +397,461 @@ class TestAIContentEnhancer:
                 assert result.enhanced_content == "Enhanced content"
 
 
+class TestResponseCaching:
+    """Test completion caching in the OpenAI call path"""
+
+    @pytest.fixture
+    def enhancer(self):
+        """Create enhancer with a mocked OpenAI client"""
+        settings = Settings(
+            OPENAI_API_KEY="test-api-key",
+            OPENAI_MODEL="gpt-3.5-turbo"
+        )
+        with patch('halcytone_content_generator.services.ai_content_enhancer.get_settings',
+                  return_value=settings):
+            enhancer = AIContentEnhancer()
+
+        response = Mock()
+        response.choices = [Mock(message=Mock(content=" Enhanced content "))]
+        enhancer._client = Mock()
+        enhancer._client.chat.completions.create = AsyncMock(return_value=response)
+        return enhancer
+
+    @pytest.mark.asyncio
+    async def test_repeated_prompt_uses_cache(self, enhancer):
+        """An identical prompt and content is only sent upstream once"""
+        first = await enhancer._call_openai_api("Improve clarity:", "Breathe in.")
+        second = await enhancer._call_openai_api("Improve clarity:", "Breathe in.")
+
+        assert first == second == "Enhanced content"
+        assert enhancer._client.chat.completions.create.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_different_content_is_not_cached(self, enhancer):
+        """A different content body goes upstream again"""
+        await enhancer._call_openai_api("Improve clarity:", "Breathe in.")
+        await enhancer._call_openai_api("Improve clarity:", "Breathe out.")
+
+        assert enhancer._client.chat.completions.create.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_segment_personalization_coalesces(self, enhancer):
+        """Concurrent personalization for one segment makes a single call"""
+        results = await asyncio.gather(*[
+            enhancer.personalize_for_segment("Try box breathing.", "wellness_enthusiast",
+                                             ContentType.EMAIL)
+            for _ in range(5)
+        ])
+
+        assert results == ["Enhanced content"] * 5
+        assert enhancer._client.chat.completions.create.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_clear_response_cache(self, enhancer):
+        """Clearing the cache forces a fresh upstream call"""
+        await enhancer._call_openai_api("Improve clarity:", "Breathe in.")
+        enhancer.clear_response_cache()
+        await enhancer._call_openai_api("Improve clarity:", "Breathe in.")
+
+        assert enhancer._client.chat.completions.create.call_count == 2
+
+
+class TestPromptBudget:
+    """Test token-budgeted prompts and token usage reporting"""
+
+    @pytest.fixture
+    def enhancer(self):
+        """Create enhancer with a small prompt budget and a mocked OpenAI client"""
+        settings = Settings(
+            OPENAI_API_KEY="test-api-key",
+            OPENAI_MODEL="gpt-3.5-turbo",
+            AI_PROMPT_TOKEN_BUDGET=300
+        )
+        with patch('halcytone_content_generator.services.ai_content_enhancer.get_settings',
+                  return_value=settings):
+            enhancer = AIContentEnhancer()
+        enhancer.prompt_compiler.estimator._encoding = None
+
+        response = Mock()
+        response.choices = [Mock(message=Mock(content=" Enhanced content "))]
+        response.usage = Mock(prompt_tokens=42, completion_tokens=7)
+        enhancer._client = Mock()
+        enhancer._client.chat.completions.create = AsyncMock(return_value=response)
+        return enhancer
+
+    @pytest.mark.asyncio
+    async def test_long_content_is_trimmed_before_sending(self, enhancer):
+        """Content over the budget is condensed before the API call"""
+        content = "\n\n".join(
+            f"Section {i} covers breathing. " + "Slow exhales calm the nervous system. " * 10
+            for i in range(20)
+        )
+
+        await enhancer._call_openai_api("Improve clarity:", content)
+
+        messages = enhancer._client.chat.completions.create.call_args.kwargs["messages"]
+        assert len(messages[1]["content"]) < len(content)
+        assert enhancer.prompt_compiler.estimator.count_messages(messages) <= 300
+
+    @pytest.mark.asyncio
+    async def test_usage_is_reported_from_response(self, enhancer):
+        """Token counts returned by OpenAI are reported to metrics"""
+        with patch('halcytone_content_generator.services.ai_content_enhancer.record_token_usage') as record:
+            await enhancer._call_openai_api("Improve clarity:", "Breathe in.")
+
+        record.assert_called_once_with("gpt-3.5-turbo", 42, 7, False)
+
+
+class TestAsyncClient:
+    """Test the async OpenAI call path"""
+
+    @pytest.fixture
+    def settings(self):
+        """Mock settings with a small concurrency limit"""
+        settings = Settings(
+            OPENAI_API_KEY="test-api-key",
+            OPENAI_MODEL="gpt-3.5-turbo",
+            OPENAI_BASE_URL="http://127.0.0.1:9/v1",
+            AI_MAX_CONCURRENT_REQUESTS=2,
+            AI_REQUEST_TIMEOUT=0.2
+        )
+        return settings
+
+    @pytest.fixture
+    def enhancer(self, settings):
+        """Create enhancer whose client responds after a delay"""
+        with patch('halcytone_content_generator.services.ai_content_enhancer.get_settings',
+                  return_value=settings):
+            enhancer = AIContentEnhancer()
+
+        enhancer.active = 0
+        enhancer.peak = 0
+        enhancer.delay = 0.01
+
+        async def create(**kwargs):
+            enhancer.active += 1
+            enhancer.peak = max(enhancer.peak, enhancer.active)
+            try:
+                await asyncio.sleep(enhancer.delay)
+            finally:
+                enhancer.active -= 1
+            content = kwargs["messages"][-1]["content"]
+            return Mock(choices=[Mock(message=Mock(content=content.upper()))])
+
+        enhancer._client = Mock()
+        enhancer._client.chat.completions.create = AsyncMock(side_effect=create)
+        return enhancer
+
+    def test_client_is_async_with_settings(self, settings):
+        """The lazily created client is AsyncOpenAI with the configured endpoint"""
+        import openai
+        with patch('halcytone_content_generator.services.ai_content_enhancer.get_settings',
+                  return_value=settings):
+            enhancer = AIContentEnhancer()
+
+        assert isinstance(enhancer.client, openai.AsyncOpenAI)
+        assert str(enhancer.client.base_url).startswith("http://127.0.0.1:9/v1")
+        assert enhancer.max_concurrent_requests == 2
+        assert enhancer.request_timeout == 0.2
+
+    @pytest.mark.asyncio
+    async def test_concurrency_is_bounded(self, enhancer):
+        """No more than AI_MAX_CONCURRENT_REQUESTS calls run at once"""
+        results = await asyncio.gather(*[
+            enhancer._call_openai_api("Improve clarity:", f"Draft {i}") for i in range(10)
+        ])
+
+        assert len(set(results)) == 10
+        assert enhancer.peak == 2
+
+    @pytest.mark.asyncio
+    async def test_request_timeout_falls_back_to_original(self, enhancer):
+        """A request slower than AI_REQUEST_TIMEOUT returns the original content"""
+        enhancer.delay = 1.0
+        request = EnhancementRequest(
+            content="Slow draft",
+            content_type=ContentType.EMAIL,
+            mode=EnhancementMode.IMPROVE_CLARITY
+        )
+
+        result = await enhancer.enhance_content(request)
+
+        assert result.enhanced_content == "Slow draft"
+        assert result.confidence_score == 0.0
+        assert "timed out" in result.suggestions[0]
+        assert enhancer.active == 0
+
+    @pytest.mark.asyncio
+    async def test_cancellation_cancels_upstream_call(self, enhancer):
+        """Cancelling the only caller cancels the in-flight OpenAI request"""
+        enhancer.delay = 10
+        task = asyncio.create_task(enhancer._call_openai_api("Improve clarity:", "Draft"))
+        await asyncio.sleep(0.01)
+        assert enhancer.active == 1
+
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        await asyncio.sleep(0.05)
+
+        assert enhancer.active == 0
+        assert enhancer.response_cache.get_stats()["in_flight"] == 0
+
+
+class TestBatchedEnhancement:
+    """Test packing several requests into one OpenAI call"""
+
+    @pytest.fixture
+    def enhancer(self):
+        """Create configured enhancer whose API calls are recorded"""
+        settings = Settings(
+            OPENAI_API_KEY="test-api-key",
+            OPENAI_MODEL="gpt-3.5-turbo",
+            AI_BATCH_MAX_ITEMS=6
+        )
+        with patch('halcytone_content_generator.services.ai_content_enhancer.get_settings',
+                  return_value=settings):
+            enhancer = AIContentEnhancer()
+        enhancer._client = Mock()
+        enhancer.api_calls = []
+
+        async def call_api(prompt, content, max_tokens=1500, trim=True):
+            enhancer.api_calls.append((prompt, content))
+            if not content.startswith('{"contents"'):
+                return f"Single: {content}"
+            payload = json.loads(content)
+            return json.dumps({"items": [
+                {"id": task["id"], "content": f"Batched {task['id']}: {payload['contents'][task['content_id']]}"}
+                for task in payload["tasks"]
+            ]})
+
+        enhancer._call_openai_api = AsyncMock(side_effect=call_api)
+        return enhancer
+
+    def _requests(self, count, content="Breathe in for four counts."):
+        return [
+            EnhancementRequest(content=content, content_type=ContentType.EMAIL,
+                               mode=EnhancementMode.IMPROVE_CLARITY, tone=f"tone {i}")
+            for i in range(count)
+        ]
+
+    @pytest.mark.asyncio
+    async def test_batch_uses_one_call_and_splits_results(self, enhancer):
+        """Three requests produce three results from a single round-trip"""
+        results = await enhancer.enhance_batch(self._requests(3))
+
+        assert len(enhancer.api_calls) == 1
+        assert [r.enhanced_content for r in results] == [
+            f"Batched {i}: Breathe in for four counts." for i in range(3)
+        ]
+        assert all(r.metadata["batched"] for r in results)
+        assert all(r.confidence_score > 0 for r in results)
+
+    @pytest.mark.asyncio
+    async def test_batch_payload_shares_identical_content(self, enhancer):
+        """Repeated source content is sent once with per-task instructions"""
+        await enhancer.enhance_batch(self._requests(3))
+
+        payload = json.loads(enhancer.api_calls[0][1])
+        assert payload["contents"] == ["Breathe in for four counts."]
+        assert [task["content_id"] for task in payload["tasks"]] == [0, 0, 0]
+        assert "Tone: tone 2" in payload["tasks"][2]["instructions"]
+
+    @pytest.mark.asyncio
+    async def test_unparseable_batch_falls_back_per_item(self, enhancer):
+        """A non-JSON batch response retries every item individually"""
+        async def call_api(prompt, content, max_tokens=1500, trim=True):
+            enhancer.api_calls.append((prompt, content))
+            return "Sorry, here are your rewrites" if content.startswith("{") else f"Single: {content}"
+
+        enhancer._call_openai_api.side_effect = call_api
+        results = await enhancer.enhance_batch(self._requests(2))
+
+        assert len(enhancer.api_calls) == 3
+        assert [r.enhanced_content for r in results] == ["Single: Breathe in for four counts."] * 2
+        assert not any(r.metadata.get("batched") for r in results)
+
+    @pytest.mark.asyncio
+    async def test_missing_items_are_retried_individually(self, enhancer):
+        """Only the items absent from the batch response get their own call"""
+        async def call_api(prompt, content, max_tokens=1500, trim=True):
+            enhancer.api_calls.append((prompt, content))
+            if content.startswith("{"):
+                return '```json\n{"items": [{"id": 0, "content": "First"}, {"id": 2, "content": ""}]}\n```'
+            return f"Single: {content}"
+
+        enhancer._call_openai_api.side_effect = call_api
+        results = await enhancer.enhance_batch(self._requests(3))
+
+        assert len(enhancer.api_calls) == 3
+        assert results[0].enhanced_content == "First"
+        assert results[1].enhanced_content == "Single: Breathe in for four counts."
+        assert results[2].enhanced_content == "Single: Breathe in for four counts."
+
+    @pytest.mark.asyncio
+    async def test_large_batches_are_chunked(self, enhancer):
+        """Requests beyond AI_BATCH_MAX_ITEMS go into further calls"""
+        results = await enhancer.enhance_batch(self._requests(14))
+
+        assert len(results) == 14
+        assert len(enhancer.api_calls) == 3
+        assert results[13].enhanced_content == "Batched 1: Breathe in for four counts."
+
+    @pytest.mark.asyncio
+    async def test_campaign_variations_across_platforms(self, enhancer):
+        """Three variations for six platforms take three round-trips instead of eighteen"""
+        platforms = [ContentType.EMAIL, ContentType.WEB, ContentType.SOCIAL_TWITTER,
+                     ContentType.SOCIAL_LINKEDIN, ContentType.SOCIAL_FACEBOOK,
+                     ContentType.SOCIAL_INSTAGRAM]
+
+        variations = await enhancer.generate_campaign_variations("Launch day", platforms)
+
+        assert len(enhancer.api_calls) == 3
+        assert set(variations) == set(platforms)
+        assert all(len(texts) == 3 for texts in variations.values())
+
+    @pytest.mark.asyncio
+    async def test_personalize_for_users_batches(self, enhancer):
+        """Personalizing for several users shares one round-trip"""
+        service = Mock()
+        service.get_personalized_content_strategy.side_effect = lambda user_id: {
+            "content_preferences": {"tone": f"{user_id} tone"},
+            "priority_topics": ["sleep"]
+        }
+        with patch('halcytone_content_generator.services.user_segmentation.get_user_segmentation_service',
+                   return_value=service):
+            personalized = await enhancer.personalize_for_users(
+                "Try box breathing.", ["u1", "u2", "u3"], ContentType.EMAIL
+            )
+
+        assert len(enhancer.api_calls) == 1
+        assert personalized == {
+            f"u{i + 1}": f"Batched {i}: Try box breathing." for i in range(3)
+        }
+
+
+class FakeCompletionStream:
+    """Async iterator of chat completion chunks, like openai.AsyncStream"""
+
+    def __init__(self, pieces, delay=0.0):
+        self.pieces = pieces
+        self.delay = delay
+        self.response = Mock(aclose=AsyncMock())
+
+    def __aiter__(self):
+        return self._chunks()
+
+    async def _chunks(self):
+        for piece in self.pieces:
+            await asyncio.sleep(self.delay)
+            yield Mock(choices=[Mock(delta=Mock(content=piece))])
+
+
+class TestStreamingEnhancement:
+    """Test streamed enhancement output"""
+
+    @pytest.fixture
+    def enhancer(self):
+        """Create enhancer with a streaming client"""
+        settings = Settings(
+            OPENAI_API_KEY="test-api-key",
+            OPENAI_MODEL="gpt-3.5-turbo",
+            AI_REQUEST_TIMEOUT=0.2
+        )
+        with patch('halcytone_content_generator.services.ai_content_enhancer.get_settings',
+                  return_value=settings):
+            enhancer = AIContentEnhancer()
+        enhancer._client = Mock()
+        enhancer._client.chat.completions.create = AsyncMock(
+            side_effect=lambda **kwargs: FakeCompletionStream(["Breathe ", "slowly, ", None, "and try it today."])
+        )
+        return enhancer
+
+    def _request(self):
+        return EnhancementRequest(
+            content="Breathe slow.",
+            content_type=ContentType.WEB,
+            mode=EnhancementMode.IMPROVE_CLARITY
+        )
+
+    @pytest.mark.asyncio
+    async def test_stream_yields_chunks_then_result(self, enhancer):
+        """Chunks arrive in order, followed by the scored result"""
+        items = [item async for item in enhancer.enhance_content_stream(self._request())]
+
+        assert items[:-1] == ["Breathe ", "slowly, ", "and try it today."]
+        result = items[-1]
+        assert isinstance(result, EnhancementResult)
+        assert result.enhanced_content == "Breathe slowly, and try it today."
+        assert result.confidence_score > 0
+        assert result.metadata["streamed"] is True
+        assert enhancer._client.chat.completions.create.call_args.kwargs["stream"] is True
+
+    @pytest.mark.asyncio
+    async def test_streamed_completion_is_cached(self, enhancer):
+        """A completed stream serves later identical requests from the cache"""
+        [item async for item in enhancer.enhance_content_stream(self._request())]
+        items = [item async for item in enhancer.enhance_content_stream(self._request())]
+        result = await enhancer.enhance_content(self._request())
+
+        assert items[0] == "Breathe slowly, and try it today."
+        assert result.enhanced_content == "Breathe slowly, and try it today."
+        assert enhancer._client.chat.completions.create.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_stalled_stream_returns_original(self, enhancer):
+        """A stream that stops producing chunks ends with the original content"""
+        enhancer._client.chat.completions.create.side_effect = \
+            lambda **kwargs: FakeCompletionStream(["Partial ", "never finished"], delay=0.15)
+        enhancer.request_timeout = 0.1
+
+        items = [item async for item in enhancer.enhance_content_stream(self._request())]
+
+        assert items[-1].enhanced_content == "Breathe slow."
+        assert "stalled" in items[-1].suggestions[0]
+        assert len(enhancer.response_cache) == 0
+
+    @pytest.mark.asyncio
+    async def test_closing_stream_early_releases_connection(self, enhancer):
+        """Stopping consumption closes the upstream response"""
+        stream = FakeCompletionStream(["One ", "two ", "three"])
+        enhancer._client.chat.completions.create.side_effect = lambda **kwargs: stream
+
+        items = enhancer.enhance_content_stream(self._request())
+        assert await items.__anext__() == "One "
+        await items.aclose()
+
+        stream.response.aclose.assert_awaited_once()
+        assert len(enhancer.response_cache) == 0
+
+    @pytest.mark.asyncio
+    async def test_stream_without_configuration(self):
+        """An unconfigured enhancer yields only the unchanged result"""
+        settings = Settings(
+            OPENAI_API_KEY=None,
+            OPENAI_MODEL="gpt-3.5-turbo"
+        )
+        with patch('halcytone_content_generator.services.ai_content_enhancer.get_settings',
+                  return_value=settings):
+            enhancer = AIContentEnhancer()
+
+        items = [item async for item in enhancer.enhance_content_stream(self._request())]
+
+        assert len(items) == 1
+        assert items[0].enhanced_content == "Breathe slow."
+        assert "Configure OpenAI API key" in items[0].suggestions[0]
+
+
 class TestGetAIEnhancer:
     """Test singleton instance management"""
 
     def test_get_ai_enhancer_singleton(self):
         """Test that get_ai_enhancer returns singleton instance"""
         with patch('halcytone_content_generator.services.ai_content_enhancer.get_settings') as mock_settings:
-            settings = Mock()
-            settings.OPENAI_API_KEY = "test-key"
-            settings.OPENAI_MODEL = "gpt-3.5-turbo"
+            settings = Settings(
+                OPENAI_API_KEY="test-key",
+                OPENAI_MODEL="gpt-3.5-turbo"
+            )
             mock_settings.return_value = settings
 
             enhancer1 = get_ai_enhancer()
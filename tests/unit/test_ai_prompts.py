@@ -471,4 +471,13 @@ class TestPromptCustomization:
 
         assert "email newsletter" in combined.lower()
         assert "keywords" in combined.lower()
-        assert len(combined) > len(email_prompt) + len(seo_prompt)
\ No newline at end of file
+        assert len(combined) > len(email_prompt) + len(seo_prompt)
+
+    def test_templates_are_precompiled(self):
+        """Every template and tone combination is compiled once up front"""
+        templates = AIPromptTemplates()
+
+        assert templates.compile_all() > 0
+        compiled = templates.get_prompt("email", "newsletter.base", tone=ToneStyle.CASUAL)
+        rendered = templates._render_prompt("email", "newsletter.base", tone=ToneStyle.CASUAL)
+        assert compiled == rendered
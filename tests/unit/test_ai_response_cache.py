@@ -0,0 +1,207 @@
+"""
+Unit tests for the AI completion cache
+"""
+import asyncio
+
+import pytest
+
+from halcytone_content_generator.services.ai_response_cache import (
+    CompletionCache,
+    make_completion_key
+)
+
+
+MESSAGES = [
+    {"role": "system", "content": "You are a writer."},
+    {"role": "user", "content": "Improve this:\n\nBreathe in."}
+]
+
+
+class FakeClock:
+    """Manually advanced monotonic clock"""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestCompletionKey:
+    """Test completion cache keys"""
+
+    def test_same_request_same_key(self):
+        """Identical model, messages and params produce the same key"""
+        params = {"temperature": 0.7, "max_tokens": 1500}
+        assert (make_completion_key("gpt-4", MESSAGES, params) ==
+                make_completion_key("gpt-4", list(MESSAGES), dict(reversed(params.items()))))
+
+    def test_key_covers_model_messages_and_params(self):
+        """Changing any part of the request changes the key"""
+        base = make_completion_key("gpt-4", MESSAGES, {"temperature": 0.7})
+        other_messages = MESSAGES[:1] + [{"role": "user", "content": "Improve this:\n\nBreathe out."}]
+
+        assert make_completion_key("gpt-3.5-turbo", MESSAGES, {"temperature": 0.7}) != base
+        assert make_completion_key("gpt-4", other_messages, {"temperature": 0.7}) != base
+        assert make_completion_key("gpt-4", MESSAGES, {"temperature": 0.2}) != base
+
+
+class TestCompletionCache:
+    """Test TTL, eviction and request coalescing"""
+
+    def test_put_and_get(self):
+        """Stored completions are returned until evicted"""
+        cache = CompletionCache(max_entries=2)
+        cache.put("a", "alpha")
+        assert cache.get("a") == "alpha"
+        assert cache.get("missing") is None
+
+    def test_entries_expire_after_ttl(self):
+        """Completions older than the TTL are not served"""
+        clock = FakeClock()
+        cache = CompletionCache(max_entries=10, ttl_seconds=60, clock=clock)
+        cache.put("a", "alpha")
+
+        clock.now = 59
+        assert cache.get("a") == "alpha"
+        clock.now = 60
+        assert cache.get("a") is None
+        assert len(cache) == 0
+
+    def test_size_eviction_prefers_expired_then_lru(self):
+        """A full cache drops expired entries before the least recently used"""
+        clock = FakeClock()
+        cache = CompletionCache(max_entries=2, ttl_seconds=60, clock=clock)
+        cache.put("old", "stale")
+        clock.now = 30
+        cache.put("a", "alpha")
+        clock.now = 61
+        cache.put("b", "beta")
+
+        assert cache.get("old") is None
+        assert cache.get("a") == "alpha"
+
+        cache.get("a")
+        cache.put("c", "gamma")
+        assert cache.get("b") is None
+        assert cache.get("a") == "alpha"
+        assert cache.get("c") == "gamma"
+
+    def test_disabled_cache_stores_nothing(self):
+        """A zero-sized cache is a pass-through"""
+        cache = CompletionCache(max_entries=0)
+        cache.put("a", "alpha")
+        assert not cache.enabled
+        assert cache.get("a") is None
+
+    @pytest.mark.asyncio
+    async def test_get_or_fetch_caches_result(self):
+        """The second identical request is served without calling upstream"""
+        cache = CompletionCache()
+        calls = []
+
+        async def fetch():
+            calls.append(1)
+            return "enhanced"
+
+        assert await cache.get_or_fetch("k", fetch) == "enhanced"
+        assert await cache.get_or_fetch("k", fetch) == "enhanced"
+        assert len(calls) == 1
+        assert cache.get_stats()["hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_concurrent_requests_are_coalesced(self):
+        """Identical in-flight requests share one upstream call"""
+        cache = CompletionCache()
+        release = asyncio.Event()
+        calls = []
+
+        async def fetch():
+            calls.append(1)
+            await release.wait()
+            return "enhanced"
+
+        waiters = [asyncio.create_task(cache.get_or_fetch("k", fetch)) for _ in range(10)]
+        await asyncio.sleep(0)
+        release.set()
+
+        assert await asyncio.gather(*waiters) == ["enhanced"] * 10
+        assert len(calls) == 1
+        stats = cache.get_stats()
+        assert stats["misses"] == 1
+        assert stats["coalesced"] == 9
+        assert stats["in_flight"] == 0
+
+    @pytest.mark.asyncio
+    async def test_failed_fetch_is_shared_and_not_cached(self):
+        """Every waiter sees the upstream error and the next request retries"""
+        cache = CompletionCache()
+        release = asyncio.Event()
+        calls = []
+
+        async def failing_fetch():
+            calls.append(1)
+            await release.wait()
+            raise RuntimeError("rate limited")
+
+        waiters = [asyncio.create_task(cache.get_or_fetch("k", failing_fetch)) for _ in range(3)]
+        await asyncio.sleep(0)
+        release.set()
+        results = await asyncio.gather(*waiters, return_exceptions=True)
+
+        assert all(isinstance(result, RuntimeError) for result in results)
+        assert len(calls) == 1
+        assert len(cache) == 0
+
+        async def fetch():
+            return "recovered"
+
+        assert await cache.get_or_fetch("k", fetch) == "recovered"
+
+    @pytest.mark.asyncio
+    async def test_cancelled_caller_does_not_cancel_shared_fetch(self):
+        """Other waiters still get the result when one caller is cancelled"""
+        cache = CompletionCache()
+        release = asyncio.Event()
+
+        async def fetch():
+            await release.wait()
+            return "enhanced"
+
+        first = asyncio.create_task(cache.get_or_fetch("k", fetch))
+        second = asyncio.create_task(cache.get_or_fetch("k", fetch))
+        await asyncio.sleep(0)
+        first.cancel()
+        release.set()
+
+        assert await second == "enhanced"
+        with pytest.raises(asyncio.CancelledError):
+            await first
+        assert cache.get("k") == "enhanced"
+
+    @pytest.mark.asyncio
+    async def test_last_cancelled_caller_cancels_fetch(self):
+        """The shared fetch is cancelled once nobody is waiting for it"""
+        cache = CompletionCache()
+        started = asyncio.Event()
+        cancelled = []
+
+        async def fetch():
+            started.set()
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.append(1)
+                raise
+            return "enhanced"
+
+        callers = [asyncio.create_task(cache.get_or_fetch("k", fetch)) for _ in range(2)]
+        await started.wait()
+        for caller in callers:
+            caller.cancel()
+        await asyncio.gather(*callers, return_exceptions=True)
+        await asyncio.sleep(0)
+
+        assert cancelled == [1]
+        assert cache.get_stats()["in_flight"] == 0
+        assert len(cache) == 0
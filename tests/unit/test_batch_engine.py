@@ -0,0 +1,193 @@
+"""
+Unit tests for the concurrent batch generation engine
+"""
+import asyncio
+import time
+import pytest
+from datetime import datetime, timedelta
+from unittest.mock import Mock
+from fastapi.testclient import TestClient
+
+from halcytone_content_generator.main import app
+from halcytone_content_generator.services.batch_engine import (
+    BatchGenerationEngine,
+    BatchItemProgress,
+    BatchProgressStore,
+    BatchRun,
+    get_batch_progress_store,
+    plan_batch
+)
+from halcytone_content_generator.services.content_assembler_v2 import EnhancedContentAssembler
+from halcytone_content_generator.services.publishers.base import (
+    PreviewResult, ValidationIssue, ValidationResult, ValidationSeverity
+)
+
+DOCUMENT = {
+    'breathscape': [{'title': 'Adaptive Sessions', 'content': 'Sessions now adapt to your rhythm.'}],
+    'hardware': [{'title': 'Sensor v2', 'content': 'Smaller and lighter.'}],
+    'tips': [{'title': 'Box Breathing', 'content': 'Inhale four, hold four.'}],
+    'vision': [{'title': 'Vision', 'content': 'Breathing for everyone.'}]
+}
+
+
+class SlowPublisher:
+    """Publisher double with latency that records how many items overlap"""
+
+    def __init__(self, latency=0.01, valid=True):
+        self.latency = latency
+        self.valid = valid
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def validate(self, content):
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(self.latency)
+        self.in_flight -= 1
+        issues = [] if self.valid else [ValidationIssue(ValidationSeverity.ERROR, "Subject too long")]
+        return ValidationResult(is_valid=self.valid, issues=issues, metadata={})
+
+    async def preview(self, content):
+        await asyncio.sleep(self.latency)
+        return PreviewResult(preview_data={}, formatted_content="", metadata={}, estimated_engagement=0.3)
+
+
+def new_run(channels, item_count, **kwargs):
+    plans = plan_batch("batch-test", channels, item_count, datetime(2025, 1, 1))
+    return BatchRun(batch_id="batch-test", items=[BatchItemProgress(plan=plan) for plan in plans], **kwargs)
+
+
+class TestBatchPlanning:
+    """Test up-front planning of batch items"""
+
+    def test_plan_rotates_channels_templates_and_platforms(self):
+        start = datetime(2025, 1, 1)
+
+        plans = plan_batch("b", ['email', 'social'], 6, start)
+        single = plan_batch("b", ['social'], 3, start)
+
+        assert [p.channel for p in plans] == ['email', 'social'] * 3
+        assert [p.template for p in plans if p.channel == 'email'] == ['modern', 'plain', 'minimal']
+        assert [p.platform for p in plans if p.channel == 'social'] == ['linkedin'] * 3
+        assert [p.platform for p in single] == ['twitter', 'linkedin', 'twitter']
+        assert plans[3].scheduled_for == start + timedelta(hours=6)
+        assert plans[4].item_id == "b-email-004"
+
+    def test_plan_without_variety_or_scheduling(self):
+        plans = plan_batch("b", ['email'], 3, datetime(2025, 1, 1),
+                           template_variety=False, include_scheduling=False)
+
+        assert {p.template for p in plans} == {'modern'}
+        assert all(p.scheduled_for is None for p in plans)
+
+
+class TestBatchGenerationEngine:
+    """Test concurrent generation and per-item progress"""
+
+    @pytest.mark.asyncio
+    async def test_items_are_generated_concurrently_within_bound(self):
+        publisher = SlowPublisher()
+        engine = BatchGenerationEngine(EnhancedContentAssembler(), {'email': publisher, 'web': publisher,
+                                                                    'social': publisher}, max_concurrency=4)
+        run = new_run(['email', 'web', 'social'], 12)
+
+        await engine.run(run, DOCUMENT)
+
+        assert run.status == 'completed'
+        assert publisher.max_in_flight == 4
+        items = run.completed_items()
+        assert [item.item_id for item in items] == [p.plan.item_id for p in run.items]
+        assert all(item.estimated_engagement == 0.3 for item in items)
+
+    @pytest.mark.asyncio
+    async def test_progress_is_visible_while_running(self):
+        """Item states move through the pipeline while the batch runs"""
+        gate = asyncio.Event()
+        publisher = SlowPublisher()
+        original_validate = publisher.validate
+
+        async def gated_validate(content):
+            await gate.wait()
+            return await original_validate(content)
+
+        publisher.validate = gated_validate
+        engine = BatchGenerationEngine(EnhancedContentAssembler(), {'web': publisher}, max_concurrency=2)
+        run = new_run(['web'], 4)
+
+        task = asyncio.create_task(engine.run(run, DOCUMENT))
+        while run.count('validating') < 2:
+            await asyncio.sleep(0.001)
+
+        assert run.status == 'running'
+        assert [item.status for item in run.items] == ['validating', 'validating', 'pending', 'pending']
+        gate.set()
+        await task
+        assert run.count('completed') == 4
+        assert all(item.completed_at >= item.started_at for item in run.items)
+
+    @pytest.mark.asyncio
+    async def test_rejected_and_failed_items_are_recorded(self):
+        assembler = EnhancedContentAssembler()
+        engine = BatchGenerationEngine(assembler, {'email': SlowPublisher(valid=False)})
+        run = new_run(['email', 'web'], 4)
+
+        await engine.run(run, DOCUMENT)
+
+        assert run.status == 'completed'
+        assert [item.status for item in run.items] == ['rejected', 'failed', 'rejected', 'failed']
+        assert run.items[0].error == "Validation failed: Subject too long"
+        assert run.completed_items() == []
+
+    @pytest.mark.asyncio
+    async def test_generation_errors_fail_only_that_item(self):
+        assembler = EnhancedContentAssembler()
+        assembler.generate_web_update = Mock(side_effect=RuntimeError("render failed"))
+        engine = BatchGenerationEngine(assembler, {'email': SlowPublisher(), 'web': SlowPublisher()})
+        run = new_run(['email', 'web'], 4)
+
+        await engine.run(run, DOCUMENT)
+
+        assert [item.status for item in run.items] == ['completed', 'failed'] * 2
+        assert run.items[1].error == "render failed"
+
+
+class TestBatchProgressStore:
+    """Test the process-wide run registry"""
+
+    def test_oldest_finished_runs_are_evicted(self):
+        store = BatchProgressStore(max_batches=2)
+        running = BatchRun(batch_id="running", items=[], status='running')
+        store.put(running)
+        for batch_id in ("done-1", "done-2"):
+            store.put(BatchRun(batch_id=batch_id, items=[], status='completed'))
+
+        assert store.get("running") is running
+        assert store.get("done-1") is None
+        assert store.get("done-2") is not None
+
+
+class TestBackgroundBatch:
+    """Test background generation through the API"""
+
+    def test_background_batch_reports_status(self):
+        with TestClient(app) as client:
+            response = client.post(
+                "/api/v1/batch/generateBatch",
+                params={"period": "day", "channels": ["web"], "dry_run": True, "background": True}
+            )
+
+            assert response.status_code == 200
+            data = response.json()
+            assert data["status"] == "pending"
+            assert data["items"] == []
+            assert data["summary"]["planned_items"] == 3
+
+            deadline = time.monotonic() + 10
+            status = client.get(data["summary"]["status_url"]).json()
+            while status["status"] in ("pending", "running") and time.monotonic() < deadline:
+                time.sleep(0.01)
+                status = client.get(data["summary"]["status_url"]).json()
+
+        assert status["status"] == "completed"
+        assert status["items_total"] == 3
+        assert get_batch_progress_store().get(data["batch_id"]).count('completed') == status["items_published"]
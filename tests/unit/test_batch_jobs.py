@@ -0,0 +1,288 @@
+"""
+Unit tests for durable batch jobs and the background executor
+"""
+import asyncio
+import copy
+import pytest
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+from halcytone_content_generator.services.batch_engine import (
+    BatchGenerationEngine,
+    BatchItemProgress,
+    BatchProgressStore,
+    BatchRun,
+    plan_batch
+)
+from halcytone_content_generator.services.batch_jobs import BatchJobExecutor, SqlBatchJobStore
+from halcytone_content_generator.services.content_assembler_v2 import EnhancedContentAssembler
+from halcytone_content_generator.services.publishers.base import PreviewResult, ValidationResult
+
+DOCUMENT = {
+    'breathscape': [{'title': 'Adaptive Sessions', 'content': 'Sessions now adapt to your rhythm.'}],
+    'hardware': [{'title': 'Sensor v2', 'content': 'Smaller and lighter.'}],
+    'tips': [{'title': 'Box Breathing', 'content': 'Inhale four, hold four.'}],
+    'vision': [{'title': 'Vision', 'content': 'Breathing for everyone.'}]
+}
+
+
+class GatedPublisher:
+    """Publisher double that holds each validation until it is allowed through"""
+
+    def __init__(self, open_gate=False):
+        self.allowance = asyncio.Semaphore(1000 if open_gate else 0)
+        self.waiting = 0
+        self.validated = 0
+
+    def allow(self, count=1000):
+        for _ in range(count):
+            self.allowance.release()
+
+    async def validate(self, content):
+        self.waiting += 1
+        await self.allowance.acquire()
+        self.waiting -= 1
+        self.validated += 1
+        return ValidationResult(is_valid=True, issues=[], metadata={})
+
+    async def preview(self, content):
+        return PreviewResult(preview_data={}, formatted_content="", metadata={}, estimated_engagement=0.2)
+
+
+class MemoryBatchJobStore:
+    """In-memory stand-in for SqlBatchJobStore; keeps deep copies like a database would"""
+
+    def __init__(self, worker_id="worker-1", lease_seconds=300, jobs=None, leases=None):
+        self.worker_id = worker_id
+        self.lease_seconds = lease_seconds
+        self.jobs = {} if jobs is None else jobs
+        self.leases = {} if leases is None else leases  # batch_id -> (owner, heartbeat)
+        self.checkpoints = []
+
+    def sibling(self, worker_id, lease_seconds=None):
+        """The same tables as seen by another worker process"""
+        lease_seconds = self.lease_seconds if lease_seconds is None else lease_seconds
+        return MemoryBatchJobStore(worker_id, lease_seconds, self.jobs, self.leases)
+
+    def _renew_lease(self, batch_id):
+        if self.leases.get(batch_id, (None, None))[0] == self.worker_id:
+            self.leases[batch_id] = (self.worker_id, datetime.now())
+
+    async def save_run(self, run, document_content=None):
+        stored = self.jobs.get(run.batch_id)
+        snapshot = copy.deepcopy(run)
+        if stored is not None:
+            snapshot.cancel_requested = snapshot.cancel_requested or stored[0].cancel_requested
+            if document_content is None:
+                document_content = stored[1]
+        else:
+            self.leases[run.batch_id] = (self.worker_id, datetime.now())
+        self.jobs[run.batch_id] = (snapshot, document_content)
+        self._renew_lease(run.batch_id)
+
+    async def checkpoint(self, run, progress):
+        stored, _ = self.jobs[run.batch_id]
+        stored.items[progress.plan.index] = copy.deepcopy(progress)
+        stored.status = run.status
+        self.checkpoints.append(progress.plan.item_id)
+        self._renew_lease(run.batch_id)
+        return stored.cancel_requested
+
+    async def request_cancel(self, batch_id):
+        if batch_id not in self.jobs:
+            return False
+        self.jobs[batch_id][0].cancel()
+        return True
+
+    async def load(self, batch_id):
+        stored = self.jobs.get(batch_id)
+        return copy.deepcopy(stored) if stored is not None else None
+
+    async def claim_unfinished(self):
+        stale = datetime.now() - timedelta(seconds=self.lease_seconds)
+        claimed = []
+        for batch_id, stored in self.jobs.items():
+            if stored[0].is_finished:
+                continue
+            owner, heartbeat = self.leases.get(batch_id, (None, None))
+            if owner is None or heartbeat is None or heartbeat < stale:
+                self.leases[batch_id] = owner, heartbeat = (self.worker_id, datetime.now())
+            if owner == self.worker_id:
+                claimed.append(copy.deepcopy(stored))
+        return claimed
+
+    async def release(self, batch_ids):
+        for batch_id in batch_ids:
+            if self.leases.get(batch_id, (None, None))[0] == self.worker_id:
+                self.leases[batch_id] = (None, None)
+
+
+def new_run(batch_id, item_count=4):
+    plans = plan_batch(batch_id, ['web'], item_count, datetime(2025, 1, 1))
+    return BatchRun(batch_id=batch_id, items=[BatchItemProgress(plan=plan) for plan in plans])
+
+
+def new_engine(publisher, max_concurrency=1):
+    return BatchGenerationEngine(EnhancedContentAssembler(), {'web': publisher}, max_concurrency=max_concurrency)
+
+
+async def wait_for(condition):
+    while not condition():
+        await asyncio.sleep(0.001)
+
+
+class TestBatchJobExecutor:
+    """Test checkpointing, resume and cancellation"""
+
+    @pytest.mark.asyncio
+    async def test_items_are_checkpointed_as_they_finish(self):
+        store = MemoryBatchJobStore()
+        executor = BatchJobExecutor(store=store, progress_store=BatchProgressStore())
+        publisher = GatedPublisher(open_gate=True)
+
+        run = await executor.execute(new_run("b1"), DOCUMENT, new_engine(publisher))
+
+        assert run.status == 'completed'
+        assert store.checkpoints == [item.plan.item_id for item in run.items]
+        stored, document = await store.load("b1")
+        assert stored.status == 'completed'
+        assert document == DOCUMENT
+        assert [item.result.item_id for item in stored.items] == store.checkpoints
+
+    @pytest.mark.asyncio
+    async def test_interrupted_batch_resumes_remaining_items(self):
+        store = MemoryBatchJobStore()
+        first = BatchJobExecutor(store=store, progress_store=BatchProgressStore())
+        publisher = GatedPublisher()
+
+        await first.submit(new_run("b2"), DOCUMENT, new_engine(publisher))
+        publisher.allow(1)
+        await wait_for(lambda: len(store.checkpoints) == 1 and publisher.waiting == 1)
+        await first.shutdown()
+
+        stored, _ = await store.load("b2")
+        assert stored.status == 'running'
+        assert [item.status for item in stored.items] == ['completed', 'pending', 'pending', 'pending']
+
+        assert store.leases["b2"] == (None, None)  # Released on shutdown
+        second = BatchJobExecutor(store=store.sibling("worker-2"), progress_store=BatchProgressStore())
+        resumed_publisher = GatedPublisher(open_gate=True)
+        assert await second.resume_unfinished(lambda: new_engine(resumed_publisher)) == 1
+        await second.wait("b2")
+
+        run = await second.get_run("b2")
+        assert run.status == 'completed'
+        assert run.count('completed') == 4
+        assert resumed_publisher.validated == 3
+
+    @pytest.mark.asyncio
+    async def test_batch_running_in_sibling_worker_is_not_resumed(self):
+        store = MemoryBatchJobStore()
+        worker = BatchJobExecutor(store=store, progress_store=BatchProgressStore())
+        starting_worker = BatchJobExecutor(store=store.sibling("worker-2"), progress_store=BatchProgressStore())
+        publisher = GatedPublisher()
+        idle_publisher = GatedPublisher(open_gate=True)
+
+        run = new_run("b7")
+        await worker.submit(run, DOCUMENT, new_engine(publisher))
+        publisher.allow(1)
+        await wait_for(lambda: len(store.checkpoints) == 1 and publisher.waiting == 1)
+
+        assert await starting_worker.resume_unfinished(lambda: new_engine(idle_publisher)) == 0
+        publisher.allow()
+        await worker.wait("b7")
+
+        assert run.status == 'completed'
+        assert idle_publisher.validated == 0
+        assert store.leases["b7"][0] == "worker-1"
+
+    @pytest.mark.asyncio
+    async def test_stale_lease_is_taken_over(self):
+        store = MemoryBatchJobStore()
+        crashed = BatchJobExecutor(store=store, progress_store=BatchProgressStore())
+        publisher = GatedPublisher()
+
+        await crashed.submit(new_run("b8"), DOCUMENT, new_engine(publisher))
+        publisher.allow(1)
+        await wait_for(lambda: len(store.checkpoints) == 1 and publisher.waiting == 1)
+        # Killed without releasing its lease, which then goes stale
+        crashed._tasks["b8"].cancel()
+        await asyncio.sleep(0)
+        owner, heartbeat = store.leases["b8"]
+        store.leases["b8"] = (owner, heartbeat - timedelta(seconds=301))
+
+        successor = BatchJobExecutor(store=store.sibling("worker-2"), progress_store=BatchProgressStore())
+        resumed_publisher = GatedPublisher(open_gate=True)
+        assert await successor.resume_unfinished(lambda: new_engine(resumed_publisher)) == 1
+        await successor.wait("b8")
+
+        assert (await successor.get_run("b8")).count('completed') == 4
+        assert resumed_publisher.validated == 3
+        assert store.leases["b8"][0] == "worker-2"
+
+    @pytest.mark.asyncio
+    async def test_cancel_skips_items_not_started(self):
+        store = MemoryBatchJobStore()
+        executor = BatchJobExecutor(store=store, progress_store=BatchProgressStore())
+        publisher = GatedPublisher()
+
+        run = new_run("b3")
+        await executor.submit(run, DOCUMENT, new_engine(publisher))
+        await wait_for(lambda: run.count('validating') == 1)
+
+        await executor.cancel("b3")
+        assert [item.status for item in run.items] == ['validating', 'cancelled', 'cancelled', 'cancelled']
+        publisher.allow()
+        await executor.wait("b3")
+
+        assert run.status == 'cancelled'
+        assert run.count('completed') == 1
+        assert (await store.load("b3"))[0].status == 'cancelled'
+
+    @pytest.mark.asyncio
+    async def test_cancel_from_another_worker_is_seen_at_checkpoint(self):
+        store = MemoryBatchJobStore()
+        worker = BatchJobExecutor(store=store, progress_store=BatchProgressStore())
+        other_worker = BatchJobExecutor(store=store, progress_store=BatchProgressStore())
+        publisher = GatedPublisher()
+
+        run = new_run("b4")
+        await worker.submit(run, DOCUMENT, new_engine(publisher))
+        await wait_for(lambda: run.count('validating') == 1)
+
+        await other_worker.cancel("b4")
+        assert run.count('pending') == 3  # Not visible to the owning worker until its next checkpoint
+        publisher.allow()
+        await worker.wait("b4")
+
+        assert run.status == 'cancelled'
+        assert [item.status for item in run.items] == ['completed', 'cancelled', 'cancelled', 'cancelled']
+
+    @pytest.mark.asyncio
+    async def test_without_store_runs_are_live_only(self):
+        executor = BatchJobExecutor(progress_store=BatchProgressStore())
+        publisher = GatedPublisher(open_gate=True)
+
+        await executor.execute(new_run("b5", item_count=2), DOCUMENT, new_engine(publisher))
+
+        assert (await executor.get_run("b5")).status == 'completed'
+        assert await executor.get_run("unknown") is None
+        assert await executor.resume_unfinished(lambda: new_engine(publisher)) == 0
+
+
+class TestSqlBatchJobStore:
+    """Test the SQL store degrades when the database layer is unavailable"""
+
+    @pytest.mark.asyncio
+    async def test_store_disables_itself_without_database(self):
+        store = SqlBatchJobStore()
+        run = new_run("b6", item_count=1)
+
+        with patch.dict('sys.modules', {'halcytone_content_generator.database': None}):
+            await store.save_run(run, DOCUMENT)
+
+        assert store.available is False
+        assert await store.load("b6") is None
+        assert await store.claim_unfinished() == []
+        await store.release(["b6"])
+        assert await store.checkpoint(run, run.items[0]) is False
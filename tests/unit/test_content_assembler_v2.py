@@ -5,7 +5,11 @@ import pytest
 from unittest.mock import Mock, patch
 from datetime import datetime
 
-from halcytone_content_generator.services.content_assembler_v2 import EnhancedContentAssembler
+from halcytone_content_generator.services.content_assembler_v2 import (
+    EnhancedContentAssembler,
+    get_template_environment,
+    warm_templates
+)
 from enum import Enum
 
 # Define test enums
@@ -306,5 +310,162 @@ class TestEnhancedContentAssembler:
         assert '<br>' not in text_content
 
 
+class TestSharedTemplateEnvironment:
+    """Test the process-wide compiled template environment"""
+
+    def test_assemblers_share_environment(self):
+        """Every assembler uses the same environment and compiled templates"""
+        first = EnhancedContentAssembler()
+        second = EnhancedContentAssembler(template_style='minimal')
+
+        assert first.env is second.env is get_template_environment()
+        assert first.env.get_template('modern') is second.env.get_template('modern')
+
+    def test_warm_templates_compiles_all_styles(self):
+        """Warm-up compiles the email styles and the Breathscape text and web templates"""
+        env = get_template_environment()
+
+        assert warm_templates() == 6
+        for name in ['modern', 'minimal', 'plain', 'breathscape', 'breathscape_text', 'breathscape_web']:
+            with patch.object(env.loader, 'get_source', side_effect=AssertionError(name)):
+                env.get_template(name)
+
+    def test_bytecode_cache_is_written(self, tmp_path):
+        """Compiled bytecode is stored for other processes to reuse"""
+        from jinja2 import Environment, FileSystemBytecodeCache
+        from halcytone_content_generator.services.content_assembler_v2 import TemplateLoader
+
+        env = Environment(loader=TemplateLoader(), bytecode_cache=FileSystemBytecodeCache(str(tmp_path)))
+        env.get_template('modern')
+
+        assert len(list(tmp_path.iterdir())) == 1
+
+
+class TestAssembleAll:
+    """Test the shared multi-channel pipeline"""
+
+    @pytest.fixture
+    def content(self):
+        return {
+            'breathscape': [{'title': 'New Meditation Mode', 'content': 'Guided sessions that improve focus.'}],
+            'hardware': [{'title': 'Sensor Upgrade', 'content': 'Better accuracy and battery.'}],
+            'tips': [{'title': 'Better Sleep', 'content': 'Slow your exhale before bed.'}],
+            'vision': []
+        }
+
+    @pytest.mark.asyncio
+    async def test_bundle_matches_individual_channels(self, content):
+        """The bundle holds the same output as calling each channel alone"""
+        assembler = EnhancedContentAssembler()
+        with patch('halcytone_content_generator.services.content_assembler_v2.random.choice',
+                   side_effect=lambda options: options[0]):
+            bundle = await assembler.assemble_all(content, platforms=['linkedin', 'facebook'])
+            newsletter = assembler.generate_newsletter(content)
+            web_update = assembler.generate_web_update(content)
+            social_posts = assembler.generate_social_posts(content, ['linkedin', 'facebook'])
+
+        assert bundle['channels'] == ['email', 'web', 'social']
+        assert bundle['newsletter'] == newsletter
+        assert bundle['web_update']['excerpt'] == web_update['excerpt']
+        assert bundle['web_update']['content'] == web_update['content']
+        assert bundle['social_posts'] == social_posts
+
+    @pytest.mark.asyncio
+    async def test_derived_fields_computed_once(self, content):
+        """Fields used by channels and bundle metadata are derived once"""
+        assembler = EnhancedContentAssembler()
+        with patch.object(assembler, '_generate_excerpt', wraps=assembler._generate_excerpt) as excerpt, \
+             patch.object(assembler, '_generate_subject_line',
+                          wraps=assembler._generate_subject_line) as subject:
+            bundle = await assembler.assemble_all(content, channels=['email', 'web'])
+
+        assert excerpt.call_count == 1
+        assert subject.call_count == 1
+        assert bundle['metadata']['subject'] == bundle['newsletter']['subject']
+        assert bundle['metadata']['excerpt'] == bundle['web_update']['excerpt']
+
+    @pytest.mark.asyncio
+    async def test_only_requested_channels_are_rendered(self, content):
+        assembler = EnhancedContentAssembler()
+
+        bundle = await assembler.assemble_all(content, channels=['web'])
+
+        assert bundle['newsletter'] is None
+        assert bundle['social_posts'] == []
+        assert bundle['web_update']['title'].startswith('Halcytone Updates')
+
+    @pytest.mark.asyncio
+    async def test_unknown_channel_is_rejected(self, content):
+        with pytest.raises(ValueError):
+            await EnhancedContentAssembler().assemble_all(content, channels=['fax'])
+
+
+class TestBreathscapeTextParity:
+    """The text template must match html2text's rendering of the HTML email"""
+
+    CONTENTS = [
+        {},
+        {'breathscape': [{'title': 'Adaptive Sessions', 'content': 'Sessions now adapt to you.'}]},
+        {
+            'breathscape': [
+                {'title': '  Multi\nline  title ', 'content': 'Line one.\n\n   Line two with  spaces. '},
+                {'title': 'Second', 'content': 'Emoji ☕ and *stars* and _underscores_ # hash'}
+            ],
+            'hardware': [{'title': 'Sensor v2', 'content': 'Rated 4.9 stars, 50K+ sessions, a-b testing.'}],
+            'tips': [{'title': '', 'content': 'Tip without a title'}, {'title': 'No content', 'content': ''}],
+            'vision': [{'title': 'Vision', 'content': "It's \"breathing\" for everyone!"}]
+        },
+        {'tips': [{'title': 'Box Breathing', 'content': 'Inhale four, hold four.'}], 'vision': []}
+    ]
+
+    @staticmethod
+    def html2text_reference(html):
+        return EnhancedContentAssembler._create_html2text().handle(html)
+
+    @pytest.mark.parametrize("content", CONTENTS)
+    def test_text_matches_html2text(self, content):
+        """Plain-text content renders identically to converting the HTML"""
+        assembler = EnhancedContentAssembler()
+
+        newsletter = assembler.generate_breathscape_newsletter(content)
+
+        assert newsletter['text'] == self.html2text_reference(newsletter['html'])
+
+    def test_custom_call_to_action_matches_html2text(self):
+        assembler = EnhancedContentAssembler()
+        custom_data = {'call_to_action': {
+            'link': 'https://halcytone.com/join', 'button_text': '\n  Join Now  ', 'text': 'Starts Monday.'
+        }}
+
+        newsletter = assembler.generate_breathscape_newsletter(TestBreathscapeTextParity.CONTENTS[2], custom_data)
+
+        assert newsletter['text'] == self.html2text_reference(newsletter['html'])
+
+    @pytest.mark.parametrize("content_text", [
+        '<b>Bold</b> news', 'Fish &amp; chips', '- a list item', '1. numbered', 'path\\to', 'see (docs)'
+    ])
+    def test_html_sensitive_content_falls_back_to_html2text(self, content_text):
+        """Markup or text html2text would escape goes through html2text"""
+        assembler = EnhancedContentAssembler()
+        content = {'breathscape': [{'title': 'Update', 'content': content_text}]}
+
+        with patch.object(assembler.env, 'get_template', wraps=assembler.env.get_template) as get_template:
+            newsletter = assembler.generate_breathscape_newsletter(content)
+
+        assert 'breathscape_text' not in [call.args[0] for call in get_template.call_args_list]
+        assert newsletter['text'] == self.html2text_reference(newsletter['html'])
+
+    def test_repeated_fallbacks_are_independent(self):
+        """html2text state does not leak between newsletters"""
+        assembler = EnhancedContentAssembler()
+        content = {'breathscape': [{'title': 'Update', 'content': '<i>Markup</i>'}]}
+
+        first = assembler.generate_breathscape_newsletter(content)
+        second = assembler.generate_breathscape_newsletter(content)
+
+        assert first['text'] == second['text']
+        assert second['text'].startswith('Halcytone')
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
\ No newline at end of file
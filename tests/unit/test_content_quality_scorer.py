@@ -5,6 +5,7 @@ Sprint 8 - AI Enhancement & Personalization
 import pytest
 from unittest.mock import Mock, AsyncMock, patch
 import statistics
+from datetime import datetime
 
 from halcytone_content_generator.services.content_quality_scorer import (
     ContentQualityScorer,
@@ -18,6 +19,7 @@ from halcytone_content_generator.services.content_quality_scorer import (
     get_content_quality_scorer
 )
 from halcytone_content_generator.services.ai_content_enhancer import ContentType
+from halcytone_content_generator.config import Settings
 
 
 class TestReadabilityMetrics:
@@ -622,4 +624,278 @@ class TestQualityScoreIntegration:
 
         assert excellent_threshold > good_threshold
         assert good_threshold > fair_threshold
-        assert fair_threshold > poor_threshold
\ No newline at end of file
+        assert fair_threshold > poor_threshold
+
+
+class TestBatchScoring:
+    """Test batch scoring with executor-backed metric calculation"""
+
+    DRAFTS = [
+        "Breathscape helps you breathe better. Discover calm today!",
+        "The report is available. Please review the document.",
+        "# Wellness Guide\n\n## Breathing\n\nImagine a calmer you. Try it now.",
+    ]
+
+    @pytest.mark.asyncio
+    async def test_score_many_matches_score_content(self):
+        """Batch results equal individual scoring and carry their input index"""
+        from concurrent.futures import ThreadPoolExecutor
+
+        scorer = ContentQualityScorer()
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            results = [item async for item in scorer.score_many(
+                self.DRAFTS, ContentType.WEB, executor=executor
+            )]
+
+        assert sorted(index for index, _ in results) == [0, 1, 2]
+        for index, score in results:
+            expected = scorer.score_metrics(self.DRAFTS[index], ContentType.WEB)
+            assert score.overall_score == expected.overall_score
+            assert score.quality_level == expected.quality_level
+
+    @pytest.mark.asyncio
+    async def test_score_many_uses_process_pool(self):
+        """Default executor is a process pool and scores are returned intact"""
+        from concurrent.futures import ProcessPoolExecutor
+
+        scorer = ContentQualityScorer()
+        scorer.settings = Settings(QUALITY_SCORING_WORKERS=2)
+        try:
+            results = dict([item async for item in scorer.score_many(self.DRAFTS, ContentType.EMAIL)])
+            assert isinstance(scorer._executor, ProcessPoolExecutor)
+        finally:
+            scorer.shutdown()
+
+        assert len(results) == 3
+        assert all(isinstance(score, QualityScore) for score in results.values())
+        assert results[0].engagement_metrics.power_words_count > 0
+        assert scorer._executor is None
+
+    @pytest.mark.asyncio
+    async def test_score_many_item_failure_is_isolated(self):
+        """A failing item yields an error score without failing the batch"""
+        from concurrent.futures import ThreadPoolExecutor
+
+        scorer = ContentQualityScorer()
+        with patch.object(scorer, '_apply_ai_analysis', new=AsyncMock(side_effect=[
+            Exception("AI down"), Mock(overall_score=50.0)
+        ])):
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                results = [item async for item in scorer.score_many(
+                    self.DRAFTS[:2], ContentType.WEB, executor=executor
+                )]
+
+        scores = [score for _, score in results]
+        assert any(score.quality_level == QualityLevel.CRITICAL and
+                   "AI down" in score.improvement_suggestions[0] for score in scores)
+        assert any(getattr(score, 'overall_score', 0) == 50.0 for score in scores)
+
+    @pytest.mark.asyncio
+    async def test_ai_analysis_blends_into_metric_score(self):
+        """AI assessment is blended 80/20 into the metric score"""
+        scorer = ContentQualityScorer()
+        base = scorer.score_metrics(self.DRAFTS[0], ContentType.WEB)
+
+        scorer.ai_enhancer = Mock()
+        scorer.ai_enhancer.is_configured.return_value = True
+        scorer.ai_enhancer.score_content_quality = AsyncMock(return_value=Mock(overall_score=90.0))
+        score = await scorer.score_content(self.DRAFTS[0], ContentType.WEB)
+
+        assert score.ai_assessment_score == 90.0
+        assert score.overall_score == pytest.approx(base.overall_score * 0.8 + 90.0 * 0.2)
+
+
+class TestScoreMemoization:
+    """Test content-hash memoization of quality scores"""
+
+    CONTENT = "Breathscape helps you breathe better. Discover calm today!"
+
+    @pytest.mark.asyncio
+    async def test_repeat_scoring_hits_cache(self):
+        """Scoring the same content twice runs the metric pipeline once"""
+        scorer = ContentQualityScorer()
+        with patch.object(scorer, 'score_metrics', wraps=scorer.score_metrics) as score_metrics:
+            first = await scorer.score_content(self.CONTENT, ContentType.WEB, include_ai_analysis=False)
+            second = await scorer.score_content(self.CONTENT, ContentType.WEB, include_ai_analysis=False)
+
+        assert score_metrics.call_count == 1
+        assert second.overall_score == first.overall_score
+        assert scorer.score_cache.get_stats()['hits'] == 1
+
+    @pytest.mark.asyncio
+    async def test_cached_scores_are_copies(self):
+        """Mutating a returned score does not change the cached one"""
+        scorer = ContentQualityScorer()
+        first = await scorer.score_content(self.CONTENT, ContentType.WEB, include_ai_analysis=False)
+        first.improvement_suggestions.append("mutated")
+        first.overall_score = -1
+
+        second = await scorer.score_content(self.CONTENT, ContentType.WEB, include_ai_analysis=False)
+        assert "mutated" not in second.improvement_suggestions
+        assert second.overall_score >= 0
+
+    @pytest.mark.asyncio
+    async def test_cached_scores_are_stamped_when_served(self):
+        """A cache hit reports when it was served, not when it was first computed"""
+        scorer = ContentQualityScorer()
+        first = await scorer.score_content(self.CONTENT, ContentType.WEB, include_ai_analysis=False)
+        cached = scorer.score_cache.get(scorer._score_cache_key(self.CONTENT, ContentType.WEB, False))
+        cached.timestamp = datetime(2020, 1, 1)
+
+        second = await scorer.score_content(self.CONTENT, ContentType.WEB, include_ai_analysis=False)
+
+        assert second.timestamp >= first.timestamp
+        assert cached.timestamp == datetime(2020, 1, 1)
+
+    @pytest.mark.asyncio
+    async def test_content_type_and_ai_flag_are_separate_entries(self):
+        """Different content types and AI settings are not served from each other"""
+        scorer = ContentQualityScorer()
+        with patch.object(scorer, 'score_metrics', wraps=scorer.score_metrics) as score_metrics:
+            await scorer.score_content(self.CONTENT, ContentType.WEB, include_ai_analysis=False)
+            await scorer.score_content(self.CONTENT, ContentType.EMAIL, include_ai_analysis=False)
+            scorer.ai_enhancer = Mock()
+            scorer.ai_enhancer.is_configured.return_value = False
+            await scorer.score_content(self.CONTENT, ContentType.WEB, include_ai_analysis=True)
+
+        assert score_metrics.call_count == 3
+        assert len(scorer.score_cache) == 3
+
+    @pytest.mark.asyncio
+    async def test_failed_ai_assessment_is_not_cached(self):
+        """A zero AI score from a configured enhancer is retried next time"""
+        scorer = ContentQualityScorer()
+        scorer.ai_enhancer = Mock()
+        scorer.ai_enhancer.is_configured.return_value = True
+        scorer.ai_enhancer.score_content_quality = AsyncMock(side_effect=[
+            Mock(overall_score=0.0), Mock(overall_score=80.0)
+        ])
+
+        first = await scorer.score_content(self.CONTENT, ContentType.WEB)
+        second = await scorer.score_content(self.CONTENT, ContentType.WEB)
+        third = await scorer.score_content(self.CONTENT, ContentType.WEB)
+
+        assert first.ai_assessment_score == 0.0
+        assert second.ai_assessment_score == 80.0
+        assert third.ai_assessment_score == 80.0
+        assert scorer.ai_enhancer.score_content_quality.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_error_scores_are_not_cached(self):
+        """Scoring failures are never memoized"""
+        scorer = ContentQualityScorer()
+        with patch.object(scorer, 'score_metrics', side_effect=Exception("boom")):
+            error = await scorer.score_content(self.CONTENT, ContentType.WEB, include_ai_analysis=False)
+
+        assert error.quality_level == QualityLevel.CRITICAL
+        assert len(scorer.score_cache) == 0
+
+    @pytest.mark.asyncio
+    async def test_score_many_uses_cache(self):
+        """Batch scoring serves previously scored drafts from the cache"""
+        from concurrent.futures import ThreadPoolExecutor
+
+        scorer = ContentQualityScorer()
+        expected = await scorer.score_content(self.CONTENT, ContentType.WEB, include_ai_analysis=False)
+        with patch('halcytone_content_generator.services.content_quality_scorer._score_metrics_in_worker') as worker:
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                results = [item async for item in scorer.score_many(
+                    [self.CONTENT], ContentType.WEB, executor=executor
+                )]
+
+        worker.assert_not_called()
+        assert results[0][1].overall_score == expected.overall_score
+
+    def test_quality_score_dict_round_trip(self):
+        """Scores survive serialization for the persistent tier"""
+        import json
+
+        scorer = ContentQualityScorer()
+        score = scorer.score_metrics("# Guide\n\n" + self.CONTENT, ContentType.WEB)
+        restored = QualityScore.from_dict(json.loads(json.dumps(score.to_dict())))
+
+        assert restored == score
+        assert ScoreCategory.READABILITY in restored.detailed_feedback["category_scores"]
+
+    @pytest.mark.asyncio
+    async def test_persistent_tier_fills_memory_on_miss(self):
+        """A memory miss falls back to the persistent store and promotes the hit"""
+        scorer = ContentQualityScorer()
+        stored = scorer.score_metrics(self.CONTENT, ContentType.WEB)
+        scorer.score_store = Mock()
+        scorer.score_store.load = AsyncMock(return_value=stored.to_dict())
+        scorer.score_store.save = AsyncMock()
+
+        with patch.object(scorer, 'score_metrics') as score_metrics:
+            score = await scorer.score_content(self.CONTENT, ContentType.WEB, include_ai_analysis=False)
+            again = await scorer.score_content(self.CONTENT, ContentType.WEB, include_ai_analysis=False)
+
+        score_metrics.assert_not_called()
+        assert score.overall_score == stored.overall_score
+        assert again.overall_score == stored.overall_score
+        scorer.score_store.load.assert_awaited_once()
+        scorer.score_store.save.assert_not_called()
+
+
+class TestIncrementalRescoring:
+    """Test re-scoring edited drafts from a previous analysis"""
+
+    DRAFT = (
+        "# Wellness Guide\n\n"
+        "Breathscape helps you breathe better. Discover calm today!\n\n"
+        "The report is available. Please review the document.\n\n"
+        "Try it now."
+    )
+
+    @pytest.mark.asyncio
+    async def test_rescore_matches_full_scoring(self):
+        """Incremental scores equal scoring the edited draft from scratch"""
+        from halcytone_content_generator.services.text_analysis import TextEdit
+
+        scorer = ContentQualityScorer()
+        previous = scorer.analyze_text(self.DRAFT)
+        start = self.DRAFT.index("The report")
+        edits = [TextEdit(start, start + len("The report"), "Your amazing journal")]
+
+        score, analysis = await scorer.rescore_content(previous, edits, ContentType.WEB)
+        expected = scorer.score_metrics(analysis.content, ContentType.WEB)
+
+        assert analysis.content.startswith(self.DRAFT[:start] + "Your amazing journal")
+        assert score.overall_score == expected.overall_score
+        assert score.category_scores == expected.category_scores
+
+    @pytest.mark.asyncio
+    async def test_rescore_chains_edits(self):
+        """The returned analysis feeds the next incremental re-score"""
+        from halcytone_content_generator.services.text_analysis import TextEdit
+
+        scorer = ContentQualityScorer()
+        analysis = scorer.analyze_text(self.DRAFT)
+        versions = [self.DRAFT + "\n\nAct now!", self.DRAFT.replace("calm", "focus") + "\n\nAct now!"]
+        for version in versions:
+            score, analysis = await scorer.rescore_content(
+                analysis, [TextEdit.between(analysis.content, version)], ContentType.EMAIL
+            )
+            assert analysis.content == version
+            assert score.overall_score == scorer.score_metrics(version, ContentType.EMAIL).overall_score
+
+    def test_analysis_from_other_scorer_is_rebuilt(self):
+        """Lexicon hits from another scorer's word lists are not reused"""
+        from halcytone_content_generator.services.text_analysis import TextAnalysis, TextEdit
+
+        scorer = ContentQualityScorer()
+        previous = TextAnalysis.from_content(self.DRAFT)
+        updated = scorer.analyze_edit(previous, [TextEdit(0, 0, "Amazing! ")])
+
+        assert updated == scorer.analyze_text("Amazing! " + self.DRAFT)
+        assert updated.lexicon_hits['power']
+
+    @pytest.mark.asyncio
+    async def test_invalid_edit_raises(self):
+        """An edit outside the previous content raises before scoring"""
+        from halcytone_content_generator.services.text_analysis import TextEdit
+
+        scorer = ContentQualityScorer()
+        previous = scorer.analyze_text("Short draft.")
+        with pytest.raises(ValueError):
+            await scorer.rescore_content(previous, [TextEdit(5, 50, "x")], ContentType.WEB)
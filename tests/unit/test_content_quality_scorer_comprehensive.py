@@ -17,6 +17,7 @@ from halcytone_content_generator.services.content_quality_scorer import (
     ScoreCategory
 )
 from halcytone_content_generator.services.ai_content_enhancer import ContentType
+from halcytone_content_generator.config import Settings
 
 
 class TestReadabilityMetricsComprehensive:
@@ -467,7 +468,8 @@ class TestContentQualityScorerHelperMethods:
     @pytest.fixture
     def scorer(self):
         """Create scorer instance"""
-        with patch('halcytone_content_generator.services.content_quality_scorer.get_settings'):
+        with patch('halcytone_content_generator.services.content_quality_scorer.get_settings',
+                   return_value=Settings()):
             with patch('halcytone_content_generator.services.content_quality_scorer.get_prompt_templates'):
                 return ContentQualityScorer()
 
@@ -597,7 +599,8 @@ class TestContentQualityScorerCalculations:
     @pytest.fixture
     def scorer(self):
         """Create scorer instance"""
-        with patch('halcytone_content_generator.services.content_quality_scorer.get_settings'):
+        with patch('halcytone_content_generator.services.content_quality_scorer.get_settings',
+                   return_value=Settings()):
             with patch('halcytone_content_generator.services.content_quality_scorer.get_prompt_templates'):
                 return ContentQualityScorer()
 
@@ -767,7 +770,8 @@ class TestContentQualityScorerEdgeCases:
     @pytest.fixture
     def scorer(self):
         """Create scorer instance"""
-        with patch('halcytone_content_generator.services.content_quality_scorer.get_settings'):
+        with patch('halcytone_content_generator.services.content_quality_scorer.get_settings',
+                   return_value=Settings()):
             with patch('halcytone_content_generator.services.content_quality_scorer.get_prompt_templates'):
                 return ContentQualityScorer()
 
@@ -26,10 +26,9 @@ from halcytone_content_generator.config import Settings
 @pytest.fixture
 def settings():
     """Create test settings"""
-    settings = Mock(spec=Settings)
-    settings.TEST_MODE = True
+    settings = Settings()
     settings.NOTION_API_KEY = "test_notion_key"
-    settings.GOOGLE_DOCS_CREDENTIALS = "test_gdocs_creds"
+    settings.GOOGLE_CREDENTIALS_JSON = "test_gdocs_creds"
     return settings
 
 
@@ -152,14 +151,29 @@ class TestServiceInitialization:
     def test_service_initialization(self, sync_service):
         """Test service initializes with correct attributes"""
         assert sync_service.jobs == {}
-        assert sync_service.active_jobs == []
+        assert sync_service.active_jobs == set()
         assert isinstance(sync_service.job_queue, asyncio.Queue)
+        assert len(sync_service.scheduled_jobs) == 0
+        assert sync_service.is_running is False
         assert sync_service.content_versions == {}
         assert sync_service.last_sync_times == {}
         assert sync_service.max_concurrent_jobs == 5
         assert sync_service.retry_attempts == 3
         assert sync_service.sync_interval_minutes == 30
 
+    def test_non_positive_pool_sizes_are_clamped(self, settings):
+        """A zero worker count still starts one worker"""
+        settings.SYNC_MAX_WORKERS = 0
+        settings.SYNC_VERSION_CACHE_SIZE = 0
+        with patch('halcytone_content_generator.services.content_sync.DocumentFetcher'), \
+             patch('halcytone_content_generator.services.content_sync.EnhancedContentAssembler'), \
+             patch('halcytone_content_generator.services.content_sync.EnhancedCRMClient'), \
+             patch('halcytone_content_generator.services.content_sync.EnhancedPlatformClient'):
+            service = ContentSyncService(settings)
+
+        assert service.max_concurrent_jobs == 1
+        assert service.max_cached_versions == 1
+
 
 # ============================================================================
 # Sync Content Tests
@@ -222,8 +236,10 @@ class TestSyncContent:
             )
 
             assert job.scheduled_for == future_time
-            # Should create async task for scheduling
-            mock_create_task.assert_called_once()
+            # Held in the timer heap, not by a sleeping task per job
+            mock_create_task.assert_not_called()
+            assert len(sync_service.scheduled_jobs) == 1
+            assert sync_service.job_queue.empty()
 
 
 # ============================================================================
@@ -752,6 +768,333 @@ class TestJobCleanup:
         assert "recent_1" in sync_service.jobs
 
 
+# ============================================================================
+# Worker Pool Tests
+# ============================================================================
+
+class TestWorkerPool:
+    """Test the sync worker pool, priorities and backpressure"""
+
+    @staticmethod
+    def record_executions(sync_service, delay=0.0):
+        """Replace job execution with a recorder that tracks overlap"""
+        executed = []
+        state = {'in_flight': 0, 'max_in_flight': 0}
+
+        async def execute(job):
+            state['in_flight'] += 1
+            state['max_in_flight'] = max(state['max_in_flight'], state['in_flight'])
+            await asyncio.sleep(delay)
+            executed.append(job.source_document_id)
+            job.status = SyncStatus.COMPLETED
+            state['in_flight'] -= 1
+            sync_service.active_jobs.discard(job.job_id)
+
+        sync_service._execute_sync_job = execute
+        return executed, state
+
+    @pytest.mark.asyncio
+    async def test_pool_bounds_concurrency(self, sync_service):
+        """Never more than max_concurrent_jobs jobs run at once"""
+        executed, state = self.record_executions(sync_service, delay=0.01)
+        for i in range(12):
+            await sync_service.sync_content(document_id=f"doc_{i}")
+
+        sync_service.start()
+        await sync_service.job_queue.join()
+        await sync_service.stop()
+
+        assert len(executed) == 12
+        assert state['max_in_flight'] == sync_service.max_concurrent_jobs
+        assert sync_service.active_jobs == set()
+        assert sync_service.is_running is False
+
+    @pytest.mark.asyncio
+    async def test_job_history_stays_bounded(self, sync_service):
+        """Finished jobs are evicted while statistics keep counting them"""
+        sync_service.jobs.max_jobs = 5
+        executed, _ = self.record_executions(sync_service)
+        for i in range(12):
+            await sync_service.sync_content(document_id=f"doc_{i}")
+
+        sync_service.start()
+        await sync_service.job_queue.join()
+        await sync_service.stop()
+
+        stats = sync_service.get_sync_statistics()
+        assert len(executed) == 12
+        assert len(sync_service.jobs) == 5
+        assert stats['total_jobs'] == 12
+        assert stats['status_breakdown'] == {'completed': 12}
+        recent = sync_service.get_recent_jobs(limit=2)
+        assert {job.source_document_id for job in recent} == {"doc_11", "doc_10"}
+        assert recent[0].created_at >= recent[1].created_at
+
+    @pytest.mark.asyncio
+    async def test_priority_then_documents_take_turns(self, sync_service):
+        """Higher priority first; within a priority, documents alternate"""
+        from halcytone_content_generator.services.content_sync import SyncPriority
+
+        sync_service.max_concurrent_jobs = 1
+        executed, _ = self.record_executions(sync_service)
+        for document_id in ["doc_a", "doc_a", "doc_a", "doc_b"]:
+            await sync_service.sync_content(document_id=document_id)
+        await sync_service.sync_content(document_id="doc_low", priority=SyncPriority.LOW)
+        await sync_service.sync_content(document_id="doc_urgent", priority=SyncPriority.HIGH)
+
+        sync_service.start()
+        await sync_service.job_queue.join()
+        await sync_service.stop()
+
+        assert executed == ["doc_urgent", "doc_a", "doc_b", "doc_a", "doc_a", "doc_low"]
+
+    @pytest.mark.asyncio
+    async def test_full_queue_rejects_without_waiting(self, settings):
+        """A full queue raises QueueFull for non-waiting producers"""
+        settings.SYNC_QUEUE_MAX_SIZE = 2
+        with patch('halcytone_content_generator.services.content_sync.DocumentFetcher'), \
+             patch('halcytone_content_generator.services.content_sync.EnhancedContentAssembler'), \
+             patch('halcytone_content_generator.services.content_sync.EnhancedCRMClient'), \
+             patch('halcytone_content_generator.services.content_sync.EnhancedPlatformClient'):
+            service = ContentSyncService(settings)
+
+        await service.sync_content(document_id="doc_1")
+        await service.sync_content(document_id="doc_2")
+        with pytest.raises(asyncio.QueueFull):
+            await service.sync_content(document_id="doc_3", wait=False)
+
+        assert len(service.jobs) == 2
+        assert service.get_queue_statistics()['queue_depth'] == 2
+
+    @pytest.mark.asyncio
+    async def test_scheduled_job_runs_when_due(self, sync_service):
+        """The timer moves a scheduled job onto the queue at its due time"""
+        executed, _ = self.record_executions(sync_service)
+        sync_service.start()
+
+        job = await sync_service.sync_content(
+            document_id="doc_later",
+            schedule_time=datetime.now() + timedelta(milliseconds=50)
+        )
+        assert sync_service.get_queue_statistics()['scheduled_jobs'] == 1
+        for _ in range(200):
+            if executed:
+                break
+            await asyncio.sleep(0.01)
+        await sync_service.stop()
+
+        assert executed == ["doc_later"]
+        assert job.status == SyncStatus.COMPLETED
+        stats = sync_service.get_sync_statistics()['queue']
+        assert stats['scheduled_jobs'] == 0
+        assert stats['queue_depth'] == 0
+        assert 'queue_wait_ms' in job.metadata
+
+
+class TestChannelFanOut:
+    """Test concurrent per-channel sync inside a job"""
+
+    @staticmethod
+    def channel_doubles(sync_service, sample_content, behaviours):
+        """Route _sync_to_channel through per-channel coroutines and count calls"""
+        calls = {}
+
+        async def sync_to_channel(channel, content, correlation_id=None):
+            calls[channel] = calls.get(channel, 0) + 1
+            return await behaviours[channel](calls[channel])
+
+        sync_service._fetch_content = AsyncMock(return_value=sample_content)
+        sync_service._sync_to_channel = sync_to_channel
+        sync_service.channel_retry_delay = 0
+        return calls
+
+    @pytest.mark.asyncio
+    async def test_channels_run_concurrently(self, sync_service, sample_content):
+        """Job latency is the slowest channel, not the sum"""
+        def sleeper(seconds):
+            async def behaviour(attempt):
+                await asyncio.sleep(seconds)
+                return {'status': 'ok'}
+            return behaviour
+
+        self.channel_doubles(sync_service, sample_content, {
+            Channel.WEBSITE: sleeper(0.2),
+            Channel.SOCIAL_TWITTER: sleeper(0.2),
+            Channel.SOCIAL_LINKEDIN: sleeper(0.2)
+        })
+        job = await sync_service.sync_content(
+            document_id="doc", channels=[Channel.WEBSITE, Channel.SOCIAL_TWITTER, Channel.SOCIAL_LINKEDIN]
+        )
+
+        started = asyncio.get_running_loop().time()
+        await sync_service._execute_sync_job(job)
+        elapsed = asyncio.get_running_loop().time() - started
+
+        assert job.status == SyncStatus.COMPLETED
+        assert elapsed < 0.5
+        assert set(job.metadata['channels']) == {'website', 'twitter', 'linkedin'}
+
+    @pytest.mark.asyncio
+    async def test_channel_timeout_gives_partial(self, sync_service, sample_content):
+        """A stuck channel times out on its own without holding the others"""
+        async def stuck(attempt):
+            await asyncio.sleep(10)
+
+        async def fine(attempt):
+            return {'status': 'ok'}
+
+        self.channel_doubles(sync_service, sample_content, {Channel.WEBSITE: fine, Channel.SOCIAL_TWITTER: stuck})
+        sync_service.channel_timeouts[Channel.SOCIAL_TWITTER] = 0.05
+        sync_service.channel_attempts[Channel.SOCIAL_TWITTER] = 2
+        job = await sync_service.sync_content(document_id="doc", channels=[Channel.WEBSITE, Channel.SOCIAL_TWITTER])
+
+        await sync_service._execute_sync_job(job)
+
+        assert job.status == SyncStatus.PARTIAL
+        assert job.results['website'] == {'status': 'ok'}
+        assert 'timed out' in job.results['twitter']['error']
+        assert job.metadata['channels']['twitter']['attempts'] == 2
+        assert job.metadata['channels']['website']['status'] == 'succeeded'
+
+    @pytest.mark.asyncio
+    async def test_transient_failure_is_retried_but_email_is_not(self, sync_service, sample_content):
+        """Channels retry within their budget; bulk email gets a single attempt"""
+        async def flaky(attempt):
+            if attempt == 1:
+                raise ConnectionError("reset")
+            return {'status': 'ok'}
+
+        calls = self.channel_doubles(sync_service, sample_content, {Channel.WEBSITE: flaky, Channel.EMAIL: flaky})
+        job = await sync_service.sync_content(document_id="doc", channels=[Channel.EMAIL, Channel.WEBSITE])
+
+        await sync_service._execute_sync_job(job)
+
+        assert calls == {Channel.WEBSITE: 2, Channel.EMAIL: 1}
+        assert job.status == SyncStatus.PARTIAL
+        assert job.results['email'] == {'error': 'reset'}
+        assert job.metadata['channels']['website']['attempts'] == 2
+
+    @pytest.mark.asyncio
+    async def test_resync_only_retries_unpublished_channels(self, sync_service, sample_content):
+        """Channels that published this content are not published again"""
+        async def failing(attempt):
+            raise ValueError("bad payload")
+
+        async def fine(attempt):
+            return {'status': 'ok'}
+
+        behaviours = {Channel.WEBSITE: fine, Channel.SOCIAL_TWITTER: failing}
+        calls = self.channel_doubles(sync_service, sample_content, behaviours)
+        first = await sync_service.sync_content(document_id="doc", channels=[Channel.WEBSITE, Channel.SOCIAL_TWITTER])
+        await sync_service._execute_sync_job(first)
+        assert first.status == SyncStatus.PARTIAL
+        assert calls[Channel.SOCIAL_TWITTER] == 1  # Validation errors are not retried
+
+        behaviours[Channel.SOCIAL_TWITTER] = fine
+        second = await sync_service.sync_content(document_id="doc", channels=[Channel.WEBSITE, Channel.SOCIAL_TWITTER])
+        await sync_service._execute_sync_job(second)
+
+        assert second.status == SyncStatus.COMPLETED
+        assert calls == {Channel.WEBSITE: 1, Channel.SOCIAL_TWITTER: 2}
+        assert second.metadata['already_published'] == ['website']
+        assert set(sync_service.content_versions["doc"].channels_published) == {'website', 'twitter'}
+
+
+class MemoryContentVersionStore:
+    """In-memory stand-in for SqlContentVersionStore shared by several services"""
+
+    def __init__(self):
+        self.versions = {}
+        self.loads = 0
+
+    async def load(self, document_id):
+        self.loads += 1
+        stored = self.versions.get(document_id)
+        return dict(stored, channels_published=dict(stored['channels_published'])) if stored else None
+
+    async def save(self, document_id, content_hash, channels_published, title=None):
+        stored = self.versions.get(document_id)
+        if stored is None or stored['content_hash'] != content_hash:
+            stored = {'version_id': f"v_{len(self.versions)}", 'content_hash': content_hash,
+                      'created_at': datetime.now(), 'channels_published': {}}
+            self.versions[document_id] = stored
+        stored['channels_published'].update(channels_published)
+
+
+class TestPersistentContentVersions:
+    """Test the version LRU and the shared persistent version store"""
+
+    @staticmethod
+    def replica(settings, store, sample_content):
+        with patch('halcytone_content_generator.services.content_sync.DocumentFetcher'), \
+             patch('halcytone_content_generator.services.content_sync.EnhancedContentAssembler'), \
+             patch('halcytone_content_generator.services.content_sync.EnhancedCRMClient'), \
+             patch('halcytone_content_generator.services.content_sync.EnhancedPlatformClient'):
+            service = ContentSyncService(settings)
+        service.version_store = store
+        service._fetch_content = AsyncMock(return_value=sample_content)
+        service._sync_to_channel = AsyncMock(return_value={'status': 'ok'})
+        return service
+
+    def test_store_is_opt_in(self, sync_service):
+        """Without CONTENT_VERSIONS_PERSISTENT dedupe stays in process"""
+        assert sync_service.version_store is None
+
+    def test_version_cache_evicts_least_recently_used(self, sync_service):
+        """The in-process tier is bounded"""
+        sync_service.max_cached_versions = 2
+        sync_service._record_content_version("doc_a", "hash_a", {})
+        sync_service._record_content_version("doc_b", "hash_b", {})
+        assert sync_service._is_duplicate_content("doc_a", "hash_a")  # Touch doc_a
+
+        sync_service._record_content_version("doc_c", "hash_c", {})
+
+        assert list(sync_service.content_versions) == ["doc_a", "doc_c"]
+
+    @pytest.mark.asyncio
+    async def test_replica_skips_content_published_elsewhere(self, settings, sample_content):
+        """A second instance sees what the first already published"""
+        store = MemoryContentVersionStore()
+        first = self.replica(settings, store, sample_content)
+        second = self.replica(settings, store, sample_content)
+
+        job = await first.sync_content(document_id="doc", channels=[Channel.WEBSITE])
+        await first._execute_sync_job(job)
+        job = await second.sync_content(document_id="doc", channels=[Channel.WEBSITE, Channel.SOCIAL_TWITTER])
+        await second._execute_sync_job(job)
+
+        assert job.status == SyncStatus.COMPLETED
+        assert job.metadata['already_published'] == ['website']
+        second._sync_to_channel.assert_awaited_once()
+        assert set(store.versions["doc"]['channels_published']) == {'website', 'twitter'}
+
+    @pytest.mark.asyncio
+    async def test_unchanged_content_is_skipped_from_cache(self, settings, sample_content):
+        """Once everything is published the store is not consulted again"""
+        store = MemoryContentVersionStore()
+        service = self.replica(settings, store, sample_content)
+
+        for _ in range(3):
+            job = await service.sync_content(document_id="doc", channels=[Channel.WEBSITE])
+            await service._execute_sync_job(job)
+
+        assert job.metadata['skipped'] is True
+        assert store.loads == 1
+        service._sync_to_channel.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_sql_store_disables_itself_without_database(self):
+        """The persistent tier degrades to a no-op"""
+        from halcytone_content_generator.services.content_version_store import SqlContentVersionStore
+        store = SqlContentVersionStore()
+
+        with patch.dict('sys.modules', {'halcytone_content_generator.database': None}):
+            await store.save("doc", "hash", {'website': datetime.now()})
+
+        assert store.available is False
+        assert await store.load("doc") is None
+
+
 # ============================================================================
 # Integration Tests
 # ============================================================================
@@ -3,6 +3,7 @@ Unit tests for Enhanced CRM client v2
 """
 import pytest
 from unittest.mock import Mock, patch, AsyncMock
+import asyncio
 import httpx
 from datetime import datetime
 
@@ -21,6 +22,7 @@ class TestEnhancedCRMClient:
         settings.CRM_API_KEY = "test_api_key"
         settings.EMAIL_BATCH_SIZE = 100
         settings.EMAIL_RATE_LIMIT = 10
+        settings.EMAIL_MAX_IN_FLIGHT_BATCHES = 4
         settings.CIRCUIT_BREAKER_FAILURE_THRESHOLD = 5
         settings.CIRCUIT_BREAKER_RECOVERY_TIMEOUT = 60
         settings.MAX_RETRIES = 3
@@ -320,4 +322,121 @@ class TestEnhancedCRMClient:
 
         # Should have been batched
         assert mock_client_instance.post.call_count >= 1
-        assert result.job_id == "job_123"
\ No newline at end of file
+        assert result.job_id == "job_123"
+
+
+class TestWindowedBatchDispatch:
+    """Bulk sends keep a bounded window of batches in flight"""
+
+    @pytest.fixture
+    def crm_client(self):
+        settings = Mock()
+        settings.CRM_BASE_URL = "http://test-crm.com"
+        settings.CRM_API_KEY = "test-key"
+        settings.DRY_RUN_MODE = False
+        settings.DRY_RUN = False
+        settings.USE_MOCK_SERVICES = False
+        settings.ENVIRONMENT = "development"
+        settings.EMAIL_BATCH_SIZE = 10
+        settings.EMAIL_RATE_LIMIT = 1000
+        settings.EMAIL_MAX_IN_FLIGHT_BATCHES = 3
+        settings.CIRCUIT_BREAKER_FAILURE_THRESHOLD = 5
+        settings.CIRCUIT_BREAKER_RECOVERY_TIMEOUT = 60
+        settings.MAX_RETRIES = 3
+        settings.RETRY_MAX_WAIT = 60
+        return EnhancedCRMClient(settings)
+
+    @staticmethod
+    def _recipients(count):
+        return [EmailRecipient(email=f"user{i}@test.com", name=f"User {i}") for i in range(count)]
+
+    def test_window_size_from_settings(self, crm_client):
+        assert crm_client.max_in_flight_batches == 3
+
+    @pytest.mark.asyncio
+    async def test_non_positive_window_still_sends(self, crm_client):
+        crm_client.settings.EMAIL_MAX_IN_FLIGHT_BATCHES = 0
+        client = EnhancedCRMClient(crm_client.settings)
+        send = AsyncMock(return_value={'sent': 10, 'failed': 0, 'errors': []})
+
+        with patch.object(client, '_send_batch_with_circuit_breaker', send):
+            results = [r async for r in client._process_batches(self._recipients(30), "S", "h", "t")]
+
+        assert client.max_in_flight_batches == 1
+        assert sum(r['sent'] for r in results) == 30
+
+    @pytest.mark.asyncio
+    async def test_results_yielded_in_batch_order_within_window(self, crm_client):
+        recipients = self._recipients(95)
+        active = 0
+        peak = 0
+
+        async def send(batch, *args):
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            index = int(batch[0].email[4:].split("@")[0]) // 10
+            # Later batches finish first
+            await asyncio.sleep(0.01 * (10 - index))
+            active -= 1
+            return {'sent': len(batch), 'failed': 0, 'errors': [f"batch {index}"]}
+
+        with patch.object(crm_client, '_send_batch_with_circuit_breaker', side_effect=send):
+            results = [r async for r in crm_client._process_batches(recipients, "Subject", "<p>Hi</p>", "Hi")]
+
+        assert [r['errors'] for r in results] == [[f"batch {i}"] for i in range(10)]
+        assert sum(r['sent'] for r in results) == 95
+        assert peak == 3
+
+    @pytest.mark.asyncio
+    async def test_window_of_one_sends_batches_one_after_another(self, crm_client):
+        crm_client.max_in_flight_batches = 1
+        active = 0
+        peak = 0
+
+        async def send(batch, *args):
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0)
+            active -= 1
+            return {'sent': len(batch), 'failed': 0, 'errors': []}
+
+        with patch.object(crm_client, '_send_batch_with_circuit_breaker', side_effect=send):
+            results = [r async for r in crm_client._process_batches(self._recipients(40), "S", "h", "t")]
+
+        assert len(results) == 4
+        assert peak == 1
+
+    @pytest.mark.asyncio
+    async def test_each_dispatch_acquires_the_rate_limiter(self, crm_client):
+        send = AsyncMock(return_value={'sent': 10, 'failed': 0, 'errors': []})
+
+        with patch.object(crm_client, '_send_batch_with_circuit_breaker', send), \
+                patch.object(crm_client.rate_limiter, 'acquire', AsyncMock()) as acquire:
+            results = [r async for r in crm_client._process_batches(self._recipients(50), "S", "h", "t")]
+
+        assert len(results) == 5
+        assert acquire.await_count == 5
+
+    @pytest.mark.asyncio
+    async def test_failed_batch_stops_dispatch_and_fails_job(self, crm_client):
+        recipients = self._recipients(100)
+        dispatched = []
+
+        async def send(batch, *args):
+            dispatched.append(batch[0].email)
+            if batch[0].email == "user10@test.com":
+                raise RuntimeError("circuit open")
+            await asyncio.sleep(0.01)
+            return {'sent': len(batch), 'failed': 0, 'errors': []}
+
+        with patch.object(crm_client, '_fetch_recipients', AsyncMock(return_value=recipients)), \
+                patch.object(crm_client, '_send_batch_with_circuit_breaker', side_effect=send):
+            job = await crm_client.send_newsletter_bulk(subject="S", html="h", text="t")
+
+        assert job.status == "failed"
+        assert "circuit open" in job.errors
+        # Nothing is dispatched after the failure; batches already in flight are still counted
+        assert len(dispatched) == 3
+        assert job.sent_count == 20
@@ -67,6 +67,7 @@ class TestEnhancedCRMClient:
         settings.CRM_API_KEY = "test-key"
         settings.EMAIL_BATCH_SIZE = 10
         settings.EMAIL_RATE_LIMIT = 100
+        settings.EMAIL_MAX_IN_FLIGHT_BATCHES = 4
         settings.CIRCUIT_BREAKER_FAILURE_THRESHOLD = 5
         settings.CIRCUIT_BREAKER_RECOVERY_TIMEOUT = 60
         settings.MAX_RETRIES = 3
@@ -0,0 +1,193 @@
+"""
+Unit tests for revision-aware living document caching
+"""
+import pytest
+from unittest.mock import AsyncMock, Mock, patch
+
+from halcytone_content_generator.config import Settings
+from halcytone_content_generator.services.document_cache import (
+    DocumentCacheEntry,
+    DocumentFetchCache
+)
+from halcytone_content_generator.services.document_fetcher import DocumentFetcher
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestDocumentFetchCache:
+    """Test the in-process document tier"""
+
+    def test_entries_are_fresh_within_ttl(self):
+        """An entry is served without revalidation until the TTL passes"""
+        clock = FakeClock()
+        cache = DocumentFetchCache(clock=clock)
+        cache.put(DocumentCacheEntry("notion", "db", {'tips': []}, revision="r1"))
+
+        entry = cache.get("notion", "db")
+        assert cache.is_fresh(entry, 60)
+        clock.now = 61
+        assert not cache.is_fresh(entry, 60)
+        assert cache.get("notion", "db") is entry
+
+    def test_least_recently_used_is_evicted(self):
+        """The cache stays within max_entries"""
+        cache = DocumentFetchCache(max_entries=2)
+        for doc_id in ("a", "b"):
+            cache.put(DocumentCacheEntry("url", doc_id, {}))
+        cache.get("url", "a")
+        cache.put(DocumentCacheEntry("url", "c", {}))
+
+        assert cache.get("url", "b") is None
+        assert cache.get("url", "a") is not None
+        assert len(cache) == 2
+
+    def test_payload_round_trip_is_stale(self):
+        """Entries restored from the persistent tier must be revalidated"""
+        entry = DocumentCacheEntry("google_docs", "doc", {'tips': [{'title': 'T'}]}, revision="r1")
+
+        restored = DocumentCacheEntry.from_payload(entry.to_payload())
+
+        assert restored.content == entry.content
+        assert restored.revision == "r1"
+        assert not DocumentFetchCache().is_fresh(restored, 3600)
+
+
+class TestDocumentFetcherCaching:
+    """Test revalidation of cached documents in DocumentFetcher"""
+
+    @pytest.fixture
+    def settings(self):
+        settings = Settings()
+        settings.LIVING_DOC_TYPE = "google_docs"
+        settings.LIVING_DOC_ID = "doc-1"
+        settings.LIVING_DOC_SOURCES = ""
+        settings.LIVING_DOC_CACHE_TTL = 0
+        settings.LIVING_DOC_CACHE_PERSISTENT = False
+        settings.NOTION_API_KEY = "notion-key"
+        settings.NOTION_DATABASE_ID = "db-1"
+        settings.DEBUG = False
+        return settings
+
+    @pytest.fixture
+    def google_fetcher(self, settings):
+        fetcher = DocumentFetcher(settings)
+        fetcher._google_service = Mock()
+        fetcher._get_google_document = AsyncMock(return_value={
+            'revisionId': 'rev-1',
+            'body': {'content': [{'paragraph': {'elements': [
+                {'textRun': {'content': 'Try this breathing technique daily.'}}
+            ]}}]}
+        })
+        fetcher._get_google_revision = AsyncMock(return_value='rev-1')
+        return fetcher
+
+    @pytest.mark.asyncio
+    async def test_unchanged_google_doc_is_not_redownloaded(self, google_fetcher):
+        """A matching revisionId reuses the parsed content"""
+        with patch.object(google_fetcher, '_parse_content', wraps=google_fetcher._parse_content) as parse:
+            first = await google_fetcher.fetch_content()
+            second = await google_fetcher.fetch_content()
+
+        assert first == second
+        assert google_fetcher._get_google_document.call_count == 1
+        assert parse.call_count == 1
+        assert google_fetcher.document_cache.revalidated == 1
+
+    @pytest.mark.asyncio
+    async def test_changed_google_doc_is_refetched(self, google_fetcher):
+        """A new revisionId triggers a full download"""
+        await google_fetcher.fetch_content()
+        google_fetcher._get_google_revision.return_value = 'rev-2'
+        await google_fetcher.fetch_content()
+
+        assert google_fetcher._get_google_document.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_fresh_entry_skips_revalidation(self, google_fetcher):
+        """Within the TTL no upstream call is made at all"""
+        google_fetcher.cache_ttl = 60
+        await google_fetcher.fetch_content()
+        await google_fetcher.fetch_content()
+
+        google_fetcher._get_google_revision.assert_not_called()
+        assert google_fetcher.document_cache.hits == 1
+
+    @pytest.mark.asyncio
+    async def test_cached_content_is_copied(self, google_fetcher):
+        """Callers mutating results do not corrupt the cache"""
+        google_fetcher.cache_ttl = 60
+        first = await google_fetcher.fetch_content()
+        first['tips'].clear()
+
+        second = await google_fetcher.fetch_content()
+
+        assert second['tips']
+
+    @pytest.mark.asyncio
+    async def test_unchanged_notion_database_is_revalidated_by_delta_query(self, settings):
+        """An empty delta since the last sync reuses the parsed content"""
+        settings.LIVING_DOC_TYPE = "notion"
+        fetcher = DocumentFetcher(settings)
+        page = {
+            'id': 'page-1',
+            'created_time': '2025-01-01T00:00:00.000Z',
+            'last_edited_time': '2025-01-02T00:00:00.000Z',
+            'properties': {
+                'Title': {'type': 'title', 'title': [{'plain_text': 'Box Breathing'}]},
+                'Category': {'type': 'select', 'select': {'name': 'Tips'}}
+            }
+        }
+        response = Mock(status_code=200, json=Mock(return_value={'results': [page], 'has_more': False}))
+
+        with patch('httpx.AsyncClient') as mock_client:
+            client = AsyncMock()
+            client.post.return_value = response
+            mock_client.return_value.__aenter__.return_value = client
+
+            first = await fetcher.fetch_content()
+            second = await fetcher.fetch_content()
+
+        assert first == second
+        assert first['tips'][0]['title'] == 'Box Breathing'
+        delta_filter = client.post.call_args_list[1].kwargs['json']['filter']
+        assert delta_filter['last_edited_time'] == {'on_or_after': '2025-01-02T00:00:00.000Z'}
+        assert fetcher.document_cache.revalidated == 1
+
+    @pytest.mark.asyncio
+    async def test_url_is_revalidated_with_etag(self, settings):
+        """A 304 for the stored ETag reuses the parsed content"""
+        fetcher = DocumentFetcher(settings)
+        ok = Mock(status_code=200, text="Plain update", headers={'ETag': '"v1"'})
+        not_modified = Mock(status_code=304, text="", headers={})
+
+        with patch('httpx.AsyncClient') as mock_client:
+            client = AsyncMock()
+            client.get.side_effect = [ok, not_modified]
+            mock_client.return_value.__aenter__.return_value = client
+
+            first = await fetcher.fetch_from_url("https://intranet.example/updates")
+            second = await fetcher.fetch_from_url("https://intranet.example/updates")
+
+        assert first == second == {"content": [{"title": "URL Content", "content": "Plain update"}]}
+        assert client.get.call_args_list[1].kwargs['headers'] == {"If-None-Match": '"v1"'}
+
+    @pytest.mark.asyncio
+    async def test_persistent_tier_seeds_revalidation(self, google_fetcher):
+        """A document from the persistent tier is revalidated, not redownloaded"""
+        stored = DocumentCacheEntry.from_payload(DocumentCacheEntry(
+            "google_docs", "doc-1", {'tips': [{'title': 'Stored'}]}, revision='rev-1'
+        ).to_payload())
+        google_fetcher.document_store = Mock()
+        google_fetcher.document_store.load = AsyncMock(return_value=stored)
+        google_fetcher.document_store.save = AsyncMock()
+
+        content = await google_fetcher.fetch_content()
+
+        assert content == {'tips': [{'title': 'Stored'}]}
+        google_fetcher._get_google_document.assert_not_called()
@@ -4,10 +4,14 @@ Unit tests for document fetcher service
 import pytest
 from unittest.mock import Mock, patch, AsyncMock, MagicMock
 from datetime import datetime
+import asyncio
 import json
 import os
 import tempfile
+import time
 
+from halcytone_content_generator.config import Settings
+from halcytone_content_generator.services import document_fetcher as document_fetcher_module
 from halcytone_content_generator.services.document_fetcher import DocumentFetcher
 
 
@@ -17,7 +21,7 @@ class TestDocumentParser:
     @pytest.fixture
     def fetcher(self):
         """Create fetcher for testing (contains parsing methods)"""
-        settings = Mock()
+        settings = Settings()
         settings.LIVING_DOC_TYPE = "internal"
         settings.LIVING_DOC_ID = "test-doc-id"
         settings.GOOGLE_CREDENTIALS_JSON = None
@@ -137,8 +141,8 @@ class TestDocumentFetcher:
 
     @pytest.fixture
     def mock_settings(self):
-        """Mock settings for testing"""
-        settings = Mock()
+        """Settings for testing"""
+        settings = Settings()
         settings.LIVING_DOC_TYPE = "internal"
         settings.LIVING_DOC_ID = "test-doc-id"
         settings.GOOGLE_CREDENTIALS_JSON = '{"type": "service_account", "project_id": "test"}'
@@ -569,5 +573,114 @@ Our mission statement"""
         assert len(result['vision']) > 0
 
 
+class TestMultiSourceFetching:
+    """Test concurrent fetching across several document sources"""
+
+    @pytest.fixture(autouse=True)
+    def reset_breakers(self):
+        document_fetcher_module._source_breakers.clear()
+        yield
+        document_fetcher_module._source_breakers.clear()
+
+    @pytest.fixture
+    def fetcher(self):
+        settings = Settings()
+        settings.LIVING_DOC_TYPE = "google_docs"
+        settings.LIVING_DOC_ID = "test-doc-id"
+        settings.LIVING_DOC_SOURCES = "google_docs, notion,https://intranet.example/updates"
+        settings.LIVING_DOC_SOURCE_TIMEOUT = 0.5
+        settings.DEBUG = False
+        return DocumentFetcher(settings)
+
+    @staticmethod
+    def source(items, delay=0.0, error=None):
+        """A fake source fetch returning categorized items after a delay"""
+        async def fetch(*args, **kwargs):
+            await asyncio.sleep(delay)
+            if error:
+                raise error
+            return items
+        return fetch
+
+    def test_sources_parsed_from_settings(self, fetcher):
+        """Configured sources are split and trimmed"""
+        assert fetcher.sources == ["google_docs", "notion", "https://intranet.example/updates"]
+        assert fetcher.source_timeout == 0.5
+
+    @pytest.mark.asyncio
+    async def test_sources_are_fetched_concurrently(self, fetcher):
+        """Latency is the slowest source, not the sum"""
+        fetcher._fetch_google_docs = self.source({'breathscape': [{'title': 'A', 'content': 'a'}]}, 0.2)
+        fetcher._fetch_notion = self.source({'tips': [{'title': 'B', 'content': 'b'}]}, 0.2)
+        fetcher.fetch_from_url = self.source({'content': [{'title': 'C', 'content': 'c'}]}, 0.2)
+
+        start = time.perf_counter()
+        content = await fetcher.fetch_content()
+        elapsed = time.perf_counter() - start
+
+        assert elapsed < 0.45
+        assert content == {
+            'breathscape': [{'title': 'A', 'content': 'a'}],
+            'tips': [{'title': 'B', 'content': 'b'}],
+            'content': [{'title': 'C', 'content': 'c'}]
+        }
+        assert set(fetcher.last_source_status.values()) == {"ok"}
+
+    @pytest.mark.asyncio
+    async def test_slow_source_returns_partial_results(self, fetcher):
+        """A source past its timeout is skipped"""
+        fetcher._fetch_google_docs = self.source({'breathscape': [{'title': 'A', 'content': 'a'}]})
+        fetcher._fetch_notion = self.source({'tips': [{'title': 'B', 'content': 'b'}]}, delay=5)
+        fetcher.fetch_from_url = self.source({}, error=ValueError("404"))
+
+        content = await fetcher.fetch_all_sources(timeout=0.1)
+
+        assert content == {'breathscape': [{'title': 'A', 'content': 'a'}]}
+        assert fetcher.last_source_status == {
+            "google_docs": "ok",
+            "notion": "timeout",
+            "https://intranet.example/updates": "failed"
+        }
+
+    @pytest.mark.asyncio
+    async def test_duplicate_items_are_merged_once(self, fetcher):
+        """The same item from two sources appears once"""
+        item = {'title': 'Box Breathing', 'content': 'Inhale for 4.'}
+        fetcher._fetch_google_docs = self.source({'tips': [item]})
+        fetcher._fetch_notion = self.source({'tips': [dict(item), {'title': 'New', 'content': 'x'}]})
+
+        content = await fetcher.fetch_all_sources(["google_docs", "notion"])
+
+        assert [i['title'] for i in content['tips']] == ['Box Breathing', 'New']
+
+    @pytest.mark.asyncio
+    async def test_failing_source_trips_its_breaker(self, fetcher):
+        """Repeated failures open the source's circuit so it is no longer called"""
+        calls = []
+
+        async def failing_notion():
+            calls.append(1)
+            raise ConnectionError("down")
+
+        fetcher._fetch_google_docs = self.source({'tips': []})
+        fetcher._fetch_notion = failing_notion
+
+        for _ in range(4):
+            await fetcher.fetch_all_sources(["google_docs", "notion"])
+
+        assert len(calls) == 3
+        assert fetcher.last_source_status["notion"] == "failed"
+
+    @pytest.mark.asyncio
+    async def test_all_sources_failing_raises(self, fetcher):
+        """No content from any source is an error outside debug mode"""
+        fetcher._fetch_google_docs = self.source({}, error=ConnectionError("down"))
+        fetcher._fetch_notion = self.source({}, error=ConnectionError("down"))
+        fetcher.fetch_from_url = self.source({}, error=ConnectionError("down"))
+
+        with pytest.raises(RuntimeError):
+            await fetcher.fetch_content()
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
\ No newline at end of file
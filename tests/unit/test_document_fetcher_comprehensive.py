@@ -8,6 +8,7 @@ from datetime import datetime
 import json
 import httpx
 
+from halcytone_content_generator.config import Settings
 from halcytone_content_generator.services.document_fetcher import DocumentFetcher
 
 
@@ -17,7 +18,7 @@ class TestGoogleDocsIntegration:
     @pytest.fixture
     def google_settings(self):
         """Settings configured for Google Docs"""
-        settings = Mock()
+        settings = Settings()
         settings.LIVING_DOC_TYPE = "google_docs"
         settings.LIVING_DOC_ID = "test-doc-id-123"
         settings.GOOGLE_CREDENTIALS_JSON = json.dumps({
@@ -241,7 +242,7 @@ class TestNotionIntegration:
     @pytest.fixture
     def notion_settings(self):
         """Settings configured for Notion"""
-        settings = Mock()
+        settings = Settings()
         settings.LIVING_DOC_TYPE = "notion"
         settings.LIVING_DOC_ID = "notion-db-id"
         settings.NOTION_API_KEY = "secret_test_key"
@@ -423,7 +424,7 @@ class TestURLFetching:
     @pytest.fixture
     def fetcher(self):
         """Create basic fetcher"""
-        settings = Mock()
+        settings = Settings()
         settings.LIVING_DOC_TYPE = "internal"
         settings.LIVING_DOC_ID = "test"
         settings.DEBUG = True
@@ -531,7 +532,7 @@ class TestContentParsing:
     @pytest.fixture
     def fetcher(self):
         """Create basic fetcher"""
-        settings = Mock()
+        settings = Settings()
         settings.LIVING_DOC_TYPE = "internal"
         settings.LIVING_DOC_ID = "test"
         settings.DEBUG = True
@@ -659,7 +660,7 @@ class TestInternalFetching:
     @pytest.fixture
     def fetcher(self):
         """Create fetcher for internal testing"""
-        settings = Mock()
+        settings = Settings()
         settings.LIVING_DOC_TYPE = "internal"
         settings.LIVING_DOC_ID = "test-internal"
         settings.DEBUG = True
@@ -710,7 +711,7 @@ class TestErrorHandling:
     @pytest.mark.asyncio
     async def test_fetch_content_debug_mode_fallback(self):
         """Test fallback to mock content in debug mode"""
-        settings = Mock()
+        settings = Settings()
         settings.LIVING_DOC_TYPE = "google_docs"
         settings.LIVING_DOC_ID = "test"
         settings.GOOGLE_CREDENTIALS_JSON = '{"invalid": "creds"}'
@@ -727,7 +728,7 @@ class TestErrorHandling:
     @pytest.mark.asyncio
     async def test_fetch_content_production_mode_raises(self):
         """Test that errors are raised in production mode"""
-        settings = Mock()
+        settings = Settings()
         settings.LIVING_DOC_TYPE = "unsupported_type"
         settings.LIVING_DOC_ID = "test"
         settings.DEBUG = False
@@ -740,7 +741,7 @@ class TestErrorHandling:
     @pytest.mark.asyncio
     async def test_fetch_google_docs_partial_data(self):
         """Test handling partial/malformed Google Docs data"""
-        settings = Mock()
+        settings = Settings()
         settings.LIVING_DOC_TYPE = "google_docs"
         settings.LIVING_DOC_ID = "test"
         settings.GOOGLE_CREDENTIALS_JSON = json.dumps({
@@ -763,7 +764,7 @@ class TestHelperMethods:
     @pytest.fixture
     def fetcher(self):
         """Create basic fetcher"""
-        settings = Mock()
+        settings = Settings()
         settings.LIVING_DOC_TYPE = "internal"
         settings.LIVING_DOC_ID = "test"
         settings.DEBUG = True
@@ -0,0 +1,158 @@
+"""
+Unit tests for the streaming living document parser
+"""
+import pytest
+from unittest.mock import AsyncMock, MagicMock, Mock, patch
+
+from halcytone_content_generator.config import Settings
+from halcytone_content_generator.services.document_fetcher import DocumentFetcher
+from halcytone_content_generator.services.document_stream_parser import (
+    StreamingDocumentParser,
+    collect,
+    iter_lines,
+    parse_text
+)
+
+MARKDOWN_DOC = """# Living Document
+
+## Breathscape Updates
+
+**Adaptive Sessions**
+- **Date:** 2025-01-10
+Sessions now adapt to your rhythm.
+
+## Hardware
+
+**Sensor Prototype v2**
+Smaller sensor, longer battery. Café-tested ☕.
+
+## Breathing Tips
+
+**Box Breathing**
+Inhale four, hold four, exhale four.
+"""
+
+STRUCTURED_DOC = """[Tips]
+**Title:** Evening Wind-down
+**Date:** 2025-01-02
+**Content:** Slow exhales before bed.
+[Vision]
+**Title:** Our Mission
+Breathing for everyone."""
+
+FREEFORM_DOC = """
+Sensor update
+The new device ships soon.
+
+
+We believe in calm
+
+Practice daily
+"""
+
+
+async def byte_chunks(data: bytes, size: int):
+    for i in range(0, len(data), size):
+        yield data[i:i + size]
+
+
+async def stream_parse(text: str, size: int, format=None):
+    parser = StreamingDocumentParser(format)
+    lines = iter_lines(byte_chunks(text.encode('utf-8'), size))
+    return collect([item async for item in parser.parse_stream(lines)])
+
+
+def without_dates(categories):
+    return {k: [{f: v for f, v in item.items() if f != 'date'} for item in items]
+            for k, items in categories.items()}
+
+
+class TestStreamingParser:
+    """Test streamed parsing against whole-document parsing"""
+
+    @pytest.fixture
+    def fetcher(self):
+        settings = Settings()
+        settings.LIVING_DOC_TYPE = "internal"
+        settings.LIVING_DOC_SOURCES = ""
+        settings.LIVING_DOC_CACHE_TTL = 0
+        settings.LIVING_DOC_CACHE_PERSISTENT = False
+        settings.NOTION_SNAPSHOT_DIR = ""
+        settings.DEBUG = True
+        return DocumentFetcher(settings)
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("document", [MARKDOWN_DOC, STRUCTURED_DOC, FREEFORM_DOC])
+    @pytest.mark.parametrize("chunk_size", [1, 3, 4096])
+    async def test_chunked_stream_matches_whole_document(self, fetcher, document, chunk_size):
+        """Any chunking of the bytes gives the same items as _parse_content"""
+        streamed = await stream_parse(document, chunk_size)
+
+        assert without_dates(streamed) == without_dates(fetcher._parse_content(document))
+
+    def test_formats_share_item_semantics(self):
+        """Each format yields its items in the expected categories"""
+        markdown = parse_text(MARKDOWN_DOC)
+        structured = parse_text(STRUCTURED_DOC, 'structured')
+        freeform = parse_text(FREEFORM_DOC)
+
+        assert [i['title'] for i in markdown['breathscape']] == ['Adaptive Sessions']
+        assert markdown['hardware'][0]['content'] == 'Smaller sensor, longer battery. Café-tested ☕.'
+        assert [i['title'].strip() for i in structured['tips']] == ['Evening Wind-down']
+        assert structured['vision'][0]['content'] == 'Breathing for everyone.'
+        assert [i['title'] for i in freeform['hardware']] == ['Sensor update']
+        assert [i['title'] for i in freeform['vision']] == ['We believe in calm']
+
+    def test_items_are_emitted_as_soon_as_complete(self):
+        """Completed items come out before the rest of the document is read"""
+        parser = StreamingDocumentParser('structured')
+
+        assert parser.feed('[Tips]') == []
+        assert parser.feed('**Title:** First') == []
+        emitted = parser.feed('[Tips]')
+
+        assert [item['title'].strip() for _, item in emitted] == ['First']
+
+    def test_detection_window_falls_back_to_freeform(self):
+        """Without markdown indicators in the window the format is fixed"""
+        parser = StreamingDocumentParser(detection_window=10)
+
+        parser.feed('plain words here')
+
+        assert parser.format == 'freeform'
+
+    def test_unknown_format_is_rejected(self):
+        with pytest.raises(ValueError):
+            StreamingDocumentParser('html')
+
+    @pytest.mark.asyncio
+    async def test_stream_document_from_file(self, fetcher, tmp_path):
+        """Local files are parsed from a chunked byte stream"""
+        path = tmp_path / "living.md"
+        path.write_text(MARKDOWN_DOC, encoding='utf-8')
+
+        items = [item async for item in fetcher.stream_document(str(path))]
+
+        assert [category for category, _ in items] == ['breathscape', 'hardware', 'tips']
+
+    @pytest.mark.asyncio
+    async def test_stream_document_from_url(self, fetcher):
+        """URLs are parsed from the response body as it arrives"""
+        response = MagicMock()
+        response.encoding = 'utf-8'
+        response.raise_for_status = Mock()
+        response.aiter_bytes = lambda: byte_chunks(STRUCTURED_DOC.encode('utf-8'), 16)
+        stream = MagicMock()
+        stream.__aenter__ = AsyncMock(return_value=response)
+        stream.__aexit__ = AsyncMock(return_value=False)
+
+        with patch('httpx.AsyncClient') as mock_client:
+            client = MagicMock()
+            client.stream.return_value = stream
+            mock_client.return_value.__aenter__.return_value = client
+
+            content = await fetcher.fetch_streamed("https://intranet.example/living.txt", 'structured')
+
+        client.stream.assert_called_once_with("GET", "https://intranet.example/living.txt")
+        assert [item['title'].strip() for item in content['tips']] == ['Evening Wind-down']
+        assert [item['title'].strip() for item in content['vision']] == ['Our Mission']
@@ -296,30 +296,36 @@ class TestDryRunIntegration:
 
     def test_batch_scheduling_dry_run(self, client):
         """Test batch scheduling in dry-run mode"""
+        batch_id = client.post("/api/v1/batch/generateBatch", params={
+            "period": "day",
+            "channels": ["web"],
+            "dry_run": True
+        }).json()["batch_id"]
+
         # Test dry-run scheduling
-        response = client.post("/api/v1/batch/schedule/test-batch-dry-run", json={
-            "batch_id": "test-batch-dry-run",
+        response = client.post(f"/api/v1/batch/schedule/{batch_id}", json={
+            "batch_id": batch_id,
             "schedule_all": True,
             "dry_run": True
         })
 
         assert response.status_code == 200
         data = response.json()
-        assert data["batch_id"] == "test-batch-dry-run"
+        assert data["batch_id"] == batch_id
         assert data["dry_run"] is True
         assert "dry_run" in data["schedule_summary"]
         assert data["schedule_summary"]["dry_run"] is True
 
         # Test non-dry-run scheduling
-        response = client.post("/api/v1/batch/schedule/test-batch-live", json={
-            "batch_id": "test-batch-live",
+        response = client.post(f"/api/v1/batch/schedule/{batch_id}", json={
+            "batch_id": batch_id,
             "schedule_all": True,
             "dry_run": False
         })
 
         assert response.status_code == 200
         data = response.json()
-        assert data["batch_id"] == "test-batch-live"
+        assert data["batch_id"] == batch_id
         assert data["dry_run"] is False
 
     def test_dry_run_with_validation_failures(self, client, mock_content_data):
@@ -535,10 +541,11 @@ class TestDryRunIntegration:
             assert data["status"] == "completed"
             assert data["dry_run"] is True
             assert all(item["content"]["dry_run"] for item in data["items"])
+            batch_id = data["batch_id"]
 
             # Step 3: Test batch scheduling in dry-run
-            response = client.post("/api/v1/batch/schedule/comprehensive-test", json={
-                "batch_id": "comprehensive-test",
+            response = client.post(f"/api/v1/batch/schedule/{batch_id}", json={
+                "batch_id": batch_id,
                 "schedule_all": True,
                 "dry_run": True
             })
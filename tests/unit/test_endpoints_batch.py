@@ -2,7 +2,7 @@
 Unit tests for batch content generation endpoints
 """
 import pytest
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from unittest.mock import AsyncMock, Mock, patch
 from fastapi.testclient import TestClient
 
@@ -261,10 +261,16 @@ class TestBatchEndpoints:
 
     def test_schedule_batch_dry_run(self, client):
         """Test batch scheduling in dry run mode"""
+        generated = client.post(
+            "/api/v1/batch/generateBatch",
+            params={"period": "day", "channels": ["web"], "dry_run": True}
+        ).json()
+        batch_id = generated["batch_id"]
+
         response = client.post(
-            "/api/v1/batch/schedule/test-batch-123",
+            f"/api/v1/batch/schedule/{batch_id}",
             json={
-                "batch_id": "test-batch-123",
+                "batch_id": batch_id,
                 "schedule_all": True,
                 "dry_run": True
             }
@@ -273,16 +279,27 @@ class TestBatchEndpoints:
         assert response.status_code == 200
         data = response.json()
         assert data["dry_run"] is True
-        assert data["batch_id"] == "test-batch-123"
+        assert data["batch_id"] == batch_id
         assert "dry_run" in data["schedule_summary"]
+        assert data["scheduled_items"] == [item["item_id"] for item in generated["items"]]
+        assert client.get(f"/api/v1/batch/status/{batch_id}").json()["status"] == "completed"
 
     def test_schedule_batch_success(self, client):
         """Test successful batch scheduling"""
+        generated = client.post(
+            "/api/v1/batch/generateBatch",
+            params={"period": "day", "channels": ["web"], "dry_run": True}
+        ).json()
+        batch_id = generated["batch_id"]
+        first_item = generated["items"][0]["item_id"]
+        custom_time = "2030-01-01T09:00:00"
+
         response = client.post(
-            "/api/v1/batch/schedule/test-batch-456",
+            f"/api/v1/batch/schedule/{batch_id}",
             json={
-                "batch_id": "test-batch-456",
+                "batch_id": batch_id,
                 "schedule_all": True,
+                "custom_schedule": {first_item: custom_time},
                 "dry_run": False
             }
         )
@@ -290,22 +307,88 @@ class TestBatchEndpoints:
         assert response.status_code == 200
         data = response.json()
         assert data["dry_run"] is False
-        assert data["batch_id"] == "test-batch-456"
-        assert len(data["scheduled_items"]) > 0
-        assert data["next_publish_time"] is not None
+        assert data["batch_id"] == batch_id
+        assert len(data["scheduled_items"]) == generated["total_items"]
+        assert data["next_publish_time"] == generated["items"][1]["scheduled_for"]
+        status = client.get(f"/api/v1/batch/status/{batch_id}").json()
+        assert status["items"][0]["scheduled_for"] == custom_time
+
+    def test_schedule_batch_timezone_aware_custom_time(self, client):
+        """Aware custom times are stored as naive local time like the planned times"""
+        generated = client.post(
+            "/api/v1/batch/generateBatch",
+            params={"period": "day", "channels": ["web"], "dry_run": True}
+        ).json()
+        batch_id = generated["batch_id"]
+        first_item = generated["items"][0]["item_id"]
+
+        response = client.post(
+            f"/api/v1/batch/schedule/{batch_id}",
+            json={
+                "batch_id": batch_id,
+                "schedule_all": True,
+                "custom_schedule": {first_item: "2030-01-01T09:00:00Z"},
+                "dry_run": False
+            }
+        )
+
+        assert response.status_code == 200
+        expected = datetime(2030, 1, 1, 9, tzinfo=timezone.utc).astimezone().replace(tzinfo=None)
+        status = client.get(f"/api/v1/batch/status/{batch_id}").json()
+        assert status["items"][0]["scheduled_for"] == expected.isoformat()
+
+    def test_schedule_unknown_batch(self, client):
+        """Test scheduling a batch that was never generated"""
+        response = client.post(
+            "/api/v1/batch/schedule/test-batch-456",
+            json={"batch_id": "test-batch-456", "schedule_all": True, "dry_run": False}
+        )
+
+        assert response.status_code == 404
+
+    def test_schedule_unknown_items(self, client):
+        """Test scheduling items that are not part of the batch"""
+        batch_id = client.post(
+            "/api/v1/batch/generateBatch",
+            params={"period": "day", "channels": ["web"], "dry_run": True}
+        ).json()["batch_id"]
+
+        response = client.post(
+            f"/api/v1/batch/schedule/{batch_id}",
+            json={
+                "batch_id": batch_id,
+                "schedule_all": False,
+                "custom_schedule": {"not-an-item": "2030-01-01T09:00:00"}
+            }
+        )
+
+        assert response.status_code == 400
 
     def test_get_batch_status(self, client):
         """Test getting batch status"""
-        response = client.get("/api/v1/batch/status/test-batch-789")
+        generated = client.post(
+            "/api/v1/batch/generateBatch",
+            params={"period": "day", "channels": ["email", "web"], "dry_run": True}
+        ).json()
+
+        response = client.get(f"/api/v1/batch/status/{generated['batch_id']}")
 
         assert response.status_code == 200
         data = response.json()
-        assert data["batch_id"] == "test-batch-789"
+        assert data["batch_id"] == generated["batch_id"]
         assert data["status"] in ["pending", "running", "completed", "failed"]
-        assert "items_total" in data
-        assert "items_published" in data
-        assert "items_pending" in data
+        assert data["items_total"] == 6
+        assert data["items_published"] == generated["total_items"]
+        assert data["items_pending"] == 0
         assert "items_failed" in data
+        assert [item["index"] for item in data["items"]] == list(range(6))
+        assert {item["channel"] for item in data["items"]} == {"email", "web"}
+
+    def test_get_batch_status_unknown_batch(self, client):
+        """Test status of a batch that was never generated"""
+        response = client.get("/api/v1/batch/status/test-batch-789")
+
+        assert response.status_code == 404
 
     def test_generate_batch_period_variations(self, client, mock_assembler, sample_newsletter):
         """Test different period types affect item count"""
@@ -453,4 +536,82 @@ class TestBatchEndpoints:
 
         if data["scheduling_plan"] and "distribution" in data["scheduling_plan"]:
             distribution = data["scheduling_plan"]["distribution"]
-            assert "hourly_distribution" in distribution or "total_scheduled" in distribution
\ No newline at end of file
+            assert "hourly_distribution" in distribution or "total_scheduled" in distribution
+
+
+class TestBatchScoreEndpoint:
+    """Test batch quality scoring endpoint"""
+
+    @pytest.fixture
+    def client(self):
+        """Create test client with a thread-backed scorer"""
+        from concurrent.futures import ThreadPoolExecutor
+        from halcytone_content_generator.api.endpoints_batch import get_quality_scorer
+        from halcytone_content_generator.services.content_quality_scorer import ContentQualityScorer
+
+        scorer = ContentQualityScorer()
+        scorer._executor = ThreadPoolExecutor(max_workers=2)
+        app.dependency_overrides[get_quality_scorer] = lambda: scorer
+        yield TestClient(app)
+        app.dependency_overrides.pop(get_quality_scorer, None)
+        scorer.shutdown()
+
+    def test_score_batch_returns_results_in_order(self, client):
+        """Drafts are scored and returned in request order"""
+        response = client.post(
+            "/api/v1/batch/score",
+            json={
+                "contents": ["Discover calm today!", "Plain text.", "# Guide\n\nBreathe now."],
+                "content_type": "email"
+            }
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["content_type"] == "email"
+        assert data["total_items"] == 3
+        assert [item["index"] for item in data["results"]] == [0, 1, 2]
+        assert "readability" in data["results"][0]["category_scores"]
+        assert 0 <= data["average_score"] <= 100
+
+    def test_score_batch_streaming(self, client):
+        """Streaming mode returns one JSON line per draft"""
+        import json
+
+        response = client.post(
+            "/api/v1/batch/score",
+            params={"stream": True},
+            json={"contents": ["One draft.", "Another draft!"], "content_type": "web"}
+        )
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("application/x-ndjson")
+        lines = [json.loads(line) for line in response.text.splitlines() if line]
+        assert sorted(line["index"] for line in lines) == [0, 1]
+
+    def test_score_batch_invalid_content_type(self, client):
+        """Unknown content types are rejected"""
+        response = client.post(
+            "/api/v1/batch/score",
+            json={"contents": ["Draft"], "content_type": "fax"}
+        )
+
+        assert response.status_code == 400
+        assert "content_type" in response.json()["detail"]
+
+    def test_score_batch_too_many_drafts(self, client):
+        """Batch size is limited by settings"""
+        with patch('halcytone_content_generator.api.endpoints_batch.get_settings') as mock_settings:
+            mock_settings.return_value = Mock(QUALITY_SCORING_BATCH_MAX_ITEMS=2)
+            response = client.post(
+                "/api/v1/batch/score",
+                json={"contents": ["a", "b", "c"], "content_type": "web"}
+            )
+
+        assert response.status_code == 400
+
+    def test_score_batch_requires_contents(self, client):
+        """Empty batches fail validation"""
+        response = client.post("/api/v1/batch/score", json={"contents": []})
+
+        assert response.status_code == 422
@@ -0,0 +1,101 @@
+"""
+Unit tests for streaming AI enhancement endpoints
+"""
+import json
+
+import pytest
+from fastapi.testclient import TestClient
+
+from halcytone_content_generator.main import app
+from halcytone_content_generator.api.endpoints_streaming import get_enhancer
+from halcytone_content_generator.services.ai_content_enhancer import (
+    EnhancementMode, EnhancementResult
+)
+
+
+class FakeStreamingEnhancer:
+    """Enhancer stub that streams a fixed completion"""
+
+    def __init__(self, pieces):
+        self.pieces = pieces
+        self.requests = []
+
+    async def enhance_content_stream(self, request):
+        self.requests.append(request)
+        for piece in self.pieces:
+            yield piece
+        yield EnhancementResult(
+            original_content=request.content,
+            enhanced_content="".join(self.pieces),
+            mode=request.mode,
+            confidence_score=0.85,
+            suggestions=["Add a clear call-to-action for better engagement"],
+            metadata={"streamed": True}
+        )
+
+
+def parse_sse(body: str):
+    """Split an event stream body into (event, data) pairs"""
+    events = []
+    for block in body.strip().split("\n\n"):
+        lines = dict(line.split(": ", 1) for line in block.split("\n"))
+        events.append((lines["event"], json.loads(lines["data"])))
+    return events
+
+
+class TestStreamingEndpoints:
+    """Test SSE and WebSocket enhancement streaming"""
+
+    @pytest.fixture
+    def enhancer(self):
+        return FakeStreamingEnhancer(["Breathe ", "slowly."])
+
+    @pytest.fixture
+    def client(self, enhancer):
+        app.dependency_overrides[get_enhancer] = lambda: enhancer
+        yield TestClient(app)
+        app.dependency_overrides.pop(get_enhancer, None)
+
+    def test_sse_streams_chunks_then_result(self, client, enhancer):
+        """The SSE endpoint emits chunk events followed by one result event"""
+        response = client.post("/api/v2/enhance/stream", json={
+            "content": "Breathe slow.",
+            "content_type": "email",
+            "mode": "increase_engagement",
+            "keywords": ["breathing"]
+        })
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/event-stream")
+        events = parse_sse(response.text)
+        assert events[:2] == [("chunk", {"text": "Breathe "}), ("chunk", {"text": "slowly."})]
+        assert events[2][0] == "result"
+        assert events[2][1]["enhanced_content"] == "Breathe slowly."
+        assert events[2][1]["mode"] == "increase_engagement"
+        assert enhancer.requests[0].mode == EnhancementMode.INCREASE_ENGAGEMENT
+        assert enhancer.requests[0].keywords == ["breathing"]
+
+    def test_sse_rejects_unknown_mode(self, client):
+        """An unknown enhancement mode is a 400"""
+        response = client.post("/api/v2/enhance/stream", json={
+            "content": "Breathe slow.",
+            "mode": "shout"
+        })
+
+        assert response.status_code == 400
+        assert "mode must be one of" in response.json()["detail"]
+
+    def test_websocket_streams_each_request(self, client):
+        """Each message on the socket produces chunks and a result"""
+        with client.websocket_connect("/api/v2/enhance/ws") as websocket:
+            websocket.send_text(json.dumps({"content": "Breathe slow.", "content_type": "web"}))
+            messages = [websocket.receive_json() for _ in range(3)]
+
+            websocket.send_text(json.dumps({"content": "Breathe slow.", "content_type": "fax"}))
+            error = websocket.receive_json()
+
+        assert [m["type"] for m in messages] == ["chunk", "chunk", "result"]
+        assert messages[0]["data"]["text"] == "Breathe "
+        assert messages[2]["data"]["confidence_score"] == 0.85
+        assert error["type"] == "error"
+        assert "content_type must be one of" in error["data"]["message"]
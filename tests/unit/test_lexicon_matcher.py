@@ -0,0 +1,93 @@
+"""
+Unit tests for the Aho-Corasick lexicon matcher
+"""
+from halcytone_content_generator.services.lexicon_matcher import LexiconMatcher, tokenize_term
+
+
+class TestTokenizeTerm:
+    """Test lexicon term tokenization"""
+
+    def test_single_word(self):
+        assert tokenize_term("Amazing") == ("amazing",)
+
+    def test_multi_word_and_punctuation(self):
+        assert tokenize_term("don't wait") == ("don", "t", "wait")
+        assert tokenize_term("self-care") == ("self", "care")
+
+    def test_empty_term(self):
+        assert tokenize_term("  ") == ()
+
+
+class TestLexiconMatcher:
+    """Test multi-lexicon matching"""
+
+    def test_counts_each_lexicon_in_one_scan(self):
+        matcher = LexiconMatcher({
+            'emotional': ['amazing', 'love'],
+            'power': ['you', 'free'],
+        })
+
+        hits = matcher.match_text("You will love this. Amazing! You get it free.")
+
+        assert hits['emotional'] == {'amazing': 1, 'love': 1}
+        assert hits['power'] == {'you': 2, 'free': 1}
+
+    def test_word_boundaries(self):
+        matcher = LexiconMatcher({'story': ['once'], 'sensory': ['see']})
+
+        hits = matcher.match_text("Concentrate on seeing the nonce value")
+
+        assert hits['story'] == {}
+        assert hits['sensory'] == {}
+
+    def test_multi_word_terms(self):
+        matcher = LexiconMatcher({'urgency': ['limited time', "don't wait", 'act fast']})
+
+        hits = matcher.match_text("Limited time offer. Don't wait, act\nfast!")
+
+        assert hits['urgency'] == {'limited time': 1, "don't wait": 1, 'act fast': 1}
+
+    def test_overlapping_terms_across_lexicons(self):
+        matcher = LexiconMatcher({
+            'power': ['limited'],
+            'urgency': ['limited time'],
+            'brand': ['health', 'mental health'],
+        })
+
+        hits = matcher.match_text("A limited time look at mental health")
+
+        assert hits['power'] == {'limited': 1}
+        assert hits['urgency'] == {'limited time': 1}
+        assert hits['brand'] == {'health': 1, 'mental health': 1}
+
+    def test_failure_links_recover_partial_matches(self):
+        matcher = LexiconMatcher({'phrases': ['let me tell you', 'me tell', 'tell you']})
+
+        hits = matcher.match_text("let me let me tell you")
+
+        assert hits['phrases'] == {'let me tell you': 1, 'me tell': 1, 'tell you': 1}
+
+    def test_same_term_in_several_lexicons(self):
+        matcher = LexiconMatcher({'power': ['discover'], 'curiosity': ['discover']})
+
+        hits = matcher.match(["discover", "more"])
+
+        assert hits['power'] == {'discover': 1}
+        assert hits['curiosity'] == {'discover': 1}
+
+    def test_no_matches_returns_every_lexicon(self):
+        matcher = LexiconMatcher({'a': ['alpha'], 'b': []})
+
+        assert matcher.match([]) == {'a': {}, 'b': {}}
+        assert matcher.state_count == 2
+
+    def test_scan_resumes_across_pieces(self):
+        """Scanning pieces with carried state equals one scan of the whole text"""
+        matcher = LexiconMatcher({'urgency': ["limited time", "act now"], 'power': ["time"]})
+        first, state = matcher.scan(["a", "limited"])
+        second, state = matcher.scan(["time", "to", "act"], state)
+        third, _ = matcher.scan(["now"], state)
+
+        assert first == {}
+        assert second == {'urgency': {"limited time": 1}, 'power': {"time": 1}}
+        assert third == {'urgency': {"act now": 1}}
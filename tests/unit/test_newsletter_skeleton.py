@@ -0,0 +1,163 @@
+"""
+Unit tests for personalized newsletter rendering from a compiled skeleton
+"""
+import pytest
+from unittest.mock import Mock, patch, AsyncMock
+from jinja2 import Template
+
+from halcytone_content_generator.services.content_assembler_v2 import EnhancedContentAssembler
+from halcytone_content_generator.services.crm_client_v2 import EnhancedCRMClient, EmailRecipient
+from halcytone_content_generator.services.newsletter_skeleton import NewsletterSkeleton
+from halcytone_content_generator.templates.email_templates import get_email_template
+
+NEWSLETTER_DATA = {
+    'subject': 'Halcytone Monthly',
+    'month_year': 'May 2025',
+    'intro_text': 'Welcome to this month\'s update.',
+    'stats': [{'value': '50K+', 'label': 'Sessions'}],
+    'breathscape_updates': [{'title': 'Adaptive Sessions', 'content': 'Sessions now adapt to you.'}],
+    'hardware_updates': [{'title': 'Sensor v2', 'content': 'Smaller and lighter.'}],
+    'tips': [{'title': 'Box Breathing', 'content': 'Inhale four, hold four.'}],
+    'call_to_action': {'title': 'Join', 'text': 'Try it', 'link': 'https://halcytone.com/join', 'button_text': 'Go'},
+    'vision': 'Breathing for everyone.',
+    'website_url': 'https://halcytone.com'
+}
+
+
+def merge_vars(name, user_id="u1"):
+    return {
+        'name': name,
+        'email': f"{user_id}@test.com",
+        'preferences_url': f"https://halcytone.com/preferences?u={user_id}",
+        'unsubscribe_url': f"https://halcytone.com/unsubscribe?u={user_id}"
+    }
+
+
+def full_render(template_name, values):
+    """Reference: render the whole template per recipient and convert to text"""
+    html = Template(get_email_template(template_name)).render(**NEWSLETTER_DATA, **values)
+    return {'html': html, 'text': EnhancedContentAssembler._create_html2text().handle(html)}
+
+
+class TestNewsletterSkeleton:
+    """Test skeleton compilation and per-recipient filling"""
+
+    @pytest.mark.parametrize("template_name", ['modern', 'minimal', 'plain', 'breathscape'])
+    @pytest.mark.parametrize("name", ['Ann', 'Zoë Smith ☕', '  spaced   out ', '1. <b>Bold</b> & co'])
+    def test_skeleton_matches_full_render(self, template_name, name):
+        """Filled skeletons equal a full render for plain and html-sensitive values"""
+        skeleton = NewsletterSkeleton(template_name, NEWSLETTER_DATA)
+        values = merge_vars(name)
+        values['unsubscribe_url'] += '&list=monthly'
+
+        assert skeleton.is_static
+        assert skeleton.render(values) == full_render(template_name, values)
+
+    def test_unsubscribe_link_is_a_slot(self):
+        skeleton = NewsletterSkeleton('modern', NEWSLETTER_DATA)
+
+        html = skeleton.render(merge_vars('Ann', user_id='u42'))['html']
+
+        assert 'href="https://halcytone.com/unsubscribe?u=u42"' in html
+        assert 'href="https://halcytone.com/preferences?u=u42"' in html
+
+    @pytest.mark.parametrize("template_str", [
+        '<p>{% if name %}Hi {{ name }}{% else %}Hello{% endif %}</p>',
+        '<p>Hi {{ name|upper }}</p>'
+    ])
+    def test_slots_in_logic_fall_back_to_full_render(self, template_str):
+        """Slots used in conditions or filters are not precompiled"""
+        with patch('halcytone_content_generator.services.newsletter_skeleton.get_email_template',
+                   return_value=template_str):
+            skeleton = NewsletterSkeleton('custom', {})
+
+        assert not skeleton.is_static
+        assert skeleton.render({'name': 'ann'})['html'] == Template(template_str).render(name='ann')
+        assert skeleton.render({})['html'] == Template(template_str).render(name='')
+
+    def test_unknown_template_is_rejected(self):
+        with pytest.raises(ValueError):
+            NewsletterSkeleton('missing', NEWSLETTER_DATA)
+
+    def test_iter_rendered_is_lazy(self):
+        """Recipients are consumed one at a time as bodies are requested"""
+        skeleton = NewsletterSkeleton('minimal', NEWSLETTER_DATA)
+        consumed = []
+
+        def recipients():
+            for i in range(1000):
+                consumed.append(i)
+                yield f"user{i}"
+
+        rendered = skeleton.iter_rendered(recipients(), lambda r: merge_vars(r, user_id=r))
+        first = [next(rendered) for _ in range(3)]
+
+        assert len(consumed) == 3
+        assert [recipient for recipient, _ in first] == ['user0', 'user1', 'user2']
+        assert 'u=user2' in first[2][1]['html']
+
+    @pytest.mark.asyncio
+    async def test_stream_rendered(self):
+        skeleton = NewsletterSkeleton('plain', NEWSLETTER_DATA)
+
+        bodies = [body async for _, body in skeleton.stream_rendered(
+            (f"user{i}" for i in range(1200)), lambda r: merge_vars(r, user_id=r))]
+
+        assert len(bodies) == 1200
+        assert 'u=user1199' in bodies[-1]['text']
+
+
+class TestPersonalizedBulkSend:
+    """Test personalized bodies in the CRM batch payload"""
+
+    @pytest.fixture
+    def crm_client(self):
+        settings = Mock()
+        settings.CRM_BASE_URL = "http://test-crm.com"
+        settings.CRM_API_KEY = "test-key"
+        settings.DRY_RUN_MODE = False
+        settings.DRY_RUN = False
+        settings.USE_MOCK_SERVICES = False
+        settings.ENVIRONMENT = "development"
+        settings.EMAIL_BATCH_SIZE = 2
+        settings.EMAIL_RATE_LIMIT = 100
+        settings.EMAIL_MAX_IN_FLIGHT_BATCHES = 4
+        settings.CIRCUIT_BREAKER_FAILURE_THRESHOLD = 5
+        settings.CIRCUIT_BREAKER_RECOVERY_TIMEOUT = 60
+        settings.MAX_RETRIES = 3
+        settings.RETRY_MAX_WAIT = 60
+        return EnhancedCRMClient(settings)
+
+    @pytest.mark.asyncio
+    async def test_each_recipient_gets_its_own_body(self, crm_client):
+        recipients = [EmailRecipient(email=f"user{i}@test.com", name=f"User {i}", user_id=f"id{i}")
+                      for i in range(3)]
+        skeleton = NewsletterSkeleton('modern', NEWSLETTER_DATA)
+        response = Mock(json=Mock(return_value={'successful': 2, 'failed': 0}), raise_for_status=Mock())
+
+        with patch.object(crm_client, '_fetch_recipients', AsyncMock(return_value=recipients)), \
+                patch('httpx.AsyncClient') as mock_client:
+            client = AsyncMock()
+            client.post.return_value = response
+            mock_client.return_value.__aenter__.return_value = client
+
+            job = await crm_client.send_newsletter_bulk(
+                subject="Monthly", html="<p>Shared</p>", text="Shared", skeleton=skeleton
+            )
+
+        assert job.status == "completed"
+        payloads = [call.kwargs['json'] for call in client.post.call_args_list]
+        entries = [entry for payload in payloads for entry in payload['recipients']]
+        assert [len(payload['recipients']) for payload in payloads] == [2, 1]
+        for i, entry in enumerate(entries):
+            assert f"unsubscribe?u=id{i}" in entry['html']
+            assert f"unsubscribe?u=id{i}" in entry['text']
+            assert entry == {**crm_client._recipient_payload(recipients[i]),
+                             **skeleton.render(entry['merge_vars'])}
+
+    def test_payload_without_skeleton_is_unchanged(self, crm_client):
+        recipient = EmailRecipient(email="a@test.com", name="A", user_id="id1")
+
+        payload = crm_client._recipient_payload(recipient)
+
+        assert set(payload) == {'email', 'name', 'user_id', 'merge_vars'}
@@ -0,0 +1,185 @@
+"""
+Unit tests for Notion pagination and delta sync
+"""
+import pytest
+from unittest.mock import AsyncMock, Mock, patch
+
+from halcytone_content_generator.config import Settings
+from halcytone_content_generator.services.document_fetcher import DocumentFetcher
+from halcytone_content_generator.services.notion_sync import (
+    NotionSnapshot,
+    NotionSnapshotStore
+)
+
+
+def notion_page(page_id, title, category="Tips", edited="2025-01-01T00:00:00.000Z",
+                created="2025-01-01T00:00:00.000Z", **extra):
+    """Build a Notion page object"""
+    return {
+        'id': page_id,
+        'created_time': created,
+        'last_edited_time': edited,
+        'properties': {
+            'Title': {'type': 'title', 'title': [{'plain_text': title}]},
+            'Category': {'type': 'select', 'select': {'name': category}}
+        },
+        **extra
+    }
+
+
+def query_response(results, next_cursor=None):
+    """Build a database query response"""
+    return Mock(status_code=200, json=Mock(return_value={
+        'results': results,
+        'has_more': next_cursor is not None,
+        'next_cursor': next_cursor
+    }))
+
+
+class TestNotionSnapshot:
+    """Test snapshot merging and persistence"""
+
+    def test_apply_tracks_watermark_and_changes(self):
+        """Merging pages advances the watermark and reports content changes"""
+        snapshot = NotionSnapshot("db")
+        item = {'title': 'Box Breathing'}
+
+        assert snapshot.apply("p1", "2025-01-01", "2025-01-03", item) is True
+        assert snapshot.apply("p1", "2025-01-01", "2025-01-03", dict(item)) is False
+        assert snapshot.apply("p2", "2025-01-02", "2025-01-02", {'title': 'Other'}) is True
+        assert snapshot.watermark == "2025-01-03"
+
+    def test_items_are_newest_first(self):
+        """Items come back in created_time descending order"""
+        snapshot = NotionSnapshot("db")
+        snapshot.apply("old", "2025-01-01", "2025-01-01", {'title': 'Old'})
+        snapshot.apply("new", "2025-02-01", "2025-02-01", {'title': 'New'})
+        snapshot.apply("empty", "2025-03-01", "2025-03-01", None)
+
+        assert [item['title'] for item in snapshot.items()] == ['New', 'Old']
+
+    def test_store_persists_to_disk(self, tmp_path):
+        """A snapshot saved to a directory is reloaded by a fresh store"""
+        snapshot = NotionSnapshot("db/1", full_synced_at=1.0)
+        snapshot.apply("p1", "2025-01-01", "2025-01-02", {'title': 'Box Breathing'})
+        NotionSnapshotStore(str(tmp_path)).save(snapshot)
+
+        loaded = NotionSnapshotStore(str(tmp_path)).load("db/1")
+
+        assert loaded == snapshot
+        assert [p.name for p in tmp_path.iterdir()] == ["notion_db_1.json"]
+
+
+class TestNotionDeltaSync:
+    """Test paginated and incremental Notion fetching"""
+
+    @pytest.fixture
+    def fetcher(self):
+        settings = Settings()
+        settings.LIVING_DOC_TYPE = "notion"
+        settings.LIVING_DOC_SOURCES = ""
+        settings.LIVING_DOC_CACHE_TTL = 0
+        settings.LIVING_DOC_CACHE_PERSISTENT = False
+        settings.NOTION_API_KEY = "notion-key"
+        settings.NOTION_DATABASE_ID = "db-1"
+        settings.NOTION_SNAPSHOT_DIR = ""
+        settings.NOTION_FULL_SYNC_INTERVAL = 86400
+        settings.DEBUG = False
+        return DocumentFetcher(settings)
+
+    @pytest.fixture
+    def client(self):
+        with patch('httpx.AsyncClient') as mock_client:
+            client = AsyncMock()
+            mock_client.return_value.__aenter__.return_value = client
+            yield client
+
+    @pytest.mark.asyncio
+    async def test_full_sync_follows_cursors(self, fetcher, client):
+        """Every page of results is fetched using next_cursor"""
+        client.post.side_effect = [
+            query_response([notion_page("p1", "First")], next_cursor="c1"),
+            query_response([notion_page("p2", "Second", category="Hardware")])
+        ]
+
+        content = await fetcher.fetch_content()
+
+        assert [item['title'] for item in content['tips']] == ['First']
+        assert [item['title'] for item in content['hardware']] == ['Second']
+        bodies = [call.kwargs['json'] for call in client.post.call_args_list]
+        assert 'start_cursor' not in bodies[0]
+        assert bodies[1]['start_cursor'] == "c1"
+        assert 'filter' not in bodies[0]
+
+    @pytest.mark.asyncio
+    async def test_delta_sync_merges_only_changes(self, fetcher, client):
+        """Later syncs query from the watermark and merge edited pages"""
+        client.post.side_effect = [
+            query_response([
+                notion_page("p1", "First", edited="2025-01-01T00:00:00.000Z"),
+                notion_page("p2", "Second", edited="2025-01-02T00:00:00.000Z")
+            ]),
+            query_response([
+                notion_page("p2", "Second (edited)", edited="2025-01-05T00:00:00.000Z"),
+                notion_page("p3", "Third", edited="2025-01-05T00:00:00.000Z",
+                            created="2025-01-05T00:00:00.000Z")
+            ])
+        ]
+
+        await fetcher.fetch_content()
+        with patch.object(fetcher, '_parse_notion_page', wraps=fetcher._parse_notion_page) as parse:
+            content = await fetcher.fetch_content()
+
+        delta_query = client.post.call_args_list[1].kwargs['json']
+        assert delta_query['filter'] == {
+            'timestamp': 'last_edited_time',
+            'last_edited_time': {'on_or_after': '2025-01-02T00:00:00.000Z'}
+        }
+        assert parse.call_count == 2
+        assert [item['title'] for item in content['tips']] == ['Third', 'First', 'Second (edited)']
+
+    @pytest.mark.asyncio
+    async def test_archived_pages_are_removed(self, fetcher, client):
+        """Archived pages returned by a delta drop out of the snapshot"""
+        client.post.side_effect = [
+            query_response([notion_page("p1", "First"), notion_page("p2", "Second")]),
+            query_response([notion_page("p2", "Second", edited="2025-01-03T00:00:00.000Z", archived=True)])
+        ]
+
+        await fetcher.fetch_content()
+        content = await fetcher.fetch_content()
+
+        assert [item['title'] for item in content['tips']] == ['First']
+
+    @pytest.mark.asyncio
+    async def test_failed_delta_keeps_previous_snapshot(self, fetcher, client):
+        """A sync that fails part way does not corrupt the stored snapshot"""
+        client.post.side_effect = [
+            query_response([notion_page("p1", "First")]),
+            query_response([notion_page("p1", "Changed", edited="2025-01-03T00:00:00.000Z")],
+                           next_cursor="c1"),
+            ConnectionError("Notion unavailable")
+        ]
+
+        await fetcher._load_notion(None)
+        with pytest.raises(ConnectionError):
+            await fetcher._load_notion(None)
+
+        snapshot = fetcher.notion_snapshots.load("db-1")
+        assert snapshot.items()[0]['title'] == 'First'
+        assert snapshot.watermark == "2025-01-01T00:00:00.000Z"
+
+    @pytest.mark.asyncio
+    async def test_full_resync_when_interval_passed(self, fetcher, client):
+        """A due full resync drops pages deleted since the last one"""
+        client.post.side_effect = [
+            query_response([notion_page("p1", "First"), notion_page("p2", "Second")]),
+            query_response([notion_page("p1", "First")])
+        ]
+
+        await fetcher.fetch_content()
+        fetcher.notion_full_sync_interval = 0
+        content = await fetcher.fetch_content()
+
+        assert 'filter' not in client.post.call_args_list[1].kwargs['json']
+        assert [item['title'] for item in content['tips']] == ['First']
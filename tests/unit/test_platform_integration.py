@@ -23,6 +23,7 @@ from halcytone_content_generator.services.content_sync import (
     SyncStatus,
     Channel
 )
+from halcytone_content_generator.config import Settings
 
 
 class TestEnhancedPlatformClient:
@@ -353,18 +354,19 @@ class TestContentSyncService:
     @pytest.fixture
     def mock_settings(self):
         """Mock settings for testing"""
-        settings = Mock()
-        settings.CRM_BASE_URL = "http://test-crm.com"
-        settings.PLATFORM_BASE_URL = "http://test-platform.com"
-        settings.CRM_API_KEY = "crm-key"
-        settings.PLATFORM_API_KEY = "platform-key"
-        settings.EMAIL_BATCH_SIZE = 10
-        settings.EMAIL_RATE_LIMIT = 100
-        settings.CIRCUIT_BREAKER_FAILURE_THRESHOLD = 5
-        settings.CIRCUIT_BREAKER_RECOVERY_TIMEOUT = 60
-        settings.MAX_RETRIES = 3
-        settings.RETRY_MAX_WAIT = 60
-        return settings
+        return Settings(
+            CRM_BASE_URL="http://test-crm.com",
+            PLATFORM_BASE_URL="http://test-platform.com",
+            CRM_API_KEY="crm-key",
+            PLATFORM_API_KEY="platform-key",
+            EMAIL_BATCH_SIZE=10,
+            EMAIL_RATE_LIMIT=100,
+            EMAIL_MAX_IN_FLIGHT_BATCHES=4,
+            CIRCUIT_BREAKER_FAILURE_THRESHOLD=5,
+            CIRCUIT_BREAKER_RECOVERY_TIMEOUT=60,
+            MAX_RETRIES=3,
+            RETRY_MAX_WAIT=60
+        )
 
     @pytest.fixture
     def sync_service(self, mock_settings):
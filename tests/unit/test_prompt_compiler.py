@@ -0,0 +1,111 @@
+"""
+Unit tests for the token-budget aware prompt compiler
+"""
+import pytest
+
+from halcytone_content_generator.services.prompt_compiler import (
+    OMISSION_MARKER,
+    PromptCompiler,
+    TokenEstimator,
+    context_window
+)
+
+
+def paragraph(index: int, sentences: int = 4) -> str:
+    """A paragraph whose first sentence identifies it"""
+    lead = f"Paragraph {index} explains slow breathing."
+    rest = " ".join(f"Detail {index}.{n} covers heart rate variability research." for n in range(sentences))
+    return f"{lead} {rest}"
+
+
+class TestTokenEstimator:
+    """Test local token estimation"""
+
+    @pytest.fixture
+    def estimator(self):
+        estimator = TokenEstimator("gpt-3.5-turbo")
+        estimator._encoding = None  # Exercise the heuristic whether or not tiktoken is installed
+        return estimator
+
+    def test_empty_text_has_no_tokens(self, estimator):
+        """Empty text counts as zero tokens"""
+        assert estimator.count("") == 0
+
+    def test_words_and_punctuation_are_counted(self, estimator):
+        """Short words and punctuation count as one token each"""
+        assert estimator.count("Rest in, rest out.") == 6
+
+    def test_long_words_split_into_pieces(self, estimator):
+        """Long words count as several tokens"""
+        assert estimator.count("variability") == 3
+
+    def test_messages_include_formatting_overhead(self, estimator):
+        """Chat messages add per-message and reply overhead"""
+        messages = [{"role": "system", "content": "Calm"}, {"role": "user", "content": "Breathe"}]
+        assert estimator.count_messages(messages) == 3 + (4 + 1) + (4 + 2)
+
+
+class TestPromptCompiler:
+    """Test prompt assembly within a token budget"""
+
+    @pytest.fixture
+    def compiler(self):
+        compiler = PromptCompiler("gpt-3.5-turbo", prompt_budget=200)
+        compiler.estimator._encoding = None
+        return compiler
+
+    def test_context_windows_match_model_families(self):
+        """Model names resolve to their family's context window"""
+        assert context_window("gpt-4") == 8192
+        assert context_window("gpt-4-0613") == 8192
+        assert context_window("gpt-4-32k-0613") == 32768
+        assert context_window("gpt-4o-mini") == 128000
+        assert context_window("unknown-model") == 4096
+
+    def test_budget_is_window_minus_completion_capped_by_setting(self):
+        """The configured budget caps what the context window allows"""
+        assert PromptCompiler("gpt-4").budget_for(1500) == 8192 - 1500
+        assert PromptCompiler("gpt-4", prompt_budget=2000).budget_for(1500) == 2000
+        assert PromptCompiler("gpt-4", prompt_budget=0).budget_for(1500) == 8192 - 1500
+
+    def test_prompt_within_budget_is_unchanged(self, compiler):
+        """Content that fits is sent verbatim"""
+        compiled = compiler.compile("System", "Improve clarity", "Breathe slowly.")
+
+        assert not compiled.trimmed
+        assert compiled.messages[1]["content"] == "Improve clarity\n\nContent:\nBreathe slowly."
+        assert compiled.prompt_tokens <= compiled.budget
+
+    def test_long_content_is_condensed_to_fit(self, compiler):
+        """Over-budget content keeps leading paragraphs and later lead sentences"""
+        content = "\n\n".join(paragraph(i) for i in range(12))
+
+        compiled = compiler.compile("System", "Improve clarity", content)
+        fitted = compiled.messages[1]["content"]
+
+        assert compiled.trimmed
+        assert compiled.prompt_tokens <= compiled.budget
+        assert paragraph(0) in fitted
+        assert OMISSION_MARKER in fitted
+        assert "Paragraph 11 explains" not in fitted or "Detail 11.0" not in fitted
+
+    def test_single_long_paragraph_is_cut_at_sentences(self, compiler):
+        """A paragraph that cannot fit whole keeps its leading sentences"""
+        content = paragraph(0, sentences=40)
+
+        fitted = compiler.fit_text(content, 50)
+
+        assert fitted.startswith("Paragraph 0 explains slow breathing.")
+        assert fitted.endswith(OMISSION_MARKER)
+        assert compiler.estimator.count(fitted) <= 50
+
+    def test_oversized_instructions_are_rejected(self, compiler):
+        """Instructions alone over budget cannot be fitted"""
+        with pytest.raises(ValueError):
+            compiler.compile("System", "word " * 300, "Breathe slowly.")
+
+    def test_untrimmable_payload_over_budget_is_rejected(self, compiler):
+        """Structured payloads are never condensed"""
+        payload = "\n\n".join(paragraph(i) for i in range(12))
+        with pytest.raises(ValueError):
+            compiler.compile("System", "Return JSON", payload, trim=False)
@@ -0,0 +1,105 @@
+"""
+Unit tests for the quality score cache
+"""
+import pytest
+from unittest.mock import patch
+
+from halcytone_content_generator.services.quality_score_cache import (
+    CacheEntryScoreStore,
+    LRUScoreCache,
+    make_score_cache_key
+)
+
+
+class TestScoreCacheKey:
+    """Test score cache key construction"""
+
+    def test_key_uses_content_hash(self):
+        """Identical content maps to the same key without storing the text"""
+        key = make_score_cache_key("Hello world", "web", False, "1")
+        assert key == make_score_cache_key("Hello world", "web", False, "1")
+        assert len(key[0]) == 64
+        assert "Hello world" not in key
+
+    def test_key_varies_with_every_component(self):
+        """Content, type, AI flag and scorer version all change the key"""
+        base = make_score_cache_key("Hello world", "web", False, "1")
+        assert make_score_cache_key("Hello world!", "web", False, "1") != base
+        assert make_score_cache_key("Hello world", "email", False, "1") != base
+        assert make_score_cache_key("Hello world", "web", True, "1") != base
+        assert make_score_cache_key("Hello world", "web", False, "2") != base
+
+
+class TestLRUScoreCache:
+    """Test the in-process LRU tier"""
+
+    def test_get_and_put(self):
+        """Stored values are returned and lookups are counted"""
+        cache = LRUScoreCache(max_entries=2)
+        assert cache.get(("a",)) is None
+        cache.put(("a",), 1)
+        assert cache.get(("a",)) == 1
+
+        stats = cache.get_stats()
+        assert stats['hits'] == 1
+        assert stats['misses'] == 1
+        assert stats['hit_rate'] == 50.0
+
+    def test_least_recently_used_entry_is_evicted(self):
+        """Reading an entry protects it from eviction"""
+        cache = LRUScoreCache(max_entries=2)
+        cache.put(("a",), 1)
+        cache.put(("b",), 2)
+        cache.get(("a",))
+        cache.put(("c",), 3)
+
+        assert len(cache) == 2
+        assert cache.get(("b",)) is None
+        assert cache.get(("a",)) == 1
+        assert cache.get(("c",)) == 3
+
+    def test_zero_size_disables_cache(self):
+        """A cache with no capacity never stores anything"""
+        cache = LRUScoreCache(max_entries=0)
+        cache.put(("a",), 1)
+        assert not cache.enabled
+        assert len(cache) == 0
+
+    def test_clear(self):
+        """Clearing drops every entry"""
+        cache = LRUScoreCache(max_entries=4)
+        cache.put(("a",), 1)
+        cache.clear()
+        assert cache.get(("a",)) is None
+
+    def test_lookups_are_reported_to_metrics(self):
+        """Hits and misses are forwarded to the Prometheus helper"""
+        cache = LRUScoreCache(max_entries=2)
+        with patch('halcytone_content_generator.services.quality_score_cache._record_lookup') as record:
+            cache.get(("a",))
+            cache.put(("a",), 1)
+            cache.get(("a",))
+
+        assert [call.args for call in record.call_args_list] == [('memory', False), ('memory', True)]
+
+
+class TestCacheEntryScoreStore:
+    """Test the persistent CacheEntry tier"""
+
+    def test_entry_key_is_namespaced_by_version_and_type(self):
+        """Persistent keys embed version, content type and AI flag"""
+        key = make_score_cache_key("Hello", "social", True, "3")
+        assert CacheEntryScoreStore.entry_key(key) == f"3:social:1:{key[0]}"
+
+    @pytest.mark.asyncio
+    async def test_unavailable_database_fails_soft(self):
+        """Missing database support disables the tier instead of raising"""
+        store = CacheEntryScoreStore()
+        key = make_score_cache_key("Hello", "web", False, "1")
+
+        with patch.dict('sys.modules', {'halcytone_content_generator.database': None}):
+            assert await store.load(key) is None
+
+        assert store._available is False
+        await store.save(key, {"overall_score": 1.0})
+        assert await store.load(key) is None
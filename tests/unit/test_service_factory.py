@@ -162,6 +162,7 @@ class TestServiceFactory:
         settings.DRY_RUN_MODE = True
         settings.USE_MOCK_SERVICES = True
         settings.SERVICE_NAME = "test-service"
+        settings.EMAIL_MAX_IN_FLIGHT_BATCHES = 4
 
         # External services mock
         settings.external_services = Mock()
@@ -436,6 +437,7 @@ class TestGlobalFunctions:
         settings.DRY_RUN_MODE = True
         settings.USE_MOCK_SERVICES = True
         settings.SERVICE_NAME = "test-service"
+        settings.EMAIL_MAX_IN_FLIGHT_BATCHES = 4
 
         settings.external_services = Mock()
         settings.external_services.CRM_BASE_URL = "https://crm.test.com"
@@ -0,0 +1,127 @@
+"""
+Unit tests for the bounded sync job history
+"""
+import pytest
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+from halcytone_content_generator.services.content_sync import Channel, SyncJob, SyncStatus
+from halcytone_content_generator.services.sync_history import SqlSyncJobArchive, SyncJobHistory
+
+
+def new_job(job_id, status=SyncStatus.PENDING, created_at=None, errors=None):
+    return SyncJob(
+        job_id=job_id,
+        created_at=created_at or datetime.now(),
+        status=status,
+        source_document_id="doc",
+        channels=[Channel.EMAIL, Channel.WEBSITE],
+        errors=errors or []
+    )
+
+
+def finish(history, job, status=SyncStatus.COMPLETED, duration_ms=250):
+    job.started_at = datetime.now()
+    job.completed_at = job.started_at + timedelta(milliseconds=duration_ms)
+    job.status = status
+    history.refresh(job)
+
+
+class TestSyncJobHistory:
+    """Test retention and running statistics"""
+
+    def test_status_changes_are_counted_on_refresh(self):
+        history = SyncJobHistory()
+        job = new_job("j1")
+        history[job.job_id] = job
+        assert history.statistics()['status_breakdown'] == {'pending': 1}
+
+        job.status = SyncStatus.IN_PROGRESS
+        history.refresh(job)
+        job.errors.append("Failed to sync to email: timeout")
+        finish(history, job, SyncStatus.PARTIAL)
+
+        stats = history.statistics()
+        assert stats['status_breakdown'] == {'partial': 1}
+        assert stats['error_breakdown'] == {'Failed to sync to email': 1}
+        assert stats['duration_ms']['count'] == 1
+        assert stats['duration_ms']['buckets'] == {'<=500': 1}
+
+    def test_refresh_is_idempotent(self):
+        history = SyncJobHistory()
+        job = new_job("j1", errors=["Failed to sync to website: 500"])
+        history[job.job_id] = job
+        for _ in range(3):
+            finish(history, job, SyncStatus.FAILED)
+
+        stats = history.statistics()
+        assert stats['status_breakdown'] == {'failed': 1}
+        assert stats['error_breakdown'] == {'Failed to sync to website': 1}
+        assert stats['duration_ms']['count'] == 1
+
+    def test_oldest_finished_jobs_are_evicted_first(self):
+        history = SyncJobHistory(max_jobs=3, archive=True)
+        pending = new_job("pending")
+        history["pending"] = pending
+        for i in range(4):
+            job = new_job(f"done_{i}")
+            history[job.job_id] = job
+            finish(history, job)
+
+        assert list(history) == ["pending", "done_2", "done_3"]
+        assert [job.job_id for job in history.drain_archive()] == ["done_0", "done_1"]
+        assert history.drain_archive() == []
+
+        stats = history.statistics()
+        assert stats['total_jobs'] == 5
+        assert stats['retained_jobs'] == 3
+        assert stats['evicted_jobs'] == 2
+        assert stats['status_breakdown'] == {'pending': 1, 'completed': 4}
+        assert stats['success_rate'] == 100.0
+
+    def test_unfinished_jobs_are_never_evicted(self):
+        history = SyncJobHistory(max_jobs=2)
+        for i in range(4):
+            history[f"j{i}"] = new_job(f"j{i}")
+
+        assert len(history) == 4
+        finish(history, history["j1"])
+        assert list(history) == ["j0", "j2", "j3"]
+
+    def test_expire_archives_finished_and_uncounts_unfinished(self):
+        history = SyncJobHistory(archive=True)
+        old = datetime.now() - timedelta(days=8)
+        history["old_done"] = new_job("old_done", status=SyncStatus.COMPLETED, created_at=old)
+        history["old_pending"] = new_job("old_pending", created_at=old)
+        history["recent"] = new_job("recent")
+
+        assert history.expire(datetime.now() - timedelta(days=7)) == 2
+
+        assert list(history) == ["recent"]
+        assert [job.job_id for job in history.drain_archive()] == ["old_done"]
+        stats = history.statistics()
+        assert stats['total_jobs'] == 2
+        assert stats['status_breakdown'] == {'completed': 1, 'pending': 1}
+        assert stats['channel_breakdown'] == {'email': 2, 'website': 2}
+
+    def test_without_archive_nothing_is_kept(self):
+        history = SyncJobHistory(max_jobs=1)
+        for i in range(3):
+            history[f"j{i}"] = new_job(f"j{i}", status=SyncStatus.COMPLETED)
+
+        assert len(history) == 1
+        assert history.drain_archive() == []
+
+
+class TestSqlSyncJobArchive:
+    """Test the archive degrades when the database layer is unavailable"""
+
+    @pytest.mark.asyncio
+    async def test_archive_disables_itself_without_database(self):
+        archive = SqlSyncJobArchive()
+
+        with patch.dict('sys.modules', {'halcytone_content_generator.database': None}):
+            assert await archive.archive([new_job("j1", status=SyncStatus.COMPLETED)]) == 0
+
+        assert archive.available is False
+        assert archive.archived == 0
@@ -0,0 +1,69 @@
+"""
+Unit tests for the sync job queue and timer heap
+"""
+import asyncio
+import pytest
+from datetime import datetime, timedelta
+
+from halcytone_content_generator.services.sync_scheduler import FairPriorityQueue, JobTimer
+
+
+def new_queue(maxsize=0):
+    """Queue of (priority, group, name) tuples"""
+    return FairPriorityQueue(maxsize, priority_of=lambda item: item[0], group_of=lambda item: item[1])
+
+
+class TestFairPriorityQueue:
+    """Test ordering and bounds of the fair priority queue"""
+
+    def test_groups_take_turns_within_a_priority(self):
+        queue = new_queue()
+        for item in [(1, 'a', 'a1'), (1, 'a', 'a2'), (1, 'a', 'a3'), (1, 'b', 'b1'), (1, 'c', 'c1'), (1, 'b', 'b2')]:
+            queue.put_nowait(item)
+
+        order = [queue.get_nowait()[2] for _ in range(queue.qsize())]
+
+        assert order == ['a1', 'b1', 'c1', 'a2', 'b2', 'a3']
+
+    def test_lower_priority_value_is_served_first(self):
+        queue = new_queue()
+        queue.put_nowait((2, 'a', 'low'))
+        queue.put_nowait((1, 'a', 'normal'))
+        queue.put_nowait((0, 'b', 'high'))
+
+        assert queue.depth_by_priority() == {0: 1, 1: 1, 2: 1}
+        assert [queue.get_nowait()[2] for _ in range(3)] == ['high', 'normal', 'low']
+        assert queue.empty()
+
+    @pytest.mark.asyncio
+    async def test_full_queue_applies_backpressure(self):
+        queue = new_queue(maxsize=1)
+        queue.put_nowait((1, 'a', 'first'))
+
+        with pytest.raises(asyncio.QueueFull):
+            queue.put_nowait((1, 'a', 'second'))
+
+        waiting_put = asyncio.create_task(queue.put((1, 'b', 'second')))
+        await asyncio.sleep(0)
+        assert not waiting_put.done()
+        assert queue.get_nowait()[2] == 'first'
+        await waiting_put
+        assert queue.get_nowait()[2] == 'second'
+
+
+class TestJobTimer:
+    """Test the scheduled job heap"""
+
+    def test_items_come_due_in_time_order(self):
+        timer = JobTimer()
+        now = datetime(2025, 1, 1, 12, 0)
+        timer.schedule(now + timedelta(minutes=10), 'later')
+        timer.schedule(now + timedelta(minutes=1), 'soon')
+        timer.schedule(now + timedelta(minutes=1), 'soon-too')
+
+        assert timer.next_due() == now + timedelta(minutes=1)
+        assert timer.pop_due(now) == []
+        assert timer.pop_due(now + timedelta(minutes=5)) == ['soon', 'soon-too']
+        assert len(timer) == 1
+        assert timer.pop_due(now + timedelta(hours=1)) == ['later']
+        assert timer.next_due() is None
@@ -0,0 +1,176 @@
+"""
+Unit tests for shared text analysis used by content quality scoring
+"""
+import re
+
+import pytest
+
+from halcytone_content_generator.services.lexicon_matcher import LexiconMatcher
+from halcytone_content_generator.services.text_analysis import TextAnalysis, TextEdit, count_syllables
+
+
+class TestCountSyllables:
+    """Test memoized syllable counting"""
+
+    def test_single_syllable(self):
+        assert count_syllables("cat") == 1
+        assert count_syllables("make") == 1
+
+    def test_multi_syllable(self):
+        assert count_syllables("computer") >= 3
+        assert count_syllables("extraordinary") >= 4
+
+    def test_case_insensitive(self):
+        assert count_syllables("Breathing") == count_syllables("breathing")
+
+
+class TestTextAnalysis:
+    """Test single-pass tokenization"""
+
+    CONTENT = (
+        "# Breathing Guide\n"
+        "## Getting Started\n"
+        "You can breathe. Your practice was improved! Are we ready?\n\n"
+        "Read the [full guide](https://example.com) and [FAQ](/faq) today"
+    )
+
+    def test_words_match_regex_tokenizer(self):
+        analysis = TextAnalysis.from_content(self.CONTENT)
+
+        assert analysis.words == re.findall(r'\b\w+\b', self.CONTENT.lower())
+        assert analysis.word_counts["you"] == 1
+        assert analysis.word_count == len(analysis.words)
+
+    def test_sentences_match_regex_split(self):
+        analysis = TextAnalysis.from_content(self.CONTENT)
+
+        expected = [s.strip() for s in re.split(r'[.!?]+', self.CONTENT) if s.strip()]
+        assert analysis.sentences == expected
+        assert analysis.sentence_lengths == [len(s.split()) for s in expected]
+
+    def test_headers_and_links(self):
+        analysis = TextAnalysis.from_content(self.CONTENT)
+
+        assert [header.level for header in analysis.headers] == [1, 2]
+        assert analysis.headers[0].offset == 0
+        assert len(analysis.link_spans) == 2
+        start, end = analysis.link_spans[0]
+        assert self.CONTENT[start:end] == "[full guide](https://example.com)"
+
+    def test_passive_voice_count(self):
+        analysis = TextAnalysis.from_content("It was tested. They were Improved. We ran.")
+
+        assert analysis.passive_voice_count == 2
+
+    def test_aggregates(self):
+        analysis = TextAnalysis.from_content("Comprehensive wellness today")
+
+        assert analysis.total_syllables == sum(count_syllables(w) for w in analysis.words)
+        assert analysis.complex_word_count == sum(
+            1 for w in analysis.words if count_syllables(w) >= 3
+        )
+        assert analysis.character_count == len("comprehensivewellnesstoday")
+        assert analysis.whitespace_word_count == 3
+
+    def test_empty_content(self):
+        analysis = TextAnalysis.from_content("")
+
+        assert analysis.words == []
+        assert analysis.sentences == []
+        assert analysis.headers == []
+        assert analysis.paragraphs == [""]
+
+
+class TestTextEdit:
+    """Test edit construction from two versions of a draft"""
+
+    def test_between_finds_minimal_replacement(self):
+        edit = TextEdit.between("Breathe in slowly.", "Breathe out slowly.")
+
+        assert edit == TextEdit(start=8, end=10, text="out")
+
+    def test_between_insertion_and_deletion(self):
+        assert TextEdit.between("abc", "abXc") == TextEdit(start=2, end=2, text="X")
+        assert TextEdit.between("abXc", "abc") == TextEdit(start=2, end=3, text="")
+        assert TextEdit.between("same", "same") == TextEdit(start=4, end=4, text="")
+
+
+class TestIncrementalAnalysis:
+    """Test re-analysis of edited content from a previous analysis"""
+
+    MATCHER = LexiconMatcher({'urgency': ["limited time", "now"], 'power': ["amazing"]})
+
+    CONTENT = (
+        "# Breathing Guide\n\n"
+        "Breathing is amazing. It was improved by practice.\n\n"
+        "Read the [full guide](https://example.com) now.\n\n"
+        "Offers are limited.\n\n"
+        "Time matters. Act now!"
+    )
+
+    def _assert_incremental(self, content, edits):
+        previous = TextAnalysis.from_content(content, self.MATCHER)
+        updated = previous.apply_edits(edits)
+        expected = TextAnalysis.from_content(updated.content, self.MATCHER)
+
+        assert updated == expected
+        assert updated.headers == expected.headers
+        assert updated.link_spans == expected.link_spans
+        assert updated.sentences == expected.sentences
+        return previous, updated
+
+    def test_edit_within_paragraph(self):
+        start = self.CONTENT.index("amazing")
+        self._assert_incremental(self.CONTENT, [TextEdit(start, start + 7, "wonderful")])
+
+    def test_untouched_blocks_are_reused(self):
+        start = self.CONTENT.index("amazing")
+        previous, updated = self._assert_incremental(
+            self.CONTENT, [TextEdit(start, start + 7, "wonderful")]
+        )
+
+        reused = sum(1 for block in updated.blocks if any(block is old for old in previous.blocks))
+        assert reused == len(previous.blocks) - 1
+
+    def test_split_and_merge_paragraphs(self):
+        split_at = self.CONTENT.index(" It was")
+        self._assert_incremental(self.CONTENT, [TextEdit(split_at, split_at + 1, "\n\n")])
+
+        # Removing a period joins the sentence with the next paragraph
+        period = self.CONTENT.index("limited.") + len("limited")
+        self._assert_incremental(self.CONTENT, [TextEdit(period, period + 1, "")])
+
+    def test_lexicon_terms_spanning_paragraphs(self):
+        """Multi-word terms still match across paragraph breaks after an edit"""
+        period = self.CONTENT.index("limited.") + len("limited")
+        _, updated = self._assert_incremental(self.CONTENT, [TextEdit(period, period + 1, " ")])
+
+        assert updated.lexicon_hits['urgency']["limited time"] == 1
+
+    def test_unclosed_link_across_paragraphs(self):
+        start = self.CONTENT.index("(https")
+        self._assert_incremental(self.CONTENT, [TextEdit(start, start + 1, "(see.\n\nmore ")])
+
+    def test_several_edits_and_empty_content(self):
+        first = self.CONTENT.index("Breathing is")
+        last = self.CONTENT.index("Act now")
+        self._assert_incremental(self.CONTENT, [
+            TextEdit(first, first + 9, "Breath"),
+            TextEdit(last, last + 3, "Start"),
+        ])
+        self._assert_incremental(self.CONTENT, [TextEdit(0, len(self.CONTENT), "")])
+        self._assert_incremental("", [TextEdit(0, 0, self.CONTENT)])
+
+    def test_edit_out_of_range(self):
+        analysis = TextAnalysis.from_content("Short.")
+
+        with pytest.raises(ValueError):
+            analysis.apply_edits([TextEdit(3, 20, "x")])
+
+    def test_sentence_length_statistics(self):
+        import statistics
+
+        analysis = TextAnalysis.from_content(self.CONTENT)
+
+        assert analysis.sentence_length_mean == statistics.mean(analysis.sentence_lengths)
+        assert analysis.sentence_length_stdev == pytest.approx(statistics.stdev(analysis.sentence_lengths))